@@ -0,0 +1,11 @@
+"""
+Бенчмарки приложения.
+
+Каждый модуль ``bench_*.py`` запускается из директории booking_app::
+
+    python -m benchmarks.bench_free_rooms_query --help
+
+Бенчмарки работают с базой из настроек DJANGO_SETTINGS_MODULE (по умолчанию
+booking_app.settings_dev), создают собственные тестовые данные и удаляют их
+после завершения.
+"""
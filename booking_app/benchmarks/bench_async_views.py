@@ -0,0 +1,227 @@
+"""
+Поиск свободных комнат под нагрузкой: синхронные воркеры gunicorn (WSGI) против
+асинхронных views под uvicorn (ASGI, settings_asgi).
+
+Оба сервера запускаются с одинаковым числом воркеров, на каждый отправляется
+одинаковый набор запросов с разными периодами (большая часть — промахи кэша),
+не больше ``--concurrency`` одновременно::
+
+    python -m benchmarks.bench_async_views --concurrency 500 --requests 5000 --workers 2
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+from datetime import timedelta
+from pathlib import Path
+from urllib.parse import urlencode
+
+from .utils import percentile, print_table, setup_django
+
+PREFIX = "bench-async-views"
+PROJECT_DIR = Path(__file__).resolve().parent.parent
+
+SERVERS = {
+    "sync (gunicorn, WSGI)": (
+        "booking_app.settings_prod",
+        ["-m", "gunicorn", "booking_app.wsgi:application", "--backlog", "2048"],
+        lambda port, workers: ["--bind", f"127.0.0.1:{port}", "--workers", workers],
+    ),
+    "async (uvicorn, ASGI)": (
+        "booking_app.settings_asgi",
+        [
+            "-m",
+            "uvicorn",
+            "booking_app.asgi:application",
+            "--no-access-log",
+            "--backlog",
+            "2048",
+        ],
+        lambda port, workers: [
+            "--host",
+            "127.0.0.1",
+            "--port",
+            str(port),
+            "--workers",
+            workers,
+        ],
+    ),
+}
+
+
+def seed(rooms: int, bookings: int):
+    """Создаёт комнаты и случайные брони на ближайший год."""
+    from booking_app_admin.models import Booking, Room
+    from django.contrib.auth import get_user_model
+    from django.utils import timezone
+
+    rng = random.Random(0)
+    user, _ = get_user_model().objects.get_or_create(username=f"{PREFIX}-user")
+    created = Room.objects.bulk_create(
+        Room(name=f"{PREFIX}-{i}", price_per_day=100 + i % 50, capacity=1 + i % 4)
+        for i in range(rooms)
+    )
+    start = timezone.now().replace(hour=12, minute=0, second=0, microsecond=0)
+    # Брони одной комнаты не пересекаются: каждая занимает свой слот из трёх суток.
+    slots = rng.sample(range(len(created) * 120), bookings)
+    Booking.objects.bulk_create(
+        Booking(
+            room=created[slot % len(created)],
+            user=user,
+            date_start=start + timedelta(days=3 * (slot // len(created))),
+            date_end=start + timedelta(days=3 * (slot // len(created)) + 2),
+        )
+        for slot in slots
+    )
+
+
+def cleanup():
+    from booking_app_admin.models import Room
+    from django.contrib.auth import get_user_model
+
+    Room.objects.filter(name__startswith=f"{PREFIX}-").delete()
+    get_user_model().objects.filter(username=f"{PREFIX}-user").delete()
+
+
+def search_paths(count: int) -> list:
+    from django.urls import reverse
+    from django.utils import timezone
+
+    rng = random.Random(1)
+    url = reverse("search-free-rooms")
+    today = timezone.localdate()
+    paths = []
+    for _ in range(count):
+        date_start = today + timedelta(days=rng.randrange(1, 300))
+        date_end = date_start + timedelta(days=rng.randrange(1, 8))
+        params = {
+            "date_start": date_start.isoformat(),
+            "date_end": date_end.isoformat(),
+            "capacity": rng.randrange(0, 5),
+        }
+        paths.append(f"{url}?{urlencode(params)}")
+    return paths
+
+
+async def fetch(
+    port: int, path: str, method: str = "GET", headers: dict = None, body: bytes = b""
+):
+    """Один HTTP-запрос по отдельному соединению: (статус, время в секундах)."""
+    headers = {"Accept": "application/json", **(headers or {})}
+    if body:
+        headers["Content-Length"] = str(len(body))
+    lines = "".join(f"{name}: {value}\r\n" for name, value in headers.items())
+    started = time.perf_counter()
+    try:
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(
+            f"{method} {path} HTTP/1.1\r\nHost: 127.0.0.1\r\n{lines}"
+            "Connection: close\r\n\r\n".encode() + body
+        )
+        await writer.drain()
+        status_line = await reader.readline()
+        await reader.read()
+        writer.close()
+        status = int(status_line.split()[1])
+    except (OSError, IndexError, ValueError):
+        status = 0
+    return status, time.perf_counter() - started
+
+
+async def load(port: int, paths: list, concurrency: int):
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def limited(path):
+        async with semaphore:
+            return await fetch(port, path)
+
+    started = time.perf_counter()
+    results = await asyncio.gather(*(limited(path) for path in paths))
+    return results, time.perf_counter() - started
+
+
+def wait_for_port(port: int, process, timeout: float = 60.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"Сервер завершился с кодом {process.returncode}")
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=0.5):
+                return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError("Сервер не запустился")
+
+
+def run_server(name: str, port: int, workers: int, paths, concurrency: int):
+    settings_module, command, bind = SERVERS[name]
+    env = {**os.environ, "DJANGO_SETTINGS_MODULE": settings_module}
+    process = subprocess.Popen(
+        [sys.executable, *command, *bind(port, str(workers))],
+        cwd=PROJECT_DIR,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        wait_for_port(port, process)
+        # Прогрев: импорт модулей и соединения с БД в каждом воркере.
+        asyncio.run(load(port, paths[: workers * 20], workers * 4))
+        results, elapsed = asyncio.run(load(port, paths, concurrency))
+    finally:
+        process.terminate()
+        process.wait(timeout=30)
+
+    timings = [duration for status, duration in results if status == 200]
+    errors = len(results) - len(timings)
+    return [
+        name,
+        errors,
+        len(timings) / elapsed,
+        percentile(timings, 50) * 1000,
+        percentile(timings, 95) * 1000,
+        percentile(timings, 99) * 1000,
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--concurrency", type=int, default=500)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--rooms", type=int, default=500)
+    parser.add_argument("--bookings", type=int, default=20_000)
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    setup_django("booking_app.settings_prod")
+    cleanup()
+    print(f"Заполнение: {args.rooms} комнат, {args.bookings} броней...")
+    seed(args.rooms, args.bookings)
+    paths = search_paths(args.requests)
+
+    table = []
+    try:
+        for name in SERVERS:
+            print(f"Нагрузка: {name}...")
+            table.append(
+                run_server(name, args.port, args.workers, paths, args.concurrency)
+            )
+    finally:
+        cleanup()
+
+    print()
+    print(
+        f"Воркеров: {args.workers}, одновременных запросов: {args.concurrency}, "
+        f"всего запросов: {args.requests}"
+    )
+    print_table(["server", "errors", "req/s", "p50 ms", "p95 ms", "p99 ms"], table)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+Соединения с БД под нагрузкой: gunicorn (settings_prod, gunicorn.conf.py) с
+DB_POOL_MODE "none" (новое соединение на каждый запрос), "persistent" и "pool".
+
+На каждый режим отправляется одинаковый набор запросов поиска свободных комнат
+(разные периоды) и списка комнат, не больше ``--concurrency`` одновременно::
+
+    python -m benchmarks.bench_db_pool --requests 3000 --concurrency 16 --workers 2
+"""
+
+import argparse
+import asyncio
+import os
+import subprocess
+import sys
+
+from .bench_async_views import (PROJECT_DIR, cleanup, load, search_paths, seed,
+                                wait_for_port)
+from .utils import percentile, print_table, setup_django
+
+MODES = ["none", "persistent", "pool"]
+
+
+def run_mode(mode: str, port: int, workers: int, paths, concurrency: int):
+    env = {
+        **os.environ,
+        "DJANGO_SETTINGS_MODULE": "booking_app.settings_prod",
+        "DB_POOL_MODE": mode,
+        "WEB_CONCURRENCY": str(workers),
+        "GUNICORN_BIND": f"127.0.0.1:{port}",
+    }
+    process = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "gunicorn",
+            "-c",
+            "gunicorn.conf.py",
+            "booking_app.wsgi:application",
+        ],
+        cwd=PROJECT_DIR,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        wait_for_port(port, process)
+        asyncio.run(load(port, paths[: workers * 20], workers * 2))
+        results, elapsed = asyncio.run(load(port, paths, concurrency))
+    finally:
+        process.terminate()
+        process.wait(timeout=30)
+
+    timings = [duration for status, duration in results if status == 200]
+    errors = len(results) - len(timings)
+    return [
+        mode,
+        errors,
+        len(timings) / elapsed,
+        percentile(timings, 50) * 1000,
+        percentile(timings, 95) * 1000,
+        percentile(timings, 99) * 1000,
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=3000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--rooms", type=int, default=50)
+    parser.add_argument("--bookings", type=int, default=2000)
+    parser.add_argument("--port", type=int, default=8766)
+    args = parser.parse_args()
+
+    setup_django("booking_app.settings_prod")
+    from django.urls import reverse
+
+    cleanup()
+    seed(args.rooms, args.bookings)
+    paths = search_paths(args.requests // 2) + [reverse("all-rooms")] * (
+        args.requests - args.requests // 2
+    )
+
+    table = []
+    try:
+        for mode in MODES:
+            print(f"Нагрузка: DB_POOL_MODE={mode}...")
+            table.append(
+                run_mode(mode, args.port, args.workers, paths, args.concurrency)
+            )
+    finally:
+        cleanup()
+
+    print()
+    print(
+        f"Воркеров: {args.workers}, одновременных запросов: {args.concurrency}, "
+        f"всего запросов: {args.requests}"
+    )
+    print_table(["mode", "errors", "req/s", "p50 ms", "p95 ms", "p99 ms"], table)
+
+
+if __name__ == "__main__":
+    main()
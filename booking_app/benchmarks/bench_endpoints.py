@@ -0,0 +1,602 @@
+"""
+Набор бенчмарков эндпоинтов v1 с отчётом и проверкой регрессий.
+
+Заполняет базу набором данных (комнаты × брони × пользователи), прогоняет каждый
+эндпоинт через тестовый клиент Django (``--driver client``) или через локальный
+gunicorn с gunicorn.conf.py (``--driver gunicorn``) и выводит пропускную
+способность, p50/p95/p99 и число SQL-запросов на запрос. Результаты сохраняются
+в JSON (``--output``); с ``--baseline`` они сравниваются с сохранёнными ранее,
+и при регрессии больше допустимой команда завершается с кодом 1::
+
+    python -m benchmarks.bench_endpoints --dataset small --output baseline.json
+    python -m benchmarks.bench_endpoints --dataset small --baseline baseline.json
+
+Данные создаются с фиксированным ``--seed``, поэтому запуски воспроизводимы.
+Генератор запросов есть для каждого именованного маршрута v1 (кроме служебных
+SKIPPED) и для получения и обновления JWT; маршрут без генератора — ошибка.
+Каждый запрос приходит с собственным адресом X-Forwarded-For из сети 198.18.0.0/15,
+чтобы ограничения частоты запросов не искажали замер.
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from urllib.parse import urlencode
+
+from .bench_async_views import PROJECT_DIR, fetch, wait_for_port
+from .utils import percentile, print_table, setup_django
+
+PREFIX = "bench-endpoints"
+CLIENT_NETWORK = "198.18"
+PASSWORD = "bench-Endpoints-2025"
+# Служебные эндпоинты мониторинга не замеряются.
+SKIPPED = {"db-pool-stats", "metrics"}
+# Маршруты вне urlconf v1.
+TOKEN_ENDPOINTS = {"token_obtain_pair", "token_refresh"}
+
+DATASETS = {
+    "small": {"rooms": 50, "bookings": 2_000, "users": 20},
+    "medium": {"rooms": 500, "bookings": 20_000, "users": 200},
+    "large": {"rooms": 2_000, "bookings": 200_000, "users": 2_000},
+}
+
+
+def seed(rooms: int, bookings: int, users: int, rng: random.Random) -> dict:
+    """
+    Создаёт комнаты, пользователей и брони на ближайший год.
+
+    :return: id комнат; id, имена, access- и refresh-токены пользователей;
+        id броней каждого пользователя и access-токен администратора
+    """
+    from booking_app_admin.models import Booking, Room
+    from booking_app_api.utils.authentication import ClaimsRefreshToken
+    from django.contrib.auth import get_user_model
+    from django.contrib.auth.hashers import make_password
+    from django.utils import timezone as django_timezone
+
+    if bookings > rooms * 120:
+        raise ValueError("Броней больше, чем свободных слотов (120 на комнату)")
+
+    # Один хеш на всех: хеширование для каждого пользователя заняло бы больше, чем замер.
+    password = make_password(PASSWORD)
+    created_users = get_user_model().objects.bulk_create(
+        get_user_model()(username=f"{PREFIX}-user-{i}", password=password)
+        for i in range(users)
+    )
+    admin = get_user_model().objects.create_superuser(
+        username=f"{PREFIX}-admin", password=None
+    )
+    created_rooms = Room.objects.bulk_create(
+        Room(name=f"{PREFIX}-{i}", price_per_day=100 + i % 50, capacity=1 + i % 4)
+        for i in range(rooms)
+    )
+    start = django_timezone.now().replace(hour=12, minute=0, second=0, microsecond=0)
+    # Брони одной комнаты не пересекаются: каждая занимает свой слот из трёх суток.
+    slots = rng.sample(range(rooms * 120), bookings)
+    created_bookings = Booking.objects.bulk_create(
+        (
+            Booking(
+                room=created_rooms[slot % rooms],
+                user=created_users[index % users],
+                date_start=start + timedelta(days=3 * (slot // rooms)),
+                date_end=start + timedelta(days=3 * (slot // rooms) + 2),
+            )
+            for index, slot in enumerate(slots)
+        ),
+        batch_size=5_000,
+    )
+
+    user_bookings = {user.pk: [] for user in created_users}
+    for booking in created_bookings:
+        user_bookings[booking.user_id].append(booking.pk)
+    tokens = {user.pk: ClaimsRefreshToken.for_user(user) for user in created_users}
+    return {
+        "rooms": [room.pk for room in created_rooms],
+        "users": [
+            (user.pk, str(tokens[user.pk].access_token))
+            for user in created_users
+            if user_bookings[user.pk]
+        ],
+        "usernames": [user.username for user in created_users],
+        "refresh_tokens": [str(token) for token in tokens.values()],
+        "user_bookings": user_bookings,
+        "admin": str(ClaimsRefreshToken.for_user(admin).access_token),
+    }
+
+
+def cleanup():
+    from booking_app_admin.models import Room
+    from booking_app_api.utils.throttling import gcra_throttle
+    from django.contrib.auth import get_user_model
+    from django.db import connection
+
+    Room.objects.filter(name__startswith=f"{PREFIX}-").delete()
+    get_user_model().objects.filter(username__startswith=f"{PREFIX}-").delete()
+    with connection.cursor() as cursor:
+        # Эндпоинты ограничивает только GCRAThrottle.
+        cursor.execute(
+            f"DELETE FROM {gcra_throttle.TABLE} WHERE key LIKE %s",
+            [f"%{CLIENT_NETWORK}.%"],
+        )
+
+
+def request_builders(data: dict, rng: random.Random) -> dict:
+    """
+    Генераторы запросов к эндпоинтам: имя -> функция, возвращающая
+    (метод, путь, заголовки, тело).
+    """
+    from django.urls import reverse
+    from django.utils import timezone as django_timezone
+
+    clients = itertools.count()
+    new_slots = itertools.count()
+    new_users = itertools.count()
+    today = django_timezone.localdate()
+    # Новые брони — через два года, после всех созданных seed().
+    far_start = django_timezone.now().replace(
+        hour=12, minute=0, second=0, microsecond=0
+    ) + timedelta(days=730)
+
+    def headers(token=None):
+        client = next(clients)
+        result = {
+            "X-Forwarded-For": f"{CLIENT_NETWORK}.{client >> 8 & 255}.{client & 255}"
+        }
+        if token:
+            result["Authorization"] = f"Bearer {token}"
+        return result
+
+    def get(name, query=None, token=None):
+        path = reverse(name)
+        if query:
+            path = f"{path}?{urlencode(query)}"
+        return "GET", path, headers(token), b""
+
+    def post(name, body, token=None):
+        request_headers = {**headers(token), "Content-Type": "application/json"}
+        return "POST", reverse(name), request_headers, json.dumps(body).encode()
+
+    def period(max_days):
+        """Случайный промежуток дат в пределах года от сегодняшнего дня."""
+        date_start = today + timedelta(days=rng.randrange(1, 300))
+        return date_start, date_start + timedelta(days=rng.randrange(1, max_days + 1))
+
+    def new_booking():
+        """Бронь на свободный слот после всех созданных seed()."""
+        slot = next(new_slots)
+        rooms = data["rooms"]
+        date_start = far_start + timedelta(days=3 * (slot // len(rooms)))
+        return {
+            "room": rooms[slot % len(rooms)],
+            "date_start": date_start.isoformat(),
+            "date_end": (date_start + timedelta(days=2)).isoformat(),
+        }
+
+    def all_rooms():
+        return "GET", reverse("all-rooms"), headers(), b""
+
+    def search_free_rooms():
+        date_start = today + timedelta(days=rng.randrange(1, 300))
+        date_end = date_start + timedelta(days=rng.randrange(1, 8))
+        query = (
+            f"date_start={date_start.isoformat()}&date_end={date_end.isoformat()}"
+            f"&capacity={rng.randrange(0, 5)}"
+        )
+        return "GET", f"{reverse('search-free-rooms')}?{query}", headers(), b""
+
+    def user_all_booking():
+        _, token = rng.choice(data["users"])
+        return "GET", reverse("user-all-booking"), headers(token), b""
+
+    def user_booking():
+        user_id, token = rng.choice(data["users"])
+        booking_id = rng.choice(data["user_bookings"][user_id])
+        return "GET", reverse("user-booking", args=[booking_id]), headers(token), b""
+
+    def flexible_search_free_rooms():
+        date_start, date_end = period(7)
+        query = {
+            "date_start": date_start.isoformat(),
+            "date_end": date_end.isoformat(),
+            "capacity": rng.randrange(0, 5),
+            "shift_days": rng.randrange(0, 4),
+            "length_days": rng.randrange(0, 3),
+        }
+        return get("flexible-search-free-rooms", query)
+
+    def room_calendar():
+        month = today + timedelta(days=rng.randrange(0, 300))
+        query = {"month": f"{month:%Y-%m}", "room": rng.choice(data["rooms"])}
+        return get("room-calendar", query)
+
+    def earliest_slots():
+        date_from = today + timedelta(days=rng.randrange(0, 300))
+        query = {
+            "nights": rng.randrange(1, 8),
+            "date_from": date_from.isoformat(),
+            "capacity": rng.randrange(0, 5),
+        }
+        return get("earliest-slots", query)
+
+    def user_registration():
+        username = f"{PREFIX}-new-{next(new_users)}"
+        body = {
+            "username": username,
+            "email": f"{username}@example.com",
+            "password": PASSWORD,
+            "password2": PASSWORD,
+        }
+        return post("user-registration", body)
+
+    def token_obtain_pair():
+        body = {"username": rng.choice(data["usernames"]), "password": PASSWORD}
+        return post("token_obtain_pair", body)
+
+    def token_refresh():
+        return post("token_refresh", {"refresh": rng.choice(data["refresh_tokens"])})
+
+    def create_booking():
+        _, token = rng.choice(data["users"])
+        return post("create-booking", new_booking(), token)
+
+    def bulk_create_booking():
+        _, token = rng.choice(data["users"])
+        bookings = [new_booking() for _ in range(5)]
+        return post("bulk-create-booking", {"bookings": bookings}, token)
+
+    def export_booking():
+        date_start, date_end = period(7)
+        query = {"date_start": date_start.isoformat(), "date_end": date_end.isoformat()}
+        return get("export-booking", query, data["admin"])
+
+    def occupancy_analytics():
+        date_start, date_end = period(30)
+        query = {
+            "date_start": date_start.isoformat(),
+            "date_end": date_end.isoformat(),
+            "period": rng.choice(["day", "week"]),
+        }
+        return get("occupancy-analytics", query, data["admin"])
+
+    return {
+        "all-rooms": all_rooms,
+        "search-free-rooms": search_free_rooms,
+        "flexible-search-free-rooms": flexible_search_free_rooms,
+        "room-calendar": room_calendar,
+        "earliest-slots": earliest_slots,
+        "user-registration": user_registration,
+        "token_obtain_pair": token_obtain_pair,
+        "token_refresh": token_refresh,
+        "user-all-booking": user_all_booking,
+        "user-booking": user_booking,
+        "create-booking": create_booking,
+        "bulk-create-booking": bulk_create_booking,
+        "export-booking": export_booking,
+        "occupancy-analytics": occupancy_analytics,
+    }
+
+
+def check_coverage(names) -> None:
+    """Проверяет, что генераторы запросов есть для всех маршрутов v1 и JWT."""
+    from booking_app_api.v1.urls import urlpatterns
+
+    routes = {pattern.name for pattern in urlpatterns} | TOKEN_ENDPOINTS
+    missing = sorted(routes - set(names) - SKIPPED)
+    if missing:
+        raise SystemExit(f"Нет генераторов запросов для эндпоинтов: {missing}")
+
+
+def client_request(client, method, path, headers, body):
+    """Запрос через тестовый клиент Django: код ответа."""
+    meta = {
+        f"HTTP_{name.upper().replace('-', '_')}": value
+        for name, value in headers.items()
+        if name != "Content-Type"
+    }
+    response = client.generic(
+        method,
+        path,
+        data=body,
+        content_type=headers.get("Content-Type", "application/octet-stream"),
+        HTTP_HOST="localhost",
+        HTTP_ACCEPT="application/json",
+        **meta,
+    )
+    if response.streaming:
+        # Выгрузка читает базу по мере отдачи ответа.
+        for _ in response.streaming_content:
+            pass
+    return response.status_code
+
+
+def count_queries(client, build, samples: int) -> float:
+    """Среднее число SQL-запросов на запрос к эндпоинту (после прогрева кэшей процесса)."""
+    from django.db import connection
+
+    for _ in range(samples):
+        client_request(client, *build())
+    queries = []
+
+    def count(execute, sql, *args):
+        queries.append(sql)
+        return execute(sql, *args)
+
+    with connection.execute_wrapper(count):
+        for _ in range(samples):
+            client_request(client, *build())
+    return len(queries) / samples
+
+
+def run_client(build, requests: int, warmup: int) -> tuple:
+    """Последовательные запросы через тестовый клиент: (коды, времена, секунды)."""
+    from django.test import Client
+
+    client = Client()
+    for _ in range(warmup):
+        client_request(client, *build())
+
+    statuses, timings = [], []
+    started = time.perf_counter()
+    for _ in range(requests):
+        request = build()
+        request_started = time.perf_counter()
+        statuses.append(client_request(client, *request))
+        timings.append(time.perf_counter() - request_started)
+    return statuses, timings, time.perf_counter() - started
+
+
+async def load(port: int, requests: list, concurrency: int) -> tuple:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def limited(method, path, headers, body):
+        async with semaphore:
+            return await fetch(port, path, method, headers, body)
+
+    started = time.perf_counter()
+    results = await asyncio.gather(*(limited(*request) for request in requests))
+    return results, time.perf_counter() - started
+
+
+def start_gunicorn(port: int, workers: int):
+    env = {
+        **os.environ,
+        "WEB_CONCURRENCY": str(workers),
+        "GUNICORN_BIND": f"127.0.0.1:{port}",
+    }
+    process = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "gunicorn",
+            "-c",
+            "gunicorn.conf.py",
+            "booking_app.wsgi:application",
+        ],
+        cwd=PROJECT_DIR,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    wait_for_port(port, process)
+    return process
+
+
+def run_gunicorn(port: int, build, requests: int, warmup: int, concurrency: int):
+    """Запросы к gunicorn не больше concurrency одновременно: (коды, времена, секунды)."""
+    asyncio.run(load(port, [build() for _ in range(warmup)], concurrency))
+    results, elapsed = asyncio.run(
+        load(port, [build() for _ in range(requests)], concurrency)
+    )
+    return [status for status, _ in results], [t for _, t in results], elapsed
+
+
+def endpoint_report(statuses, timings, elapsed, queries) -> dict:
+    ok = [t for status, t in zip(statuses, timings) if 200 <= status < 300]
+    return {
+        "requests": len(statuses),
+        "errors": len(statuses) - len(ok),
+        "rps": len(ok) / elapsed if elapsed else 0.0,
+        "p50_ms": percentile(ok, 50) * 1000,
+        "p95_ms": percentile(ok, 95) * 1000,
+        "p99_ms": percentile(ok, 99) * 1000,
+        "queries": queries,
+    }
+
+
+def compare(current: dict, baseline: dict, max_latency: float, max_throughput: float):
+    """
+    Сравнение результатов с базовыми.
+
+    Регрессия — рост p95 больше чем на max_latency, падение пропускной способности
+    больше чем на max_throughput (доли), рост числа SQL-запросов (с округлением до целого:
+    в среднем его сдвигают промахи кэшей) или ошибок.
+
+    :return: строки таблицы сравнения и список регрессий
+    """
+    rows, regressions = [], []
+    for name, result in current["endpoints"].items():
+        base = baseline["endpoints"].get(name)
+        if base is None:
+            continue
+        checks = [
+            ("p95_ms", result["p95_ms"] > base["p95_ms"] * (1 + max_latency)),
+            ("rps", result["rps"] < base["rps"] * (1 - max_throughput)),
+            ("queries", round(result["queries"]) > round(base["queries"])),
+            ("errors", result["errors"] > base["errors"]),
+        ]
+        for metric, failed in checks:
+            change = (
+                (result[metric] - base[metric]) / base[metric] * 100
+                if base[metric]
+                else 0.0
+            )
+            rows.append(
+                [
+                    name,
+                    metric,
+                    base[metric],
+                    result[metric],
+                    f"{change:+.1f}%",
+                    "REGRESSION" if failed else "ok",
+                ]
+            )
+            if failed:
+                regressions.append(
+                    f"{name}: {metric} {base[metric]} -> {result[metric]}"
+                )
+    return rows, regressions
+
+
+def run(args) -> dict:
+    from django.conf import settings
+    from django.test import Client
+
+    dataset = dict(DATASETS[args.dataset])
+    for key in dataset:
+        if getattr(args, key) is not None:
+            dataset[key] = getattr(args, key)
+
+    rng = random.Random(args.seed)
+    builders = request_builders({}, rng)
+    check_coverage(builders)
+    endpoints = args.endpoints or list(builders)
+    unknown = sorted(set(endpoints) - set(builders))
+    if unknown:
+        raise SystemExit(f"Неизвестные эндпоинты: {unknown}")
+    report = {
+        "meta": {
+            "dataset": dataset,
+            "driver": args.driver,
+            "requests": args.requests,
+            "concurrency": args.concurrency if args.driver == "gunicorn" else 1,
+            "workers": args.workers if args.driver == "gunicorn" else None,
+            "settings": settings.SETTINGS_MODULE,
+            "seed": args.seed,
+            "created": datetime.now(timezone.utc).isoformat(),
+        },
+        "endpoints": {},
+    }
+
+    cleanup()
+    process = None
+    try:
+        print(
+            f"Заполнение: {dataset['rooms']} комнат, {dataset['bookings']} броней, "
+            f"{dataset['users']} пользователей..."
+        )
+        data = seed(**dataset, rng=rng)
+        builders = request_builders(data, rng)
+        if args.driver == "gunicorn":
+            process = start_gunicorn(args.port, args.workers)
+
+        for name in endpoints:
+            print(f"Эндпоинт {name}...")
+            build = builders[name]
+            if args.driver == "gunicorn":
+                statuses, timings, elapsed = run_gunicorn(
+                    args.port, build, args.requests, args.warmup, args.concurrency
+                )
+            else:
+                statuses, timings, elapsed = run_client(
+                    build, args.requests, args.warmup
+                )
+            queries = count_queries(Client(), build, args.query_samples)
+            report["endpoints"][name] = endpoint_report(
+                statuses, timings, elapsed, queries
+            )
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait(timeout=30)
+        cleanup()
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--dataset", choices=DATASETS, default="small")
+    parser.add_argument("--rooms", type=int, help="переопределяет размер набора")
+    parser.add_argument("--bookings", type=int, help="переопределяет размер набора")
+    parser.add_argument("--users", type=int, help="переопределяет размер набора")
+    parser.add_argument("--driver", choices=["client", "gunicorn"], default="client")
+    parser.add_argument("--endpoints", nargs="*", help="по умолчанию все")
+    parser.add_argument("--requests", type=int, default=300)
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument("--query-samples", type=int, default=5)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--port", type=int, default=8767)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="файл для результатов в JSON")
+    parser.add_argument("--baseline", help="JSON с базовыми результатами")
+    parser.add_argument(
+        "--max-latency-regression",
+        type=float,
+        default=0.2,
+        help="допустимый рост p95 (доля), по умолчанию 0.2",
+    )
+    parser.add_argument(
+        "--max-throughput-regression",
+        type=float,
+        default=0.2,
+        help="допустимое падение req/s (доля), по умолчанию 0.2",
+    )
+    args = parser.parse_args()
+
+    setup_django()
+    report = run(args)
+
+    print()
+    print_table(
+        ["endpoint", "errors", "req/s", "p50 ms", "p95 ms", "p99 ms", "queries"],
+        [
+            [
+                name,
+                result["errors"],
+                result["rps"],
+                result["p50_ms"],
+                result["p95_ms"],
+                result["p99_ms"],
+                result["queries"],
+            ]
+            for name, result in report["endpoints"].items()
+        ],
+    )
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(report, file, ensure_ascii=False, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as file:
+            baseline = json.load(file)
+        if baseline["meta"]["dataset"] != report["meta"]["dataset"] or (
+            baseline["meta"]["driver"] != report["meta"]["driver"]
+        ):
+            print("\nВнимание: набор данных или драйвер отличаются от базовых.")
+        rows, regressions = compare(
+            report,
+            baseline,
+            args.max_latency_regression,
+            args.max_throughput_regression,
+        )
+        print()
+        print_table(
+            ["endpoint", "metric", "baseline", "current", "change", "status"], rows
+        )
+        if regressions:
+            print("\nРегрессии:")
+            for regression in regressions:
+                print(f"  {regression}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
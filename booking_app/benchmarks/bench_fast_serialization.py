@@ -0,0 +1,109 @@
+"""
+Сериализация списков комнат и броней: ModelSerializer из DRF против FastSerializer.
+
+Замеряется полный путь от QuerySet до списка словарей, включая запросы к БД::
+
+    python -m benchmarks.bench_fast_serialization --rows 10000 --repeat 20
+"""
+
+import argparse
+from datetime import timedelta
+
+from .utils import measure, print_table, setup_django, summarize
+
+PREFIX = "bench-fast-serialization"
+
+
+def seed(rows: int):
+    """Создаёт rows комнат и по одной брони на каждую."""
+    from booking_app_admin.models import Booking, Room
+    from django.contrib.auth import get_user_model
+    from django.utils import timezone
+
+    user, _ = get_user_model().objects.get_or_create(username=f"{PREFIX}-user")
+    rooms = Room.objects.bulk_create(
+        Room(name=f"{PREFIX}-{i}", price_per_day=100 + i % 50, capacity=1 + i % 4)
+        for i in range(rows)
+    )
+    start = timezone.now()
+    Booking.objects.bulk_create(
+        Booking(
+            room=room,
+            user=user,
+            date_start=start + timedelta(hours=i),
+            date_end=start + timedelta(hours=i, days=2),
+        )
+        for i, room in enumerate(rooms)
+    )
+    return user
+
+
+def cleanup():
+    from booking_app_admin.models import Room
+    from django.contrib.auth import get_user_model
+
+    # Брони удаляются каскадно вместе с комнатами.
+    Room.objects.filter(name__startswith=f"{PREFIX}-").delete()
+    get_user_model().objects.filter(username=f"{PREFIX}-user").delete()
+
+
+def run(rows: int, repeat: int):
+    from booking_app_admin.models import Booking, Room
+    from booking_app_api.v1.serializers import (BookingSerializer,
+                                                RoomSerializer,
+                                                fast_booking_serializer,
+                                                fast_room_serializer)
+
+    cleanup()
+    print(f"Заполнение: {rows} комнат и броней...")
+    user = seed(rows)
+
+    rooms = Room.objects.filter(name__startswith=f"{PREFIX}-").order_by("id")
+    bookings = Booking.objects.filter(user=user).prefetch_related("room").order_by("id")
+    cases = [
+        ("rooms", "RoomSerializer", lambda: RoomSerializer(rooms, many=True).data),
+        ("rooms", "FastSerializer", lambda: fast_room_serializer.serialize(rooms)),
+        (
+            "bookings",
+            "BookingSerializer",
+            lambda: BookingSerializer(bookings, many=True).data,
+        ),
+        (
+            "bookings",
+            "FastSerializer",
+            lambda: fast_booking_serializer.serialize(bookings),
+        ),
+    ]
+
+    table = []
+    try:
+        for name, serializer, func in cases:
+            stats = summarize(measure(func, repeat=repeat))
+            table.append(
+                [
+                    name,
+                    serializer,
+                    stats["p50_ms"],
+                    stats["p95_ms"],
+                    stats["p50_ms"] * 1000 / rows,
+                ]
+            )
+    finally:
+        cleanup()
+
+    print()
+    print_table(["list", "serializer", "p50 ms", "p95 ms", "us/row (p50)"], table)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    setup_django()
+    run(args.rows, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+"""
+Поиск свободных комнат: прежний запрос ``NOT IN`` по date_start/date_end против
+анти-join ``NOT EXISTS`` по колонке period с GiST-индексом (room_id, period).
+
+Для каждого объёма броней печатает план запроса (EXPLAIN ANALYZE) и задержку::
+
+    python -m benchmarks.bench_free_rooms_query --sizes 10000 1000000 10000000
+"""
+
+import argparse
+import math
+import random
+from datetime import timedelta
+
+from .utils import measure, print_table, setup_django, summarize
+
+PREFIX = "bench-free-rooms"
+BOOKING_DAYS = 2
+GAP_DAYS = 1
+
+
+def legacy_free_rooms(date_start, date_end):
+    """Запрос из get_free_rooms до перехода на колонку period."""
+    from booking_app_admin.models import Booking, Room
+    from django.db.models import Q
+
+    busy_rooms = Booking.objects.filter(
+        Q(date_start__lt=date_end) & Q(date_end__gt=date_start)
+    ).values_list("room_id", flat=True)
+    return Room.objects.exclude(id__in=busy_rooms)
+
+
+def seed(rooms: int, bookings: int):
+    """Создаёт комнаты и непересекающиеся брони одним INSERT ... SELECT."""
+    from booking_app_admin.models import Booking, Room
+    from django.contrib.auth import get_user_model
+    from django.db import connection
+    from django.utils import timezone
+
+    user, _ = get_user_model().objects.get_or_create(username=f"{PREFIX}-user")
+    Room.objects.bulk_create(
+        Room(name=f"{PREFIX}-{i}", price_per_day=100 + i % 50, capacity=1 + i % 4)
+        for i in range(rooms)
+    )
+
+    per_room = math.ceil(bookings / rooms)
+    step = BOOKING_DAYS + GAP_DAYS
+    # История уходит в прошлое, последний год броней — в будущем.
+    origin = timezone.now() - timedelta(days=max(per_room * step - 365, 0))
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            INSERT INTO {Booking._meta.db_table} (date_start, date_end, room_id, user_id)
+            SELECT %(origin)s + n * %(step)s * interval '1 day',
+                   %(origin)s + (n * %(step)s + %(days)s) * interval '1 day',
+                   r.id, %(user)s
+            FROM {Room._meta.db_table} r
+            CROSS JOIN generate_series(0, %(per_room)s - 1) AS n
+            WHERE r.name LIKE %(prefix)s
+            ORDER BY n, r.id
+            LIMIT %(bookings)s
+            """,
+            {
+                "origin": origin,
+                "step": step,
+                "days": BOOKING_DAYS,
+                "user": user.id,
+                "per_room": per_room,
+                "prefix": f"{PREFIX}-%",
+                "bookings": bookings,
+            },
+        )
+        cursor.execute(f"ANALYZE {Booking._meta.db_table}")
+        cursor.execute(f"ANALYZE {Room._meta.db_table}")
+
+
+def cleanup():
+    from booking_app_admin.models import Booking, Room
+    from django.contrib.auth import get_user_model
+    from django.db import connection
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            DELETE FROM {Booking._meta.db_table}
+            WHERE room_id IN (SELECT id FROM {Room._meta.db_table} WHERE name LIKE %s)
+            """,
+            [f"{PREFIX}-%"],
+        )
+    Room.objects.filter(name__startswith=f"{PREFIX}-").delete()
+    get_user_model().objects.filter(username=f"{PREFIX}-user").delete()
+
+
+def run(sizes, rooms: int, repeat: int, show_plans: bool):
+    from booking_app_api.utils.filters import get_free_rooms_sql
+    from django.utils import timezone
+
+    rng = random.Random(0)
+    today = timezone.now()
+    windows = []
+    for _ in range(repeat):
+        date_start = today + timedelta(days=rng.randint(1, 300))
+        windows.append((date_start, date_start + timedelta(days=rng.randint(1, 7))))
+
+    queries = {
+        "NOT IN (legacy)": legacy_free_rooms,
+        "NOT EXISTS &&": get_free_rooms_sql,
+    }
+    rows = []
+    for size in sizes:
+        cleanup()
+        print(f"Заполнение: {rooms} комнат, {size} броней...")
+        seed(rooms, size)
+        for name, query in queries.items():
+            if show_plans:
+                print(f"\n=== {name}, {size} броней")
+                print(query(*windows[0]).explain(analyze=True, buffers=True))
+            iterator = iter(windows * 2)
+
+            def call():
+                list(query(*next(iterator)).values_list("id", flat=True))
+
+            stats = summarize(measure(call, repeat=repeat, warmup=min(3, repeat)))
+            rows.append([size, name, stats["p50_ms"], stats["p95_ms"], stats["p99_ms"]])
+    cleanup()
+    print()
+    print_table(["bookings", "query", "p50 ms", "p95 ms", "p99 ms"], rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[10_000, 1_000_000, 10_000_000]
+    )
+    parser.add_argument("--rooms", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--no-plans", action="store_true", help="не печатать EXPLAIN")
+    args = parser.parse_args()
+
+    setup_django()
+    run(args.sizes, args.rooms, args.repeat, not args.no_plans)
+
+
+if __name__ == "__main__":
+    main()
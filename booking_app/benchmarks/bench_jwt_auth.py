@@ -0,0 +1,152 @@
+"""
+Аутентификация по JWT на эндпоинтах броней: JWTAuthentication из simplejwt против
+CachedJWTAuthentication и StatelessJWTAuthentication (JWT_AUTH["STATELESS_READS"]).
+
+Для каждого эндпоинта считаются запросы к БД и время одного запроса через
+тестовый клиент Django (полный стек middleware и view)::
+
+    python -m benchmarks.bench_jwt_auth --calls 200 --repeat 10
+"""
+
+import argparse
+from datetime import timedelta
+
+from .utils import measure, print_table, setup_django, summarize
+
+PREFIX = "bench-jwt-auth"
+
+
+def seed():
+    from booking_app_admin.models import Booking, Room
+    from django.contrib.auth import get_user_model
+    from django.utils import timezone
+
+    user = get_user_model().objects.create_user(username=f"{PREFIX}-user")
+    room = Room.objects.create(name=f"{PREFIX}-room", price_per_day=100, capacity=2)
+    start = timezone.now() + timedelta(days=400)
+    bookings = Booking.objects.bulk_create(
+        Booking(
+            room=room,
+            user=user,
+            date_start=start + timedelta(days=3 * i),
+            date_end=start + timedelta(days=3 * i + 2),
+        )
+        for i in range(20)
+    )
+    return user, room, bookings[0]
+
+
+def cleanup():
+    from booking_app_admin.models import Room
+    from django.contrib.auth import get_user_model
+
+    Room.objects.filter(name__startswith=f"{PREFIX}-").delete()
+    get_user_model().objects.filter(username=f"{PREFIX}-user").delete()
+
+
+def run(calls: int, repeat: int):
+    from booking_app_api.utils.authentication import (
+        CachedJWTAuthentication, ClaimsRefreshToken,
+        StatelessJWTAuthentication, token_cache)
+    from booking_app_api.v1.views import (CreateBookingApi, UserAllBookingApi,
+                                          UserBookingApi)
+    from django.conf import settings
+    from django.core.cache import caches
+    from django.db import connection
+    from django.test import Client
+    from django.urls import reverse
+    from rest_framework_simplejwt.authentication import JWTAuthentication
+
+    views = [UserAllBookingApi, UserBookingApi, CreateBookingApi]
+    original = {
+        view: (view.authentication_classes, view.throttle_classes) for view in views
+    }
+
+    cleanup()
+    user, room, booking = seed()
+    token = ClaimsRefreshToken.for_user(user).access_token
+    client = Client(HTTP_AUTHORIZATION=f"Bearer {token}", HTTP_HOST="localhost")
+    # Неверные даты: запрос проходит аутентификацию и отклоняется валидацией.
+    create_body = {
+        "room": room.pk,
+        "date_start": "2000-01-02",
+        "date_end": "2000-01-01",
+    }
+    endpoints = [
+        ("GET user/booking/", lambda: client.get(reverse("user-all-booking"))),
+        (
+            "GET user/booking/<pk>/",
+            lambda: client.get(reverse("user-booking", args=[booking.pk])),
+        ),
+        (
+            "POST user/booking/create/",
+            lambda: client.post(
+                reverse("create-booking"), create_body, content_type="application/json"
+            ),
+        ),
+    ]
+    modes = [
+        ("JWTAuthentication", JWTAuthentication, False),
+        ("CachedJWTAuthentication", CachedJWTAuthentication, False),
+        ("StatelessJWTAuthentication", StatelessJWTAuthentication, True),
+    ]
+
+    table = []
+    try:
+        for mode, authentication_class, stateless in modes:
+            settings.JWT_AUTH = {**settings.JWT_AUTH, "STATELESS_READS": stateless}
+            for view in views:
+                view.authentication_classes = [authentication_class]
+                # Ограничение частоты (100 запросов в сутки) не относится к замеру.
+                view.throttle_classes = []
+            token_cache.clear()
+            caches[settings.JWT_AUTH["USER_CACHE_ALIAS"]].clear()
+
+            for endpoint, request in endpoints:
+                request()
+                # Django очищает connection.queries в начале каждого запроса,
+                # поэтому запросы к БД считаются через execute_wrapper.
+                queries = []
+                with connection.execute_wrapper(
+                    lambda execute, sql, *args: queries.append(sql)
+                    or execute(sql, *args)
+                ):
+                    response = request()
+
+                def func():
+                    for _ in range(calls):
+                        request()
+
+                stats = summarize(measure(func, repeat=repeat))
+                table.append(
+                    [
+                        mode,
+                        endpoint,
+                        response.status_code,
+                        len(queries),
+                        stats["p50_ms"] / calls,
+                    ]
+                )
+    finally:
+        for view, (authentication_classes, throttle_classes) in original.items():
+            view.authentication_classes = authentication_classes
+            view.throttle_classes = throttle_classes
+        cleanup()
+
+    print_table(
+        ["authentication", "endpoint", "status", "queries", "ms/request"], table
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--calls", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    setup_django("booking_app.settings_prod")
+    run(args.calls, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
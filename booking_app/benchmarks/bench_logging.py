@@ -0,0 +1,138 @@
+"""
+Накладные расходы логирования на один запрос создания брони.
+
+Сравнивает прежнюю схему (синхронная запись в RotatingFileHandler, сообщения
+собираются f-строками, debug-сообщение всегда выполняет поиск свободных комнат)
+с текущей (AsyncQueueHandler, ленивые аргументы, проверка isEnabledFor)::
+
+    python -m benchmarks.bench_logging --repeat 20000 --query-ms 0.5
+
+Поиск свободных комнат имитируется задержкой ``--query-ms``, поэтому бенчмарку
+не нужна база данных.
+"""
+
+import argparse
+import logging
+import tempfile
+import time
+from logging.handlers import QueueListener, RotatingFileHandler
+from pathlib import Path
+
+from booking_app.log_handlers import AsyncQueueHandler, JsonFormatter
+
+from .utils import measure, print_table, summarize
+
+BOOKING = {
+    "id": 1,
+    "room": 7,
+    "date_start": "2026-11-01T12:00:00+03:00",
+    "date_end": "2026-11-03T12:00:00+03:00",
+}
+
+
+def build_handlers(log_dir: Path, formatter: logging.Formatter):
+    handlers = []
+    for name, level in (
+        ("info", logging.INFO),
+        ("error", logging.ERROR),
+        ("critical", logging.CRITICAL),
+    ):
+        handler = RotatingFileHandler(
+            log_dir / f"{name}.log", maxBytes=1024 * 1024 * 5, backupCount=3
+        )
+        handler.setLevel(level)
+        handler.setFormatter(formatter)
+        handlers.append(handler)
+    return handlers
+
+
+def make_logger(name: str, handlers, level: int) -> logging.Logger:
+    logger = logging.getLogger(f"bench.{name}")
+    logger.handlers = list(handlers)
+    logger.setLevel(level)
+    logger.propagate = False
+    return logger
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=20000)
+    parser.add_argument(
+        "--query-ms",
+        type=float,
+        default=0.5,
+        help="имитируемая длительность SQL-запроса поиска свободных комнат",
+    )
+    args = parser.parse_args()
+
+    query_calls = 0
+
+    def free_rooms():
+        nonlocal query_calls
+        query_calls += 1
+        time.sleep(args.query_ms / 1000)
+        return [1, 2, 3]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        (tmp / "sync").mkdir()
+        (tmp / "queue").mkdir()
+        verbose = logging.Formatter("{asctime} {levelname} {name} {message}", style="{")
+
+        sync_logger = make_logger(
+            "sync", build_handlers(tmp / "sync", verbose), logging.INFO
+        )
+        targets = build_handlers(tmp / "queue", JsonFormatter())
+        queue_handler = AsyncQueueHandler(maxsize=1_000_000)
+        # Слушатель запустится при первой записи, как и при настройке через LOGGING.
+        queue_handler.listener = QueueListener(
+            queue_handler.queue, *targets, respect_handler_level=True
+        )
+        queue_logger = make_logger("queue", [queue_handler], logging.INFO)
+
+        def before():
+            # Прежний код: f-строки форматируются до проверки уровня.
+            sync_logger.debug(
+                "Проверка свободна ли комната:\n"
+                f"комната: {BOOKING['room']}\n"
+                f"свободные комнаты:{free_rooms()}"
+            )
+            sync_logger.info(
+                f"Пользователь с id  {42} создал новое бронирование {BOOKING}"
+            )
+
+        def after():
+            if queue_logger.isEnabledFor(logging.DEBUG):
+                queue_logger.debug(
+                    "Проверка свободна ли комната:\nкомната: %s\nсвободные комнаты:%s",
+                    BOOKING["room"],
+                    free_rooms(),
+                )
+            queue_logger.info(
+                "Пользователь с id %s создал новое бронирование %s",
+                42,
+                BOOKING["id"],
+                extra={"user_id": 42, "booking_id": BOOKING["id"], "room_id": 7},
+            )
+
+        rows = []
+        query_calls = 0
+        samples = measure(before, repeat=args.repeat)
+        rows.append(["sync + f-string", *summarize(samples).values(), query_calls])
+
+        query_calls = 0
+        samples = measure(after, repeat=args.repeat)
+        rows.append(["queue + lazy", *summarize(samples).values(), query_calls])
+        queue_handler.stop()
+
+        for handler in [*sync_logger.handlers, *targets]:
+            handler.close()
+
+    print_table(
+        ["setup", "mean_ms", "p50_ms", "p95_ms", "p99_ms", "free_rooms_calls"], rows
+    )
+    print(f"dropped records: {queue_handler.dropped}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,191 @@
+"""
+Поиск свободных комнат на секционированной таблице броней по мере роста истории.
+
+Для каждого числа лет истории создаёт брони, раскладывает их по помесячным
+секциям и сравнивает запрос с условием на date_start (start_bounds_q), по которому
+PostgreSQL отсекает секции, с тем же запросом без него. Печатает число
+прочитанных секций (по EXPLAIN ANALYZE) и задержку::
+
+    python -m benchmarks.bench_partitions --years 1 3 5 10
+"""
+
+import argparse
+import random
+import re
+from datetime import timedelta
+
+from .utils import measure, print_table, setup_django, summarize
+
+PREFIX = "bench-partitions"
+BOOKING_DAYS = 2
+GAP_DAYS = 1
+FUTURE_DAYS = 365
+
+
+def unpruned_free_rooms(date_start, date_end):
+    """get_free_rooms_sql без условия на date_start: читает все секции."""
+    from booking_app_admin.models import Booking, Room
+    from django.db.backends.postgresql.psycopg_any import DateTimeTZRange
+    from django.db.models import Exists, OuterRef
+
+    busy = Booking.objects.filter(
+        period__overlap=DateTimeTZRange(date_start, date_end), room=OuterRef("pk")
+    )
+    return Room.objects.filter(~Exists(busy))
+
+
+def seed(rooms: int, years: int):
+    """Создаёт комнаты и брони: years лет истории и год броней в будущем."""
+    from booking_app_admin.models import Booking, Room
+    from django.contrib.auth import get_user_model
+    from django.db import connection
+    from django.utils import timezone
+
+    user, _ = get_user_model().objects.get_or_create(username=f"{PREFIX}-user")
+    Room.objects.bulk_create(
+        Room(name=f"{PREFIX}-{i}", price_per_day=100 + i % 50, capacity=1 + i % 4)
+        for i in range(rooms)
+    )
+
+    step = BOOKING_DAYS + GAP_DAYS
+    origin = timezone.now() - timedelta(days=365 * years)
+    per_room = (365 * years + FUTURE_DAYS) // step
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            INSERT INTO {Booking._meta.db_table} (date_start, date_end, room_id, user_id)
+            SELECT %(origin)s + n * %(step)s * interval '1 day',
+                   %(origin)s + (n * %(step)s + %(days)s) * interval '1 day',
+                   r.id, %(user)s
+            FROM {Room._meta.db_table} r
+            CROSS JOIN generate_series(0, %(per_room)s - 1) AS n
+            WHERE r.name LIKE %(prefix)s
+            """,
+            {
+                "origin": origin,
+                "step": step,
+                "days": BOOKING_DAYS,
+                "user": user.id,
+                "per_room": per_room,
+                "prefix": f"{PREFIX}-%",
+            },
+        )
+        bookings = cursor.rowcount
+    return origin, bookings
+
+
+def partition(origin):
+    """Создаёт помесячные секции за всю историю и переносит в них брони."""
+    from booking_app_admin.models import Booking
+    from booking_app_api.utils.db import ensure_partitions
+    from django.db import connection
+    from django.utils import timezone
+
+    last = timezone.localdate() + timedelta(days=FUTURE_DAYS + BOOKING_DAYS)
+    ensure_partitions(timezone.localtime(origin).date().replace(day=1), last)
+    with connection.cursor() as cursor:
+        cursor.execute(f"ANALYZE {Booking._meta.db_table}")
+
+
+def cleanup(keep_partitions):
+    """Удаляет данные бенчмарка и созданные им секции."""
+    from booking_app_admin.models import Booking, Room
+    from booking_app_api.utils.db import detach_partition, list_partitions
+    from django.contrib.auth import get_user_model
+    from django.db import connection
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            DELETE FROM {Booking._meta.db_table}
+            WHERE room_id IN (SELECT id FROM {Room._meta.db_table} WHERE name LIKE %s)
+            """,
+            [f"{PREFIX}-%"],
+        )
+    Room.objects.filter(name__startswith=f"{PREFIX}-").delete()
+    get_user_model().objects.filter(username=f"{PREFIX}-user").delete()
+    for month in list_partitions():
+        if month not in keep_partitions and not _has_bookings(month):
+            detach_partition(month)
+
+
+def _has_bookings(month) -> bool:
+    from booking_app_api.utils.db.partitions import PARTITION_NAME
+    from django.db import connection
+
+    with connection.cursor() as cursor:
+        cursor.execute(f"SELECT EXISTS (SELECT 1 FROM {PARTITION_NAME.format(month)})")
+        return cursor.fetchone()[0]
+
+
+def scanned_partitions(queryset) -> int:
+    """Число секций броней, которые читает план запроса."""
+    from booking_app_api.utils.db.partitions import PARENT
+
+    plan = queryset.explain(analyze=True)
+    return len(set(re.findall(rf"\b{PARENT}_(default|p\d{{4}}_\d{{2}})\b", plan)))
+
+
+def run(years_list, rooms: int, repeat: int):
+    from booking_app_api.utils.db import list_partitions
+    from booking_app_api.utils.filters import get_free_rooms_sql
+    from django.utils import timezone
+
+    rng = random.Random(0)
+    today = timezone.now()
+    windows = []
+    for _ in range(repeat):
+        date_start = today + timedelta(days=rng.randint(1, 300))
+        windows.append((date_start, date_start + timedelta(days=rng.randint(1, 7))))
+
+    queries = {
+        "без отсечения": unpruned_free_rooms,
+        "start_bounds_q": get_free_rooms_sql,
+    }
+    keep = set(list_partitions())
+    rows = []
+    for years in years_list:
+        cleanup(keep)
+        print(f"Заполнение: {rooms} комнат, {years} лет истории...")
+        origin, bookings = seed(rooms, years)
+        partition(origin)
+        for name, query in queries.items():
+            scanned = scanned_partitions(query(*windows[0]))
+            iterator = iter(windows * 2)
+
+            def call():
+                list(query(*next(iterator)).values_list("id", flat=True))
+
+            stats = summarize(measure(call, repeat=repeat, warmup=min(3, repeat)))
+            rows.append(
+                [
+                    years,
+                    bookings,
+                    len(list_partitions()),
+                    name,
+                    scanned,
+                    stats["p50_ms"],
+                    stats["p95_ms"],
+                ]
+            )
+    cleanup(keep)
+    print()
+    print_table(
+        ["years", "bookings", "partitions", "query", "scanned", "p50 ms", "p95 ms"],
+        rows,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--years", type=int, nargs="+", default=[1, 3, 5, 10])
+    parser.add_argument("--rooms", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    setup_django()
+    run(args.years, args.rooms, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+"""
+Всплеск регистраций: прежний RegistrationSerializer (проверки уникальности
+запросами, create + set_password + save, хеширование в потоке запроса) против
+текущего (хеширование в пуле PASSWORD_HASHING["MAX_WORKERS"], один INSERT).
+
+``--signups`` регистраций выполняются в ``--threads`` потоках, как в воркере
+gthread; параллельно поток-зонд раз в 10 мс выполняет лёгкий запрос к БД,
+его задержка показывает, насколько регистрации вытесняют остальные запросы::
+
+    python -m benchmarks.bench_registration --signups 40 --threads 8
+"""
+
+import argparse
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+
+from .utils import percentile, print_table, setup_django
+
+PREFIX = "bench-registration"
+
+
+def legacy_serializer_class():
+    """RegistrationSerializer до перехода на один INSERT."""
+    from booking_app_api.v1.serializers import RegistrationSerializer
+    from django.contrib.auth import get_user_model
+    from rest_framework import serializers
+    from rest_framework.validators import UniqueValidator
+
+    class LegacyRegistrationSerializer(RegistrationSerializer):
+        email = serializers.EmailField(
+            required=True,
+            validators=[UniqueValidator(queryset=get_user_model().objects.all())],
+        )
+
+        class Meta(RegistrationSerializer.Meta):
+            extra_kwargs = {}
+
+        def create(self, validated_data):
+            user = get_user_model().objects.create(
+                username=validated_data["username"],
+                email=validated_data["email"],
+            )
+            user.set_password(validated_data["password"])
+            user.save()
+            return user
+
+    return LegacyRegistrationSerializer
+
+
+def cleanup():
+    from django.contrib.auth import get_user_model
+
+    get_user_model().objects.filter(username__startswith=PREFIX).delete()
+
+
+def run_burst(name, serializer_class, in_transaction, signups: int, threads: int):
+    from django.db import connection, connections, transaction
+
+    slug = name.split()[0]
+    queries = []
+    counter = threading.Lock()
+
+    def count_query(execute, sql, *args):
+        with counter:
+            queries.append(sql)
+        return execute(sql, *args)
+
+    def signup(index):
+        data = {
+            "username": f"{PREFIX}-{slug}-{index}",
+            "email": f"{PREFIX}-{slug}-{index}@example.com",
+            "password": "bench_password_99",
+            "password2": "bench_password_99",
+        }
+        started = time.perf_counter()
+        with connection.execute_wrapper(count_query):
+            serializer = serializer_class(data=data)
+            # Прежний view оборачивал валидацию и сохранение в транзакцию.
+            with transaction.atomic() if in_transaction else nullcontext():
+                serializer.is_valid(raise_exception=True)
+                serializer.save()
+        connections.close_all()
+        return time.perf_counter() - started
+
+    probe_timings = []
+    stop = threading.Event()
+
+    def probe():
+        while not stop.is_set():
+            started = time.perf_counter()
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT 1")
+            probe_timings.append(time.perf_counter() - started)
+            time.sleep(0.01)
+        connections.close_all()
+
+    probe_thread = threading.Thread(target=probe)
+    probe_thread.start()
+    started = time.perf_counter()
+    try:
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            timings = list(pool.map(signup, range(signups)))
+    finally:
+        stop.set()
+        probe_thread.join()
+    elapsed = time.perf_counter() - started
+
+    return [
+        name,
+        signups / elapsed,
+        len(queries) / signups,
+        percentile(timings, 50) * 1000,
+        percentile(timings, 95) * 1000,
+        percentile(probe_timings, 50) * 1000,
+        percentile(probe_timings, 95) * 1000,
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--signups", type=int, default=40)
+    parser.add_argument("--threads", type=int, default=8)
+    args = parser.parse_args()
+
+    setup_django()
+    from booking_app_api.v1.serializers import RegistrationSerializer
+    from django.conf import settings
+
+    cases = [
+        ("legacy", legacy_serializer_class(), True),
+        ("single insert + pool", RegistrationSerializer, False),
+    ]
+    table = []
+    cleanup()
+    try:
+        for name, serializer_class, in_transaction in cases:
+            table.append(
+                run_burst(
+                    name, serializer_class, in_transaction, args.signups, args.threads
+                )
+            )
+    finally:
+        cleanup()
+
+    print(
+        f"Регистраций: {args.signups}, потоков: {args.threads}, "
+        f"потоков хеширования: {settings.PASSWORD_HASHING['MAX_WORKERS']}"
+    )
+    print_table(
+        [
+            "pipeline",
+            "signups/s",
+            "queries/signup",
+            "signup p50 ms",
+            "signup p95 ms",
+            "probe p50 ms",
+            "probe p95 ms",
+        ],
+        table,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Пропускная способность рендереров ответа на больших списках комнат и броней.
+
+Данные сериализуются RoomSerializer/BookingSerializer один раз из объектов в памяти
+(база данных не нужна), после чего замеряется только рендеринг::
+
+    python -m benchmarks.bench_renderers --rows 10000 --repeat 30
+"""
+
+import argparse
+from datetime import timedelta
+from decimal import Decimal
+
+from .utils import measure, print_table, setup_django, summarize
+
+
+def build_payloads(rows: int) -> dict:
+    from booking_app_admin.models import Booking, Room
+    from booking_app_api.v1.serializers import (BookingSerializer,
+                                                RoomSerializer)
+    from django.utils import timezone
+
+    rooms = [
+        Room(
+            id=i,
+            name=f"Комната {i}",
+            price_per_day=Decimal(100 + i % 50),
+            capacity=1 + i % 4,
+        )
+        for i in range(rows)
+    ]
+    start = timezone.now()
+    bookings = [
+        Booking(
+            id=i,
+            room=room,
+            date_start=start + timedelta(hours=i),
+            date_end=start + timedelta(hours=i, days=2),
+        )
+        for i, room in enumerate(rooms)
+    ]
+    return {
+        "rooms": {"results": RoomSerializer(rooms, many=True).data},
+        "bookings": {"results": BookingSerializer(bookings, many=True).data},
+    }
+
+
+def run(rows: int, repeat: int):
+    from booking_app_api.utils.renderers import (MessagePackRenderer,
+                                                 ORJSONRenderer)
+    from rest_framework.renderers import JSONRenderer
+
+    renderers = {
+        "JSONRenderer (DRF)": JSONRenderer(),
+        "ORJSONRenderer": ORJSONRenderer(),
+        "MessagePackRenderer": MessagePackRenderer(),
+    }
+    table = []
+    for name, payload in build_payloads(rows).items():
+        for renderer_name, renderer in renderers.items():
+            size = len(renderer.render(payload))
+            stats = summarize(measure(lambda: renderer.render(payload), repeat=repeat))
+            table.append(
+                [
+                    name,
+                    renderer_name,
+                    stats["p50_ms"],
+                    stats["p95_ms"],
+                    size / 1024,
+                    size / 1024 / 1024 / (stats["p50_ms"] / 1000),
+                ]
+            )
+
+    print_table(["payload", "renderer", "p50 ms", "p95 ms", "KiB", "MiB/s"], table)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=30)
+    args = parser.parse_args()
+
+    setup_django()
+    run(args.rows, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
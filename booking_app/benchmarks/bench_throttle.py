@@ -0,0 +1,139 @@
+"""
+Стоимость проверки ограничения частоты запросов на один запрос: SimpleRateThrottle
+из DRF (LocMemCache) против SharedRateThrottle и GCRAThrottle с хранилищами
+"cache" и "database".
+
+Каждый замер — ``--calls`` вызовов allow_request с лимитом ``--limit`` запросов
+в сутки. Запросы распределяются по ``--keys`` клиентам (разным IP) и идут
+по кругу, поэтому при ``--keys 1`` история одного клиента заполнена, а при большом
+числе ключей нагрузка приходится на количество записей в хранилище::
+
+    python -m benchmarks.bench_throttle --calls 1000 --repeat 20 --limit 100
+    python -m benchmarks.bench_throttle --calls 10000 --repeat 5 --keys 100000
+"""
+
+import argparse
+import pickle
+
+from .utils import measure, print_table, setup_django, summarize
+
+PREFIX = "bench-throttle"
+
+
+def cleanup():
+    from booking_app_api.utils.throttling import gcra_throttle, shared_throttle
+    from django.core.cache import cache
+    from django.db import connection
+
+    with connection.cursor() as cursor:
+        for table in (shared_throttle.TABLE, gcra_throttle.TABLE):
+            cursor.execute(f"DELETE FROM {table} WHERE key LIKE %s", [f"%{PREFIX}%"])
+    cache.clear()
+
+
+def state_size(throttle_class, request) -> int:
+    """Размер состояния одного ключа в кэше (в байтах pickle) после ``--limit`` запросов."""
+    from django.core.cache import cache
+
+    throttle = throttle_class()
+    for _ in range(throttle.num_requests):
+        throttle_class().allow_request(request, None)
+    return len(pickle.dumps(cache.get(throttle.get_cache_key(request, None))))
+
+
+def run(calls: int, repeat: int, limit: int, keys: int):
+    from booking_app_api.utils import GCRAThrottle
+    from booking_app_api.utils.throttling.shared_throttle import \
+        SharedRateThrottle
+    from django.conf import settings
+    from rest_framework.test import APIRequestFactory
+    from rest_framework.throttling import SimpleRateThrottle
+
+    class BenchThrottleMixin:
+        scope = PREFIX
+        rate = f"{limit}/day"
+
+        def get_cache_key(self, request, view):
+            return self.cache_format % {
+                "scope": f"{self.scope}-{settings.THROTTLE_STORE['BACKEND']}",
+                "ident": self.get_ident(request),
+            }
+
+    class DRFThrottle(BenchThrottleMixin, SimpleRateThrottle):
+        pass
+
+    class SharedThrottle(BenchThrottleMixin, SharedRateThrottle):
+        pass
+
+    class GCRABenchThrottle(BenchThrottleMixin, GCRAThrottle):
+        pass
+
+    factory = APIRequestFactory()
+    requests = [
+        factory.post("/", REMOTE_ADDR=f"10.{i >> 16 & 255}.{i >> 8 & 255}.{i & 255}")
+        for i in range(keys)
+    ]
+    position = 0
+
+    def check(throttle_class):
+        def func():
+            nonlocal position
+            for _ in range(calls):
+                throttle_class().allow_request(requests[position], None)
+                position = (position + 1) % len(requests)
+
+        return func
+
+    cases = [
+        ("SimpleRateThrottle", "LocMemCache", DRFThrottle),
+        ("SharedRateThrottle", "cache", SharedThrottle),
+        ("SharedRateThrottle", "database", SharedThrottle),
+        ("GCRAThrottle", "cache", GCRABenchThrottle),
+        ("GCRAThrottle", "database", GCRABenchThrottle),
+    ]
+    table = []
+    cleanup()
+    try:
+        for name, backend, throttle_class in cases:
+            settings.THROTTLE_STORE = {**settings.THROTTLE_STORE, "BACKEND": backend}
+            position = 0
+            stats = summarize(measure(check(throttle_class), repeat=repeat))
+            table.append(
+                [
+                    name,
+                    backend,
+                    stats["p50_ms"] * 1000 / calls,
+                    stats["p95_ms"] * 1000 / calls,
+                ]
+            )
+
+        settings.THROTTLE_STORE = {**settings.THROTTLE_STORE, "BACKEND": "cache"}
+        cleanup()
+        request = factory.post("/", REMOTE_ADDR="10.255.255.255")
+        sizes = [
+            ["SimpleRateThrottle", state_size(DRFThrottle, request)],
+            ["GCRAThrottle", state_size(GCRABenchThrottle, request)],
+        ]
+    finally:
+        cleanup()
+
+    print(f"Клиентов: {keys}, лимит: {limit}/day")
+    print_table(["throttle", "store", "us/request (p50)", "us/request (p95)"], table)
+    print()
+    print_table(["throttle", "bytes per key"], sizes)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--calls", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--limit", type=int, default=100)
+    parser.add_argument("--keys", type=int, default=1)
+    args = parser.parse_args()
+
+    setup_django()
+    run(args.calls, args.repeat, args.limit, args.keys)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+import math
+import os
+import statistics
+import time
+
+
+def setup_django(settings_module: str = "booking_app.settings_dev"):
+    """Настраивает Django для запуска бенчмарка как отдельного скрипта."""
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", settings_module)
+
+    import django
+
+    django.setup()
+
+
+def percentile(samples, q: float) -> float:
+    """Перцентиль q (0..100) по методу ближайшего ранга."""
+    ordered = sorted(samples)
+    if not ordered:
+        return 0.0
+    rank = math.ceil(q / 100 * len(ordered)) - 1
+    return ordered[max(0, min(len(ordered) - 1, rank))]
+
+
+def measure(func, repeat: int, warmup: int = 3) -> list:
+    """Время выполнения func в секундах для каждого из repeat запусков."""
+    for _ in range(warmup):
+        func()
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - started)
+    return samples
+
+
+def summarize(samples) -> dict:
+    """Сводка по замерам в миллисекундах."""
+    return {
+        "mean_ms": statistics.fmean(samples) * 1000 if samples else 0.0,
+        "p50_ms": percentile(samples, 50) * 1000,
+        "p95_ms": percentile(samples, 95) * 1000,
+        "p99_ms": percentile(samples, 99) * 1000,
+    }
+
+
+def print_table(headers, rows):
+    """Печатает результаты в виде выровненной текстовой таблицы."""
+    rows = [
+        [f"{v:.3f}" if isinstance(v, float) else str(v) for v in row] for row in rows
+    ]
+    widths = [
+        max(len(str(h)), *(len(r[i]) for r in rows)) for i, h in enumerate(headers)
+    ]
+    print("  ".join(str(h).ljust(w) for h, w in zip(headers, widths)))
+    print("  ".join("-" * w for w in widths))
+    for row in rows:
+        print("  ".join(v.ljust(w) for v, w in zip(row, widths)))
@@ -0,0 +1,121 @@
+"""
+Неблокирующее логирование для продакшн-настроек.
+
+Запись в файлы и консоль выполняется фоновым потоком: обработчик
+AsyncQueueHandler только кладёт LogRecord в очередь, а форматирование сообщения
+и запись выполняют целевые обработчики в потоке QueueListener.
+"""
+
+import atexit
+import json
+import logging
+import os
+import threading
+from logging.handlers import QueueHandler, QueueListener
+from queue import Full, Queue
+
+# Атрибуты, которые есть у любого LogRecord; всё остальное пришло через extra.
+_RECORD_ATTRS = frozenset(
+    logging.LogRecord("", 0, "", 0, "", (), None).__dict__.keys()
+) | {"message", "asctime", "taskName"}
+
+
+def _get_handler(name: str) -> logging.Handler:
+    handler = logging._handlers.get(name)
+    if handler is None:
+        # dictConfig откладывает настройку обработчика с такой ошибкой и
+        # повторяет её после остальных обработчиков.
+        raise ValueError(f"Обработчик логов {name!r}: target not configured yet")
+    return handler
+
+
+class AsyncQueueHandler(QueueHandler):
+    """
+    QueueHandler с фоновым QueueListener, который запускается при первой записи.
+
+    В LOGGING указывается списком имён целевых обработчиков::
+
+        "queue": {
+            "class": "booking_app.log_handlers.AsyncQueueHandler",
+            "handlers": ["console", "info_file"],
+        }
+
+    Начиная с Python 3.12 dictConfig сам создаёт QueueListener для наследников
+    QueueHandler и передаёт его в атрибут listener; тогда используется он.
+
+    Очередь ограничена maxsize записями: при переполнении запись отбрасывается
+    (счётчик dropped), а поток запроса не блокируется.
+    """
+
+    def __init__(
+        self, queue=None, handlers=(), maxsize=10000, respect_handler_level=True
+    ):
+        super().__init__(queue if queue is not None else Queue(maxsize=maxsize))
+        # Ссылки на целевые обработчики нужно держать здесь: logging хранит
+        # обработчики, не привязанные к логгерам, только через слабые ссылки.
+        self.targets = [_get_handler(name) for name in handlers]
+        self.respect_handler_level = respect_handler_level
+        self.listener = None
+        self.dropped = 0
+        self._listener_pid = None
+        self._start_lock = threading.Lock()
+
+    def _start_listener(self):
+        with self._start_lock:
+            if self._listener_pid == os.getpid():
+                return
+            if self.listener is None or self._listener_pid is not None:
+                # Первый запуск или воркер после fork: поток слушателя нужно создать заново.
+                targets = self.targets or list(getattr(self.listener, "handlers", ()))
+                self.listener = QueueListener(
+                    self.queue,
+                    *targets,
+                    respect_handler_level=self.respect_handler_level,
+                )
+            self.listener.start()
+            atexit.register(self.stop)
+            self._listener_pid = os.getpid()
+
+    def stop(self):
+        """Дожидается записи накопленных сообщений и останавливает фоновый поток."""
+        with self._start_lock:
+            if self._listener_pid == os.getpid():
+                self.listener.stop()
+                self._listener_pid = None
+
+    def prepare(self, record):
+        # Сообщение не форматируется в потоке запроса: это сделают целевые
+        # обработчики в фоновом потоке. Поэтому в аргументы логов нельзя
+        # передавать объекты, которые изменятся после вызова.
+        return record
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except Full:
+            self.dropped += 1
+
+    def emit(self, record):
+        if self._listener_pid != os.getpid():
+            self._start_listener()
+        super().emit(record)
+
+
+class JsonFormatter(logging.Formatter):
+    """Форматирует запись в одну строку JSON вместе с полями, переданными через extra."""
+
+    def format(self, record):
+        payload = {
+            "time": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        payload.update(
+            (key, value)
+            for key, value in record.__dict__.items()
+            if key not in _RECORD_ATTRS
+        )
+        if record.exc_info:
+            payload["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(payload, ensure_ascii=False, default=str)
@@ -0,0 +1,26 @@
+"""
+Настройки для запуска под ASGI-сервером::
+
+    uvicorn booking_app.asgi:application --host 0.0.0.0 --port 8000 --workers 4
+
+Включают асинхронные версии read-эндпоинтов (ASYNC_VIEWS) и убирают синхронные
+middleware: если в цепочке есть middleware без поддержки async, Django обрабатывает
+каждый запрос в общем синхронном потоке, и асинхронные views теряют смысл.
+"""
+
+from .settings_prod import *
+
+ASYNC_VIEWS = {**ASYNC_VIEWS, "ENABLED": True}
+
+# WhiteNoise поддерживает только WSGI, в этом режиме статика из STATIC_ROOT
+# раздаётся прокси-сервером.
+MIDDLEWARE = [
+    middleware
+    for middleware in MIDDLEWARE
+    if middleware != "whitenoise.middleware.WhiteNoiseMiddleware"
+]
+
+# Под ASGI синхронный код запросов выполняется в разных потоках, и постоянные
+# соединения потоков не переиспользуются, а копятся. Пул соединений подходит.
+if DB_POOL_MODE == "persistent":
+    DATABASES["default"]["CONN_MAX_AGE"] = 0
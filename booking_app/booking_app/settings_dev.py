@@ -34,6 +34,9 @@ INSTALLED_APPS += ["debug_toolbar"]
 
 MIDDLEWARE += ["debug_toolbar.middleware.DebugToolbarMiddleware"]
 
+# В разработке Server-Timing добавляется к каждому ответу.
+REQUEST_TIMING = {**REQUEST_TIMING, "SAMPLE_RATE": 1.0}
+
 
 DEBUG_TOOLBAR_PANELS = [
     "debug_toolbar.panels.versions.VersionsPanel",
@@ -46,6 +46,8 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    "booking_app_api.utils.instrumentation.RequestTimingMiddleware",
+    "booking_app_api.utils.metrics.MetricsMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
@@ -90,6 +92,74 @@ DATABASES = {
     }
 }
 
+# Соединения с БД (DB_POOL_MODE):
+# "pool" — пул соединений psycopg 3 в каждом процессе;
+# "persistent" — постоянные соединения потоков (CONN_MAX_AGE) с проверкой перед запросом;
+# "none" — новое соединение на каждый запрос.
+DB_POOL_MODE = os.getenv("DB_POOL_MODE", "pool")
+# Размер пула процесса: бюджет соединений Postgres делится между воркерами
+# (WEB_CONCURRENCY выставляет gunicorn.conf.py).
+DB_POOL = {
+    "MIN_SIZE": int(os.getenv("DB_POOL_MIN_SIZE", "1")),
+    "MAX_SIZE": int(os.getenv("DB_POOL_MAX_SIZE", "0"))
+    or max(
+        2,
+        int(os.getenv("DB_MAX_CONNECTIONS", "90"))
+        // int(os.getenv("WEB_CONCURRENCY", "2")),
+    ),
+    # Сколько секунд запрос ждёт свободное соединение, прежде чем завершиться ошибкой.
+    "TIMEOUT": float(os.getenv("DB_POOL_TIMEOUT", "10")),
+}
+# Серверная привязка параметров: запрос, выполненный на соединении prepare_threshold
+# раз (поиск свободных комнат, список броней), psycopg выполняет как подготовленный
+# (PREPARE) и дальше не разбирает и не планирует заново. Имеет смысл только для
+# соединений, которые живут дольше одного запроса.
+PREPARED_STATEMENTS_OPTIONS = {"server_side_binding": True, "prepare_threshold": 5}
+
+if DB_POOL_MODE == "pool":
+    DATABASES["default"]["OPTIONS"] = {
+        "pool": {
+            "min_size": DB_POOL["MIN_SIZE"],
+            "max_size": DB_POOL["MAX_SIZE"],
+            "timeout": DB_POOL["TIMEOUT"],
+        },
+        **PREPARED_STATEMENTS_OPTIONS,
+    }
+    # С пулом проверка выполняется при выдаче соединения из пула.
+    DATABASES["default"]["CONN_HEALTH_CHECKS"] = True
+elif DB_POOL_MODE == "persistent":
+    DATABASES["default"]["CONN_MAX_AGE"] = 600
+    DATABASES["default"]["CONN_HEALTH_CHECKS"] = True
+    DATABASES["default"]["OPTIONS"] = PREPARED_STATEMENTS_OPTIONS
+
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    },
+    # Кэш ответов поиска свободных комнат и календаря. Записи свои в каждом воркере,
+    # а версии занятости, по которым они проверяются, общие (SEARCH_CACHE["VERSION_STORE"]).
+    # LocMemCache вытесняет давно не использованные записи (LRU) при превышении MAX_ENTRIES.
+    "search": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "search",
+        "TIMEOUT": 60,
+        "OPTIONS": {"MAX_ENTRIES": 2048},
+    },
+}
+
+SEARCH_CACHE = {
+    "ENABLED": True,
+    "ALIAS": "search",
+    # Запросы на периоды длиннее этого числа суток не кэшируются.
+    "MAX_DAYS": 62,
+    # Где хранятся версии занятости: "database" — таблица в PostgreSQL, общая для
+    # всех воркеров и процессов (в том числе команд manage.py); "cache" — кэш ALIAS,
+    # годится только если он сам общий (например, Redis).
+    "VERSION_STORE": "database",
+}
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
@@ -135,16 +205,39 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
 
 PASSWORD_HASHERS = [
-    "django.contrib.auth.hashers.Argon2PasswordHasher",
+    "booking_app_api.utils.passwords.TunedArgon2PasswordHasher",
     "django.contrib.auth.hashers.PBKDF2PasswordHasher",
     "django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher",
     "django.contrib.auth.hashers.BCryptSHA256PasswordHasher",
     "django.contrib.auth.hashers.ScryptPasswordHasher",
 ]
+# Хеширование паролей при регистрации.
+PASSWORD_HASHING = {
+    # Потоков, одновременно хеширующих пароли, в каждом процессе.
+    "MAX_WORKERS": int(os.getenv("PASSWORD_HASHING_WORKERS", "2")),
+    # Параметры Argon2 (по умолчанию как у Django); память — в КиБ.
+    "ARGON2_TIME_COST": int(os.getenv("ARGON2_TIME_COST", "2")),
+    "ARGON2_MEMORY_COST": int(os.getenv("ARGON2_MEMORY_COST", "102400")),
+    "ARGON2_PARALLELISM": int(os.getenv("ARGON2_PARALLELISM", "8")),
+}
 
 SIMPLE_JWT = {
     "ACCESS_TOKEN_LIFETIME": timedelta(minutes=120),
     "REFRESH_TOKEN_LIFETIME": timedelta(days=7),
+    "TOKEN_OBTAIN_SERIALIZER": "booking_app_api.utils.authentication.ClaimsTokenObtainPairSerializer",
+}
+# Кэши CachedJWTAuthentication.
+JWT_AUTH = {
+    # Число проверенных токенов в LRU каждого процесса.
+    "TOKEN_CACHE_SIZE": 4096,
+    # Кэш пользователей и время жизни записи. Записи могут быть свои в каждом воркере
+    # ("default" — LocMemCache): на каждый запрос версия пользователя сверяется
+    # с общей таблицей booking_app_api_jwt_user_version, поэтому блокировка
+    # (is_active) и смена пароля действуют во всех воркерах сразу.
+    "USER_CACHE_ALIAS": "default",
+    "USER_CACHE_TIMEOUT": 30,
+    # Чтение своих броней без загрузки пользователя (TokenUser из claims токена).
+    "STATELESS_READS": os.getenv("API_JWT_STATELESS_READS", "0") == "1",
 }
 REST_FRAMEWORK = {
     "DEFAULT_FILTER_BACKENDS": [
@@ -152,8 +245,21 @@ REST_FRAMEWORK = {
         "rest_framework.filters.OrderingFilter",
     ],
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
+    "DEFAULT_PAGINATION_CLASS": "booking_app_api.utils.KeysetCursorPagination",
+    "PAGE_SIZE": 50,
+    "DEFAULT_RENDERER_CLASSES": [
+        "booking_app_api.utils.renderers.ORJSONRenderer",
+        "booking_app_api.utils.renderers.MessagePackRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
+    "DEFAULT_PARSER_CLASSES": [
+        "booking_app_api.utils.renderers.ORJSONParser",
+        "booking_app_api.utils.renderers.MessagePackParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ],
     "DEFAULT_AUTHENTICATION_CLASSES": [
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "booking_app_api.utils.authentication.CachedJWTAuthentication",
     ],
     "DEFAULT_THROTTLE_RATES": {
         "user_registration": "100/day",
@@ -161,6 +267,16 @@ REST_FRAMEWORK = {
     },
 }
 
+# Хранилище состояния ограничений частоты запросов (GCRAThrottle; SharedRateThrottle
+# остался только для сравнения в benchmarks/bench_throttle.py).
+THROTTLE_STORE = {
+    # "database" — UNLOGGED-таблица в PostgreSQL, лимит общий для всех воркеров;
+    # "cache" — кэш по умолчанию (у LocMemCache свой в каждом воркере).
+    "BACKEND": "database",
+    # Доля запросов, после которых из таблицы удаляются истёкшие записи.
+    "PURGE_RATE": 0.01,
+}
+
 SPECTACULAR_SETTINGS = {
     "TITLE": "Booking App",
     "DESCRIPTION": "API for Booking App",
@@ -168,6 +284,125 @@ SPECTACULAR_SETTINGS = {
     "SERVE_INCLUDE_SCHEMA": False,
 }
 
+# Битовая карта занятости комнат в памяти воркера для поиска свободных комнат.
+# При выключенной карте поиск всегда выполняется SQL-запросом.
+AVAILABILITY_BITMAP = {
+    "ENABLED": os.getenv("AVAILABILITY_BITMAP", "0") == "1",
+    # Сколько суток до текущей даты и после неё покрывает карта.
+    "LOOKBACK_DAYS": 7,
+    "HORIZON_DAYS": 730,
+    # Максимальный возраст карты в секундах, после которого она перестраивается
+    # (изменения из других воркеров не приходят по сигналам).
+    "MAX_AGE": 300,
+    # Доля запросов, ответ на которые сверяется с SQL-запросом.
+    "CHECK_RATE": 0.01,
+}
+
+# Календарь занятости комнат (rooms/calendar/); кэшируется помесячно в SEARCH_CACHE.
+AVAILABILITY_CALENDAR = {
+    # Максимальное число месяцев в одном запросе.
+    "MAX_MONTHS": 12,
+}
+
+# Поиск ближайших свободных окон (rooms/earliest-slots/).
+EARLIEST_SLOTS = {
+    # Окна ищутся не дальше этого числа суток от даты начала поиска.
+    "HORIZON_DAYS": int(os.getenv("EARLIEST_SLOTS_HORIZON_DAYS", "180")),
+    # Максимальное число окон в ответе.
+    "MAX_LIMIT": 50,
+}
+
+# Гибкий поиск (search-free-rooms/flexible/): допуски сдвига дат и длины проживания в сутках.
+FLEXIBLE_SEARCH = {
+    "MAX_SHIFT_DAYS": 7,
+    "MAX_LENGTH_DAYS": 3,
+}
+
+# Отчёт о занятости и выручке (analytics/occupancy/), читается из BookingDailyRollup.
+BOOKING_ANALYTICS = {
+    # Максимальная длина периода отчёта в сутках.
+    "MAX_DAYS": 366,
+}
+
+# Списки объектов в админке.
+ADMIN_CHANGELIST = {
+    # С какого оценочного числа строк не выполнять точный COUNT(*) для пагинации.
+    "EXACT_COUNT_LIMIT": 10_000,
+}
+
+# Помесячные секции таблицы броней (команда manage_booking_partitions).
+BOOKING_PARTITIONS = {
+    # Наибольшая длина брони в сутках. Брони, пересекающиеся с промежутком, ищутся
+    # только в секциях, начинающихся не раньше чем за столько суток до него, поэтому
+    # более длинные брони API отклоняет (400), а БД — ошибкой booking_max_length.
+    # Пустое значение — длина не ограничена, но поиск читает все прошлые секции.
+    # В БД значение переносит manage_booking_partitions; уменьшить его не получится,
+    # пока в таблице есть более длинные брони.
+    "MAX_BOOKING_DAYS": (
+        int(os.getenv("BOOKING_PARTITIONS_MAX_BOOKING_DAYS", "90"))
+        if os.getenv("BOOKING_PARTITIONS_MAX_BOOKING_DAYS", "90")
+        else None
+    ),
+    # На сколько месяцев вперёд от текущего создаются секции.
+    "MONTHS_AHEAD": int(os.getenv("BOOKING_PARTITIONS_MONTHS_AHEAD", "12")),
+    # Сколько прошлых месяцев хранить в таблице броней; более старые секции
+    # отключаются. Пустое значение — хранить всё.
+    "RETENTION_MONTHS": (
+        int(os.getenv("BOOKING_PARTITIONS_RETENTION_MONTHS"))
+        if os.getenv("BOOKING_PARTITIONS_RETENTION_MONTHS")
+        else None
+    ),
+    # Схема, в которую переносятся отключённые секции.
+    "ARCHIVE_SCHEMA": os.getenv("BOOKING_PARTITIONS_ARCHIVE_SCHEMA", "booking_archive"),
+}
+
+# Вывод списков комнат и броней через values() без создания моделей и полей DRF
+# (см. booking_app_api.v1.serializers.FastSerializer).
+FAST_SERIALIZATION = {
+    "ENABLED": os.getenv("API_FAST_SERIALIZATION", "0") == "1",
+}
+
+# Асинхронные версии read-эндпоинтов (список и поиск комнат, брони пользователя)
+# для запуска под ASGI-сервером, см. settings_asgi.
+ASYNC_VIEWS = {
+    "ENABLED": os.getenv("API_ASYNC_VIEWS", "0") == "1",
+    # Сколько async-запросов воркер обрабатывает одновременно. Каждый запрос
+    # работает с БД в своём потоке и своём соединении, поэтому значение, умноженное
+    # на число воркеров, не должно превышать max_connections в PostgreSQL.
+    "MAX_CONCURRENT_REQUESTS": 20,
+}
+
+# Пакетное создание броней (user/booking/bulk-create/).
+BULK_BOOKING = {
+    "MAX_ITEMS": 100,
+}
+
+# Потоковая выгрузка броней (API и команда export_bookings).
+BOOKING_EXPORT = {
+    # Сколько строк за раз читается из серверного курсора.
+    "CHUNK_SIZE": 2000,
+}
+
+# Замер запросов (booking_app_api.utils.instrumentation.RequestTimingMiddleware).
+REQUEST_TIMING = {
+    "ENABLED": os.getenv("API_REQUEST_TIMING", "1") == "1",
+    # Доля запросов, для которых считаются SQL-запросы и время в БД и добавляется
+    # заголовок Server-Timing. Время остальных запросов только засекается.
+    "SAMPLE_RATE": float(os.getenv("API_REQUEST_TIMING_SAMPLE_RATE", "0.01")),
+    "SERVER_TIMING_HEADER": os.getenv("API_SERVER_TIMING_HEADER", "1") == "1",
+    # Запросы дольше порога (в миллисекундах) пишутся в лог.
+    "SLOW_REQUEST_MS": float(os.getenv("API_SLOW_REQUEST_MS", "500")),
+}
+
+# Метрики Prometheus (booking_app_api.utils.metrics, эндпоинт service/metrics/).
+# Под несколькими воркерами нужна переменная PROMETHEUS_MULTIPROC_DIR, её
+# выставляет gunicorn.conf.py.
+METRICS = {
+    "ENABLED": os.getenv("API_METRICS", "1") == "1",
+    # Токен для заголовка "Authorization: Bearer"; без него эндпоинт метрик отвечает 403.
+    "TOKEN": os.getenv("METRICS_TOKEN", ""),
+}
+
 LOG_DIR = BASE_DIR / "logs"
 LOG_DIR.mkdir(exist_ok=True)
 
@@ -183,6 +418,10 @@ LOGGING = {
             "format": "{levelname} {message}",
             "style": "{",
         },
+        # Одна строка JSON на запись, поля из extra попадают в неё как есть.
+        "json": {
+            "()": "booking_app.log_handlers.JsonFormatter",
+        },
     },
     "handlers": {
         "console": {
@@ -194,7 +433,7 @@ LOGGING = {
             "class": "logging.handlers.RotatingFileHandler",
             "filename": "/logs/info.log",
             "level": "INFO",
-            "formatter": "verbose",
+            "formatter": "json",
             "maxBytes": 1024 * 1024 * 5,
             "backupCount": 3,
         },
@@ -202,7 +441,7 @@ LOGGING = {
             "class": "logging.handlers.RotatingFileHandler",
             "filename": "/logs/error.log",
             "level": "ERROR",
-            "formatter": "verbose",
+            "formatter": "json",
             "maxBytes": 1024 * 1024 * 5,
             "backupCount": 3,
         },
@@ -210,18 +449,24 @@ LOGGING = {
             "class": "logging.handlers.RotatingFileHandler",
             "filename": "/logs/critical.log",
             "level": "CRITICAL",
-            "formatter": "verbose",
+            "formatter": "json",
             "maxBytes": 1024 * 1024 * 5,
             "backupCount": 3,
         },
+        # Логгеры пишут только в очередь; в консоль и файлы записи выводит
+        # фоновый поток, поэтому запрос не ждёт дискового ввода-вывода.
+        "queue": {
+            "class": "booking_app.log_handlers.AsyncQueueHandler",
+            "handlers": ["console", "info_file", "error_file", "critical_file"],
+        },
     },
     "root": {
-        "handlers": ["console", "info_file", "error_file"],
+        "handlers": ["queue"],
         "level": "INFO",
     },
     "loggers": {
         "django": {
-            "handlers": ["console", "info_file", "error_file", "critical_file"],
+            "handlers": ["queue"],
             "level": "INFO",
             "propagate": False,
         },
@@ -231,8 +476,8 @@ LOGGING = {
             "propagate": False,
         },
         "booking_app_api": {
-            "handlers": ["console", "info_file", "error_file", "critical_file"],
-            "level": "DEBUG",
+            "handlers": ["queue"],
+            "level": "DEBUG" if DEBUG else "INFO",
             "propagate": False,
         },
     },
@@ -20,6 +20,23 @@ EMAIL_BACKEND = "django.core.mail.backends.locmem.EmailBackend"
 
 # Дополнительные настройки для тестирования
 CACHE_BACKEND = "django.core.cache.backends.locmem.LocMemCache"
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    },
+    # Данные в БД сбрасываются между тестами без сигналов, поэтому ответы поиска не кэшируем.
+    "search": {
+        "BACKEND": "django.core.cache.backends.dummy.DummyCache",
+    },
+    # По той же причине (и из-за повторяющихся id) не кэшируем пользователей JWT.
+    "jwt_users": {
+        "BACKEND": "django.core.cache.backends.dummy.DummyCache",
+    },
+}
+JWT_AUTH = {**JWT_AUTH, "USER_CACHE_ALIAS": "jwt_users"}
+# Таблица ограничений не очищается между тестами, поэтому в тестах история
+# запросов хранится в LocMemCache.
+THROTTLE_STORE = {**THROTTLE_STORE, "BACKEND": "cache"}
 LOGGING = {
     "version": 1,
     "disable_existing_loggers": True,  # Отключение всех логеров
@@ -1,5 +1,7 @@
 from django.contrib import admin
 
+from .admin_tools import (AutocompleteFilter, DateDrillDownQuerySet,
+                          EstimatedCountPaginator, autocomplete_filter_media)
 from .models import Booking, Room
 
 
@@ -7,10 +9,35 @@ from .models import Booking, Room
 class RoomAdmin(admin.ModelAdmin):
     list_display = ("id", "name", "price_per_day", "capacity")
     list_filter = ("price_per_day", "capacity")
+    # Нужны автодополнению в фильтре броней по комнате.
+    search_fields = ("name",)
+    ordering = ("id",)
 
 
 @admin.register(Booking)
 class BookingAdmin(admin.ModelAdmin):
     list_display = ("id", "room", "user", "date_start", "date_end")
-    list_filter = ("room", "user", "date_start")
+    list_filter = (
+        ("room", AutocompleteFilter),
+        ("user", AutocompleteFilter),
+        "date_start",
+    )
     search_fields = ("room__name", "user__username")
+    list_select_related = ("room", "user")
+    # Переход по годам, месяцам и дням по индексу booking_date_start_idx.
+    date_hierarchy = "date_start"
+    # Число броней оценивается по статистике PostgreSQL, без COUNT(*) по всей таблице.
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    show_facets = admin.ShowFacets.NEVER
+
+    @property
+    def media(self):
+        return super().media + autocomplete_filter_media()
+
+    def get_queryset(self, request):
+        # Booking.__str__ читает комнату и пользователя (форма брони, удаление, история).
+        queryset = super().get_queryset(request).select_related("room", "user")
+        return DateDrillDownQuerySet(
+            self.model, query=queryset.query, using=queryset.db
+        )
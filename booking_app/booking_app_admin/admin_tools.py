@@ -0,0 +1,146 @@
+import json
+from datetime import datetime
+
+from django import forms
+from django.conf import settings
+from django.contrib import admin
+from django.contrib.admin.widgets import AutocompleteSelect
+from django.core.paginator import Paginator
+from django.db import connections
+from django.db.models import Min, QuerySet
+from django.utils import timezone
+from django.utils.functional import cached_property
+
+
+def estimate_count(queryset: QuerySet) -> int:
+    """Оценка числа строк запроса планировщиком PostgreSQL (EXPLAIN), без его выполнения."""
+    sql, params = queryset.order_by().query.sql_with_params()
+    with connections[queryset.db].cursor() as cursor:
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Пагинатор, который не считает большие выборки точно.
+
+    Если по оценке планировщика строк не меньше ADMIN_CHANGELIST["EXACT_COUNT_LIMIT"],
+    число строк берётся из оценки (по статистике, которую собирает ANALYZE),
+    иначе выполняется обычный COUNT(*).
+    """
+
+    @cached_property
+    def count(self):
+        if not isinstance(self.object_list, QuerySet):
+            return super().count
+        estimate = estimate_count(self.object_list)
+        if estimate < settings.ADMIN_CHANGELIST["EXACT_COUNT_LIMIT"]:
+            return super().count
+        return estimate
+
+
+class AutocompleteFilter(admin.RelatedFieldListFilter):
+    """
+    Фильтр по связанной модели с полем автодополнения вместо списка всех объектов.
+
+    Варианты подгружает автодополнение админки (у админки связанной модели должны
+    быть заданы search_fields), поэтому связанные объекты целиком не читаются.
+    Скрипты виджета подключает ModelAdmin через autocomplete_filter_media.
+    """
+
+    template = "admin/booking_app_admin/autocomplete_filter.html"
+
+    def __init__(self, field, request, params, model, model_admin, field_path):
+        # Очищенное поле автодополнения отправляет пустое значение: это «все».
+        lookup_kwarg = "%s__%s__exact" % (field_path, field.target_field.name)
+        if params.get(lookup_kwarg) == [""]:
+            del params[lookup_kwarg]
+        super().__init__(field, request, params, model, model_admin, field_path)
+        self.form_field = forms.ModelChoiceField(
+            queryset=field.remote_field.model._default_manager.all(),
+            to_field_name=field.target_field.name,
+            required=False,
+            widget=AutocompleteSelect(field, model_admin.admin_site),
+        )
+
+    def field_choices(self, field, request, model_admin):
+        return []
+
+    def has_output(self):
+        return True
+
+    def get_facet_counts(self, pk_attname, filtered_qs):
+        return {}
+
+    def choices(self, changelist):
+        value = self.lookup_val[-1] if self.lookup_val else None
+        yield {
+            "selected": value is None,
+            "query_string": changelist.get_query_string(
+                remove=[self.lookup_kwarg, self.lookup_kwarg_isnull]
+            ),
+            "display": self.form_field.widget.render(
+                self.lookup_kwarg,
+                value,
+                attrs={"id": f"filter_{self.lookup_kwarg}", "style": "width: 100%"},
+            ),
+            # Остальные параметры списка сохраняются скрытыми полями формы фильтра.
+            "params": [
+                (name, param)
+                for name, param in changelist.params.items()
+                if name not in (self.lookup_kwarg, self.lookup_kwarg_isnull)
+            ],
+        }
+
+
+def autocomplete_filter_media() -> forms.Media:
+    """Скрипты и стили виджета AutocompleteSelect для страницы списка."""
+    return AutocompleteSelect(None, admin.site).media
+
+
+class DateDrillDownQuerySet(QuerySet):
+    """
+    QuerySet для date_hierarchy, который находит годы, месяцы и дни по индексу.
+
+    Стандартный datetimes() выполняет DISTINCT по усечённым датам всей выборки.
+    Здесь каждое следующее значение — MIN(поле) не раньше конца предыдущего
+    периода, то есть по одному короткому проходу по индексу на период.
+    """
+
+    SKIP_SCAN_KINDS = ("year", "month", "day")
+
+    def datetimes(self, field_name, kind, order="ASC", tzinfo=None):
+        if kind not in self.SKIP_SCAN_KINDS or order != "ASC" or not settings.USE_TZ:
+            return super().datetimes(field_name, kind, order, tzinfo)
+        tzinfo = tzinfo or timezone.get_current_timezone()
+
+        result = []
+        queryset = self.order_by()
+        while True:
+            first = queryset.aggregate(first=Min(field_name))["first"]
+            if first is None:
+                return result
+            start = _truncate(timezone.localtime(first, tzinfo), kind)
+            result.append(timezone.make_aware(start, tzinfo))
+            next_start = timezone.make_aware(_advance(start, kind), tzinfo)
+            queryset = self.order_by().filter(**{f"{field_name}__gte": next_start})
+
+
+def _truncate(value: datetime, kind: str) -> datetime:
+    if kind == "year":
+        return datetime(value.year, 1, 1)
+    if kind == "month":
+        return datetime(value.year, value.month, 1)
+    return datetime(value.year, value.month, value.day)
+
+
+def _advance(start: datetime, kind: str) -> datetime:
+    if kind == "year":
+        return start.replace(year=start.year + 1)
+    if kind == "month":
+        index = start.year * 12 + start.month
+        return datetime(index // 12, index % 12 + 1, 1)
+    return datetime.fromordinal(start.toordinal() + 1)
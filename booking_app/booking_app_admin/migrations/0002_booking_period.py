@@ -0,0 +1,50 @@
+# Generated by Django 5.2 on 2026-10-18 13:22
+
+import booking_app_admin.models
+import django.contrib.postgres.fields.ranges
+import django.contrib.postgres.indexes
+import django.contrib.postgres.operations
+import django.core.validators
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("booking_app_admin", "0001_initial"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        # GiST-индекс по (room_id, period) требует btree_gist для bigint.
+        django.contrib.postgres.operations.BtreeGistExtension(),
+        # Сгенерированная STORED-колонка заполняется для существующих строк самой БД.
+        migrations.AddField(
+            model_name="booking",
+            name="period",
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=booking_app_admin.models.TsTzRange(
+                    "date_start",
+                    "date_end",
+                    django.contrib.postgres.fields.ranges.RangeBoundary(),
+                ),
+                output_field=django.contrib.postgres.fields.ranges.DateTimeRangeField(),
+            ),
+        ),
+        migrations.AlterField(
+            model_name="room",
+            name="capacity",
+            field=models.IntegerField(
+                help_text="Количество человек на которое рассчитана комната",
+                validators=[django.core.validators.MinValueValidator(1)],
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="booking",
+            index=django.contrib.postgres.indexes.GistIndex(
+                fields=["room", "period"], name="booking_room_period_gist"
+            ),
+        ),
+    ]
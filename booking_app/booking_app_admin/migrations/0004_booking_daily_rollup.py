@@ -0,0 +1,62 @@
+# Generated by Django 5.2 on 2026-10-18 15:19
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("booking_app_admin", "0003_pagination_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="BookingDailyRollup",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("day", models.DateField()),
+                (
+                    "booked_hours",
+                    models.DecimalField(
+                        decimal_places=2,
+                        help_text="Занятые часы за сутки",
+                        max_digits=5,
+                    ),
+                ),
+                (
+                    "revenue",
+                    models.DecimalField(
+                        decimal_places=2,
+                        help_text="Выручка за сутки по текущей цене комнаты",
+                        max_digits=12,
+                    ),
+                ),
+                (
+                    "room",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="booking_app_admin.room",
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(fields=["day"], name="booking_rollup_day_idx")
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("room", "day"), name="booking_rollup_room_day_uniq"
+                    )
+                ],
+            },
+        ),
+    ]
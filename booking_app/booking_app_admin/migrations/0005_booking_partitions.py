@@ -0,0 +1,264 @@
+import datetime
+
+from django.conf import settings
+from django.db import migrations, models
+from django.utils import timezone
+
+# Таблица броней пересоздаётся как секционированная по date_start. Помесячные секции
+# на MONTHS_AHEAD месяцев вперёд создаются здесь же, до переноса строк; брони других
+# месяцев попадают в секцию по умолчанию. Дальше секции создаёт (и переносит в них
+# строки) команда manage_booking_partitions, которая запускается при развёртывании.
+#
+# Первичный ключ секционированной таблицы обязан включать ключ секционирования,
+# поэтому в БД он (id, date_start). EXCLUDE поверх секций PostgreSQL не поддерживает:
+# пересечения броней одной комнаты проверяет триггер, который берёт advisory lock
+# комнаты (иначе две транзакции могли бы вставить пересекающиеся брони в разные
+# секции) и завершается той же ошибкой, что и ограничение exclude_overlapping_booking.
+# Пересекающиеся брони ищутся только в секциях, которые могут их содержать: бронь не
+# длиннее настройки BOOKING_PARTITIONS["MAX_BOOKING_DAYS"]. Её значение хранится в
+# однострочной таблице booking_app_admin_booking_max_length (записывает миграция и
+# manage_booking_partitions), и тот же триггер отклоняет более длинные брони ошибкой
+# booking_max_length. NULL в таблице — длина не ограничена, поиск читает все секции.
+#
+# Ограничение exclude_overlapping_booking удаляется и из состояния миграций
+# (в Meta модели его больше нет), чтобы будущие миграции его не трогали.
+
+# Значения по умолчанию BOOKING_PARTITIONS на момент миграции.
+MAX_BOOKING_DAYS = 90
+MONTHS_AHEAD = 12
+
+PARTITION_SQL = """
+LOCK TABLE booking_app_admin_booking IN ACCESS EXCLUSIVE MODE;
+ALTER TABLE booking_app_admin_booking RENAME TO booking_app_admin_booking_old;
+ALTER TABLE booking_app_admin_booking_old ALTER COLUMN id DROP IDENTITY;
+ALTER TABLE booking_app_admin_booking_old DROP CONSTRAINT exclude_overlapping_booking;
+ALTER TABLE booking_app_admin_booking_old
+    RENAME CONSTRAINT booking_app_admin_booking_pkey TO booking_app_admin_booking_old_pkey;
+DROP INDEX booking_app_admin_booking_user_id_db031a61;
+DROP INDEX booking_app_admin_booking_room_id_0594ebe3;
+DROP INDEX booking_room_period_gist;
+DROP INDEX booking_user_start_id_idx;
+
+CREATE TABLE booking_app_admin_booking (
+    id bigint GENERATED BY DEFAULT AS IDENTITY,
+    date_start timestamp with time zone NOT NULL,
+    date_end timestamp with time zone NOT NULL,
+    user_id integer NOT NULL,
+    room_id bigint NOT NULL,
+    period tstzrange GENERATED ALWAYS AS (tstzrange(date_start, date_end, '[)')) STORED,
+    CONSTRAINT booking_app_admin_booking_pkey PRIMARY KEY (id, date_start),
+    CONSTRAINT booking_app_admin_booking_user_id_db031a61_fk_auth_user_id
+        FOREIGN KEY (user_id) REFERENCES auth_user (id) DEFERRABLE INITIALLY DEFERRED,
+    CONSTRAINT booking_app_admin_bo_room_id_0594ebe3_fk_booking_a
+        FOREIGN KEY (room_id) REFERENCES booking_app_admin_room (id)
+        DEFERRABLE INITIALLY DEFERRED
+) PARTITION BY RANGE (date_start);
+
+CREATE TABLE booking_app_admin_booking_default
+    PARTITION OF booking_app_admin_booking DEFAULT;
+
+CREATE TABLE booking_app_admin_booking_max_length (
+    id boolean PRIMARY KEY DEFAULT true CHECK (id),
+    days integer CHECK (days > 0)
+);
+"""
+
+COPY_SQL = """
+INSERT INTO booking_app_admin_booking (id, date_start, date_end, user_id, room_id)
+SELECT id, date_start, date_end, user_id, room_id FROM booking_app_admin_booking_old;
+SELECT setval(
+    pg_get_serial_sequence('booking_app_admin_booking', 'id'),
+    COALESCE((SELECT MAX(id) FROM booking_app_admin_booking), 0) + 1,
+    false
+);
+DROP TABLE booking_app_admin_booking_old;
+
+CREATE INDEX booking_app_admin_booking_user_id_db031a61
+    ON booking_app_admin_booking (user_id);
+CREATE INDEX booking_app_admin_booking_room_id_0594ebe3
+    ON booking_app_admin_booking (room_id);
+CREATE INDEX booking_room_period_gist
+    ON booking_app_admin_booking USING gist (room_id, period);
+CREATE INDEX booking_user_start_id_idx
+    ON booking_app_admin_booking (user_id, date_start, id);
+
+CREATE FUNCTION booking_app_admin_booking_exclude_overlapping() RETURNS trigger AS $$
+DECLARE
+    max_days integer;
+    start_from timestamp with time zone := '-infinity';
+BEGIN
+    IF NEW.date_start >= NEW.date_end THEN
+        RETURN NEW;
+    END IF;
+    PERFORM pg_advisory_xact_lock(
+        hashtext('exclude_overlapping_booking'), NEW.room_id::integer
+    );
+    SELECT days INTO max_days FROM booking_app_admin_booking_max_length;
+    IF max_days IS NOT NULL THEN
+        IF NEW.date_end > NEW.date_start + make_interval(hours => 24 * max_days) THEN
+            RAISE EXCEPTION
+                'new row for relation "booking_app_admin_booking" violates check constraint "booking_max_length"'
+                USING ERRCODE = 'check_violation',
+                      CONSTRAINT = 'booking_max_length',
+                      TABLE = 'booking_app_admin_booking',
+                      DETAIL = format('Booking is longer than %s days.', max_days);
+        END IF;
+        start_from := NEW.date_start - make_interval(hours => 24 * max_days);
+    END IF;
+    IF EXISTS (
+        SELECT 1 FROM booking_app_admin_booking AS booking
+        WHERE booking.room_id = NEW.room_id
+          AND booking.period && tstzrange(NEW.date_start, NEW.date_end, '[)')
+          AND booking.date_start < NEW.date_end
+          AND booking.date_start > start_from
+          AND booking.id <> NEW.id
+    ) THEN
+        RAISE EXCEPTION
+            'conflicting key value violates exclusion constraint "exclude_overlapping_booking"'
+            USING ERRCODE = 'exclusion_violation',
+                  CONSTRAINT = 'exclude_overlapping_booking',
+                  TABLE = 'booking_app_admin_booking',
+                  DETAIL = format(
+                      'Key (room_id, period)=(%s, %s) conflicts with existing key.',
+                      NEW.room_id, tstzrange(NEW.date_start, NEW.date_end, '[)')
+                  );
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql VOLATILE;
+
+CREATE TRIGGER exclude_overlapping_booking
+    BEFORE INSERT OR UPDATE OF room_id, date_start, date_end
+    ON booking_app_admin_booking
+    FOR EACH ROW EXECUTE FUNCTION booking_app_admin_booking_exclude_overlapping();
+"""
+
+UNPARTITION_SQL = """
+LOCK TABLE booking_app_admin_booking IN ACCESS EXCLUSIVE MODE;
+ALTER TABLE booking_app_admin_booking RENAME TO booking_app_admin_booking_old;
+ALTER TABLE booking_app_admin_booking_old ALTER COLUMN id DROP IDENTITY;
+ALTER TABLE booking_app_admin_booking_old
+    RENAME CONSTRAINT booking_app_admin_booking_pkey TO booking_app_admin_booking_old_pkey;
+DROP TRIGGER exclude_overlapping_booking ON booking_app_admin_booking_old;
+DROP FUNCTION booking_app_admin_booking_exclude_overlapping();
+DROP TABLE booking_app_admin_booking_max_length;
+DROP INDEX booking_app_admin_booking_user_id_db031a61;
+DROP INDEX booking_app_admin_booking_room_id_0594ebe3;
+DROP INDEX booking_room_period_gist;
+DROP INDEX booking_user_start_id_idx;
+
+CREATE TABLE booking_app_admin_booking (
+    id bigint GENERATED BY DEFAULT AS IDENTITY,
+    date_start timestamp with time zone NOT NULL,
+    date_end timestamp with time zone NOT NULL,
+    user_id integer NOT NULL,
+    room_id bigint NOT NULL,
+    period tstzrange GENERATED ALWAYS AS (tstzrange(date_start, date_end, '[)')) STORED,
+    CONSTRAINT booking_app_admin_booking_pkey PRIMARY KEY (id),
+    CONSTRAINT booking_app_admin_booking_user_id_db031a61_fk_auth_user_id
+        FOREIGN KEY (user_id) REFERENCES auth_user (id) DEFERRABLE INITIALLY DEFERRED,
+    CONSTRAINT booking_app_admin_bo_room_id_0594ebe3_fk_booking_a
+        FOREIGN KEY (room_id) REFERENCES booking_app_admin_room (id)
+        DEFERRABLE INITIALLY DEFERRED,
+    CONSTRAINT exclude_overlapping_booking EXCLUDE USING gist (
+        tstzrange(date_start, date_end, '[)') WITH &&, room_id WITH =
+    )
+);
+
+INSERT INTO booking_app_admin_booking (id, date_start, date_end, user_id, room_id)
+SELECT id, date_start, date_end, user_id, room_id FROM booking_app_admin_booking_old;
+SELECT setval(
+    pg_get_serial_sequence('booking_app_admin_booking', 'id'),
+    COALESCE((SELECT MAX(id) FROM booking_app_admin_booking), 0) + 1,
+    false
+);
+DROP TABLE booking_app_admin_booking_old;
+
+CREATE INDEX booking_app_admin_booking_user_id_db031a61
+    ON booking_app_admin_booking (user_id);
+CREATE INDEX booking_app_admin_booking_room_id_0594ebe3
+    ON booking_app_admin_booking (room_id);
+CREATE INDEX booking_room_period_gist
+    ON booking_app_admin_booking USING gist (room_id, period);
+CREATE INDEX booking_user_start_id_idx
+    ON booking_app_admin_booking (user_id, date_start, id);
+"""
+
+
+def booking_partitions_setting(key, default):
+    return getattr(settings, "BOOKING_PARTITIONS", {}).get(key, default)
+
+
+def check_booking_length(apps, schema_editor):
+    """
+    Останавливает миграцию до пересоздания таблицы, если есть брони длиннее
+    MAX_BOOKING_DAYS: триггер не нашёл бы пересечений с ними.
+    """
+    max_days = booking_partitions_setting("MAX_BOOKING_DAYS", MAX_BOOKING_DAYS)
+    if max_days is None:
+        return
+    Booking = apps.get_model("booking_app_admin", "Booking")
+    too_long = Booking.objects.using(schema_editor.connection.alias).filter(
+        date_end__gt=models.F("date_start") + datetime.timedelta(days=max_days)
+    )
+    count = too_long.count()
+    if count:
+        ids = list(too_long.order_by("id").values_list("id", flat=True)[:20])
+        raise RuntimeError(
+            f"Броней длиннее {max_days} суток: {count} (id: {ids}). Сократите или "
+            "разбейте их на несколько броней либо увеличьте "
+            'BOOKING_PARTITIONS["MAX_BOOKING_DAYS"] и повторите миграцию.'
+        )
+
+
+def create_partitions(apps, schema_editor):
+    """
+    Создаёт пустые помесячные секции с текущего месяца на MONTHS_AHEAD месяцев вперёд
+    и записывает MAX_BOOKING_DAYS в booking_app_admin_booking_max_length.
+    """
+    months_ahead = booking_partitions_setting("MONTHS_AHEAD", MONTHS_AHEAD)
+    max_days = booking_partitions_setting("MAX_BOOKING_DAYS", MAX_BOOKING_DAYS)
+    month = timezone.localdate().replace(day=1)
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(
+            "INSERT INTO booking_app_admin_booking_max_length (days) VALUES (%s)",
+            [max_days],
+        )
+        for _ in range(months_ahead + 1):
+            following = (month + datetime.timedelta(days=31)).replace(day=1)
+            lower, upper = (
+                timezone.make_aware(datetime.datetime.combine(day, datetime.time()))
+                for day in (month, following)
+            )
+            schema_editor.execute(
+                f"CREATE TABLE booking_app_admin_booking_p{month:%Y_%m} "
+                "PARTITION OF booking_app_admin_booking "
+                f"FOR VALUES FROM ('{lower.isoformat()}') TO ('{upper.isoformat()}')"
+            )
+            # Статистика пустой секции, иначе планировщик оценивает её в сотни строк.
+            schema_editor.execute(f"ANALYZE booking_app_admin_booking_p{month:%Y_%m}")
+            month = following
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("booking_app_admin", "0004_booking_daily_rollup"),
+    ]
+
+    operations = [
+        migrations.RunPython(check_booking_length, migrations.RunPython.noop),
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunSQL(PARTITION_SQL, reverse_sql=migrations.RunSQL.noop),
+                migrations.RunPython(create_partitions, migrations.RunPython.noop),
+                migrations.RunSQL(COPY_SQL, reverse_sql=UNPARTITION_SQL),
+            ],
+            state_operations=[
+                migrations.RemoveConstraint(
+                    model_name="booking",
+                    name="exclude_overlapping_booking",
+                ),
+            ],
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2 on 2026-10-18 15:43
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("booking_app_admin", "0005_booking_partitions"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="booking",
+            index=models.Index(fields=["date_start"], name="booking_date_start_idx"),
+        ),
+    ]
@@ -1,14 +1,30 @@
+from datetime import timedelta
 from decimal import Decimal
 
+from django.conf import settings
 from django.contrib.auth.models import User
 from django.contrib.postgres.constraints import ExclusionConstraint
 from django.contrib.postgres.fields import (DateTimeRangeField, RangeBoundary,
                                             RangeOperators)
+from django.contrib.postgres.indexes import GistIndex
+from django.core.exceptions import ValidationError
 from django.core.validators import MinValueValidator
-from django.db import models
+from django.db import models, router
 from django.db.models import Func
 
 
+def max_booking_days():
+    """
+    Наибольшая длина брони в сутках (BOOKING_PARTITIONS["MAX_BOOKING_DAYS"]) или None.
+
+    Брони, пересекающиеся с промежутком, ищутся только в секциях таблицы броней,
+    начинающихся не раньше чем за столько суток до него. В БД это значение хранит
+    таблица booking_app_admin_booking_max_length (см. миграцию 0005_booking_partitions),
+    его туда переносит команда manage_booking_partitions.
+    """
+    return settings.BOOKING_PARTITIONS["MAX_BOOKING_DAYS"]
+
+
 class Room(models.Model):
     name = models.CharField(
         max_length=100, help_text="Название/номер комнаты", unique=True, blank=False
@@ -26,13 +42,20 @@ class Room(models.Model):
         validators=[MinValueValidator(1)],
     )
 
+    class Meta:
+        # Индексы под курсорную пагинацию каталога с сортировкой по цене и вместимости.
+        indexes = [
+            models.Index(fields=["price_per_day", "id"], name="room_price_id_idx"),
+            models.Index(fields=["capacity", "id"], name="room_capacity_id_idx"),
+        ]
+
     def __str__(self):
         return self.name
 
 
 class TsTzRange(Func):
     function = "TSTZRANGE"
-    outpput_field = DateTimeRangeField()
+    output_field = DateTimeRangeField()
 
 
 class Booking(models.Model):
@@ -40,20 +63,105 @@ class Booking(models.Model):
     date_end = models.DateTimeField()
     room = models.ForeignKey(Room, on_delete=models.CASCADE)
     user = models.ForeignKey(User, on_delete=models.CASCADE)
+    # Период брони [date_start, date_end), вычисляется и хранится самой БД.
+    period = models.GeneratedField(
+        expression=TsTzRange("date_start", "date_end", RangeBoundary()),
+        output_field=DateTimeRangeField(),
+        db_persist=True,
+    )
+
+    class Meta:
+        # Таблица секционирована по date_start (см. миграцию 0005_booking_partitions).
+        # PostgreSQL не поддерживает EXCLUDE поверх секций, поэтому в БД
+        # exclude_overlapping_booking проверяет триггер, а не ограничение; в Meta его
+        # нет, иначе makemigrations создавал бы операции с несуществующим ограничением.
+        # Тот же триггер проверяет длину брони (max_booking_days).
+        indexes = [
+            GistIndex(fields=["room", "period"], name="booking_room_period_gist"),
+            # Курсорная пагинация броней пользователя в порядке (date_start, id).
+            models.Index(
+                fields=["user", "date_start", "id"], name="booking_user_start_id_idx"
+            ),
+            # Фильтры и date_hierarchy админки по date_start.
+            models.Index(fields=["date_start"], name="booking_date_start_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.user.username} – {self.room.name} – {self.date_start:%Y-%m-%d}"
+
+    def validate_constraints(self, exclude=None):
+        # Пересечения и длина брони при проверке модели (админка) проверяются так же,
+        # как раньше ограничениями в Meta; при сохранении их проверяет триггер.
+        errors = {}
+        try:
+            super().validate_constraints(exclude=exclude)
+        except ValidationError as error:
+            errors = error.update_error_dict(errors)
+        max_days = max_booking_days()
+        if (
+            max_days is not None
+            and not {"date_start", "date_end"} & set(exclude or ())
+            and self.date_start is not None
+            and self.date_end is not None
+            and self.date_end - self.date_start > timedelta(days=max_days)
+        ):
+            errors = ValidationError(
+                f"Бронь не может быть длиннее {max_days} суток.",
+                code="booking_max_length",
+            ).update_error_dict(errors)
+        try:
+            EXCLUDE_OVERLAPPING_BOOKING.validate(
+                type(self),
+                self,
+                exclude=exclude,
+                using=router.db_for_write(type(self), instance=self),
+            )
+        except ValidationError as error:
+            errors = error.update_error_dict(errors)
+        if errors:
+            raise ValidationError(errors)
+
+
+# Ограничение только для проверки моделей, в БД его заменяет триггер (см. Booking.Meta).
+EXCLUDE_OVERLAPPING_BOOKING = ExclusionConstraint(
+    name="exclude_overlapping_booking",
+    expressions=[
+        (
+            TsTzRange("date_start", "date_end", RangeBoundary()),
+            RangeOperators.OVERLAPS,
+        ),
+        ("room", RangeOperators.EQUAL),
+    ],
+)
+
+
+class BookingDailyRollup(models.Model):
+    """
+    Занятость и выручка комнаты за одни сутки (в часовом поясе TIME_ZONE).
+
+    Таблица производная от Booking: строки пересчитываются при изменении броней
+    (см. booking_app_api.utils.analytics) и целиком командой rebuild_booking_rollup.
+    Сутки без броней не хранятся.
+    """
+
+    room = models.ForeignKey(Room, on_delete=models.CASCADE)
+    day = models.DateField()
+    booked_hours = models.DecimalField(
+        max_digits=5, decimal_places=2, help_text="Занятые часы за сутки"
+    )
+    revenue = models.DecimalField(
+        max_digits=12,
+        decimal_places=2,
+        help_text="Выручка за сутки по текущей цене комнаты",
+    )
 
     class Meta:
         constraints = [
-            ExclusionConstraint(
-                name="exclude_overlapping_booking",
-                expressions=[
-                    (
-                        TsTzRange("date_start", "date_end", RangeBoundary()),
-                        RangeOperators.OVERLAPS,
-                    ),
-                    ("room", RangeOperators.EQUAL),
-                ],
+            models.UniqueConstraint(
+                fields=["room", "day"], name="booking_rollup_room_day_uniq"
             )
         ]
+        indexes = [models.Index(fields=["day"], name="booking_rollup_day_idx")]
 
     def __str__(self):
-        return f"{self.user.username} – {self.room.name} – {self.date_start:%Y-%m-%d}"
+        return f"{self.room_id} – {self.day:%Y-%m-%d}"
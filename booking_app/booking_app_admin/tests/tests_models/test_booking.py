@@ -23,6 +23,18 @@ class BookingModelTest(TestCase):
         self.assertEqual(booking.date_start, start)
         self.assertEqual(booking.date_end, end)
 
+    def test_booking_period_is_generated(self):
+        start = timezone.now()
+        end = start + timezone.timedelta(days=2)
+        booking = Booking.objects.create(
+            room=self.room, user=self.user, date_start=start, date_end=end
+        )
+        booking.refresh_from_db()
+        self.assertEqual(booking.period.lower, start)
+        self.assertEqual(booking.period.upper, end)
+        self.assertTrue(booking.period.lower_inc)
+        self.assertFalse(booking.period.upper_inc)
+
     def test_cannot_create_overlapping_booking(self):
 
         start = timezone.now()
@@ -0,0 +1,64 @@
+from booking_app_api.utils.export import (EXPORT_FORMATS, booking_rows,
+                                          export_queryset)
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+
+def _parse_datetime(value):
+    parsed = parse_datetime(value)
+    if parsed is None:
+        raise CommandError(f"Неверный формат даты: {value}")
+    if timezone.is_naive(parsed):
+        parsed = timezone.make_aware(parsed)
+    return parsed
+
+
+class Command(BaseCommand):
+    help = (
+        "Потоковая выгрузка броней вместе с комнатой и пользователем в NDJSON или CSV. "
+        "Брони читаются серверным курсором, память не зависит от размера таблицы."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--format",
+            dest="export_format",
+            choices=sorted(EXPORT_FORMATS),
+            default="ndjson",
+        )
+        parser.add_argument(
+            "--date-start",
+            type=_parse_datetime,
+            help="выгружать брони, которые заканчиваются после этой даты",
+        )
+        parser.add_argument(
+            "--date-end",
+            type=_parse_datetime,
+            help="выгружать брони, которые начинаются до этой даты",
+        )
+        parser.add_argument("--room", type=int, help="id комнаты")
+        parser.add_argument(
+            "--output", "-o", help="файл для выгрузки, по умолчанию stdout"
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            help="сколько строк за раз читать из курсора (BOOKING_EXPORT)",
+        )
+
+    def handle(self, *args, **options):
+        _, render = EXPORT_FORMATS[options["export_format"]]
+        queryset = export_queryset(
+            date_start=options["date_start"],
+            date_end=options["date_end"],
+            room=options["room"],
+        )
+        chunks = render(booking_rows(queryset, chunk_size=options["chunk_size"]))
+
+        if options["output"]:
+            with open(options["output"], "w", encoding="utf-8", newline="") as output:
+                output.writelines(chunks)
+        else:
+            for chunk in chunks:
+                self.stdout.write(chunk, ending="")
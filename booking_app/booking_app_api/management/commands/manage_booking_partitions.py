@@ -0,0 +1,104 @@
+import argparse
+import re
+
+from booking_app_api.utils.db import (default_months, detach_partition,
+                                      detachable_months, ensure_partitions,
+                                      list_partitions, shift_month,
+                                      sync_max_booking_days)
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+
+def _schema(value):
+    if not re.fullmatch(r"[a-z_][a-z0-9_]*", value):
+        raise argparse.ArgumentTypeError(
+            "Имя схемы: строчные латинские буквы, цифры и подчёркивания"
+        )
+    return value
+
+
+def _days(value):
+    return "без ограничения" if value is None else f"{value} суток"
+
+
+class Command(BaseCommand):
+    help = (
+        "Обслуживает помесячные секции таблицы броней: переносит в БД "
+        'BOOKING_PARTITIONS["MAX_BOOKING_DAYS"], создаёт секции на --months-ahead '
+        "месяцев вперёд, с --backfill переносит брони из секции по умолчанию в "
+        "помесячные секции, с --retention-months отключает старые секции "
+        "(переносит в архивную схему или, с --drop, удаляет)."
+    )
+
+    def add_arguments(self, parser):
+        config = settings.BOOKING_PARTITIONS
+        parser.add_argument(
+            "--months-ahead",
+            type=int,
+            default=config["MONTHS_AHEAD"],
+            help="на сколько месяцев вперёд создавать секции",
+        )
+        parser.add_argument(
+            "--backfill",
+            action="store_true",
+            help="создать секции для всех месяцев, брони которых лежат в секции по умолчанию",
+        )
+        parser.add_argument(
+            "--retention-months",
+            type=int,
+            default=config["RETENTION_MONTHS"],
+            help="сколько прошлых месяцев хранить; более старые секции отключаются",
+        )
+        parser.add_argument(
+            "--archive-schema",
+            type=_schema,
+            default=config["ARCHIVE_SCHEMA"],
+            help="схема для отключённых секций",
+        )
+        parser.add_argument(
+            "--drop",
+            action="store_true",
+            help="удалять отключённые секции вместо переноса в архивную схему",
+        )
+
+    def handle(self, *args, **options):
+        if options["months_ahead"] < 0:
+            raise CommandError("--months-ahead не может быть отрицательным")
+        retention = options["retention_months"]
+        if retention is not None and retention < 1:
+            raise CommandError("--retention-months должна быть не меньше 1")
+
+        try:
+            previous, max_days = sync_max_booking_days()
+        except ValueError as error:
+            raise CommandError(str(error))
+        if previous != max_days:
+            self.stdout.write(
+                f"Наибольшая длина брони: {_days(previous)} -> {_days(max_days)}"
+            )
+
+        current = timezone.localdate().replace(day=1)
+        created = ensure_partitions(
+            current, shift_month(current, options["months_ahead"])
+        )
+        if options["backfill"]:
+            for month in default_months():
+                created.extend(ensure_partitions(month, month))
+        for month, moved in created:
+            self.stdout.write(
+                f"Создана секция {month:%Y-%m}, перенесено броней: {moved}"
+            )
+
+        if retention is not None:
+            archive_schema = None if options["drop"] else options["archive_schema"]
+            for month in detachable_months(shift_month(current, -retention)):
+                detach_partition(month, archive_schema)
+                where = (
+                    f"перенесена в {archive_schema}" if archive_schema else "удалена"
+                )
+                self.stdout.write(f"Секция {month:%Y-%m} отключена и {where}")
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Готово, секций: {len(list_partitions())}")
+        )
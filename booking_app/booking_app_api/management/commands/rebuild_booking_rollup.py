@@ -0,0 +1,44 @@
+import argparse
+
+from booking_app_admin.models import BookingDailyRollup
+from booking_app_api.utils.analytics import rebuild_rollup, refresh_rollup
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.dateparse import parse_date
+
+
+def _date(value):
+    parsed = parse_date(value)
+    if parsed is None:
+        raise argparse.ArgumentTypeError(f"Неверный формат даты: {value}")
+    return parsed
+
+
+class Command(BaseCommand):
+    help = (
+        "Пересчитывает суточную статистику броней (BookingDailyRollup) по таблице броней: "
+        "целиком или за сутки [--start, --end) и для одной комнаты (--room)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--start", type=_date, help="Первые сутки (YYYY-MM-DD)")
+        parser.add_argument(
+            "--end", type=_date, help="Сутки после последних (YYYY-MM-DD)"
+        )
+        parser.add_argument("--room", type=int, help="id комнаты")
+
+    def handle(self, *args, **options):
+        start, end, room = options["start"], options["end"], options["room"]
+        if start is None and end is None and room is None:
+            rebuild_rollup()
+        else:
+            if start is None or end is None:
+                raise CommandError("Для частичного пересчёта укажите --start и --end")
+            if start >= end:
+                raise CommandError("--start должна быть раньше --end")
+            refresh_rollup(start, end, room)
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Готово, строк статистики: {BookingDailyRollup.objects.count()}"
+            )
+        )
@@ -0,0 +1,235 @@
+import argparse
+import itertools
+import re
+from datetime import date
+
+from booking_app_admin.models import (Booking, BookingDailyRollup, Room,
+                                      max_booking_days)
+from booking_app_api.utils.analytics import rebuild_rollup
+from booking_app_api.utils.cache import bump_global
+from booking_app_api.utils.seeding import (LENGTH_DISTRIBUTIONS, booking_rows,
+                                           copy_rows, room_rows, user_rows)
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.utils.dateparse import parse_date
+
+# Первый день броней по умолчанию: фиксированный, чтобы при одинаковых параметрах
+# данные совпадали в любой день запуска.
+DEFAULT_START = date(2026, 1, 1)
+
+BOOKING_COLUMNS = ("room_id", "user_id", "date_start", "date_end")
+ROOM_COLUMNS = ("name", "price_per_day", "capacity")
+USER_COLUMNS = (
+    "password",
+    "is_superuser",
+    "username",
+    "first_name",
+    "last_name",
+    "email",
+    "is_staff",
+    "is_active",
+    "date_joined",
+)
+
+
+def _prefix(value):
+    if not re.fullmatch(r"[a-z0-9][a-z0-9-]*", value):
+        raise argparse.ArgumentTypeError(
+            "Префикс может содержать только строчные латинские буквы, цифры и дефис"
+        )
+    return value
+
+
+def _fraction(value):
+    value = float(value)
+    if not 0 < value < 1:
+        raise argparse.ArgumentTypeError("Значение должно быть в интервале (0, 1)")
+    return value
+
+
+def _date(value):
+    parsed = parse_date(value)
+    if parsed is None:
+        raise argparse.ArgumentTypeError(f"Неверный формат даты: {value}")
+    return parsed
+
+
+class Command(BaseCommand):
+    help = (
+        "Заполняет базу синтетическими комнатами, пользователями и непересекающимися "
+        "бронями через COPY. Результат зависит только от параметров команды."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rooms", type=int, default=1000)
+        parser.add_argument("--users", type=int, default=10000)
+        parser.add_argument(
+            "--start",
+            type=_date,
+            default=DEFAULT_START,
+            help=f"первый день броней и дата регистрации пользователей, по умолчанию {DEFAULT_START}",
+        )
+        parser.add_argument("--days", type=int, default=365, help="горизонт в сутках")
+        parser.add_argument(
+            "--occupancy",
+            type=_fraction,
+            default=0.6,
+            help="средняя доля занятых суток комнаты",
+        )
+        parser.add_argument(
+            "--seasonality",
+            type=float,
+            default=0.3,
+            help="амплитуда годовых колебаний загрузки (доля от --occupancy)",
+        )
+        parser.add_argument(
+            "--peak-day",
+            type=int,
+            default=200,
+            help="день года с наибольшей загрузкой",
+        )
+        parser.add_argument(
+            "--length-distribution",
+            choices=sorted(LENGTH_DISTRIBUTIONS),
+            default="geometric",
+        )
+        parser.add_argument(
+            "--mean-length",
+            type=float,
+            default=3.0,
+            help="средняя длина брони в сутках",
+        )
+        parser.add_argument(
+            "--max-length",
+            type=int,
+            default=30,
+            help='наибольшая длина брони в сутках (не больше BOOKING_PARTITIONS["MAX_BOOKING_DAYS"])',
+        )
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument(
+            "--prefix",
+            type=_prefix,
+            default="seed",
+            help="префикс имён комнат и пользователей",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=50_000,
+            help="сколько броней загружать одной командой COPY",
+        )
+        parser.add_argument(
+            "--clear",
+            action="store_true",
+            help="сначала удалить данные, созданные ранее с тем же префиксом",
+        )
+
+    def handle(self, *args, **options):
+        if options["rooms"] < 1 or options["users"] < 1 or options["days"] < 1:
+            raise CommandError("--rooms, --users и --days должны быть больше нуля")
+        if options["mean_length"] < 1 or options["max_length"] < 1:
+            raise CommandError("--mean-length и --max-length должны быть не меньше 1")
+        max_days = max_booking_days()
+        if max_days is not None and options["max_length"] > max_days:
+            raise CommandError(f"--max-length должна быть не больше {max_days}")
+
+        prefix = options["prefix"]
+        rooms = Room.objects.filter(name__startswith=f"{prefix}-room-")
+        users = get_user_model().objects.filter(username__startswith=f"{prefix}-user-")
+        if options["clear"]:
+            self.clear(prefix)
+        elif rooms.exists() or users.exists():
+            raise CommandError(
+                f"Данные с префиксом {prefix} уже есть: укажите --clear или --prefix"
+            )
+
+        with transaction.atomic(), connection.cursor() as cursor:
+            copy_rows(
+                cursor,
+                get_user_model()._meta.db_table,
+                USER_COLUMNS,
+                user_rows(prefix, options["users"], options["seed"], options["start"]),
+            )
+            copy_rows(
+                cursor,
+                Room._meta.db_table,
+                ROOM_COLUMNS,
+                room_rows(prefix, options["rooms"], options["seed"]),
+            )
+        # Порядок id совпадает с порядком строк в COPY.
+        room_ids = list(rooms.order_by("pk").values_list("pk", flat=True))
+        user_ids = list(users.order_by("pk").values_list("pk", flat=True))
+        self.stdout.write(
+            f"Создано комнат: {len(room_ids)}, пользователей: {len(user_ids)}"
+        )
+
+        rows = booking_rows(
+            room_ids,
+            user_ids,
+            seed=options["seed"],
+            start=options["start"],
+            days=options["days"],
+            occupancy=options["occupancy"],
+            seasonality=options["seasonality"],
+            peak_day=options["peak_day"],
+            length_distribution=options["length_distribution"],
+            mean_length=options["mean_length"],
+            max_length=options["max_length"],
+        )
+        total = 0
+        while True:
+            batch = list(itertools.islice(rows, options["batch_size"]))
+            if not batch:
+                break
+            # Триггер exclude_overlapping_booking проверяет каждую строку COPY.
+            with transaction.atomic(), connection.cursor() as cursor:
+                total += copy_rows(
+                    cursor, Booking._meta.db_table, BOOKING_COLUMNS, batch
+                )
+            self.stdout.write(f"Загружено броней: {total}")
+
+        # Без свежей статистики планировщик считает таблицы почти пустыми.
+        with connection.cursor() as cursor:
+            for model in (get_user_model(), Room, Booking):
+                cursor.execute(f"ANALYZE {model._meta.db_table}")
+        # COPY не отправляет сигналы, поэтому кэш поиска сбрасывается целиком,
+        # а суточная статистика перестраивается. Версии в БД видят все воркеры;
+        # версии в кэше процесса до воркеров из этой команды не доходят.
+        bump_global()
+        if settings.SEARCH_CACHE["VERSION_STORE"] != "database":
+            self.stdout.write(
+                self.style.WARNING(
+                    "Версии кэша поиска хранятся не в БД: перезапустите воркеры, "
+                    "чтобы они не отдавали устаревшие ответы"
+                )
+            )
+        rebuild_rollup()
+        self.stdout.write(self.style.SUCCESS(f"Готово, броней: {total}"))
+
+    def clear(self, prefix):
+        """Удаляет данные прошлого запуска SQL-запросами, не загружая объекты в память."""
+        created = [
+            ("room_id", Room._meta.db_table, "name", f"{prefix}-room-%"),
+            (
+                "user_id",
+                get_user_model()._meta.db_table,
+                "username",
+                f"{prefix}-user-%",
+            ),
+        ]
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(
+                f"DELETE FROM {BookingDailyRollup._meta.db_table} WHERE room_id IN "
+                f"(SELECT id FROM {Room._meta.db_table} WHERE name LIKE %s)",
+                [f"{prefix}-room-%"],
+            )
+            for foreign_key, table, column, pattern in created:
+                cursor.execute(
+                    f"DELETE FROM {Booking._meta.db_table} WHERE {foreign_key} IN "
+                    f"(SELECT id FROM {table} WHERE {column} LIKE %s)",
+                    [pattern],
+                )
+            for _, table, column, pattern in created:
+                cursor.execute(f"DELETE FROM {table} WHERE {column} LIKE %s", [pattern])
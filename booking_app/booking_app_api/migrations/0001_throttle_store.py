@@ -0,0 +1,30 @@
+# Generated by Django 5.2 on 2026-10-18 16:05
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        # Хранилище истории запросов для SharedRateThrottle. Таблица UNLOGGED: записи
+        # не пишутся в WAL и теряются при аварийном перезапуске PostgreSQL, что для
+        # ограничения частоты запросов допустимо. С переходом эндпоинтов на GCRAThrottle
+        # таблицей пользуется только бенчмарк benchmarks/bench_throttle.py.
+        migrations.RunSQL(
+            sql="""
+                CREATE UNLOGGED TABLE booking_app_api_throttle (
+                    key varchar(255) PRIMARY KEY,
+                    history double precision[] NOT NULL,
+                    allowed boolean NOT NULL,
+                    expires_at double precision NOT NULL
+                );
+                CREATE INDEX booking_app_api_throttle_expires_idx
+                    ON booking_app_api_throttle (expires_at);
+            """,
+            reverse_sql="DROP TABLE booking_app_api_throttle;",
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.2 on 2026-10-18 17:20
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("booking_app_api", "0001_throttle_store"),
+    ]
+
+    operations = [
+        # Состояние GCRAThrottle: одно время TAT на ключ. Запись не нужна, как только
+        # TAT оказывается в прошлом, поэтому по tat же удаляются устаревшие строки.
+        migrations.RunSQL(
+            sql="""
+                CREATE UNLOGGED TABLE booking_app_api_throttle_gcra (
+                    key varchar(255) PRIMARY KEY,
+                    tat double precision NOT NULL,
+                    allowed boolean NOT NULL
+                );
+                CREATE INDEX booking_app_api_throttle_gcra_tat_idx
+                    ON booking_app_api_throttle_gcra (tat);
+            """,
+            reverse_sql="DROP TABLE booking_app_api_throttle_gcra;",
+        ),
+    ]
@@ -0,0 +1,65 @@
+from django.db import migrations
+from django.db.models import Count
+from django.db.models.functions import Upper
+
+# Уникальность email без учёта регистра для RegistrationSerializer, который
+# не проверяет email запросом перед INSERT. Пустой email (createsuperuser)
+# допускается у нескольких пользователей.
+#
+# Индекс строится с CONCURRENTLY, чтобы не блокировать запись в auth_user на
+# время построения, поэтому миграция не атомарная. Если построение прервалось,
+# PostgreSQL оставляет невалидный индекс; он удаляется перед повторной попыткой.
+
+
+def check_duplicate_emails(apps, schema_editor):
+    """
+    Останавливает миграцию, если в auth_user есть адреса, отличающиеся только
+    регистром: с ними уникальный индекс не построится.
+    """
+    User = apps.get_model("auth", "User")
+    duplicates = list(
+        User.objects.using(schema_editor.connection.alias)
+        .exclude(email="")
+        .values(key=Upper("email"))
+        .annotate(count=Count("id"))
+        .filter(count__gt=1)
+        .order_by("key")
+        .values_list("key", flat=True)
+    )
+    if duplicates:
+        users = (
+            User.objects.using(schema_editor.connection.alias)
+            .annotate(key=Upper("email"))
+            .filter(key__in=duplicates[:20])
+            .order_by("key", "id")
+            .values_list("id", "email")
+        )
+        raise RuntimeError(
+            f"Адреса, совпадающие без учёта регистра: {len(duplicates)} "
+            f"(id и email: {list(users)}). Измените email у лишних пользователей "
+            "и повторите миграцию."
+        )
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ("booking_app_api", "0002_throttle_gcra"),
+        ("auth", "0012_alter_user_first_name_max_length"),
+    ]
+
+    operations = [
+        migrations.RunPython(check_duplicate_emails, migrations.RunPython.noop),
+        migrations.RunSQL(
+            sql=[
+                "DROP INDEX CONCURRENTLY IF EXISTS auth_user_email_upper_uniq;",
+                """
+                CREATE UNIQUE INDEX CONCURRENTLY auth_user_email_upper_uniq
+                    ON auth_user (UPPER(email)) WHERE email <> '';
+                """,
+            ],
+            reverse_sql="DROP INDEX CONCURRENTLY IF EXISTS auth_user_email_upper_uniq;",
+        ),
+    ]
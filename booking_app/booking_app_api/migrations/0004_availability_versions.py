@@ -0,0 +1,25 @@
+from django.db import migrations
+
+# Миграция написана вручную: у таблицы нет модели, DatabaseVersionStore работает
+# с ней SQL-запросами (INSERT ... ON CONFLICT), как хранилища ограничений запросов.
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("booking_app_api", "0003_auth_user_email_upper"),
+    ]
+
+    operations = [
+        # Версии занятости для кэшей поиска и календаря, общие для всех воркеров
+        # (см. utils.cache.availability_versions.DatabaseVersionStore).
+        migrations.RunSQL(
+            sql="""
+                CREATE TABLE booking_app_api_availability_version (
+                    key varchar(64) PRIMARY KEY,
+                    version bigint NOT NULL
+                );
+            """,
+            reverse_sql="DROP TABLE booking_app_api_availability_version;",
+        ),
+    ]
@@ -0,0 +1,26 @@
+from django.db import migrations
+
+# Миграция написана вручную: у таблицы нет модели, CachedJWTAuthentication работает
+# с ней SQL-запросами, как DatabaseVersionStore с версиями занятости.
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("booking_app_api", "0004_availability_versions"),
+    ]
+
+    operations = [
+        # Версии пользователей для кэша CachedJWTAuthentication, общие для всех
+        # воркеров (см. utils.authentication.cached_jwt). Внешнего ключа нет: при
+        # удалении пользователя версия тоже повышается, и строка должна остаться.
+        migrations.RunSQL(
+            sql="""
+                CREATE TABLE booking_app_api_jwt_user_version (
+                    user_id integer PRIMARY KEY,
+                    version bigint NOT NULL
+                );
+            """,
+            reverse_sql="DROP TABLE booking_app_api_jwt_user_version;",
+        ),
+    ]
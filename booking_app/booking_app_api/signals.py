@@ -0,0 +1,129 @@
+from booking_app_admin.models import Booking, Room
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import Signal, receiver
+
+from .utils.analytics import refresh_booking, refresh_bookings, refresh_room
+from .utils.authentication import invalidate_user_cache
+from .utils.cache import bump_global, bump_period, bump_periods
+from .utils.filters.availability_bitmap import (bitmap_enabled,
+                                                get_availability_bitmap)
+
+# Отправляется после Booking.objects.bulk_create (пакетное создание броней) вместо
+# post_save для каждой брони: статистика и версии кэша обновляются один раз на пакет.
+# Аргументы: sender=Booking, bookings — список созданных броней.
+bookings_created = Signal()
+
+
+@receiver(pre_save, sender=Booking)
+def booking_saving(sender, instance, raw, **kwargs):
+    # Для пересчёта суточной статистики и сброса кэша поиска нужны прежние
+    # комната и даты брони.
+    instance._previous_period = None
+    if not instance._state.adding and not raw:
+        instance._previous_period = (
+            Booking.objects.filter(pk=instance.pk)
+            .values_list("room_id", "date_start", "date_end")
+            .first()
+        )
+
+
+@receiver(post_save, sender=Booking)
+def booking_saved(sender, instance, created, **kwargs):
+    transaction.on_commit(
+        lambda: refresh_booking(
+            instance.room_id, instance.date_start, instance.date_end
+        )
+    )
+    previous = getattr(instance, "_previous_period", None)
+    if previous is not None:
+        transaction.on_commit(lambda: refresh_booking(*previous))
+
+    transaction.on_commit(lambda: bump_period(instance.date_start, instance.date_end))
+    if previous is not None:
+        transaction.on_commit(lambda: bump_period(previous[1], previous[2]))
+    elif not created:
+        # При загрузке фикстур (raw) прежние даты брони неизвестны.
+        transaction.on_commit(bump_global)
+
+    if bitmap_enabled():
+        bitmap = get_availability_bitmap()
+        if created:
+            transaction.on_commit(
+                lambda: bitmap.add_booking(
+                    instance.room_id, instance.date_start, instance.date_end
+                )
+            )
+        else:
+            transaction.on_commit(bitmap.invalidate)
+
+
+@receiver(bookings_created, sender=Booking)
+def bookings_bulk_created(sender, bookings, **kwargs):
+    periods = [
+        (booking.room_id, booking.date_start, booking.date_end) for booking in bookings
+    ]
+    transaction.on_commit(lambda: refresh_bookings(periods))
+    transaction.on_commit(
+        lambda: bump_periods([(start, end) for _, start, end in periods])
+    )
+
+    if bitmap_enabled():
+        bitmap = get_availability_bitmap()
+
+        def add_bookings():
+            for period in periods:
+                bitmap.add_booking(*period)
+
+        transaction.on_commit(add_bookings)
+
+
+@receiver(post_delete, sender=Booking)
+def booking_deleted(sender, instance, **kwargs):
+    transaction.on_commit(
+        lambda: refresh_booking(
+            instance.room_id, instance.date_start, instance.date_end
+        )
+    )
+    transaction.on_commit(lambda: bump_period(instance.date_start, instance.date_end))
+
+    if bitmap_enabled():
+        bitmap = get_availability_bitmap()
+        transaction.on_commit(lambda: bitmap.refresh_room(instance.room_id))
+
+
+@receiver(pre_save, sender=Room)
+def room_saving(sender, instance, raw, **kwargs):
+    # Выручка в суточной статистике считается по цене комнаты.
+    instance._previous_price = None
+    if not instance._state.adding and not raw:
+        instance._previous_price = (
+            Room.objects.filter(pk=instance.pk)
+            .values_list("price_per_day", flat=True)
+            .first()
+        )
+
+
+@receiver(post_save, sender=Room)
+def room_saved(sender, instance, **kwargs):
+    previous_price = getattr(instance, "_previous_price", None)
+    if previous_price is not None and previous_price != instance.price_per_day:
+        transaction.on_commit(lambda: refresh_room(instance.pk))
+
+
+@receiver(post_save, sender=Room)
+@receiver(post_delete, sender=Room)
+def room_changed(sender, instance, **kwargs):
+    transaction.on_commit(bump_global)
+
+    if bitmap_enabled():
+        transaction.on_commit(get_availability_bitmap().invalidate)
+
+
+@receiver(post_save, sender=get_user_model())
+@receiver(post_delete, sender=get_user_model())
+def user_changed(sender, instance, created=False, **kwargs):
+    # Новый пользователь ещё не мог попасть в кэш аутентификации.
+    if not created:
+        invalidate_user_cache(instance.pk)
@@ -0,0 +1,124 @@
+from datetime import datetime, time, timedelta
+from decimal import Decimal
+
+import pytest
+from booking_app_admin.models import Booking, Room
+from booking_app_api.utils.filters import (AvailabilityBitmap, get_free_rooms,
+                                           get_free_rooms_sql)
+from django.utils import timezone
+
+
+def day(offset, hour=0):
+    """Начало суток (или указанный час) через offset дней от сегодняшнего."""
+    return timezone.make_aware(
+        datetime.combine(timezone.localdate() + timedelta(days=offset), time(hour))
+    )
+
+
+@pytest.fixture
+def rooms(db):
+    room1 = Room.objects.create(
+        name="Для двоих", price_per_day=Decimal("100.00"), capacity=2
+    )
+    room2 = Room.objects.create(
+        name="Для одного", price_per_day=Decimal("50.00"), capacity=1
+    )
+    room3 = Room.objects.create(
+        name="Для троих", price_per_day=Decimal("150.00"), capacity=3
+    )
+    return room1, room2, room3
+
+
+@pytest.fixture
+def bookings(rooms, django_user_model):
+    room1, room2, _ = rooms
+    user = django_user_model.objects.create_user(username="user", password="54321")
+    Booking.objects.create(room=room1, user=user, date_start=day(2), date_end=day(4))
+    # Бронь с выездом и заездом посреди суток.
+    Booking.objects.create(
+        room=room2, user=user, date_start=day(5, 14), date_end=day(7, 12)
+    )
+    return user
+
+
+def sql_ids(date_start, date_end, capacity=0):
+    return set(
+        get_free_rooms_sql(date_start, date_end)
+        .filter(capacity__gte=capacity)
+        .values_list("id", flat=True)
+    )
+
+
+@pytest.mark.django_db(transaction=True, reset_sequences=True)
+@pytest.mark.parametrize(
+    "start, end, capacity",
+    [
+        ((0, 0), (2, 0), 0),
+        ((1, 0), (3, 0), 0),
+        ((3, 0), (6, 0), 2),
+        ((7, 12), (9, 0), 0),
+        ((7, 10), (9, 0), 0),
+        ((4, 0), (5, 14), 0),
+        ((4, 0), (5, 15), 1),
+        ((5, 10), (5, 13), 0),
+        ((0, 0), (30, 0), 3),
+    ],
+)
+def test_bitmap_matches_sql(rooms, bookings, start, end, capacity):
+    bitmap = AvailabilityBitmap(lookback_days=7, horizon_days=60)
+    date_start, date_end = day(*start), day(*end)
+
+    free_ids = bitmap.free_room_ids(date_start, date_end, capacity)
+
+    assert set(free_ids) == sql_ids(date_start, date_end, capacity)
+
+
+@pytest.mark.django_db(transaction=True, reset_sequences=True)
+def test_bitmap_outside_horizon_returns_none(rooms, bookings):
+    bitmap = AvailabilityBitmap(lookback_days=7, horizon_days=60)
+
+    assert bitmap.free_room_ids(day(200), day(202)) is None
+    assert bitmap.free_room_ids(day(-30), day(2)) is None
+
+
+@pytest.mark.django_db(transaction=True, reset_sequences=True)
+def test_bitmap_incremental_updates(settings, rooms, bookings):
+    settings.AVAILABILITY_BITMAP = {**settings.AVAILABILITY_BITMAP, "ENABLED": True}
+    room1, _, room3 = rooms
+    date_start, date_end = day(10), day(12)
+
+    ids = set(get_free_rooms(date_start, date_end).values_list("id", flat=True))
+    assert room3.id in ids
+
+    booking = Booking.objects.create(
+        room=room3, user=bookings, date_start=day(11), date_end=day(13)
+    )
+    ids = set(get_free_rooms(date_start, date_end).values_list("id", flat=True))
+    assert room3.id not in ids
+    assert ids == sql_ids(date_start, date_end)
+
+    booking.delete()
+    ids = set(get_free_rooms(date_start, date_end).values_list("id", flat=True))
+    assert room3.id in ids
+    assert ids == sql_ids(date_start, date_end)
+
+
+@pytest.mark.django_db(transaction=True, reset_sequences=True)
+def test_bitmap_verify_invalidates_on_mismatch(rooms, bookings):
+    bitmap = AvailabilityBitmap(lookback_days=7, horizon_days=60)
+    room1, room2, room3 = rooms
+    date_start, date_end = day(2), day(3)
+    free_ids = bitmap.free_room_ids(date_start, date_end)
+
+    assert bitmap.verify(date_start, date_end, free_ids, sql_ids(date_start, date_end))
+
+    # Бронь, созданная в обход сигналов (например, другим воркером).
+    Booking.objects.bulk_create(
+        [Booking(room=room3, user=bookings, date_start=day(2), date_end=day(3))]
+    )
+    stale_ids = bitmap.free_room_ids(date_start, date_end)
+    assert room3.id in stale_ids
+    assert not bitmap.verify(
+        date_start, date_end, stale_ids, sql_ids(date_start, date_end)
+    )
+    assert room3.id not in bitmap.free_room_ids(date_start, date_end)
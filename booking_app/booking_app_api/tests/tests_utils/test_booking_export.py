@@ -0,0 +1,70 @@
+import csv
+import io
+import json
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import pytest
+from booking_app_admin.models import Booking, Room
+from booking_app_api.utils.export import booking_export
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.utils import timezone
+
+
+@pytest.fixture
+def bookings(db):
+    user = get_user_model().objects.create_user(username="user", password="54321")
+    room = Room.objects.create(
+        name="Для двоих", price_per_day=Decimal("100.00"), capacity=2
+    )
+    start = timezone.make_aware(datetime(2025, 1, 1))
+    return Booking.objects.bulk_create(
+        Booking(
+            room=room,
+            user=user,
+            date_start=start + timedelta(days=2 * i),
+            date_end=start + timedelta(days=2 * i + 1),
+        )
+        for i in range(7)
+    )
+
+
+@pytest.mark.django_db(transaction=True, reset_sequences=True)
+def test_ndjson_is_chunked(bookings, monkeypatch):
+    monkeypatch.setattr(booking_export, "LINES_PER_CHUNK", 3)
+    queryset = booking_export.export_queryset()
+
+    chunks = list(booking_export.ndjson_lines(booking_export.booking_rows(queryset, 2)))
+
+    assert [chunk.count("\n") for chunk in chunks] == [3, 3, 1]
+    ids = [json.loads(line)["id"] for line in "".join(chunks).splitlines()]
+    assert ids == [booking.id for booking in bookings]
+
+
+@pytest.mark.django_db(transaction=True, reset_sequences=True)
+def test_export_bookings_command_stdout(bookings):
+    out = io.StringIO()
+
+    call_command(
+        "export_bookings",
+        "--format=csv",
+        "--date-start=2025-01-04T00:00:00",
+        "--date-end=2025-01-08T00:00:00",
+        stdout=out,
+    )
+
+    rows = list(csv.DictReader(io.StringIO(out.getvalue())))
+    assert [int(row["id"]) for row in rows] == [bookings[2].id, bookings[3].id]
+    assert rows[0]["room_name"] == "Для двоих"
+
+
+@pytest.mark.django_db(transaction=True, reset_sequences=True)
+def test_export_bookings_command_output_file(bookings, tmp_path):
+    output = tmp_path / "bookings.ndjson"
+
+    call_command("export_bookings", "--output", str(output), "--chunk-size", "2")
+
+    lines = output.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == len(bookings)
+    assert json.loads(lines[0])["username"] == "user"
@@ -0,0 +1,279 @@
+from datetime import date, datetime
+from decimal import Decimal
+
+import pytest
+from booking_app_admin.models import Booking, Room, max_booking_days
+from booking_app_api.utils.db import (create_partition, detach_partition,
+                                      detachable_months, list_partitions,
+                                      shift_month, sync_max_booking_days)
+from booking_app_api.utils.db.partitions import (DEFAULT_PARTITION,
+                                                 PARTITION_NAME)
+from booking_app_api.utils.filters import get_free_rooms_sql
+from django.core.exceptions import ValidationError
+from django.core.management import call_command
+from django.db import IntegrityError, connection
+from django.db.migrations.executor import MigrationExecutor
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.timezone import make_aware
+from rest_framework.test import APIClient
+
+
+def at(month, day):
+    return make_aware(datetime(2025, month, day))
+
+
+def rows(table):
+    with connection.cursor() as cursor:
+        cursor.execute(f"SELECT id FROM {table} ORDER BY id")
+        return [row[0] for row in cursor]
+
+
+@pytest.fixture
+def partitions(db):
+    """
+    Секции создаются DDL-командами, поэтому тест начинается без помесячных секций
+    (их создаёт миграция), а после теста созданные им удаляются и прежние возвращаются.
+    """
+    existing = list_partitions()
+    for month in existing:
+        detach_partition(month)
+    yield
+    for month in list_partitions():
+        detach_partition(month)
+    for month in existing:
+        create_partition(month)
+    with connection.cursor() as cursor:
+        cursor.execute("DROP SCHEMA IF EXISTS test_archive CASCADE")
+
+
+@pytest.fixture
+def room(db):
+    return Room.objects.create(
+        name="Для двоих", price_per_day=Decimal("100.00"), capacity=2
+    )
+
+
+@pytest.fixture
+def user(django_user_model):
+    return django_user_model.objects.create_user(username="user", password="54321")
+
+
+@pytest.mark.django_db(transaction=True, reset_sequences=True)
+def test_create_partition_moves_bookings_from_default(partitions, room, user):
+    january = Booking.objects.create(
+        room=room, user=user, date_start=at(1, 30), date_end=at(2, 2)
+    )
+    february = Booking.objects.create(
+        room=room, user=user, date_start=at(2, 10), date_end=at(2, 12)
+    )
+
+    assert create_partition(date(2025, 1, 1)) == 1
+
+    assert list_partitions() == [date(2025, 1, 1)]
+    assert rows(PARTITION_NAME.format(date(2025, 1, 1))) == [january.id]
+    assert rows(DEFAULT_PARTITION) == [february.id]
+    assert Booking.objects.count() == 2
+
+
+@pytest.mark.django_db(transaction=True, reset_sequences=True)
+def test_overlap_across_partitions_rejected(partitions, room, user):
+    create_partition(date(2025, 1, 1))
+    create_partition(date(2025, 2, 1))
+    Booking.objects.create(
+        room=room, user=user, date_start=at(1, 30), date_end=at(2, 2)
+    )
+
+    with pytest.raises(IntegrityError, match="exclude_overlapping_booking"):
+        Booking.objects.create(
+            room=room, user=user, date_start=at(2, 1), date_end=at(2, 3)
+        )
+
+    Booking.objects.create(room=room, user=user, date_start=at(2, 2), date_end=at(2, 3))
+    assert Booking.objects.count() == 2
+
+
+@pytest.mark.django_db(transaction=True, reset_sequences=True)
+def test_create_booking_view_conflict_across_partitions(partitions, room, user):
+    create_partition(date(2025, 1, 1))
+    Booking.objects.create(
+        room=room, user=user, date_start=at(1, 30), date_end=at(2, 2)
+    )
+    client = APIClient()
+    client.force_authenticate(user=user)
+
+    response = client.post(
+        reverse("create-booking"),
+        {"room": room.id, "date_start": at(2, 1), "date_end": at(2, 3)},
+    )
+
+    assert response.status_code == 409
+
+
+@pytest.mark.django_db(transaction=True, reset_sequences=True)
+def test_free_rooms_with_partitions(partitions, room, user):
+    create_partition(date(2025, 1, 1))
+    create_partition(date(2025, 2, 1))
+    Booking.objects.create(
+        room=room, user=user, date_start=at(1, 30), date_end=at(2, 2)
+    )
+
+    assert list(get_free_rooms_sql(at(2, 1), at(2, 3))) == []
+    assert list(get_free_rooms_sql(at(2, 2), at(2, 3))) == [room]
+
+
+@pytest.mark.django_db(transaction=True, reset_sequences=True)
+def test_detach_partition_to_archive(partitions, room, user):
+    create_partition(date(2025, 1, 1))
+    booking = Booking.objects.create(
+        room=room, user=user, date_start=at(1, 10), date_end=at(1, 12)
+    )
+
+    detach_partition(date(2025, 1, 1), "test_archive")
+
+    assert list_partitions() == []
+    assert not Booking.objects.exists()
+    assert rows(f"test_archive.{PARTITION_NAME.format(date(2025, 1, 1))}") == [
+        booking.id
+    ]
+    # У архивной таблицы нет внешних ключей, комнату можно удалить.
+    room.delete()
+
+
+@pytest.mark.django_db(transaction=True, reset_sequences=True)
+def test_recent_partitions_not_detachable(partitions):
+    current = timezone.localdate().replace(day=1)
+    old, recent = shift_month(current, -12), shift_month(current, -1)
+    create_partition(old)
+    create_partition(recent)
+
+    assert detachable_months(current) == [old]
+
+
+@pytest.mark.django_db(transaction=True, reset_sequences=True)
+def test_manage_partitions_command(partitions, room, user):
+    current = timezone.localdate().replace(day=1)
+    old = shift_month(current, -24)
+    Booking.objects.create(
+        room=room,
+        user=user,
+        date_start=make_aware(datetime.combine(old, datetime.min.time())),
+        date_end=make_aware(datetime(old.year, old.month, 3)),
+    )
+
+    call_command("manage_booking_partitions", months_ahead=2, backfill=True)
+
+    assert list_partitions() == [old] + [shift_month(current, i) for i in range(3)]
+    assert rows(DEFAULT_PARTITION) == []
+
+    call_command(
+        "manage_booking_partitions", months_ahead=2, retention_months=12, drop=True
+    )
+
+    assert list_partitions() == [shift_month(current, i) for i in range(3)]
+    assert not Booking.objects.exists()
+
+
+@pytest.mark.django_db(transaction=True, reset_sequences=True)
+def test_migration_creates_partitions_ahead():
+    current = timezone.localdate().replace(day=1)
+    months = [shift_month(current, i) for i in range(13)]
+
+    assert set(months) <= set(list_partitions())
+
+
+@pytest.mark.django_db(transaction=True, reset_sequences=True)
+def test_trigger_rejects_long_booking(room, user):
+    start = at(1, 1)
+    with pytest.raises(IntegrityError, match="booking_max_length"):
+        Booking.objects.create(
+            room=room,
+            user=user,
+            date_start=start,
+            date_end=start + timezone.timedelta(days=max_booking_days(), minutes=1),
+        )
+
+    Booking.objects.create(
+        room=room,
+        user=user,
+        date_start=start,
+        date_end=start + timezone.timedelta(days=max_booking_days()),
+    )
+
+
+def with_max_booking_days(settings, days):
+    settings.BOOKING_PARTITIONS = {
+        **settings.BOOKING_PARTITIONS,
+        "MAX_BOOKING_DAYS": days,
+    }
+
+
+@pytest.mark.django_db(transaction=True, reset_sequences=True)
+def test_sync_max_booking_days(room, user, settings):
+    limit = max_booking_days()
+    start = at(1, 1)
+    try:
+        with_max_booking_days(settings, None)
+        assert sync_max_booking_days() == (limit, None)
+        Booking.objects.create(
+            room=room,
+            user=user,
+            date_start=start,
+            date_end=start + timezone.timedelta(days=limit + 30),
+        )
+        # Пересечение с длинной бронью находится и без ограничения длины.
+        with pytest.raises(IntegrityError, match="exclude_overlapping_booking"):
+            Booking.objects.create(
+                room=room,
+                user=user,
+                date_start=start + timezone.timedelta(days=limit + 10),
+                date_end=start + timezone.timedelta(days=limit + 11),
+            )
+
+        with_max_booking_days(settings, limit)
+        with pytest.raises(ValueError, match=f"Броней длиннее {limit} суток: 1"):
+            sync_max_booking_days()
+
+        with_max_booking_days(settings, limit + 30)
+        assert sync_max_booking_days() == (None, limit + 30)
+    finally:
+        Booking.objects.all().delete()
+        with_max_booking_days(settings, limit)
+        sync_max_booking_days()
+
+
+@pytest.mark.django_db(transaction=True, reset_sequences=True)
+def test_overlap_validated_by_model(room, user):
+    Booking.objects.create(
+        room=room, user=user, date_start=at(1, 10), date_end=at(1, 12)
+    )
+
+    booking = Booking(room=room, user=user, date_start=at(1, 11), date_end=at(1, 13))
+    with pytest.raises(ValidationError, match="exclude_overlapping_booking"):
+        booking.full_clean()
+
+    Booking(room=room, user=user, date_start=at(1, 12), date_end=at(1, 13)).full_clean()
+
+
+@pytest.mark.django_db(transaction=True, reset_sequences=True)
+def test_partition_migration_rejects_long_bookings(room, user):
+    before = [("booking_app_admin", "0004_booking_daily_rollup")]
+    executor = MigrationExecutor(connection)
+    leaf = executor.loader.graph.leaf_nodes()
+    executor.migrate(before)
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"INSERT INTO {Booking._meta.db_table} "
+                "(date_start, date_end, room_id, user_id) VALUES (%s, %s, %s, %s)",
+                [at(1, 1), at(5, 1), room.id, user.id],
+            )
+        executor = MigrationExecutor(connection)
+        with pytest.raises(RuntimeError, match="Броней длиннее 90 суток: 1"):
+            executor.migrate(leaf)
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {Booking._meta.db_table}")
+    finally:
+        executor = MigrationExecutor(connection)
+        executor.loader.build_graph()
+        executor.migrate(leaf)
@@ -0,0 +1,165 @@
+from datetime import date, datetime
+from decimal import Decimal
+
+import pytest
+from booking_app_admin.models import Booking, BookingDailyRollup, Room
+from booking_app_api.utils.analytics import rebuild_rollup
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils.timezone import make_aware
+from rest_framework.test import APIClient
+
+
+def at(day, hour=0):
+    return make_aware(datetime(2025, 2, day, hour))
+
+
+def rollup(room=None):
+    rows = BookingDailyRollup.objects.order_by("room_id", "day")
+    if room is not None:
+        rows = rows.filter(room=room)
+    return [(row.day.day, row.booked_hours, row.revenue) for row in rows]
+
+
+@pytest.fixture
+def rooms(db):
+    room1 = Room.objects.create(
+        name="Для двоих", price_per_day=Decimal("100.00"), capacity=2
+    )
+    room2 = Room.objects.create(
+        name="Для одного", price_per_day=Decimal("48.00"), capacity=1
+    )
+    return room1, room2
+
+
+@pytest.fixture
+def user(django_user_model):
+    return django_user_model.objects.create_user(username="user", password="54321")
+
+
+@pytest.mark.django_db(transaction=True, reset_sequences=True)
+def test_created_booking_split_by_local_days(rooms, user):
+    room1, _ = rooms
+
+    Booking.objects.create(
+        room=room1, user=user, date_start=at(3, 14), date_end=at(5, 12)
+    )
+
+    assert rollup() == [
+        (3, Decimal("10.00"), Decimal("41.67")),
+        (4, Decimal("24.00"), Decimal("100.00")),
+        (5, Decimal("12.00"), Decimal("50.00")),
+    ]
+
+
+@pytest.mark.django_db(transaction=True, reset_sequences=True)
+def test_bookings_of_one_day_are_summed(rooms, user):
+    _, room2 = rooms
+
+    Booking.objects.create(room=room2, user=user, date_start=at(3), date_end=at(3, 12))
+    Booking.objects.create(room=room2, user=user, date_start=at(3, 18), date_end=at(4))
+
+    assert rollup(room2) == [(3, Decimal("18.00"), Decimal("36.00"))]
+
+
+@pytest.mark.django_db(transaction=True, reset_sequences=True)
+def test_deleted_booking_removed(rooms, user):
+    room1, _ = rooms
+    kept = Booking.objects.create(
+        room=room1, user=user, date_start=at(3), date_end=at(3, 12)
+    )
+    deleted = Booking.objects.create(
+        room=room1, user=user, date_start=at(3, 12), date_end=at(5)
+    )
+
+    deleted.delete()
+
+    assert rollup() == [(3, Decimal("12.00"), Decimal("50.00"))]
+    kept.delete()
+    assert rollup() == []
+
+
+@pytest.mark.django_db(transaction=True, reset_sequences=True)
+def test_updated_booking_moves_days(rooms, user):
+    room1, room2 = rooms
+    booking = Booking.objects.create(
+        room=room1, user=user, date_start=at(3), date_end=at(4)
+    )
+
+    booking.room = room2
+    booking.date_start = at(10)
+    booking.date_end = at(11)
+    booking.save()
+
+    assert rollup(room1) == []
+    assert rollup(room2) == [(10, Decimal("24.00"), Decimal("48.00"))]
+
+
+@pytest.mark.django_db(transaction=True, reset_sequences=True)
+def test_bulk_created_bookings_counted(rooms, user):
+    room1, room2 = rooms
+    client = APIClient()
+    client.force_authenticate(user=user)
+
+    response = client.post(
+        reverse("bulk-create-booking"),
+        {
+            "bookings": [
+                {"room": room1.id, "date_start": at(3), "date_end": at(4)},
+                {"room": room2.id, "date_start": at(3), "date_end": at(5)},
+            ]
+        },
+        format="json",
+    )
+
+    assert response.status_code == 201
+    assert [row[0] for row in rollup(room1)] == [3]
+    assert [row[0] for row in rollup(room2)] == [3, 4]
+
+
+@pytest.mark.django_db(transaction=True, reset_sequences=True)
+def test_rebuild_matches_incremental(rooms, user):
+    room1, room2 = rooms
+    for room, start, end in [
+        (room1, at(1, 15), at(4, 11)),
+        (room1, at(4, 14), at(6, 12)),
+        (room2, at(2), at(9)),
+    ]:
+        Booking.objects.create(room=room, user=user, date_start=start, date_end=end)
+    incremental = rollup()
+
+    BookingDailyRollup.objects.all().delete()
+    rebuild_rollup()
+    assert rollup() == incremental
+
+    BookingDailyRollup.objects.filter(room=room2).delete()
+    call_command(
+        "rebuild_booking_rollup",
+        "--start",
+        "2025-02-01",
+        "--end",
+        "2025-03-01",
+        "--room",
+        str(room2.id),
+    )
+    assert rollup() == incremental
+    assert BookingDailyRollup.objects.filter(day=date(2025, 2, 4)).count() == 2
+
+
+@pytest.mark.django_db(transaction=True, reset_sequences=True)
+def test_price_change_refreshes_room(rooms, user):
+    room1, room2 = rooms
+    Booking.objects.create(room=room1, user=user, date_start=at(3), date_end=at(5))
+    Booking.objects.create(room=room2, user=user, date_start=at(3), date_end=at(4))
+
+    room1.price_per_day = Decimal("120.00")
+    room1.save()
+
+    assert rollup(room1) == [
+        (3, Decimal("24.00"), Decimal("120.00")),
+        (4, Decimal("24.00"), Decimal("120.00")),
+    ]
+    assert rollup(room2) == [(3, Decimal("24.00"), Decimal("48.00"))]
+    incremental = rollup()
+    rebuild_rollup()
+    assert rollup() == incremental
@@ -0,0 +1,180 @@
+from datetime import timedelta
+
+import pytest
+from asgiref.sync import async_to_sync
+from booking_app_api.utils.authentication import (CachedJWTAuthentication,
+                                                  ClaimsRefreshToken,
+                                                  StatelessJWTAuthentication,
+                                                  token_cache)
+from booking_app_api.utils.authentication.cached_jwt import BUMP_VERSION_SQL
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIRequestFactory
+from rest_framework_simplejwt.exceptions import (AuthenticationFailed,
+                                                 InvalidToken)
+from rest_framework_simplejwt.models import TokenUser
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import AccessToken
+
+
+@pytest.fixture
+def jwt_settings(settings):
+    settings.JWT_AUTH = {
+        "TOKEN_CACHE_SIZE": 2,
+        "USER_CACHE_ALIAS": "default",
+        "USER_CACHE_TIMEOUT": 30,
+        "STATELESS_READS": True,
+    }
+    token_cache.clear()
+    cache.clear()
+    yield settings
+    token_cache.clear()
+    cache.clear()
+
+
+@pytest.fixture
+def user():
+    return get_user_model().objects.create_user(username="user", password="54321")
+
+
+def auth_request(token, method="get"):
+    return getattr(APIRequestFactory(), method)(
+        "/", HTTP_AUTHORIZATION=f"Bearer {token}"
+    )
+
+
+@pytest.mark.django_db(transaction=True, reset_sequences=True)
+def test_repeated_requests_only_check_version(jwt_settings, user):
+    token = AccessToken.for_user(user)
+
+    with CaptureQueriesContext(connection) as queries:
+        first, _ = CachedJWTAuthentication().authenticate(auth_request(token))
+        second, _ = CachedJWTAuthentication().authenticate(auth_request(token))
+
+    assert first == second == user
+    # Пользователь с версией одним запросом, затем только версия.
+    assert len(queries) == 2
+    assert "auth_user" in queries[0]["sql"]
+    assert "auth_user" not in queries[1]["sql"]
+
+
+def change_in_other_worker(user, **fields):
+    """Изменение пользователя в другом воркере: версия общая, а кэш этого процесса не тронут."""
+    get_user_model().objects.filter(pk=user.pk).update(**fields)
+    with connection.cursor() as cursor:
+        cursor.execute(BUMP_VERSION_SQL, [user.pk])
+
+
+@pytest.mark.django_db(transaction=True, reset_sequences=True)
+def test_user_change_in_other_worker_invalidates_cache(jwt_settings, user):
+    token = AccessToken.for_user(user)
+    CachedJWTAuthentication().authenticate(auth_request(token))
+
+    change_in_other_worker(user, is_active=False)
+
+    with pytest.raises(AuthenticationFailed, match="inactive"):
+        CachedJWTAuthentication().authenticate(auth_request(token))
+
+
+@pytest.mark.django_db(transaction=True, reset_sequences=True)
+def test_user_change_in_other_worker_invalidates_async_cache(jwt_settings, user):
+    token = AccessToken.for_user(user)
+    authenticate = async_to_sync(CachedJWTAuthentication().aauthenticate)
+    authenticated, _ = authenticate(auth_request(token))
+    assert authenticated == user
+
+    change_in_other_worker(user, is_active=False)
+
+    with pytest.raises(AuthenticationFailed, match="inactive"):
+        authenticate(auth_request(token))
+
+
+@pytest.mark.django_db(transaction=True, reset_sequences=True)
+def test_user_save_invalidates_cache(jwt_settings, user):
+    token = AccessToken.for_user(user)
+    CachedJWTAuthentication().authenticate(auth_request(token))
+
+    user.is_active = False
+    user.save()
+
+    with pytest.raises(AuthenticationFailed):
+        CachedJWTAuthentication().authenticate(auth_request(token))
+
+
+@pytest.mark.django_db(transaction=True, reset_sequences=True)
+def test_password_change_revokes_cached_token(jwt_settings, monkeypatch, user):
+    # simplejwt не перечитывает api_settings при override_settings в уже импортированных модулях.
+    monkeypatch.setattr(api_settings, "CHECK_REVOKE_TOKEN", True)
+    token = AccessToken.for_user(user)
+    CachedJWTAuthentication().authenticate(auth_request(token))
+
+    user.set_password("new-password-123")
+    user.save()
+
+    with pytest.raises(AuthenticationFailed):
+        CachedJWTAuthentication().authenticate(auth_request(token))
+
+
+@pytest.mark.django_db(transaction=True, reset_sequences=True)
+def test_expired_token_is_not_served_from_cache(jwt_settings, user):
+    token = AccessToken.for_user(user)
+    raw_token = str(token).encode()
+    CachedJWTAuthentication().authenticate(auth_request(token))
+    assert token_cache.get(raw_token) is not None
+
+    cached = token_cache.get(raw_token)
+    cached.set_exp(lifetime=timedelta(seconds=-1))
+
+    assert token_cache.get(raw_token) is None
+    with pytest.raises(InvalidToken):
+        CachedJWTAuthentication().authenticate(auth_request(str(cached)))
+
+
+def test_token_cache_is_bounded(jwt_settings):
+    tokens = [AccessToken() for _ in range(3)]
+    for token in tokens:
+        token_cache.set(str(token).encode(), token)
+
+    assert token_cache.get(str(tokens[0]).encode()) is None
+    assert token_cache.get(str(tokens[2]).encode()) is tokens[2]
+
+
+@pytest.mark.django_db(transaction=True, reset_sequences=True)
+def test_stateless_reads_use_token_claims(jwt_settings, user):
+    token = ClaimsRefreshToken.for_user(user).access_token
+
+    with CaptureQueriesContext(connection) as queries:
+        read_user, _ = StatelessJWTAuthentication().authenticate(auth_request(token))
+    assert isinstance(read_user, TokenUser)
+    assert read_user.pk == user.pk
+    assert not read_user.is_superuser
+    assert len(queries) == 0
+
+    write_user, _ = StatelessJWTAuthentication().authenticate(
+        auth_request(token, "delete")
+    )
+    assert write_user == user
+
+
+@pytest.mark.django_db(transaction=True, reset_sequences=True)
+def test_stateless_reads_are_opt_in(jwt_settings, user):
+    jwt_settings.JWT_AUTH = {**jwt_settings.JWT_AUTH, "STATELESS_READS": False}
+    token = AccessToken.for_user(user)
+
+    read_user, _ = StatelessJWTAuthentication().authenticate(auth_request(token))
+
+    assert read_user == user
+
+
+@pytest.mark.django_db(transaction=True, reset_sequences=True)
+def test_stateless_reads_keep_superuser_rights(jwt_settings):
+    admin = get_user_model().objects.create_superuser(
+        username="admin", password="54321"
+    )
+    token = ClaimsRefreshToken.for_user(admin).access_token
+
+    read_user, _ = StatelessJWTAuthentication().authenticate(auth_request(token))
+
+    assert read_user.is_superuser
@@ -0,0 +1,40 @@
+import pytest
+from booking_app_api.utils.db import pool, pool_stats
+from django.db import connection
+from django.db.backends.postgresql.base import DatabaseWrapper
+
+
+@pytest.fixture
+def pooled_connection(monkeypatch):
+    wrapper = DatabaseWrapper(
+        {
+            **connection.settings_dict,
+            "OPTIONS": {"pool": {"min_size": 1, "max_size": 2, "timeout": 5}},
+        },
+        alias="pool_tests",
+    )
+    monkeypatch.setattr(pool, "connections", {"default": wrapper})
+    # Пул с открытым min_size соединением: иначе первый запрос открывает лишнее.
+    wrapper.pool.open(wait=True)
+    yield wrapper
+    wrapper.close_pool()
+
+
+@pytest.mark.django_db(transaction=True, reset_sequences=True)
+def test_pool_stats(pooled_connection):
+    with pooled_connection.cursor() as cursor:
+        cursor.execute("SELECT 1")
+    stats = pool_stats()
+
+    assert stats["max_size"] == 2
+    assert stats["in_use"] == 1
+    assert stats["requests"] == 1
+    assert stats["connections_opened"] >= 1
+
+    # Django возвращает соединение в пул при закрытии.
+    pooled_connection.close()
+    assert pool_stats()["in_use"] == 0
+
+
+def test_pool_stats_without_pool():
+    assert pool_stats() is None
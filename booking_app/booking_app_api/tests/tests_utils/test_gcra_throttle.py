@@ -0,0 +1,120 @@
+import multiprocessing
+import time
+import uuid
+
+import pytest
+from booking_app_api.utils import BookingThrottle, UserRegistrationThrottle
+from booking_app_api.utils.throttling.gcra_throttle import (TABLE,
+                                                            CacheGCRAStore,
+                                                            DatabaseGCRAStore)
+from django.core.cache import cache
+from django.db import connection, connections
+from rest_framework.test import APIRequestFactory
+
+PROCESSES = 4
+HITS_PER_PROCESS = 25
+LIMIT = 30
+
+
+@pytest.fixture
+def throttle_key():
+    key = f"gcra_tests_{uuid.uuid4().hex}"
+    yield key
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {TABLE} WHERE key = %s", [key])
+    cache.delete(key)
+
+
+@pytest.fixture
+def database_store(settings):
+    settings.THROTTLE_STORE = {"BACKEND": "database", "PURGE_RATE": 0}
+    return DatabaseGCRAStore()
+
+
+def hit_many(key):
+    """Запросы одного процесса: сколько из них прошло ограничение."""
+    store = DatabaseGCRAStore()
+    now = time.time()
+    allowed = sum(
+        store.hit(key, now, 60 / LIMIT, 60)[0] for _ in range(HITS_PER_PROCESS)
+    )
+    connections.close_all()
+    return allowed
+
+
+@pytest.mark.django_db(transaction=True, reset_sequences=True)
+@pytest.mark.parametrize("store_class", [DatabaseGCRAStore, CacheGCRAStore])
+def test_store_burst_and_rate(settings, throttle_key, store_class):
+    settings.THROTTLE_STORE = {"BACKEND": "database", "PURGE_RATE": 0}
+    store = store_class()
+
+    # Лимит 2 запроса за 10 секунд: пачка из двух, затем один раз в 5 секунд.
+    assert store.hit(throttle_key, 100.0, 5.0, 10) == (True, 105.0)
+    assert store.hit(throttle_key, 100.0, 5.0, 10) == (True, 110.0)
+    assert store.hit(throttle_key, 101.0, 5.0, 10) == (False, 110.0)
+    assert store.hit(throttle_key, 105.0, 5.0, 10) == (True, 115.0)
+    # После простоя TAT отсчитывается от текущего времени.
+    assert store.hit(throttle_key, 200.0, 5.0, 10) == (True, 205.0)
+
+
+@pytest.mark.django_db(transaction=True, reset_sequences=True)
+def test_database_store_purges_expired(settings, database_store, throttle_key):
+    database_store.hit(throttle_key, 100.0, 5.0, 10)
+    settings.THROTTLE_STORE = {"BACKEND": "database", "PURGE_RATE": 1}
+
+    database_store.hit(f"{throttle_key}_other", 200.0, 5.0, 10)
+
+    with connection.cursor() as cursor:
+        cursor.execute(f"SELECT count(*) FROM {TABLE} WHERE key = %s", [throttle_key])
+        assert cursor.fetchone()[0] == 0
+        cursor.execute(f"DELETE FROM {TABLE} WHERE key = %s", [f"{throttle_key}_other"])
+
+
+@pytest.mark.django_db(transaction=True, reset_sequences=True)
+def test_database_store_limit_holds_across_processes(database_store, throttle_key):
+    # Дочерние процессы открывают свои соединения с БД.
+    connections.close_all()
+    context = multiprocessing.get_context("fork")
+    with context.Pool(PROCESSES) as pool:
+        allowed = pool.map(hit_many, [throttle_key] * PROCESSES)
+
+    assert sum(allowed) == LIMIT
+
+
+@pytest.mark.django_db(transaction=True, reset_sequences=True)
+def test_throttles_wait_and_scopes(database_store):
+    class LimitedBookingThrottle(BookingThrottle):
+        rate = "2/min"
+
+    request = APIRequestFactory().post("/", REMOTE_ADDR="10.0.0.1")
+    key = BookingThrottle().get_cache_key(request, None)
+
+    try:
+        results = [
+            LimitedBookingThrottle().allow_request(request, None) for _ in range(3)
+        ]
+        assert results == [True, True, False]
+
+        throttle = LimitedBookingThrottle()
+        assert not throttle.allow_request(request, None)
+        # Следующий запрос станет возможен через интервал 30 секунд после первого.
+        assert 29 < throttle.wait() <= 30
+        # У регистрации своя область, лимит бронирования на неё не влияет.
+        assert UserRegistrationThrottle().allow_request(request, None)
+    finally:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"DELETE FROM {TABLE} WHERE key IN (%s, %s)",
+                [key, UserRegistrationThrottle().get_cache_key(request, None)],
+            )
+
+
+def test_zero_rate_denies_without_wait():
+    class ClosedThrottle(BookingThrottle):
+        rate = "0/min"
+
+    throttle = ClosedThrottle()
+    request = APIRequestFactory().post("/", REMOTE_ADDR="10.0.0.2")
+
+    assert not throttle.allow_request(request, None)
+    assert throttle.wait() is None
@@ -0,0 +1,64 @@
+import json
+import logging
+from logging.handlers import QueueListener
+from queue import Queue
+
+import pytest
+from booking_app.log_handlers import AsyncQueueHandler, JsonFormatter
+
+
+class ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.lines = []
+
+    def emit(self, record):
+        self.lines.append(self.format(record))
+
+
+@pytest.fixture
+def queue_logger():
+    target = ListHandler()
+    target.setFormatter(JsonFormatter())
+    handler = AsyncQueueHandler(maxsize=10)
+    handler.listener = QueueListener(handler.queue, target)
+    logger = logging.getLogger("tests.log_handlers")
+    logger.handlers = [handler]
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    yield logger, handler, target
+    handler.stop()
+    logger.handlers = []
+
+
+def test_records_are_written_by_listener(queue_logger):
+    logger, handler, target = queue_logger
+
+    logger.info("Бронь %s создана", 5, extra={"user_id": 3})
+    handler.stop()
+
+    assert len(target.lines) == 1
+    payload = json.loads(target.lines[0])
+    assert payload["message"] == "Бронь 5 создана"
+    assert payload["level"] == "INFO"
+    assert payload["user_id"] == 3
+
+
+def test_disabled_level_is_not_queued(queue_logger):
+    logger, handler, target = queue_logger
+
+    logger.debug("Не должно попасть в очередь %s", 1)
+    handler.stop()
+
+    assert target.lines == []
+
+
+def test_full_queue_drops_records():
+    handler = AsyncQueueHandler(queue=Queue(maxsize=1))
+    record = logging.LogRecord("tests", logging.INFO, "", 0, "msg", (), None)
+
+    handler.enqueue(record)
+    handler.enqueue(record)
+
+    assert handler.queue.qsize() == 1
+    assert handler.dropped == 1
@@ -0,0 +1,55 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from prometheus_client.parser import text_string_to_metric_families
+
+PROJECT_DIR = Path(__file__).resolve().parents[3]
+
+# Отдельный процесс, как воркер gunicorn: реестр импортируется после того,
+# как задана PROMETHEUS_MULTIPROC_DIR.
+WORKER = """
+from booking_app_api.utils.metrics.registry import REQUESTS, cache_lookup
+REQUESTS.labels("all-rooms", "GET", "200").inc(3)
+cache_lookup("search", True)
+"""
+SCRAPE = """
+import sys
+from booking_app_api.utils.metrics.registry import exposition
+sys.stdout.write(exposition().decode())
+"""
+
+
+def run(code, directory):
+    env = {**os.environ, "PROMETHEUS_MULTIPROC_DIR": str(directory)}
+    return subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=PROJECT_DIR,
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+
+
+def test_metrics_are_summed_across_processes(tmp_path):
+    for _ in range(2):
+        run(WORKER, tmp_path)
+
+    samples = {
+        (sample.name, tuple(sorted(sample.labels.items()))): sample.value
+        for family in text_string_to_metric_families(run(SCRAPE, tmp_path))
+        for sample in family.samples
+    }
+
+    requests = (
+        "booking_http_requests_total",
+        (("method", "GET"), ("status", "200"), ("view", "all-rooms")),
+    )
+    cache_hits = (
+        "booking_cache_requests_total",
+        (("cache", "search"), ("result", "hit")),
+    )
+    assert samples[requests] == 6
+    assert samples[cache_hits] == 2
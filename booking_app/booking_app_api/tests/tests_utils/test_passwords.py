@@ -0,0 +1,40 @@
+import threading
+
+from booking_app_api.utils.passwords import (TunedArgon2PasswordHasher,
+                                             hash_password, hashing_pool)
+from django.contrib.auth.hashers import check_password
+
+
+def test_tuned_argon2_uses_settings(settings):
+    settings.PASSWORD_HASHING = {
+        **settings.PASSWORD_HASHING,
+        "ARGON2_TIME_COST": 1,
+        "ARGON2_MEMORY_COST": 1024,
+        "ARGON2_PARALLELISM": 1,
+    }
+    hasher = TunedArgon2PasswordHasher()
+    encoded = hasher.encode("password", hasher.salt())
+
+    assert hasher.decode(encoded)["time_cost"] == 1
+    assert hasher.decode(encoded)["memory_cost"] == 1024
+    assert hasher.verify("password", encoded)
+
+    settings.PASSWORD_HASHING = {**settings.PASSWORD_HASHING, "ARGON2_TIME_COST": 2}
+    assert hasher.must_update(encoded)
+
+
+def test_hash_password_runs_in_pool(monkeypatch):
+    threads = []
+
+    def make_password(raw_password):
+        threads.append(threading.current_thread().name)
+        return f"hashed:{raw_password}"
+
+    monkeypatch.setattr(hashing_pool, "make_password", make_password)
+
+    assert hash_password("password") == "hashed:password"
+    assert threads[0].startswith("password-hashing")
+
+
+def test_hash_password_result_is_checkable():
+    assert check_password("password", hash_password("password"))
@@ -0,0 +1,116 @@
+import io
+import uuid
+from datetime import date, datetime
+from datetime import timezone as dt_timezone
+from decimal import Decimal
+
+import msgpack
+import pytest
+from booking_app_admin.models import Booking, Room
+from booking_app_api.utils.renderers import (MessagePackParser,
+                                             MessagePackRenderer, ORJSONParser,
+                                             ORJSONRenderer)
+from booking_app_api.v1.serializers import BookingSerializer, RoomSerializer
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ErrorDetail, ParseError
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+
+
+def payloads():
+    room = Room(id=1, name="Для двоих\u2028", price_per_day=Decimal("100.5"), capacity=2)
+    booking = Booking(
+        id=7,
+        room=room,
+        date_start=datetime(2025, 1, 1, 21, 0, tzinfo=dt_timezone.utc),
+        date_end=timezone.make_aware(datetime(2025, 1, 3, 12, 30, 15, 123456)),
+    )
+    return [
+        RoomSerializer([room], many=True).data,
+        BookingSerializer(booking).data,
+        {"detail": ErrorDetail("Комната уже забронирована.", code="invalid")},
+        {
+            "decimal": Decimal("1.10"),
+            "utc": datetime(2025, 1, 1, tzinfo=dt_timezone.utc),
+            "aware": timezone.make_aware(datetime(2025, 1, 1, 0, 0, 0, 5)),
+            "date": date(2025, 1, 1),
+            "uuid": uuid.UUID(int=1),
+            "lazy": gettext_lazy("This field is required."),
+            "tuple": (1, 2),
+            1: "int key",
+            "big": 2**70,
+        },
+    ]
+
+
+@pytest.mark.parametrize("data", payloads())
+def test_orjson_renderer_parity(data):
+    assert ORJSONRenderer().render(data) == JSONRenderer().render(data)
+
+
+def test_orjson_renderer_indent_falls_back():
+    data = {"a": [1, 2]}
+    assert ORJSONRenderer().render(
+        data, "application/json; indent=4"
+    ) == JSONRenderer().render(data, "application/json; indent=4")
+
+
+def test_orjson_parser():
+    stream = io.BytesIO('{"room": 1, "name": "Для двоих"}'.encode())
+    assert ORJSONParser().parse(stream) == {"room": 1, "name": "Для двоих"}
+
+    with pytest.raises(ParseError):
+        ORJSONParser().parse(io.BytesIO(b'{"room": NaN}'))
+
+
+@pytest.mark.parametrize("data", payloads()[:3])
+def test_msgpack_roundtrip(data):
+    rendered = MessagePackRenderer().render(data)
+    assert MessagePackParser().parse(io.BytesIO(rendered)) == data
+
+
+def test_msgpack_parser_error():
+    with pytest.raises(ParseError):
+        MessagePackParser().parse(io.BytesIO(b"\xc1"))
+
+
+@pytest.mark.django_db(transaction=True, reset_sequences=True)
+def test_msgpack_content_negotiation():
+    Room.objects.create(name="Для двоих", price_per_day=Decimal("100.00"), capacity=2)
+    client = APIClient()
+
+    response = client.get(reverse("all-rooms"), HTTP_ACCEPT="application/msgpack")
+
+    assert response.status_code == 200
+    assert response["Content-Type"] == "application/msgpack"
+    data = msgpack.unpackb(response.content)
+    assert data["results"] == [
+        {"id": 1, "name": "Для двоих", "capacity": 2, "price_per_day": "100.00"}
+    ]
+
+
+@pytest.mark.django_db(transaction=True, reset_sequences=True)
+def test_msgpack_request_body():
+    user = get_user_model().objects.create_user(username="user", password="54321")
+    room = Room.objects.create(
+        name="Для двоих", price_per_day=Decimal("100.00"), capacity=2
+    )
+    client = APIClient()
+    client.force_authenticate(user=user)
+    body = msgpack.packb(
+        {
+            "room": room.id,
+            "date_start": "2030-01-01T12:00:00+03:00",
+            "date_end": "2030-01-03T12:00:00+03:00",
+        }
+    )
+
+    response = client.post(
+        reverse("create-booking"), body, content_type="application/msgpack"
+    )
+
+    assert response.status_code == 201
+    assert Booking.objects.filter(room=room).exists()
@@ -0,0 +1,133 @@
+import logging
+import re
+from contextlib import contextmanager
+from decimal import Decimal
+
+import pytest
+from asgiref.sync import async_to_sync
+from booking_app_admin.models import Room
+from booking_app_api.utils.instrumentation import request_timing
+from booking_app_api.v1.views import mixins
+from django.urls import reverse
+
+ASYNC_URLCONF = "booking_app_api.v1.urls_async"
+SERVER_TIMING = re.compile(
+    r'db;dur=\d+\.\d;desc="(\d+) queries", serialize;dur=(\d+\.\d), total;dur=\d+\.\d'
+)
+
+
+@pytest.fixture
+def rooms(db):
+    return Room.objects.bulk_create(
+        Room(name=f"Комната {i}", price_per_day=Decimal("100.00"), capacity=2)
+        for i in range(3)
+    )
+
+
+@pytest.fixture
+def timing_settings(settings):
+    settings.REQUEST_TIMING = {
+        "ENABLED": True,
+        "SAMPLE_RATE": 1.0,
+        "SERVER_TIMING_HEADER": True,
+        "SLOW_REQUEST_MS": 10_000,
+    }
+    return settings
+
+
+@pytest.fixture
+def slow_requests(caplog):
+    return lambda: [
+        record for record in caplog.records if record.name == request_timing.logger.name
+    ]
+
+
+@pytest.mark.django_db(transaction=True, reset_sequences=True)
+def test_server_timing_header(client, rooms, timing_settings):
+    response = client.get(reverse("all-rooms"))
+
+    match = SERVER_TIMING.fullmatch(response.headers["Server-Timing"])
+    assert match is not None
+    assert int(match[1]) >= 1
+
+
+@pytest.mark.django_db(transaction=True, reset_sequences=True)
+def test_server_timing_header_for_async_view(async_client, rooms, timing_settings):
+    timing_settings.ROOT_URLCONF = ASYNC_URLCONF
+
+    response = async_to_sync(async_client.get)(reverse("all-rooms"))
+
+    match = SERVER_TIMING.fullmatch(response.headers["Server-Timing"])
+    assert match is not None
+    assert int(match[1]) >= 1
+
+
+def test_serialize_excludes_queries_inside_block(monkeypatch):
+    timing = request_timing.RequestTiming()
+    clock = iter([1.0, 1.5, 1.75, 2.0])
+    monkeypatch.setattr(request_timing.time, "perf_counter", lambda: next(clock))
+    token = request_timing._current.set(timing)
+    try:
+        with request_timing.measure_serialize():
+            timing(lambda *args: None, "SELECT 1", None, False, {})
+    finally:
+        request_timing._current.reset(token)
+
+    # Блок длился 1 с, из них запрос — 0.25 с.
+    assert timing.queries == 1
+    assert timing.db == 0.25
+    assert timing.serialize == 0.75
+
+
+@pytest.mark.django_db(transaction=True, reset_sequences=True)
+@pytest.mark.parametrize("fast", [True, False])
+def test_list_serializer_is_measured(client, rooms, timing_settings, monkeypatch, fast):
+    timing_settings.FAST_SERIALIZATION = {"ENABLED": fast}
+    measured = []
+
+    @contextmanager
+    def measure_serialize():
+        yield
+        measured.append(request_timing.current_timing())
+
+    monkeypatch.setattr(mixins, "measure_serialize", measure_serialize)
+
+    client.get(reverse("all-rooms"))
+
+    assert len(measured) == 1 and measured[0] is not None
+
+
+@pytest.mark.django_db(transaction=True, reset_sequences=True)
+def test_not_sampled_request_has_no_header(client, rooms, timing_settings):
+    timing_settings.REQUEST_TIMING = {
+        **timing_settings.REQUEST_TIMING,
+        "SAMPLE_RATE": 0,
+    }
+
+    response = client.get(reverse("all-rooms"))
+
+    assert "Server-Timing" not in response.headers
+
+
+@pytest.mark.django_db(transaction=True, reset_sequences=True)
+def test_slow_request_is_logged(client, rooms, timing_settings, slow_requests):
+    timing_settings.REQUEST_TIMING = {
+        **timing_settings.REQUEST_TIMING,
+        "SLOW_REQUEST_MS": 0,
+    }
+
+    client.get(reverse("all-rooms"))
+
+    [record] = slow_requests()
+    assert record.levelno == logging.WARNING
+    assert record.path == reverse("all-rooms")
+    assert record.status == 200
+    assert record.queries >= 1
+    assert record.duration_ms >= record.db_ms
+
+
+@pytest.mark.django_db(transaction=True, reset_sequences=True)
+def test_fast_request_is_not_logged(client, rooms, timing_settings, slow_requests):
+    client.get(reverse("all-rooms"))
+
+    assert slow_requests() == []
@@ -0,0 +1,202 @@
+from datetime import datetime, time, timedelta
+from datetime import timezone as dt_timezone
+from decimal import Decimal
+
+import pytest
+from booking_app_admin.models import Booking, Room
+from booking_app_api.utils.cache import search_cache
+from booking_app_api.utils.cache.availability_versions import (bump_period,
+                                                               get_versions,
+                                                               version_keys)
+from django.core.cache import caches
+from django.urls import reverse
+from django.utils import timezone
+
+
+def day(offset):
+    return timezone.make_aware(
+        datetime.combine(timezone.localdate() + timedelta(days=offset), time())
+    )
+
+
+@pytest.fixture
+def search_cache_enabled(settings):
+    settings.CACHES = {
+        **settings.CACHES,
+        "search": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "search-tests",
+        },
+    }
+    caches["search"].clear()
+    search_cache.reset_stats()
+    yield
+    caches["search"].clear()
+
+
+@pytest.fixture
+def rooms(db):
+    room1 = Room.objects.create(
+        name="Для двоих", price_per_day=Decimal("100.00"), capacity=2
+    )
+    room2 = Room.objects.create(
+        name="Для одного", price_per_day=Decimal("50.00"), capacity=1
+    )
+    return room1, room2
+
+
+def search(client, date_start, date_end, capacity=0):
+    response = client.get(
+        reverse("search-free-rooms"),
+        {
+            "date_start": date_start.isoformat(),
+            "date_end": date_end.isoformat(),
+            "capacity": capacity,
+        },
+    )
+    assert response.status_code == 200
+    return [room["id"] for room in response.data]
+
+
+@pytest.mark.django_db(transaction=True, reset_sequences=True)
+def test_repeated_search_hits_cache(
+    client, search_cache_enabled, rooms, django_assert_num_queries
+):
+    ids = search(client, day(1), day(3))
+
+    # Только чтение версий занятости.
+    with django_assert_num_queries(1):
+        assert search(client, day(1), day(3)) == ids
+
+    assert search_cache.stats() == {"hits": 1, "misses": 1, "hit_ratio": 0.5}
+
+
+@pytest.mark.django_db(transaction=True, reset_sequences=True)
+def test_equivalent_params_share_cache_entry(client, search_cache_enabled, rooms):
+    search(client, day(1), day(3))
+    response = client.get(
+        reverse("search-free-rooms"),
+        {
+            "date_start": day(1).astimezone(dt_timezone.utc).isoformat(),
+            "date_end": day(3).astimezone(dt_timezone.utc).isoformat(),
+        },
+    )
+
+    assert response.status_code == 200
+    assert search_cache.stats()["hits"] == 1
+
+
+@pytest.mark.django_db(transaction=True, reset_sequences=True)
+def test_booking_in_period_invalidates_entry(
+    client, search_cache_enabled, rooms, django_user_model
+):
+    room1, room2 = rooms
+    user = django_user_model.objects.create_user(username="user", password="54321")
+    assert room1.id in search(client, day(1), day(3))
+
+    booking = Booking.objects.create(
+        room=room1, user=user, date_start=day(2), date_end=day(4)
+    )
+    assert room1.id not in search(client, day(1), day(3))
+
+    booking.delete()
+    assert room1.id in search(client, day(1), day(3))
+    assert search_cache.stats()["hits"] == 0
+
+
+@pytest.mark.django_db(transaction=True, reset_sequences=True)
+def test_booking_outside_period_keeps_entry(
+    client, search_cache_enabled, rooms, django_user_model
+):
+    room1, _ = rooms
+    user = django_user_model.objects.create_user(username="user", password="54321")
+    search(client, day(1), day(3))
+
+    Booking.objects.create(room=room1, user=user, date_start=day(3), date_end=day(5))
+    search(client, day(1), day(3))
+
+    assert search_cache.stats()["hits"] == 1
+
+
+@pytest.mark.django_db(transaction=True, reset_sequences=True)
+def test_moved_booking_invalidates_old_and_new_periods(
+    client, search_cache_enabled, rooms, django_user_model
+):
+    room1, _ = rooms
+    user = django_user_model.objects.create_user(username="user", password="54321")
+    booking = Booking.objects.create(
+        room=room1, user=user, date_start=day(2), date_end=day(3)
+    )
+    assert room1.id not in search(client, day(1), day(3))
+    assert room1.id in search(client, day(10), day(12))
+    assert room1.id in search(client, day(20), day(22))
+
+    booking.date_start, booking.date_end = day(10), day(11)
+    booking.save()
+
+    assert room1.id in search(client, day(1), day(3))
+    assert room1.id not in search(client, day(10), day(12))
+    search(client, day(20), day(22))
+    # Сброшены только прежний и новый периоды брони.
+    assert search_cache.stats()["hits"] == 1
+
+
+@pytest.mark.django_db(transaction=True, reset_sequences=True)
+def test_room_change_invalidates_all_entries(client, search_cache_enabled, rooms):
+    room1, _ = rooms
+    assert room1.id in search(client, day(1), day(3), capacity=2)
+
+    room1.capacity = 1
+    room1.save()
+
+    assert room1.id not in search(client, day(1), day(3), capacity=2)
+    assert search_cache.stats()["hits"] == 0
+
+
+def use_worker_cache(settings, location):
+    """Кэш поиска отдельного воркера: у каждого процесса gunicorn свой LocMemCache."""
+    settings.CACHES = {
+        **settings.CACHES,
+        "search": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": location,
+        },
+    }
+
+
+@pytest.mark.django_db(transaction=True, reset_sequences=True)
+def test_booking_in_other_worker_invalidates_entry(
+    client, settings, search_cache_enabled, rooms, django_user_model
+):
+    room1, _ = rooms
+    user = django_user_model.objects.create_user(username="user", password="54321")
+    use_worker_cache(settings, "worker-1")
+    caches["search"].clear()
+    assert room1.id in search(client, day(1), day(3))
+
+    use_worker_cache(settings, "worker-2")
+    Booking.objects.create(room=room1, user=user, date_start=day(2), date_end=day(4))
+
+    use_worker_cache(settings, "worker-1")
+    assert room1.id not in search(client, day(1), day(3))
+    assert search_cache.stats()["hits"] == 0
+    caches["search"].clear()
+
+
+@pytest.mark.django_db(transaction=True, reset_sequences=True)
+def test_cache_version_store_is_per_worker_with_locmem(settings, search_cache_enabled):
+    settings.SEARCH_CACHE = {**settings.SEARCH_CACHE, "VERSION_STORE": "cache"}
+    keys = version_keys([day(1).date()])
+    use_worker_cache(settings, "worker-1")
+    versions = get_versions(keys)
+
+    use_worker_cache(settings, "worker-2")
+    bump_period(day(1), day(2))
+
+    use_worker_cache(settings, "worker-1")
+    assert get_versions(keys) == versions
+    settings.SEARCH_CACHE = {**settings.SEARCH_CACHE, "VERSION_STORE": "database"}
+    use_worker_cache(settings, "worker-2")
+    bump_period(day(1), day(2))
+    use_worker_cache(settings, "worker-1")
+    assert get_versions(keys) != versions
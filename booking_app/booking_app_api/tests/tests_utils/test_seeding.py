@@ -0,0 +1,106 @@
+import io
+import random
+from datetime import date, datetime, time
+
+import pytest
+from booking_app_admin.models import Booking, Room
+from booking_app_api.management.commands.seed_bookings import DEFAULT_START
+from booking_app_api.utils.cache.availability_versions import (GLOBAL_KEY,
+                                                               get_versions)
+from booking_app_api.utils.seeding import LENGTH_DISTRIBUTIONS, room_intervals
+from django.contrib.auth import get_user_model
+from django.core.management import CommandError, call_command
+from django.utils.timezone import make_aware
+
+
+def seeded_bookings():
+    return list(
+        Booking.objects.order_by("room__name", "date_start").values_list(
+            "room__name", "user__username", "date_start", "date_end"
+        )
+    )
+
+
+@pytest.mark.parametrize("distribution", sorted(LENGTH_DISTRIBUTIONS))
+def test_room_intervals_do_not_overlap(distribution):
+    draw_length = LENGTH_DISTRIBUTIONS[distribution](4)
+    intervals = list(
+        room_intervals(
+            random.Random(0), date(2025, 1, 1), 3650, 0.7, 0.0, 200, draw_length, 4, 30
+        )
+    )
+
+    for (day, length), (next_day, _) in zip(intervals, intervals[1:]):
+        assert day + length <= next_day
+    assert all(1 <= length <= 30 for _, length in intervals)
+    occupied = sum(length for _, length in intervals) / 3650
+    assert occupied == pytest.approx(0.7, abs=0.05)
+
+
+def test_room_intervals_follow_seasonality():
+    draw_length = LENGTH_DISTRIBUTIONS["geometric"](3)
+    occupied = {"peak": 0, "low": 0}
+    for index in range(50):
+        for day, length in room_intervals(
+            random.Random(index),
+            date(2025, 1, 1),
+            365,
+            0.5,
+            0.6,
+            200,
+            draw_length,
+            3,
+            30,
+        ):
+            # Пик загрузки — в июле, спад — в январе.
+            if 170 <= day < 230:
+                occupied["peak"] += length
+            elif day < 60:
+                occupied["low"] += length
+
+    assert occupied["peak"] > 2 * occupied["low"]
+
+
+@pytest.mark.django_db(transaction=True, reset_sequences=True)
+def test_seed_bookings_command_is_deterministic():
+    options = ["--rooms", "4", "--users", "5", "--days", "90"]
+    call_command("seed_bookings", *options, "--batch-size", "7", stdout=io.StringIO())
+    first = seeded_bookings()
+
+    call_command("seed_bookings", *options, "--clear", stdout=io.StringIO())
+
+    assert first and seeded_bookings() == first
+    assert min(booking[2] for booking in first).date() >= DEFAULT_START
+    assert set(get_user_model().objects.values_list("date_joined", flat=True)) == {
+        make_aware(datetime.combine(DEFAULT_START, time()))
+    }
+    assert Room.objects.count() == 4
+    assert get_user_model().objects.count() == 5
+
+
+@pytest.mark.django_db(transaction=True, reset_sequences=True)
+def test_seed_bookings_command_requires_clear_for_existing_prefix():
+    options = ["--rooms", "1", "--users", "1", "--days", "10"]
+    call_command("seed_bookings", *options, stdout=io.StringIO())
+
+    with pytest.raises(CommandError):
+        call_command("seed_bookings", *options, stdout=io.StringIO())
+
+
+@pytest.mark.django_db(transaction=True, reset_sequences=True)
+def test_seed_bookings_command_bumps_shared_versions():
+    """Версии лежат в БД, поэтому сброс из команды видят все воркеры."""
+    versions = get_versions([GLOBAL_KEY])
+
+    call_command(
+        "seed_bookings",
+        "--rooms",
+        "1",
+        "--users",
+        "1",
+        "--days",
+        "10",
+        stdout=io.StringIO(),
+    )
+
+    assert get_versions([GLOBAL_KEY]) != versions
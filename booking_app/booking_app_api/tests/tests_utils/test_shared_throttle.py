@@ -0,0 +1,119 @@
+import multiprocessing
+import time
+import uuid
+
+import pytest
+from booking_app_api.utils.throttling.shared_throttle import (
+    TABLE, CacheThrottleStore, DatabaseThrottleStore, SharedRateThrottle)
+from django.core.cache import cache
+from django.db import connection, connections
+from rest_framework.test import APIRequestFactory
+
+PROCESSES = 4
+HITS_PER_PROCESS = 25
+LIMIT = 30
+
+
+@pytest.fixture
+def throttle_key():
+    key = f"throttle_tests_{uuid.uuid4().hex}"
+    yield key
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {TABLE} WHERE key = %s", [key])
+    cache.delete(key)
+
+
+@pytest.fixture
+def database_store(settings):
+    settings.THROTTLE_STORE = {"BACKEND": "database", "PURGE_RATE": 0}
+    return DatabaseThrottleStore()
+
+
+def hit_many(key):
+    """Запросы одного процесса: сколько из них прошло ограничение."""
+    store = DatabaseThrottleStore()
+    allowed = sum(
+        store.hit(key, time.time(), LIMIT, 60)[0] for _ in range(HITS_PER_PROCESS)
+    )
+    connections.close_all()
+    return allowed
+
+
+@pytest.mark.django_db(transaction=True, reset_sequences=True)
+@pytest.mark.parametrize("store_class", [DatabaseThrottleStore, CacheThrottleStore])
+def test_store_window(settings, throttle_key, store_class):
+    settings.THROTTLE_STORE = {"BACKEND": "database", "PURGE_RATE": 0}
+    store = store_class()
+
+    assert store.hit(throttle_key, 100.0, 2, 10) == (True, [100.0])
+    assert store.hit(throttle_key, 101.0, 2, 10) == (True, [101.0, 100.0])
+    assert store.hit(throttle_key, 102.0, 2, 10) == (False, [101.0, 100.0])
+    # Запрос в момент 100 выходит из окна (100, 110].
+    assert store.hit(throttle_key, 110.0, 2, 10) == (True, [110.0, 101.0])
+
+
+@pytest.mark.django_db(transaction=True, reset_sequences=True)
+def test_database_store_zero_rate(database_store, throttle_key):
+    assert database_store.hit(throttle_key, 100.0, 0, 10) == (False, [])
+    assert database_store.hit(throttle_key, 101.0, 0, 10) == (False, [])
+
+
+@pytest.mark.django_db(transaction=True, reset_sequences=True)
+def test_database_store_purges_expired(settings, database_store, throttle_key):
+    database_store.hit(throttle_key, 100.0, 1, 10)
+    settings.THROTTLE_STORE = {"BACKEND": "database", "PURGE_RATE": 1}
+
+    database_store.hit(f"{throttle_key}_other", 200.0, 1, 10)
+
+    with connection.cursor() as cursor:
+        cursor.execute(f"SELECT count(*) FROM {TABLE} WHERE key = %s", [throttle_key])
+        assert cursor.fetchone()[0] == 0
+        cursor.execute(f"DELETE FROM {TABLE} WHERE key = %s", [f"{throttle_key}_other"])
+
+
+@pytest.mark.django_db(transaction=True, reset_sequences=True)
+def test_database_store_limit_holds_across_processes(database_store, throttle_key):
+    # Дочерние процессы открывают свои соединения с БД.
+    connections.close_all()
+    context = multiprocessing.get_context("fork")
+    with context.Pool(PROCESSES) as pool:
+        allowed = pool.map(hit_many, [throttle_key] * PROCESSES)
+
+    assert sum(allowed) == LIMIT
+    _, history = database_store.hit(throttle_key, time.time(), LIMIT, 60)
+    assert len(history) == LIMIT
+
+
+@pytest.mark.django_db(transaction=True, reset_sequences=True)
+def test_throttles_use_shared_store(database_store, throttle_key):
+    class LimitedThrottle(SharedRateThrottle):
+        scope = throttle_key
+        rate = "2/min"
+
+        def get_cache_key(self, request, view):
+            return self.cache_format % {
+                "scope": self.scope,
+                "ident": self.get_ident(request),
+            }
+
+    class OtherThrottle(LimitedThrottle):
+        scope = f"{throttle_key}_other"
+
+    request = APIRequestFactory().post("/", REMOTE_ADDR="10.0.0.1")
+    keys = [
+        throttle.get_cache_key(request, None)
+        for throttle in (LimitedThrottle(), OtherThrottle())
+    ]
+
+    try:
+        results = [LimitedThrottle().allow_request(request, None) for _ in range(3)]
+        assert results == [True, True, False]
+
+        throttle = LimitedThrottle()
+        assert not throttle.allow_request(request, None)
+        assert 0 < throttle.wait() <= 60
+        # У другой области свой лимит.
+        assert OtherThrottle().allow_request(request, None)
+    finally:
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {TABLE} WHERE key = ANY(%s)", [keys])
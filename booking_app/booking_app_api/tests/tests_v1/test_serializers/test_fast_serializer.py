@@ -0,0 +1,105 @@
+import json
+from datetime import datetime
+from datetime import timezone as dt_timezone
+from decimal import Decimal
+
+import pytest
+from booking_app_admin.models import Booking, Room
+from booking_app_api.v1.serializers import (BookingSerializer, FastSerializer,
+                                            RoomSerializer,
+                                            fast_booking_serializer,
+                                            fast_room_serializer)
+from django.contrib.auth import get_user_model
+from django.core.exceptions import ImproperlyConfigured
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import serializers
+from rest_framework.test import APIClient
+
+
+def as_json(data):
+    return json.loads(json.dumps(data))
+
+
+@pytest.fixture
+def bookings(db):
+    user = get_user_model().objects.create_user(username="user", password="54321")
+    rooms = [
+        Room.objects.create(name="Для двоих", price_per_day=Decimal("100"), capacity=2),
+        Room.objects.create(
+            name="Для одного", price_per_day=Decimal("49.9"), capacity=1
+        ),
+    ]
+    return user, [
+        Booking.objects.create(
+            room=rooms[0],
+            user=user,
+            date_start=datetime(2025, 1, 1, 21, 0, tzinfo=dt_timezone.utc),
+            date_end=datetime(2025, 1, 3, 12, 30, 15, 123456, tzinfo=dt_timezone.utc),
+        ),
+        Booking.objects.create(
+            room=rooms[1],
+            user=user,
+            date_start=timezone.make_aware(datetime(2025, 6, 1)),
+            date_end=timezone.make_aware(datetime(2025, 6, 2, 0, 0, 0, 1)),
+        ),
+    ]
+
+
+@pytest.mark.django_db(transaction=True, reset_sequences=True)
+def test_room_parity(bookings):
+    queryset = Room.objects.order_by("id")
+
+    assert fast_room_serializer.serialize(queryset) == as_json(
+        RoomSerializer(queryset, many=True).data
+    )
+
+
+@pytest.mark.django_db(transaction=True, reset_sequences=True)
+@pytest.mark.parametrize("tz", ["Europe/Moscow", "UTC", "America/New_York"])
+def test_booking_parity(bookings, tz):
+    queryset = Booking.objects.order_by("id").prefetch_related("room")
+
+    with timezone.override(tz):
+        expected = as_json(BookingSerializer(queryset, many=True).data)
+        assert fast_booking_serializer.serialize(queryset) == expected
+
+
+@pytest.mark.django_db(transaction=True, reset_sequences=True)
+def test_unsupported_field():
+    class RoomWithMethodSerializer(serializers.ModelSerializer):
+        title = serializers.SerializerMethodField()
+
+        class Meta:
+            model = Room
+            fields = ["id", "title"]
+
+        def get_title(self, obj):
+            return obj.name
+
+    with pytest.raises(ImproperlyConfigured):
+        FastSerializer(RoomWithMethodSerializer).paths
+
+
+@pytest.mark.django_db(transaction=True, reset_sequences=True)
+@pytest.mark.parametrize(
+    "url_name, params",
+    [
+        ("all-rooms", {}),
+        ("all-rooms", {"ordering": "-price_per_day", "page_size": 1}),
+        ("user-all-booking", {"page_size": 1}),
+    ],
+)
+def test_view_parity(bookings, settings, url_name, params):
+    user, _ = bookings
+    client = APIClient()
+    client.force_authenticate(user=user)
+    url = reverse(url_name)
+
+    settings.FAST_SERIALIZATION = {"ENABLED": False}
+    expected = client.get(url, params).json()
+    settings.FAST_SERIALIZATION = {"ENABLED": True}
+    response = client.get(url, params)
+
+    assert response.status_code == 200
+    assert response.json() == expected
@@ -0,0 +1,136 @@
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+from booking_app_admin.models import Booking, BookingDailyRollup, Room
+from booking_app_api.utils.cache.availability_versions import (get_versions,
+                                                               period_days,
+                                                               version_keys)
+from django.contrib.auth import get_user_model
+from django.test import override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import AccessToken
+
+
+@pytest.mark.django_db(transaction=True, reset_sequences=True)
+@override_settings(ROOT_URLCONF="booking_app_api.v1.urls_async")
+class AsyncUserBookingApiTest(APITestCase):
+    def setUp(self):
+        User = get_user_model()
+        self.user = User.objects.create_user(username="user", password="54321")
+        self.other = User.objects.create_user(username="other", password="54321")
+        self.superuser = User.objects.create_superuser(
+            username="admin", password="admin"
+        )
+        room = Room.objects.create(
+            name="Для двоих", price_per_day=Decimal("100.00"), capacity=2
+        )
+        self.bookings = [
+            Booking.objects.create(
+                room=room,
+                user=self.user,
+                date_start=timezone.make_aware(datetime(2021, 1, day)),
+                date_end=timezone.make_aware(datetime(2021, 1, day + 1)),
+            )
+            for day in (5, 1, 3)
+        ]
+
+    def login(self, user):
+        self.client.credentials(
+            HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(user)}"
+        )
+
+    def test_user_bookings(self):
+        self.login(self.user)
+        response = self.client.get(reverse("user-all-booking"), {"page_size": 2})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()
+        self.assertEqual(
+            [booking["id"] for booking in data["results"]],
+            [self.bookings[1].id, self.bookings[2].id],
+        )
+        self.assertEqual(data["results"][0]["room"]["name"], "Для двоих")
+
+        response = self.client.get(data["next"])
+        self.assertEqual(
+            [booking["id"] for booking in response.json()["results"]],
+            [self.bookings[0].id],
+        )
+
+    def test_user_bookings_force_authenticate(self):
+        self.client.force_authenticate(user=self.other)
+        response = self.client.get(reverse("user-all-booking"))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["results"], [])
+
+    def test_user_bookings_without_auth(self):
+        response = self.client.get(reverse("user-all-booking"))
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertIn("Bearer", response["WWW-Authenticate"])
+
+    def test_invalid_token(self):
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer not-a-token")
+        response = self.client.get(reverse("user-all-booking"))
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual(response.json()["code"], "token_not_valid")
+
+    def test_get_booking(self):
+        booking = self.bookings[0]
+        url = reverse("user-booking", args=[booking.id])
+
+        self.login(self.user)
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["id"], booking.id)
+
+        self.login(self.other)
+        self.assertEqual(self.client.get(url).status_code, status.HTTP_403_FORBIDDEN)
+
+        self.login(self.superuser)
+        self.assertEqual(self.client.get(url).status_code, status.HTTP_200_OK)
+
+        response = self.client.get(reverse("user-booking", args=[999]))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_delete_booking(self):
+        booking = self.bookings[0]
+        url = reverse("user-booking", args=[booking.id])
+
+        self.login(self.other)
+        self.assertEqual(self.client.delete(url).status_code, status.HTTP_403_FORBIDDEN)
+
+        self.login(self.user)
+        response = self.client.delete(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.json(), {"detail": f"Бронь с id {booking.id} успешно удалена."}
+        )
+        self.assertFalse(Booking.objects.filter(id=booking.id).exists())
+
+    def test_delete_booking_invalidates_rollup_and_cache_versions(self):
+        booking = self.bookings[0]
+        with self.captureOnCommitCallbacks(execute=True):
+            booking.save()
+        keys = version_keys(period_days(booking.date_start, booking.date_end))
+        rollup = BookingDailyRollup.objects.filter(
+            room=booking.room, day=booking.date_start.date()
+        )
+        self.assertTrue(rollup.exists())
+        versions = get_versions(keys)
+
+        self.login(self.user)
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            response = self.client.delete(reverse("user-booking", args=[booking.id]))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(callbacks)
+        self.assertFalse(rollup.exists())
+        self.assertNotEqual(get_versions(keys), versions)
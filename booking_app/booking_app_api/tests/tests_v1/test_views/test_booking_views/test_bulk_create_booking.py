@@ -0,0 +1,166 @@
+from decimal import Decimal
+
+import pytest
+from booking_app_admin.models import Booking, Room
+from booking_app_api.signals import bookings_created
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+
+
+@pytest.mark.django_db(transaction=True, reset_sequences=True)
+class UserBulkCreateBookingApiTest(APITestCase):
+    def setUp(self):
+        self.User = get_user_model()
+        self.user = self.User.objects.create_user(username="user", password="54321")
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+        self.url = reverse("bulk-create-booking")
+
+        self.room1 = Room.objects.create(
+            name="Для двоих", price_per_day=Decimal("100.00"), capacity=2
+        )
+        self.room2 = Room.objects.create(
+            name="Для одного", price_per_day=Decimal("50.00"), capacity=1
+        )
+        self.start = timezone.now() + timezone.timedelta(days=1)
+
+    def item(self, room, start_day=0, days=2):
+        date_start = self.start + timezone.timedelta(days=start_day)
+        return {
+            "room": room.id,
+            "date_start": date_start.isoformat(),
+            "date_end": (date_start + timezone.timedelta(days=days)).isoformat(),
+        }
+
+    def post(self, bookings, mode=None):
+        data = {"bookings": bookings}
+        if mode:
+            data["mode"] = mode
+        return self.client.post(self.url, data, format="json")
+
+    def statuses(self, response):
+        return [result["status"] for result in response.data["results"]]
+
+    def test_bulk_create(self):
+        response = self.post([self.item(self.room1), self.item(self.room2)])
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["mode"], "atomic")
+        self.assertEqual(self.statuses(response), [201, 201])
+        self.assertEqual(response.data["results"][1]["data"]["room"], self.room2.id)
+        self.assertEqual(Booking.objects.filter(user=self.user).count(), 2)
+
+    def test_bulk_create_without_auth(self):
+        self.client.logout()
+        response = self.post([self.item(self.room1)])
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_best_effort_skips_conflicting_booking(self):
+        Booking.objects.create(
+            user=self.user,
+            room=self.room1,
+            date_start=self.start,
+            date_end=self.start + timezone.timedelta(days=3),
+        )
+
+        response = self.post(
+            [self.item(self.room1), self.item(self.room2)], mode="best_effort"
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_207_MULTI_STATUS)
+        self.assertEqual(self.statuses(response), [409, 201])
+        self.assertTrue(Booking.objects.filter(room=self.room2).exists())
+
+    def test_best_effort_validation_error(self):
+        invalid = self.item(self.room2)
+        invalid["date_end"] = invalid["date_start"]
+
+        response = self.post([self.item(self.room1), invalid], mode="best_effort")
+
+        self.assertEqual(response.status_code, status.HTTP_207_MULTI_STATUS)
+        self.assertEqual(self.statuses(response), [201, 400])
+        self.assertIn("errors", response.data["results"][1])
+
+    def test_atomic_rolls_back_on_overlap_inside_batch(self):
+        response = self.post(
+            [
+                self.item(self.room2),
+                self.item(self.room1),
+                self.item(self.room1, start_day=1),
+            ]
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+        self.assertEqual(self.statuses(response), [424, 424, 409])
+        self.assertFalse(Booking.objects.exists())
+
+    def test_atomic_validation_error(self):
+        response = self.post([self.item(self.room1), {"room": 0}])
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.statuses(response), [424, 400])
+        self.assertFalse(Booking.objects.exists())
+
+    def test_bookings_created_sent_once(self):
+        sent = []
+
+        def receiver(sender, bookings, **kwargs):
+            sent.append([booking.pk for booking in bookings])
+
+        bookings_created.connect(receiver, sender=Booking, weak=False)
+        try:
+            response = self.post([self.item(self.room1), self.item(self.room2)])
+        finally:
+            bookings_created.disconnect(receiver, sender=Booking)
+
+        ids = [result["data"]["id"] for result in response.data["results"]]
+        self.assertEqual(sent, [ids])
+
+    def test_too_many_items(self):
+        with self.settings(BULK_BOOKING={"MAX_ITEMS": 1}):
+            response = self.post([self.item(self.room1), self.item(self.room2)])
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("bookings", response.data)
+        self.assertFalse(Booking.objects.exists())
+
+    def test_empty_list(self):
+        response = self.post([])
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+@pytest.mark.django_db(transaction=True, reset_sequences=True)
+def test_queries_do_not_grow_with_items(
+    django_user_model, django_assert_max_num_queries
+):
+    user = django_user_model.objects.create_user(username="user", password="54321")
+    client = APIClient()
+    client.force_authenticate(user=user)
+    rooms = [
+        Room.objects.create(
+            name=f"Комната {i}", price_per_day=Decimal("10.00"), capacity=1
+        )
+        for i in range(20)
+    ]
+    start = timezone.now() + timezone.timedelta(days=1)
+    items = [
+        {
+            "room": room.id,
+            "date_start": (start + timezone.timedelta(days=i)).isoformat(),
+            "date_end": (start + timezone.timedelta(days=i + 2)).isoformat(),
+        }
+        for i, room in enumerate(rooms)
+    ]
+
+    # Поиск комнат, вставка, один пересчёт агрегатов и одно повышение версий
+    # на весь пакет вместо post_save на каждую бронь.
+    with django_assert_max_num_queries(12):
+        response = client.post(
+            reverse("bulk-create-booking"), {"bookings": items}, format="json"
+        )
+
+    assert response.status_code == status.HTTP_201_CREATED
+    assert Booking.objects.count() == 20
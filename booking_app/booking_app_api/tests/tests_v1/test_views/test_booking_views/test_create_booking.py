@@ -2,7 +2,7 @@ from datetime import datetime
 from decimal import Decimal
 
 import pytest
-from booking_app_admin.models import Room
+from booking_app_admin.models import Room, max_booking_days
 from django.contrib.auth import get_user_model
 from django.urls import reverse
 from django.utils import timezone
@@ -64,3 +64,14 @@ class UserCreateBookingApiTest(APITestCase):
         self.client.post(url, data)
         error_response = self.client.post(url, data)
         self.assertEqual(error_response.status_code, status.HTTP_409_CONFLICT)
+
+    def test_create_too_long_booking(self):
+        url = reverse("create-booking")
+        data = {
+            "room": self.room1.id,
+            "date_start": datetime.now(),
+            "date_end": datetime.now()
+            + timezone.timedelta(days=max_booking_days(), minutes=1),
+        }
+        response = self.client.post(url, data)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,108 @@
+import csv
+import io
+import json
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+from booking_app_admin.models import Booking, Room
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+
+
+@pytest.mark.django_db(transaction=True, reset_sequences=True)
+class ExportBookingApiTest(APITestCase):
+    def setUp(self):
+        self.User = get_user_model()
+        self.user = self.User.objects.create_user(username="user", password="54321")
+        self.superuser = self.User.objects.create_superuser(
+            username="admin", password="admin", email="admin@example.com"
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.superuser)
+        self.url = reverse("export-booking")
+
+        self.room1 = Room.objects.create(
+            name="Для двоих", price_per_day=Decimal("100.00"), capacity=2
+        )
+        self.room2 = Room.objects.create(
+            name="Для одного", price_per_day=Decimal("50.00"), capacity=1
+        )
+        self.booking1 = Booking.objects.create(
+            room=self.room1,
+            user=self.user,
+            date_start=timezone.make_aware(datetime(2025, 1, 1)),
+            date_end=timezone.make_aware(datetime(2025, 1, 3)),
+        )
+        self.booking2 = Booking.objects.create(
+            room=self.room2,
+            user=self.superuser,
+            date_start=timezone.make_aware(datetime(2025, 2, 1)),
+            date_end=timezone.make_aware(datetime(2025, 2, 3)),
+        )
+
+    def content(self, response):
+        return b"".join(response.streaming_content).decode()
+
+    def test_export_ndjson(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        self.assertEqual(
+            response["Content-Type"], "application/x-ndjson; charset=utf-8"
+        )
+        rows = [json.loads(line) for line in self.content(response).splitlines()]
+        self.assertEqual(
+            [row["id"] for row in rows], [self.booking1.id, self.booking2.id]
+        )
+        self.assertEqual(rows[0]["room_name"], "Для двоих")
+        self.assertEqual(rows[0]["username"], "user")
+        self.assertEqual(rows[1]["room_price_per_day"], "50.00")
+        self.assertEqual(
+            datetime.fromisoformat(rows[0]["date_start"]), self.booking1.date_start
+        )
+
+    def test_export_csv(self):
+        response = self.client.get(self.url, {"export_format": "csv"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn("bookings.csv", response["Content-Disposition"])
+        rows = list(csv.DictReader(io.StringIO(self.content(response))))
+        self.assertEqual(len(rows), 2)
+        self.assertEqual(rows[1]["user_email"], "admin@example.com")
+
+    def test_export_filters(self):
+        response = self.client.get(
+            self.url,
+            {
+                "date_start": "2025-01-15T00:00:00+03:00",
+                "date_end": "2025-03-01T00:00:00+03:00",
+            },
+        )
+        rows = [json.loads(line) for line in self.content(response).splitlines()]
+        self.assertEqual([row["id"] for row in rows], [self.booking2.id])
+
+        response = self.client.get(self.url, {"room": self.room1.id})
+        rows = [json.loads(line) for line in self.content(response).splitlines()]
+        self.assertEqual([row["id"] for row in rows], [self.booking1.id])
+
+    def test_export_wrong_params(self):
+        response = self.client.get(self.url, {"export_format": "xml"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        response = self.client.get(self.url, {"room": 0})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_export_not_superuser(self):
+        self.client.force_authenticate(user=self.user)
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_export_without_auth(self):
+        self.client.logout()
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
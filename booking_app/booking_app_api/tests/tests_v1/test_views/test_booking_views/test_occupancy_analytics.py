@@ -0,0 +1,115 @@
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+from booking_app_admin.models import Booking, Room
+from django.contrib.auth import get_user_model
+from django.test import override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+
+
+@pytest.mark.django_db(transaction=True, reset_sequences=True)
+class OccupancyAnalyticsApiTest(APITestCase):
+    def setUp(self):
+        User = get_user_model()
+        self.user = User.objects.create_user(username="user", password="54321")
+        self.superuser = User.objects.create_superuser(
+            username="admin", password="admin", email="admin@example.com"
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.superuser)
+        self.url = reverse("occupancy-analytics")
+        self.room1 = Room.objects.create(
+            name="Для двоих", price_per_day=Decimal("100.00"), capacity=2
+        )
+        self.room2 = Room.objects.create(
+            name="Для одного", price_per_day=Decimal("50.00"), capacity=1
+        )
+        # Понедельник 3 февраля 2025 — пятница 7 февраля, плюс половина суток 28 февраля.
+        for room, start, end in [
+            (self.room1, datetime(2025, 2, 3), datetime(2025, 2, 8)),
+            (self.room1, datetime(2025, 2, 28, 12), datetime(2025, 3, 1)),
+            (self.room2, datetime(2025, 2, 10), datetime(2025, 2, 11)),
+        ]:
+            # Статистика пересчитывается после коммита транзакции с бронью.
+            with self.captureOnCommitCallbacks(execute=True):
+                Booking.objects.create(
+                    room=room,
+                    user=self.user,
+                    date_start=timezone.make_aware(start),
+                    date_end=timezone.make_aware(end),
+                )
+
+    def report(self, **params):
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [
+            (
+                row["room"],
+                row["period_start"],
+                row["booked_hours"],
+                row["occupancy"],
+                row["revenue"],
+            )
+            for row in response.data
+        ]
+
+    def test_month_report(self):
+        rows = self.report(
+            date_start="2025-02-01", date_end="2025-02-28", period="month"
+        )
+
+        self.assertEqual(
+            rows,
+            [
+                (self.room1.id, "2025-02-01", "132.00", "0.1964", "550.00"),
+                (self.room2.id, "2025-02-01", "24.00", "0.0357", "50.00"),
+            ],
+        )
+
+    def test_week_report_clipped_to_range(self):
+        rows = self.report(
+            date_start="2025-02-05",
+            date_end="2025-02-16",
+            period="week",
+            room=self.room1.id,
+        )
+
+        # Неделя с 3 февраля учитывается с 5-го: 3 занятых суток из 5.
+        self.assertEqual(
+            rows, [(self.room1.id, "2025-02-03", "72.00", "0.6000", "300.00")]
+        )
+
+    def test_day_report(self):
+        rows = self.report(date_start="2025-02-28", date_end="2025-03-01")
+
+        self.assertEqual(
+            rows, [(self.room1.id, "2025-02-28", "12.00", "0.5000", "50.00")]
+        )
+
+    def test_report_reads_only_rollup(self):
+        with self.assertNumQueries(1):
+            self.client.get(
+                self.url, {"date_start": "2025-01-01", "date_end": "2025-12-31"}
+            )
+
+    def test_superuser_required(self):
+        self.client.force_authenticate(user=self.user)
+        response = self.client.get(
+            self.url, {"date_start": "2025-02-01", "date_end": "2025-02-28"}
+        )
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    @override_settings(BOOKING_ANALYTICS={"MAX_DAYS": 31})
+    def test_validation_error(self):
+        for params in [
+            {"date_start": "2025-02-01"},
+            {"date_start": "2025-02-10", "date_end": "2025-02-01"},
+            {"date_start": "2025-01-01", "date_end": "2025-03-01"},
+            {"date_start": "2025-02-01", "date_end": "2025-02-10", "period": "year"},
+        ]:
+            response = self.client.get(self.url, params)
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
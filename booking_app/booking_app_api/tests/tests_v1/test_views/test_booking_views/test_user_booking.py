@@ -52,7 +52,7 @@ class UserBookingApiTest(APITestCase):
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
-        data = response.data[0]
+        data = response.data["results"][0]
 
         self.assertEqual(data["id"], self.booking2.id)
         self.assertEqual(data["room"]["id"], self.room2.id)
@@ -120,4 +120,33 @@ class UserBookingApiTest(APITestCase):
 
         response = self.client.get(url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data, [])
+        self.assertEqual(response.data["results"], [])
+
+    def test_get_user_rooms_pages(self):
+        start = timezone.make_aware(datetime(2021, 2, 1))
+        Booking.objects.bulk_create(
+            Booking(
+                room=self.room1,
+                user=self.user,
+                date_start=start + timezone.timedelta(days=day),
+                date_end=start + timezone.timedelta(days=day, hours=12),
+            )
+            for day in range(5)
+        )
+        expected = list(
+            Booking.objects.filter(user=self.user)
+            .order_by("date_start", "id")
+            .values_list("id", flat=True)
+        )
+        url = reverse("user-all-booking")
+
+        ids = []
+        next_url = f"{url}?page_size=2"
+        while next_url:
+            response = self.client.get(next_url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertLessEqual(len(response.data["results"]), 2)
+            ids.extend(booking["id"] for booking in response.data["results"])
+            next_url = response.data["next"]
+
+        self.assertEqual(ids, expected)
@@ -0,0 +1,109 @@
+from datetime import timedelta
+from decimal import Decimal
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+from booking_app_admin.models import Booking, Room
+from django.contrib.auth import get_user_model
+from django.test import override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+ASYNC_URLCONF = "booking_app_api.v1.urls_async"
+
+
+def cursor(link):
+    return parse_qs(urlparse(link).query).get("cursor") if link else None
+
+
+@pytest.mark.django_db(transaction=True, reset_sequences=True)
+class AsyncRoomsApiTest(APITestCase):
+    def setUp(self):
+        self.rooms = Room.objects.bulk_create(
+            Room(name=f"Комната {i}", price_per_day=Decimal(50 + i % 3), capacity=i)
+            for i in range(1, 8)
+        )
+        user = get_user_model().objects.create_user(username="user", password="54321")
+        start = timezone.now() + timedelta(days=10)
+        Booking.objects.create(
+            room=self.rooms[1],
+            user=user,
+            date_start=start,
+            date_end=start + timedelta(days=2),
+        )
+        self.search_params = {
+            "date_start": (start + timedelta(days=1)).isoformat(),
+            "date_end": (start + timedelta(days=3)).isoformat(),
+            "capacity": 2,
+        }
+
+    def get_both(self, name, params=None):
+        sync_response = self.client.get(reverse(name), params)
+        with override_settings(ROOT_URLCONF=ASYNC_URLCONF):
+            async_response = self.client.get(reverse(name), params)
+        return sync_response, async_response
+
+    def assert_same_page(self, name, params):
+        sync_response, async_response = self.get_both(name, params)
+        self.assertEqual(async_response.status_code, status.HTTP_200_OK)
+        sync_data, async_data = sync_response.json(), async_response.json()
+        self.assertEqual(async_data["results"], sync_data["results"])
+        self.assertEqual(cursor(async_data["next"]), cursor(sync_data["next"]))
+        self.assertEqual(cursor(async_data["previous"]), cursor(sync_data["previous"]))
+        return async_data
+
+    def test_all_rooms_pages(self):
+        data = self.assert_same_page(
+            "all-rooms", {"ordering": "-price_per_day", "page_size": 3}
+        )
+        self.assertEqual(len(data["results"]), 3)
+
+        next_cursor = cursor(data["next"])[0]
+        self.assert_same_page(
+            "all-rooms",
+            {"ordering": "-price_per_day", "page_size": 3, "cursor": next_cursor},
+        )
+
+    @override_settings(FAST_SERIALIZATION={"ENABLED": True})
+    def test_all_rooms_fast_serialization(self):
+        self.assert_same_page("all-rooms", {"ordering": "capacity", "page_size": 4})
+
+    def test_search_free_rooms(self):
+        sync_response, async_response = self.get_both(
+            "search-free-rooms", self.search_params
+        )
+
+        self.assertEqual(async_response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            sorted(room["id"] for room in async_response.json()),
+            [room.id for room in self.rooms[2:]],
+        )
+        self.assertCountEqual(async_response.json(), sync_response.json())
+
+    @override_settings(FAST_SERIALIZATION={"ENABLED": True})
+    def test_search_free_rooms_fast_serialization(self):
+        sync_response, async_response = self.get_both(
+            "search-free-rooms", self.search_params
+        )
+
+        self.assertCountEqual(async_response.json(), sync_response.json())
+
+    def test_search_free_rooms_invalid_params(self):
+        sync_response, async_response = self.get_both(
+            "search-free-rooms", {"date_start": "нет"}
+        )
+
+        self.assertEqual(async_response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(async_response.json(), sync_response.json())
+
+    def test_msgpack_and_method_not_allowed(self):
+        with override_settings(ROOT_URLCONF=ASYNC_URLCONF):
+            response = self.client.get(
+                reverse("all-rooms"), HTTP_ACCEPT="application/msgpack"
+            )
+            post_response = self.client.post(reverse("all-rooms"))
+
+        self.assertEqual(response["Content-Type"], "application/msgpack")
+        self.assertEqual(post_response.status_code, status.HTTP_405_METHOD_NOT_ALLOWED)
@@ -0,0 +1,124 @@
+from datetime import datetime, time, timedelta
+from decimal import Decimal
+
+import pytest
+from booking_app_admin.models import Booking, Room
+from django.test import override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+
+def day(offset, hour=0):
+    return timezone.make_aware(
+        datetime.combine(timezone.localdate() + timedelta(days=offset), time(hour))
+    )
+
+
+@pytest.fixture
+def rooms(db, django_user_model):
+    room1 = Room.objects.create(
+        name="Для двоих", price_per_day=Decimal("100.00"), capacity=2
+    )
+    room2 = Room.objects.create(
+        name="Для четверых", price_per_day=Decimal("300.00"), capacity=4
+    )
+    user = django_user_model.objects.create_user(username="user", password="54321")
+    # room1: занята с 0 по 2 сутки, затем свободна 2 суток, затем занята с 4 по 10.
+    for start, end in [(day(0), day(2, 12)), (day(4), day(10))]:
+        Booking.objects.create(room=room1, user=user, date_start=start, date_end=end)
+    # room2: занята с 0 по 6 сутки.
+    Booking.objects.create(room=room2, user=user, date_start=day(-3), date_end=day(6))
+    return room1, room2
+
+
+def slots(client, **params):
+    response = client.get(reverse("earliest-slots"), params)
+    assert response.status_code == 200
+    return [
+        (
+            slot["room"],
+            datetime.fromisoformat(slot["date_start"]),
+            datetime.fromisoformat(slot["date_end"]),
+        )
+        for slot in response.data
+    ]
+
+
+@pytest.mark.django_db(transaction=True, reset_sequences=True)
+def test_short_stay_fits_between_bookings(client, rooms):
+    room1, room2 = rooms
+
+    assert slots(client, nights=1, limit=3) == [
+        (room1.id, day(2, 12), day(3, 12)),
+        (room2.id, day(6), day(7)),
+        (room1.id, day(10), day(11)),
+    ]
+
+
+@pytest.mark.django_db(transaction=True, reset_sequences=True)
+def test_long_stay_skips_short_gaps(client, rooms):
+    room1, room2 = rooms
+
+    assert slots(client, nights=3) == [
+        (room2.id, day(6), day(9)),
+        (room1.id, day(10), day(13)),
+    ]
+
+
+@pytest.mark.django_db(transaction=True, reset_sequences=True)
+def test_capacity_and_price_filters(client, rooms):
+    room1, room2 = rooms
+
+    assert [slot[0] for slot in slots(client, nights=3, capacity=3)] == [room2.id]
+    assert [slot[0] for slot in slots(client, nights=3, max_price="150")] == [room1.id]
+
+
+@pytest.mark.django_db(transaction=True, reset_sequences=True)
+def test_search_starts_from_date(client, rooms):
+    room1, room2 = rooms
+    date_from = (timezone.localdate() + timedelta(days=7)).isoformat()
+
+    assert slots(client, nights=1, date_from=date_from, limit=2) == [
+        (room2.id, day(7), day(8)),
+        (room1.id, day(10), day(11)),
+    ]
+
+
+@pytest.mark.django_db(transaction=True, reset_sequences=True)
+def test_today_slots_start_no_earlier_than_now(client, rooms):
+    room3 = Room.objects.create(
+        name="Свободный", price_per_day=Decimal("50.00"), capacity=1
+    )
+    before = timezone.now()
+
+    [(room, date_start, date_end)] = slots(client, nights=1, limit=1)
+
+    # Свободный номер предлагается с текущего момента, а не с полуночи.
+    assert room == room3.id
+    assert before <= date_start <= timezone.now()
+    assert date_end == date_start + timedelta(days=1)
+
+
+@pytest.mark.django_db(transaction=True, reset_sequences=True)
+@override_settings(EARLIEST_SLOTS={"HORIZON_DAYS": 12, "MAX_LIMIT": 50})
+def test_slots_limited_by_horizon(client, rooms):
+    room1, room2 = rooms
+
+    # Окно в room1 с 10 по 13 сутки выходит за горизонт в 12 суток.
+    assert slots(client, nights=3) == [(room2.id, day(6), day(9))]
+
+
+@pytest.mark.django_db(transaction=True, reset_sequences=True)
+@pytest.mark.parametrize(
+    "params",
+    [
+        {},
+        {"nights": 0},
+        {"nights": 1, "limit": 51},
+        {"nights": 1, "date_from": "2021-01-01"},
+        {"nights": 1000},
+    ],
+)
+def test_slots_validation_error(client, params):
+    response = client.get(reverse("earliest-slots"), params)
+    assert response.status_code == 400
@@ -0,0 +1,136 @@
+from datetime import datetime, time, timedelta
+from decimal import Decimal
+
+import pytest
+from booking_app_admin.models import Booking, Room
+from django.urls import reverse
+from django.utils import timezone
+
+
+def day(offset):
+    return timezone.make_aware(
+        datetime.combine(timezone.localdate() + timedelta(days=offset), time())
+    )
+
+
+@pytest.fixture
+def rooms(db, django_user_model):
+    room1 = Room.objects.create(
+        name="Для двоих", price_per_day=Decimal("100.00"), capacity=2
+    )
+    room2 = Room.objects.create(
+        name="Для одного", price_per_day=Decimal("50.00"), capacity=1
+    )
+    user = django_user_model.objects.create_user(username="user", password="54321")
+    Booking.objects.create(room=room1, user=user, date_start=day(10), date_end=day(12))
+    Booking.objects.create(room=room2, user=user, date_start=day(8), date_end=day(9))
+    return room1, room2
+
+
+def search(client, **params):
+    response = client.get(reverse("flexible-search-free-rooms"), params)
+    assert response.status_code == 200
+    return {
+        (
+            datetime.fromisoformat(window["date_start"]),
+            datetime.fromisoformat(window["date_end"]),
+        ): [room["id"] for room in window["rooms"]]
+        for window in response.data
+    }
+
+
+@pytest.mark.django_db(transaction=True, reset_sequences=True)
+def test_free_rooms_per_window(client, rooms, django_assert_num_queries):
+    room1, room2 = rooms
+
+    with django_assert_num_queries(1):
+        windows = search(
+            client,
+            date_start=day(9).isoformat(),
+            date_end=day(10).isoformat(),
+            shift_days=1,
+            length_days=1,
+        )
+
+    # Сдвиги -1..1 и длины 0..2 суток (пустые промежутки отброшены).
+    assert windows == {
+        (day(8), day(9)): [room1.id],
+        (day(8), day(10)): [room1.id],
+        (day(9), day(10)): [room1.id, room2.id],
+        (day(9), day(11)): [room2.id],
+        (day(10), day(11)): [room2.id],
+        (day(10), day(12)): [room2.id],
+    }
+
+
+@pytest.mark.django_db(transaction=True, reset_sequences=True)
+def test_cheapest_room_per_window(client, rooms):
+    room1, room2 = rooms
+
+    windows = search(
+        client,
+        date_start=day(8).isoformat(),
+        date_end=day(9).isoformat(),
+        shift_days=2,
+        cheapest=True,
+    )
+
+    assert windows == {
+        (day(6), day(7)): [room2.id],
+        (day(7), day(8)): [room2.id],
+        (day(8), day(9)): [room1.id],
+        (day(9), day(10)): [room2.id],
+        (day(10), day(11)): [room2.id],
+    }
+
+
+@pytest.mark.django_db(transaction=True, reset_sequences=True)
+def test_capacity_filter(client, rooms):
+    room1, _ = rooms
+
+    windows = search(
+        client,
+        date_start=day(8).isoformat(),
+        date_end=day(9).isoformat(),
+        shift_days=1,
+        capacity=2,
+    )
+
+    assert list(windows.values()) == [[room1.id], [room1.id], [room1.id]]
+
+
+@pytest.mark.django_db(transaction=True, reset_sequences=True)
+def test_past_windows_are_skipped(client, rooms):
+    windows = search(
+        client,
+        date_start=day(-1).isoformat(),
+        date_end=day(0).isoformat(),
+        shift_days=2,
+    )
+
+    # Как и в search-free-rooms, отбрасываются промежутки с выездом в прошлом.
+    assert list(windows) == [(day(-1), day(0)), (day(0), day(1)), (day(1), day(2))]
+
+
+@pytest.mark.django_db(transaction=True, reset_sequences=True)
+@pytest.mark.parametrize(
+    "params",
+    [
+        {"date_end": day(3).isoformat()},
+        {"date_start": day(3).isoformat(), "date_end": day(2).isoformat()},
+        {"date_start": day(-5).isoformat(), "date_end": day(-3).isoformat()},
+        {
+            "date_start": day(2).isoformat(),
+            "date_end": day(3).isoformat(),
+            "shift_days": 8,
+        },
+        {
+            "date_start": day(2).isoformat(),
+            "date_end": day(3).isoformat(),
+            "length_days": 4,
+        },
+    ],
+)
+def test_validation_error(client, params):
+    response = client.get(reverse("flexible-search-free-rooms"), params)
+    assert response.status_code == 400
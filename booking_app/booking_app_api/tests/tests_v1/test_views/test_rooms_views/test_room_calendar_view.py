@@ -0,0 +1,177 @@
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+from booking_app_admin.models import Booking, Room
+from django.core.cache import caches
+from django.urls import reverse
+from django.utils.timezone import make_aware
+
+
+@pytest.fixture
+def search_cache_enabled(settings):
+    settings.CACHES = {
+        **settings.CACHES,
+        "search": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "calendar-tests",
+        },
+    }
+    caches["search"].clear()
+    yield
+    caches["search"].clear()
+
+
+@pytest.fixture
+def rooms(db, django_user_model):
+    room1 = Room.objects.create(
+        name="Для двоих", price_per_day=Decimal("100.00"), capacity=2
+    )
+    room2 = Room.objects.create(
+        name="Для одного", price_per_day=Decimal("50.00"), capacity=1
+    )
+    user = django_user_model.objects.create_user(username="user", password="54321")
+    # 3–5 февраля, выезд в полдень 5-го: заняты сутки 3, 4 и 5.
+    Booking.objects.create(
+        room=room1,
+        user=user,
+        date_start=make_aware(datetime(2025, 2, 3)),
+        date_end=make_aware(datetime(2025, 2, 5, 12)),
+    )
+    # С 27 февраля по 2 марта (выезд в полночь 2-го): заняты 27, 28 февраля и 1 марта.
+    Booking.objects.create(
+        room=room2,
+        user=user,
+        date_start=make_aware(datetime(2025, 2, 27)),
+        date_end=make_aware(datetime(2025, 3, 2)),
+    )
+    return room1, room2, user
+
+
+def bits(days, occupied):
+    return "".join("1" if day in occupied else "0" for day in range(1, days + 1))
+
+
+def calendar(client, headers=None, **params):
+    return client.get(reverse("room-calendar"), params, headers=headers)
+
+
+@pytest.mark.django_db(transaction=True, reset_sequences=True)
+def test_calendar_single_room(client, rooms):
+    room1, _, _ = rooms
+
+    response = calendar(client, month="2025-02", room=room1.id)
+
+    assert response.status_code == 200
+    assert response.data["date_start"] == datetime(2025, 2, 1).date()
+    assert response.data["date_end"] == datetime(2025, 3, 1).date()
+    assert response.data["rooms"] == [
+        {"room": room1.id, "occupied": bits(28, {3, 4, 5})}
+    ]
+
+
+@pytest.mark.django_db(transaction=True, reset_sequences=True)
+def test_calendar_all_rooms_several_months(client, rooms):
+    room1, room2, _ = rooms
+
+    response = calendar(client, month="2025-02", months=2)
+
+    assert response.status_code == 200
+    assert response.data["rooms"] == [
+        {"room": room1.id, "occupied": bits(28, {3, 4, 5}) + bits(31, set())},
+        {"room": room2.id, "occupied": bits(28, {27, 28}) + bits(31, {1})},
+    ]
+
+
+@pytest.mark.django_db(transaction=True, reset_sequences=True)
+def test_calendar_single_query(client, settings, rooms, django_assert_num_queries):
+    settings.SEARCH_CACHE = {**settings.SEARCH_CACHE, "ENABLED": False}
+    with django_assert_num_queries(1):
+        response = calendar(client, month="2025-01", months=3)
+    assert response.status_code == 200
+
+
+@pytest.mark.django_db(transaction=True, reset_sequences=True)
+def test_calendar_unknown_room(client, rooms):
+    response = calendar(client, month="2025-02", room=100)
+    assert response.status_code == 404
+
+
+@pytest.mark.django_db(transaction=True, reset_sequences=True)
+@pytest.mark.parametrize(
+    "params",
+    [
+        {},
+        {"month": "2025-13"},
+        {"month": "2025-02", "months": 13},
+        {"month": "2025-02", "months": 0},
+    ],
+)
+def test_calendar_validation_error(client, params):
+    response = calendar(client, **params)
+    assert response.status_code == 400
+
+
+@pytest.mark.django_db(transaction=True, reset_sequences=True)
+def test_calendar_cached_by_month(
+    client, search_cache_enabled, rooms, django_assert_num_queries
+):
+    room1, _, user = rooms
+    response = calendar(client, month="2025-02", months=2)
+    etag = response["ETag"]
+
+    # Каждый запрос читает только версии занятости.
+    with django_assert_num_queries(3):
+        response = calendar(client, month="2025-02", months=2)
+        assert response["ETag"] == etag
+        response = calendar(client, month="2025-03")
+        assert response.status_code == 200
+        response = calendar(
+            client, month="2025-02", months=2, headers={"If-None-Match": etag}
+        )
+        assert response.status_code == 304
+
+    # Бронь в марте сбрасывает только март: февраль остаётся в кэше.
+    Booking.objects.create(
+        room=room1,
+        user=user,
+        date_start=make_aware(datetime(2025, 3, 10)),
+        date_end=make_aware(datetime(2025, 3, 11)),
+    )
+    with django_assert_num_queries(2):
+        response = calendar(client, month="2025-02", months=2)
+    assert response["ETag"] != etag
+    assert response.data["rooms"][0]["occupied"] == bits(28, {3, 4, 5}) + bits(31, {10})
+    with django_assert_num_queries(1):
+        calendar(client, month="2025-02")
+
+
+@pytest.mark.django_db(transaction=True, reset_sequences=True)
+def test_calendar_etag_shared_between_workers(client, settings, rooms):
+    def use_worker_cache(location):
+        settings.CACHES = {
+            **settings.CACHES,
+            "search": {
+                "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+                "LOCATION": location,
+            },
+        }
+
+    use_worker_cache("calendar-worker-1")
+    etag = calendar(client, month="2025-02")["ETag"]
+
+    use_worker_cache("calendar-worker-2")
+    response = calendar(client, month="2025-02", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+
+
+@pytest.mark.django_db(transaction=True, reset_sequences=True)
+def test_calendar_no_etag_with_per_worker_versions(
+    client, settings, search_cache_enabled, rooms
+):
+    settings.SEARCH_CACHE = {**settings.SEARCH_CACHE, "VERSION_STORE": "cache"}
+
+    response = calendar(client, month="2025-02")
+
+    assert response.status_code == 200
+    assert "ETag" not in response
@@ -28,9 +28,15 @@ class ShowRoomsApiTest(APITestCase):
         ]
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data[0]["name"], expected_response[0]["name"])
-        self.assertEqual(response.data[1]["name"], expected_response[1]["name"])
-        self.assertEqual(response.data[2]["name"], expected_response[2]["name"])
+        self.assertEqual(
+            response.data["results"][0]["name"], expected_response[0]["name"]
+        )
+        self.assertEqual(
+            response.data["results"][1]["name"], expected_response[1]["name"]
+        )
+        self.assertEqual(
+            response.data["results"][2]["name"], expected_response[2]["name"]
+        )
 
     def test_get_rooms_with_filter(self):
         url = reverse("all-rooms")
@@ -41,6 +47,57 @@ class ShowRoomsApiTest(APITestCase):
             {"id": 3, "name": "Для троих", "price_per_day": "150.00", "capacity": 3},
         ]
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data[0]["name"], expected_response[0]["name"])
-        self.assertEqual(response.data[1]["name"], expected_response[1]["name"])
-        self.assertEqual(response.data[2]["name"], expected_response[2]["name"])
+        self.assertEqual(
+            response.data["results"][0]["name"], expected_response[0]["name"]
+        )
+        self.assertEqual(
+            response.data["results"][1]["name"], expected_response[1]["name"]
+        )
+        self.assertEqual(
+            response.data["results"][2]["name"], expected_response[2]["name"]
+        )
+
+    def test_get_rooms_pages(self):
+        url = reverse("all-rooms")
+        response = self.client.get(f"{url}?ordering=-price_per_day&page_size=2")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [room["name"] for room in response.data["results"]],
+            ["Для троих", "Для двоих"],
+        )
+        self.assertIsNone(response.data["previous"])
+
+        response = self.client.get(response.data["next"])
+        self.assertEqual(
+            [room["name"] for room in response.data["results"]], ["Для одного"]
+        )
+        self.assertIsNone(response.data["next"])
+
+        response = self.client.get(response.data["previous"])
+        self.assertEqual(
+            [room["name"] for room in response.data["results"]],
+            ["Для троих", "Для двоих"],
+        )
+
+    def test_get_rooms_pages_with_equal_values(self):
+        Room.objects.create(
+            name="Ещё для двоих", price_per_day=Decimal("80.00"), capacity=2
+        )
+        url = reverse("all-rooms")
+
+        names = []
+        next_url = f"{url}?ordering=capacity&page_size=1"
+        while next_url:
+            response = self.client.get(next_url)
+            names.extend(room["name"] for room in response.data["results"])
+            next_url = response.data["next"]
+
+        self.assertEqual(
+            names, ["Для одного", "Для двоих", "Ещё для двоих", "Для троих"]
+        )
+
+    def test_get_rooms_invalid_cursor(self):
+        url = reverse("all-rooms")
+        response = self.client.get(f"{url}?cursor=bad")
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
@@ -0,0 +1,35 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+
+
+@pytest.mark.django_db(transaction=True, reset_sequences=True)
+class DbPoolStatsApiTest(APITestCase):
+    def setUp(self):
+        self.User = get_user_model()
+        self.user = self.User.objects.create_user(username="user", password="54321")
+        self.superuser = self.User.objects.create_superuser(
+            username="admin", password="admin", email="admin@example.com"
+        )
+        self.client = APIClient()
+        self.url = reverse("db-pool-stats")
+
+    def test_superuser_gets_stats(self):
+        self.client.force_authenticate(user=self.superuser)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn("pid", response.data)
+        self.assertIn("mode", response.data)
+        # В тестах пул соединений не включён.
+        self.assertIsNone(response.data["pool"])
+
+    def test_user_forbidden(self):
+        self.client.force_authenticate(user=self.user)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
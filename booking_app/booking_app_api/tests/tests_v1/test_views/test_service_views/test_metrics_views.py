@@ -0,0 +1,139 @@
+from datetime import timedelta
+from decimal import Decimal
+from unittest import mock
+
+import pytest
+from booking_app_admin.models import Booking, Room
+from booking_app_api.utils import BookingThrottle
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import override_settings
+from django.urls import reverse
+from django.utils import timezone
+from prometheus_client.parser import text_string_to_metric_families
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+
+
+@pytest.mark.django_db(transaction=True, reset_sequences=True)
+@override_settings(METRICS={"ENABLED": True, "TOKEN": "secret"})
+class MetricsApiTest(APITestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(
+            username="user", password="54321"
+        )
+        self.room = Room.objects.create(
+            name="Для двоих", price_per_day=Decimal("100.00"), capacity=2
+        )
+        self.client = APIClient()
+        self.url = reverse("metrics")
+        # Состояние ограничений хранится в кэше и не должно перейти в другие тесты.
+        cache.clear()
+        self.addCleanup(cache.clear)
+
+    def sample(self, name, **labels):
+        response = self.client.get(self.url, HTTP_AUTHORIZATION="Bearer secret")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        for family in text_string_to_metric_families(response.content.decode()):
+            for metric in family.samples:
+                if metric.name == name and metric.labels == labels:
+                    return metric.value
+        return 0.0
+
+    def book(self, start):
+        return self.client.post(
+            reverse("create-booking"),
+            {
+                "room": self.room.id,
+                "date_start": start,
+                "date_end": start + timedelta(days=2),
+            },
+        )
+
+    def test_requests_are_counted_by_view_and_status(self):
+        start = timezone.now() + timedelta(days=10)
+        Booking.objects.create(
+            room=self.room,
+            user=self.user,
+            date_start=start,
+            date_end=start + timedelta(days=2),
+        )
+        labels = {"view": "create-booking", "method": "POST", "status": "409"}
+        before = self.sample("booking_http_requests_total", **labels)
+        self.client.force_authenticate(user=self.user)
+
+        response = self.book(start)
+
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+        self.assertEqual(
+            self.sample("booking_http_requests_total", **labels), before + 1
+        )
+        self.assertGreaterEqual(
+            self.sample(
+                "booking_http_request_duration_seconds_count",
+                view="create-booking",
+                method="POST",
+            ),
+            1,
+        )
+
+    def test_throttled_requests_are_counted(self):
+        labels = {"view": "create-booking", "method": "POST", "status": "429"}
+        before = self.sample("booking_http_requests_total", **labels)
+        self.client.force_authenticate(user=self.user)
+        start = timezone.now() + timedelta(days=10)
+
+        with mock.patch.object(BookingThrottle, "rate", "1/day", create=True):
+            self.book(start)
+            response = self.book(start + timedelta(days=5))
+
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+        self.assertEqual(
+            self.sample("booking_http_requests_total", **labels), before + 1
+        )
+
+    def test_exposition_format(self):
+        self.client.get(reverse("all-rooms"))
+
+        response = self.client.get(self.url, HTTP_AUTHORIZATION="Bearer secret")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response["Content-Type"].startswith("text/plain"))
+        names = {
+            family.name
+            for family in text_string_to_metric_families(response.content.decode())
+        }
+        self.assertLessEqual(
+            {
+                "booking_http_requests",
+                "booking_http_request_duration_seconds",
+                "booking_http_request_db_queries",
+                "booking_cache_requests",
+            },
+            names,
+        )
+
+    def test_token_required(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+        response = self.client.get(self.url, HTTP_AUTHORIZATION="Bearer wrong")
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+        response = self.client.get(self.url, HTTP_AUTHORIZATION="Bearer secret")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    @override_settings(METRICS={"ENABLED": True, "TOKEN": ""})
+    def test_denied_without_configured_token(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+        response = self.client.get(self.url, HTTP_AUTHORIZATION="Bearer ")
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+        superuser = get_user_model().objects.create_superuser(
+            username="admin", password="54321"
+        )
+        self.client.force_authenticate(user=superuser)
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
@@ -1,4 +1,8 @@
 import pytest
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.db.migrations.executor import MigrationExecutor
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APIClient, APITestCase
@@ -45,3 +49,83 @@ class RegistrationApiTest(APITestCase):
         self.client.post(url, data)
         error_response = self.client.post(url, data)
         self.assertEqual(error_response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_registration_single_insert(self):
+        url = reverse("user-registration")
+
+        data = {
+            "username": "test_user",
+            "password": "test_password_99",
+            "password2": "test_password_99",
+            "email": "test_email@test.com",
+        }
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(url, data)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        user_queries = [q["sql"] for q in queries if "auth_user" in q["sql"]]
+        self.assertEqual(len(user_queries), 1)
+        self.assertTrue(user_queries[0].startswith("INSERT"))
+        user = get_user_model().objects.get(username="test_user")
+        self.assertTrue(user.check_password("test_password_99"))
+
+    def test_invalid_registration_username_exists_message(self):
+        url = reverse("user-registration")
+        get_user_model().objects.create_user(username="test_user", email="a@test.com")
+
+        data = {
+            "username": "test_user",
+            "password": "test_password_99",
+            "password2": "test_password_99",
+            "email": "b@test.com",
+        }
+        response = self.client.post(url, data)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            response.data["username"], ["Пользователь с таким именем уже существует."]
+        )
+
+    def test_invalid_registration_email_exists_ignoring_case(self):
+        url = reverse("user-registration")
+        get_user_model().objects.create_user(
+            username="other_user", email="Test_Email@test.com"
+        )
+
+        data = {
+            "username": "test_user",
+            "password": "test_password_99",
+            "password2": "test_password_99",
+            "email": "test_email@TEST.com",
+        }
+        response = self.client.post(url, data)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            response.data["email"], ["Значения поля должны быть уникальны."]
+        )
+        self.assertFalse(get_user_model().objects.filter(username="test_user").exists())
+
+
+@pytest.mark.django_db(transaction=True, reset_sequences=True)
+def test_email_index_migration_rejects_case_duplicates():
+    before = [("booking_app_api", "0002_throttle_gcra")]
+    executor = MigrationExecutor(connection)
+    leaf = executor.loader.graph.leaf_nodes()
+    executor.migrate(before)
+    try:
+        User = get_user_model()
+        first = User.objects.create_user(username="first", email="Same@example.com")
+        second = User.objects.create_user(username="second", email="same@EXAMPLE.com")
+        executor = MigrationExecutor(connection)
+        with pytest.raises(RuntimeError, match="без учёта регистра: 1") as error:
+            executor.migrate(leaf)
+        assert str((first.id, first.email)) in str(error.value)
+        assert str((second.id, second.email)) in str(error.value)
+        # Без сигналов: таблицы версий пользователей до миграции ещё нет.
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {User._meta.db_table}")
+    finally:
+        executor = MigrationExecutor(connection)
+        executor.loader.build_graph()
+        executor.migrate(leaf)
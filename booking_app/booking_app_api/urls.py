@@ -1,3 +1,4 @@
+from django.conf import settings
 from django.urls import include, path
 from drf_spectacular.views import (SpectacularAPIView, SpectacularRedocView,
                                    SpectacularSwaggerView)
@@ -12,7 +13,14 @@ urlpatterns = [
         name="swagger-ui",
     ),
     path("api/redoc/", SpectacularRedocView.as_view(url_name="schema"), name="redoc"),
-    path("api/v1/", include("booking_app_api.v1.urls")),
+    path(
+        "api/v1/",
+        include(
+            "booking_app_api.v1.urls_async"
+            if settings.ASYNC_VIEWS["ENABLED"]
+            else "booking_app_api.v1.urls"
+        ),
+    ),
     path("api/token/", TokenObtainPairView.as_view(), name="token_obtain_pair"),
     path("api/token/refresh/", TokenRefreshView.as_view(), name="token_refresh"),
 ]
@@ -1,5 +1,16 @@
-from .premissions.permission_superuser import IsOwnerOrSuperUser
+from .pagination.keyset_pagination import KeysetCursorPagination
+from .premissions.permission_metrics import HasMetricsToken
+from .premissions.permission_superuser import IsOwnerOrSuperUser, IsSuperUser
 from .throttling.booking_trottling import BookingThrottle
+from .throttling.gcra_throttle import GCRAThrottle
 from .throttling.user_reg_trottling import UserRegistrationThrottle
 
-__all__ = ["IsOwnerOrSuperUser", "UserRegistrationThrottle", "BookingThrottle"]
+__all__ = [
+    "IsOwnerOrSuperUser",
+    "IsSuperUser",
+    "HasMetricsToken",
+    "UserRegistrationThrottle",
+    "BookingThrottle",
+    "GCRAThrottle",
+    "KeysetCursorPagination",
+]
@@ -0,0 +1,16 @@
+from .report import PERIODS, occupancy_report
+from .rollup import (booking_days, rebuild_rollup, refresh_booking,
+                     refresh_bookings, refresh_rollup, refresh_room,
+                     refresh_rooms)
+
+__all__ = [
+    "refresh_rollup",
+    "refresh_rooms",
+    "refresh_booking",
+    "refresh_bookings",
+    "refresh_room",
+    "rebuild_rollup",
+    "booking_days",
+    "occupancy_report",
+    "PERIODS",
+]
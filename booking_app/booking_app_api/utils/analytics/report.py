@@ -0,0 +1,58 @@
+from datetime import date, timedelta
+from decimal import Decimal
+
+from booking_app_admin.models import BookingDailyRollup
+from django.db.models import DateField, Sum
+from django.db.models.functions import Trunc
+
+PERIODS = ("day", "week", "month")
+
+
+def period_end(period_start: date, period: str) -> date:
+    if period == "day":
+        return period_start + timedelta(days=1)
+    if period == "week":
+        return period_start + timedelta(days=7)
+    return (period_start + timedelta(days=32)).replace(day=1)
+
+
+def occupancy_report(
+    first_day: date, last_day: date, period: str = "day", room_id: int = None
+) -> list:
+    """
+    Занятость и выручка комнат по суткам, неделям или месяцам из BookingDailyRollup.
+
+    Таблица броней не читается. Комнаты без броней в периоде в отчёт не попадают.
+
+    :param first_day: первые сутки отчёта
+    :param last_day: последние сутки отчёта (включительно)
+    :param period: day, week (с понедельника) или month
+    :param room_id: id комнаты; по умолчанию все комнаты
+    :return: список словарей с ключами room, period_start, booked_hours,
+        occupancy (доля занятых часов периода в границах отчёта) и revenue
+    """
+    rollup = BookingDailyRollup.objects.filter(day__gte=first_day, day__lte=last_day)
+    if room_id is not None:
+        rollup = rollup.filter(room_id=room_id)
+    rows = (
+        rollup.annotate(period_start=Trunc("day", period, output_field=DateField()))
+        .values("room_id", "period_start")
+        .annotate(booked_hours=Sum("booked_hours"), revenue=Sum("revenue"))
+        .order_by("period_start", "room_id")
+    )
+
+    report = []
+    for row in rows:
+        start = max(row["period_start"], first_day)
+        end = min(period_end(row["period_start"], period), last_day + timedelta(days=1))
+        hours = Decimal(24 * (end - start).days)
+        report.append(
+            {
+                "room": row["room_id"],
+                "period_start": row["period_start"],
+                "booked_hours": row["booked_hours"],
+                "occupancy": round(row["booked_hours"] / hours, 4),
+                "revenue": row["revenue"],
+            }
+        )
+    return report
@@ -0,0 +1,150 @@
+from datetime import date, datetime, timedelta
+
+from booking_app_admin.models import Booking, BookingDailyRollup, Room
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.backends.postgresql.psycopg_any import DateTimeTZRange
+from django.utils import timezone
+
+from ..db.partitions import start_bounds
+from ..filters.availability_calendar import local_midnight
+
+ROLLUP_TABLE = BookingDailyRollup._meta.db_table
+
+# Брони раскладываются по локальным суткам, которые они задевают; часы брони
+# в сутках — длина пересечения её периода с сутками. Выручка считается по текущей
+# цене комнаты пропорционально занятым часам, поэтому при изменении цены строки
+# комнаты пересчитываются (refresh_room). Пересчитываются только сутки
+# [first_day, last_day) и (если заданы) только комнаты room_ids.
+ROLLUP_SQL = f"""
+INSERT INTO {ROLLUP_TABLE} (room_id, day, booked_hours, revenue)
+SELECT room_id, day, ROUND(hours, 2), ROUND(hours * price_per_day / 24, 2)
+FROM (
+    SELECT booking.room_id, days.day, room.price_per_day,
+           SUM(EXTRACT(EPOCH FROM upper(booking.period * days.span)
+                                  - lower(booking.period * days.span))) / 3600 AS hours
+    FROM {Booking._meta.db_table} AS booking
+    JOIN {Room._meta.db_table} AS room ON room.id = booking.room_id
+    CROSS JOIN LATERAL (
+        SELECT GREATEST((lower(booking.period) AT TIME ZONE %(tz)s)::date,
+                        %(first_day)s::date) AS first_day,
+               LEAST(((upper(booking.period) - interval '1 microsecond')
+                      AT TIME ZONE %(tz)s)::date,
+                     %(last_day)s::date - 1) AS last_day
+    ) AS bounds
+    CROSS JOIN LATERAL (
+        SELECT bounds.first_day + i AS day,
+               tstzrange((bounds.first_day + i)::timestamp AT TIME ZONE %(tz)s,
+                         (bounds.first_day + i + 1)::timestamp AT TIME ZONE %(tz)s) AS span
+        FROM generate_series(0, bounds.last_day - bounds.first_day) AS i
+    ) AS days
+    WHERE booking.period && %(window)s
+      AND booking.date_start > %(start_from)s AND booking.date_start < %(start_to)s
+      AND (%(room_ids)s::bigint[] IS NULL OR booking.room_id = ANY(%(room_ids)s::bigint[]))
+    GROUP BY booking.room_id, days.day, room.price_per_day
+) AS per_day
+"""
+
+DELETE_SQL = f"""
+DELETE FROM {ROLLUP_TABLE}
+WHERE day >= %(first_day)s AND day < %(last_day)s
+  AND (%(room_ids)s::bigint[] IS NULL OR room_id = ANY(%(room_ids)s::bigint[]))
+"""
+
+# Блокировки пересчёта комнат берутся в порядке id, чтобы пересчёты
+# пересекающихся наборов комнат не взаимоблокировались.
+LOCK_ROOMS_SQL = f"""
+SELECT pg_advisory_xact_lock('{ROLLUP_TABLE}'::regclass::oid::integer, id::integer)
+FROM (SELECT DISTINCT id FROM unnest(%s::bigint[]) AS id ORDER BY id) AS rooms
+"""
+
+# Границы для полной перестройки: с запасом шире любых дат броней.
+MIN_DAY = date(1900, 1, 1)
+MAX_DAY = date(9000, 1, 1)
+
+
+def booking_days(date_start: datetime, date_end: datetime) -> tuple:
+    """Локальные сутки [first_day, last_day), которые задевает промежуток брони."""
+    first_day = timezone.localtime(date_start).date()
+    last_day = timezone.localtime(date_end - timedelta(microseconds=1)).date()
+    return first_day, max(first_day, last_day) + timedelta(days=1)
+
+
+def refresh_rollup(first_day: date, last_day: date, room_id: int = None):
+    """
+    Пересчитывает строки BookingDailyRollup за сутки [first_day, last_day) по броням.
+
+    Равносильно refresh_rooms с одной комнатой (или со всеми, если room_id не задан).
+
+    :param first_day: первые сутки
+    :param last_day: сутки после последних
+    :param room_id: id комнаты; по умолчанию все комнаты
+    """
+    refresh_rooms(first_day, last_day, None if room_id is None else [room_id])
+
+
+def refresh_rooms(first_day: date, last_day: date, room_ids: list = None):
+    """
+    Пересчитывает строки BookingDailyRollup комнат room_ids за сутки [first_day, last_day).
+
+    Пересчёт идемпотентен, поэтому годится и для созданных, и для удалённых,
+    и для изменённых броней. Пересчёты одной комнаты выполняются по очереди
+    (advisory lock), а полная перестройка блокирует всю таблицу: пересчёт,
+    начавшийся последним, видит все подтверждённые к этому моменту брони.
+
+    :param first_day: первые сутки
+    :param last_day: сутки после последних
+    :param room_ids: id комнат; по умолчанию (None) все комнаты
+    """
+    window_start = local_midnight(max(first_day, MIN_DAY))
+    window_end = local_midnight(min(last_day, MAX_DAY))
+    start_from, start_to = start_bounds(window_start, window_end)
+    params = {
+        "first_day": first_day,
+        "last_day": last_day,
+        "window": DateTimeTZRange(window_start, window_end),
+        "start_from": start_from,
+        "start_to": start_to,
+        "room_ids": room_ids,
+        "tz": settings.TIME_ZONE,
+    }
+    with transaction.atomic(), connection.cursor() as cursor:
+        if room_ids is None:
+            cursor.execute(f"LOCK TABLE {ROLLUP_TABLE} IN EXCLUSIVE MODE")
+        else:
+            cursor.execute(LOCK_ROOMS_SQL, [room_ids])
+        cursor.execute(DELETE_SQL, params)
+        cursor.execute(ROLLUP_SQL, params)
+
+
+def refresh_booking(room_id: int, date_start: datetime, date_end: datetime):
+    """Пересчитывает сутки, которые задевает бронь комнаты room_id."""
+    refresh_bookings([(room_id, date_start, date_end)])
+
+
+def refresh_bookings(periods: list):
+    """
+    Пересчитывает сутки броней одним запросом: все их комнаты за промежуток
+    от первых до последних задетых суток.
+
+    :param periods: список (room_id, date_start, date_end)
+    """
+    periods = [period for period in periods if period[1] < period[2]]
+    if not periods:
+        return
+    days = [booking_days(date_start, date_end) for _, date_start, date_end in periods]
+    refresh_rooms(
+        min(first for first, _ in days),
+        max(last for _, last in days),
+        sorted({room_id for room_id, _, _ in periods}),
+    )
+
+
+def refresh_room(room_id: int):
+    """Пересчитывает все сутки комнаты room_id (например, после изменения её цены)."""
+    refresh_rollup(MIN_DAY, MAX_DAY, room_id)
+
+
+def rebuild_rollup():
+    """Перестраивает BookingDailyRollup целиком."""
+    refresh_rollup(MIN_DAY, MAX_DAY)
@@ -0,0 +1,14 @@
+from .async_jwt import AsyncJWTAuthentication
+from .cached_jwt import (CachedJWTAuthentication, StatelessJWTAuthentication,
+                         invalidate_user_cache, token_cache)
+from .tokens import ClaimsRefreshToken, ClaimsTokenObtainPairSerializer
+
+__all__ = [
+    "AsyncJWTAuthentication",
+    "CachedJWTAuthentication",
+    "StatelessJWTAuthentication",
+    "ClaimsRefreshToken",
+    "ClaimsTokenObtainPairSerializer",
+    "invalidate_user_cache",
+    "token_cache",
+]
@@ -0,0 +1,213 @@
+import hashlib
+import threading
+from collections import OrderedDict
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import caches
+from django.db import connection
+from django.db.models.expressions import RawSQL
+from django.utils.translation import gettext_lazy as _
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework_simplejwt.exceptions import (AuthenticationFailed,
+                                                 TokenError)
+from rest_framework_simplejwt.settings import api_settings
+
+from ..metrics import cache_lookup
+from .async_jwt import AsyncJWTAuthentication
+
+
+class TokenCache:
+    """
+    LRU проверенных токенов процесса, ключ — SHA-256 сырого токена.
+
+    Токен попадает в кэш только после проверки подписи и срока действия; при
+    чтении срок (``exp``) проверяется снова, истёкший токен удаляется из кэша.
+    Размер ограничен JWT_AUTH["TOKEN_CACHE_SIZE"].
+    """
+
+    def __init__(self):
+        self._tokens = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(raw_token: bytes) -> bytes:
+        return hashlib.sha256(raw_token).digest()
+
+    def get(self, raw_token: bytes):
+        key = self.make_key(raw_token)
+        with self._lock:
+            token = self._tokens.get(key)
+            if token is None:
+                return None
+            self._tokens.move_to_end(key)
+        try:
+            token.check_exp()
+        except TokenError:
+            with self._lock:
+                self._tokens.pop(key, None)
+            return None
+        return token
+
+    def set(self, raw_token: bytes, token):
+        key = self.make_key(raw_token)
+        with self._lock:
+            self._tokens[key] = token
+            self._tokens.move_to_end(key)
+            while len(self._tokens) > settings.JWT_AUTH["TOKEN_CACHE_SIZE"]:
+                self._tokens.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._tokens.clear()
+
+
+token_cache = TokenCache()
+
+USER_VERSIONS_TABLE = "booking_app_api_jwt_user_version"
+
+VERSION_SQL = (
+    f"COALESCE((SELECT version FROM {USER_VERSIONS_TABLE} WHERE user_id = %s), 0)"
+)
+
+BUMP_VERSION_SQL = f"""
+INSERT INTO {USER_VERSIONS_TABLE} AS t (user_id, version) VALUES (%s, 1)
+ON CONFLICT (user_id) DO UPDATE SET version = t.version + 1
+"""
+
+
+def user_cache():
+    return caches[settings.JWT_AUTH["USER_CACHE_ALIAS"]]
+
+
+def user_cache_key(user_id) -> str:
+    return f"jwt_user_{user_id}"
+
+
+def get_user_version(user_id) -> int:
+    """Версия пользователя в общей для всех воркеров таблице (0, если её нет)."""
+    with connection.cursor() as cursor:
+        cursor.execute(f"SELECT {VERSION_SQL}", [user_id])
+        return cursor.fetchone()[0]
+
+
+def invalidate_user_cache(user_id):
+    """
+    Повышает версию пользователя (вызывается при его сохранении и удалении).
+
+    Версия общая для всех воркеров и меняется в той же транзакции, что и
+    пользователь, поэтому записи кэша с прежней версией не используются ни в одном
+    процессе, даже если кэш свой в каждом из них (LocMemCache).
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(BUMP_VERSION_SQL, [user_id])
+    user_cache().delete(user_cache_key(user_id))
+
+
+class CachedJWTAuthentication(AsyncJWTAuthentication):
+    """
+    JWTAuthentication без проверки подписи и запроса к auth_user на каждый запрос.
+
+    Проверенные токены хранятся в TokenCache, пользователи — в кэше
+    JWT_AUTH["USER_CACHE_ALIAS"] на JWT_AUTH["USER_CACHE_TIMEOUT"] секунд вместе
+    с версией пользователя. На каждый запрос версия сверяется с таблицей
+    booking_app_api_jwt_user_version (один запрос по первичному ключу), которую
+    повышает сохранение или удаление пользователя: блокировка и смена пароля
+    действуют сразу во всех воркерах, даже если кэш свой в каждом из них.
+    Пользователь и его версия при промахе читаются одним запросом. Проверки
+    активности и смены пароля выполняются для пользователя из кэша так же, как
+    для загруженного.
+    """
+
+    def get_validated_token(self, raw_token):
+        validated_token = token_cache.get(raw_token)
+        cache_lookup("jwt_token", validated_token is not None)
+        if validated_token is None:
+            validated_token = super().get_validated_token(raw_token)
+            token_cache.set(raw_token, validated_token)
+        return validated_token
+
+    def get_user(self, validated_token):
+        user_id = self.get_user_id(validated_token)
+        key = user_cache_key(user_id)
+        user = user_cache().get(key)
+        if user is not None and user.jwt_version != get_user_version(user_id):
+            user = None
+        cache_lookup("jwt_user", user is not None)
+        if user is None:
+            try:
+                user = self.user_queryset(user_id).get(
+                    **{api_settings.USER_ID_FIELD: user_id}
+                )
+            except self.user_model.DoesNotExist:
+                raise AuthenticationFailed(_("User not found"), code="user_not_found")
+            user_cache().set(key, user, settings.JWT_AUTH["USER_CACHE_TIMEOUT"])
+
+        self.check_user(user, validated_token)
+        return user
+
+    async def aget_user(self, validated_token):
+        user_id = self.get_user_id(validated_token)
+        key = user_cache_key(user_id)
+        user = await user_cache().aget(key)
+        if user is not None and user.jwt_version != await sync_to_async(
+            get_user_version
+        )(user_id):
+            user = None
+        cache_lookup("jwt_user", user is not None)
+        if user is None:
+            try:
+                user = await self.user_queryset(user_id).aget(
+                    **{api_settings.USER_ID_FIELD: user_id}
+                )
+            except self.user_model.DoesNotExist:
+                raise AuthenticationFailed(_("User not found"), code="user_not_found")
+            await user_cache().aset(key, user, settings.JWT_AUTH["USER_CACHE_TIMEOUT"])
+
+        self.check_user(user, validated_token)
+        return user
+
+    def user_queryset(self, user_id):
+        """Пользователи с версией в jwt_version: пользователь и версия одним запросом."""
+        return self.user_model.objects.annotate(
+            jwt_version=RawSQL(VERSION_SQL, [user_id])
+        )
+
+
+class StatelessJWTAuthentication(CachedJWTAuthentication):
+    """
+    CachedJWTAuthentication, которая для чтения (GET, HEAD, OPTIONS) при включённой
+    настройке JWT_AUTH["STATELESS_READS"] не загружает пользователя, а строит
+    TokenUser из claims токена.
+
+    Активность пользователя и смена пароля в этом режиме не проверяются до истечения
+    токена, флаги прав берутся из claims ``is_staff`` и ``is_superuser``
+    (см. ClaimsRefreshToken). Остальные методы аутентифицируются как обычно.
+    """
+
+    read_only = False
+
+    def authenticate(self, request):
+        self.read_only = request.method in SAFE_METHODS
+        return super().authenticate(request)
+
+    async def aauthenticate(self, request):
+        self.read_only = request.method in SAFE_METHODS
+        return await super().aauthenticate(request)
+
+    def is_stateless(self) -> bool:
+        return self.read_only and settings.JWT_AUTH["STATELESS_READS"]
+
+    def get_user(self, validated_token):
+        if self.is_stateless():
+            return self.get_token_user(validated_token)
+        return super().get_user(validated_token)
+
+    async def aget_user(self, validated_token):
+        if self.is_stateless():
+            return self.get_token_user(validated_token)
+        return await super().aget_user(validated_token)
+
+    def get_token_user(self, validated_token):
+        self.get_user_id(validated_token)
+        return api_settings.TOKEN_USER_CLASS(validated_token)
@@ -0,0 +1,33 @@
+from drf_spectacular.contrib.rest_framework_simplejwt import \
+    TokenObtainPairSerializerExtension
+from drf_spectacular.utils import extend_schema_serializer
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
+from rest_framework_simplejwt.tokens import RefreshToken
+
+
+class ClaimsRefreshToken(RefreshToken):
+    """
+    RefreshToken с флагами прав пользователя в claims.
+
+    Claims копируются в access-токен и нужны StatelessJWTAuthentication, которая
+    не загружает пользователя из БД. Изменение прав вступает в силу для таких
+    запросов только после выпуска нового токена.
+    """
+
+    @classmethod
+    def for_user(cls, user):
+        token = super().for_user(user)
+        token["is_staff"] = user.is_staff
+        token["is_superuser"] = user.is_superuser
+        return token
+
+
+@extend_schema_serializer(component_name="TokenObtainPair")
+class ClaimsTokenObtainPairSerializer(TokenObtainPairSerializer):
+    token_class = ClaimsRefreshToken
+
+
+class ClaimsTokenObtainPairSerializerExtension(TokenObtainPairSerializerExtension):
+    """Схема OpenAPI для ClaimsTokenObtainPairSerializer (та же, что у TokenObtainPairSerializer)."""
+
+    target_class = ClaimsTokenObtainPairSerializer
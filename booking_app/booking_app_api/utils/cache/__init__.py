@@ -0,0 +1,13 @@
+from .availability_versions import bump_global, bump_period, bump_periods
+from .calendar_cache import CalendarCache, calendar_cache
+from .search_cache import SearchResultCache, search_cache
+
+__all__ = [
+    "SearchResultCache",
+    "search_cache",
+    "CalendarCache",
+    "calendar_cache",
+    "bump_period",
+    "bump_periods",
+    "bump_global",
+]
@@ -0,0 +1,152 @@
+import uuid
+from datetime import datetime, timedelta
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.db import connection
+from django.utils import timezone
+
+GLOBAL_KEY = "availability:global"
+DAY_KEY = "availability:day:{:%Y-%m-%d}"
+
+# Брони длиннее этого срока сбрасывают все закэшированные ответы разом.
+MAX_BUMP_DAYS = 366
+
+VERSIONS_TABLE = "booking_app_api_availability_version"
+
+# Ключи обновляются в порядке сортировки, чтобы параллельные сбросы
+# пересекающихся периодов не взаимоблокировались.
+BUMP_SQL = f"""
+INSERT INTO {VERSIONS_TABLE} AS t (key, version)
+SELECT key, 1 FROM unnest(%s::varchar[]) AS key ORDER BY key
+ON CONFLICT (key) DO UPDATE SET version = t.version + 1
+"""
+
+SELECT_SQL = f"SELECT key, version FROM {VERSIONS_TABLE} WHERE key = ANY(%s::varchar[])"
+
+
+def get_cache():
+    return caches[settings.SEARCH_CACHE["ALIAS"]]
+
+
+def new_token() -> str:
+    return uuid.uuid4().hex[:12]
+
+
+def period_days(date_start: datetime, date_end: datetime) -> list:
+    """Список локальных суток, которые задевает промежуток [date_start, date_end)."""
+    first = timezone.localtime(date_start).date()
+    end = timezone.localtime(date_end)
+    last = end.date()
+    if end.time() == datetime.min.time() and last > first:
+        last -= timedelta(days=1)
+    return [first + timedelta(days=i) for i in range((last - first).days + 1)]
+
+
+def version_keys(days) -> list:
+    return [GLOBAL_KEY] + [DAY_KEY.format(day) for day in days]
+
+
+class DatabaseVersionStore:
+    """
+    Версии в таблице PostgreSQL, общие для всех воркеров.
+
+    Версия — счётчик сбросов ключа; у ключа без строки версия 0. Таблица обычная
+    (не UNLOGGED): счётчики не должны обнуляться после сбоя, иначе старые записи
+    кэша снова совпали бы с версиями.
+    """
+
+    shared = True
+
+    def get_many(self, keys) -> dict:
+        with connection.cursor() as cursor:
+            cursor.execute(SELECT_SQL, [list(keys)])
+            found = dict(cursor.fetchall())
+        return {key: found.get(key, 0) for key in keys}
+
+    def bump(self, keys):
+        with connection.cursor() as cursor:
+            cursor.execute(BUMP_SQL, [sorted(keys)])
+
+
+class CacheVersionStore:
+    """
+    Версии в кэше поиска (SEARCH_CACHE["ALIAS"]).
+
+    Общие для воркеров, только если общий сам кэш (например, Redis); у LocMemCache
+    они свои в каждом процессе. Версии — случайные токены, а не счётчики: если ключ
+    версии вытеснен из кэша, ему присваивается новый токен, и старые записи
+    гарантированно не совпадут.
+    """
+
+    # Кэши, которые другие процессы не видят.
+    LOCAL_BACKENDS = (LocMemCache, DummyCache)
+
+    @property
+    def shared(self) -> bool:
+        """Видят ли сброс версий все воркеры."""
+        return not isinstance(get_cache(), self.LOCAL_BACKENDS)
+
+    def get_many(self, keys) -> dict:
+        cache = get_cache()
+        found = cache.get_many(keys)
+        missing = {key: new_token() for key in keys if key not in found}
+        if missing:
+            cache.set_many(missing, timeout=None)
+            found = {**found, **missing}
+        return found
+
+    def bump(self, keys):
+        get_cache().set_many({key: new_token() for key in keys}, timeout=None)
+
+
+VERSION_STORES = {
+    "database": DatabaseVersionStore,
+    "cache": CacheVersionStore,
+}
+
+
+def get_version_store():
+    return VERSION_STORES[settings.SEARCH_CACHE["VERSION_STORE"]]()
+
+
+def get_versions(keys) -> tuple:
+    """Текущие версии для ключей keys."""
+    found = get_version_store().get_many(keys)
+    return tuple(found[key] for key in keys)
+
+
+async def aget_versions(keys) -> tuple:
+    """Асинхронный вариант get_versions."""
+    return await sync_to_async(get_versions)(keys)
+
+
+def bump_period(date_start: datetime, date_end: datetime):
+    """Сбрасывает закэшированные ответы, пересекающиеся с промежутком брони."""
+    bump_periods([(date_start, date_end)])
+
+
+def bump_periods(periods: list):
+    """
+    Сбрасывает закэшированные ответы, пересекающиеся с любым из промежутков,
+    одним обращением к хранилищу версий.
+
+    :param periods: список (date_start, date_end)
+    """
+    days = set()
+    for date_start, date_end in periods:
+        period = period_days(date_start, date_end)
+        if len(period) > MAX_BUMP_DAYS:
+            bump_global()
+            return
+        days.update(period)
+    if days:
+        get_version_store().bump([DAY_KEY.format(day) for day in sorted(days)])
+
+
+def bump_global():
+    """Сбрасывает все закэшированные ответы (например, после изменения комнат)."""
+    get_version_store().bump([GLOBAL_KEY])
@@ -0,0 +1,90 @@
+import hashlib
+from datetime import date, timedelta
+
+from django.conf import settings
+
+from ..metrics import cache_lookup
+from .availability_versions import (get_cache, get_version_store, get_versions,
+                                    version_keys)
+
+ENTRY_KEY = "room-calendar:{}:{:%Y-%m}"
+
+
+def month_days(month: date, next_month: date) -> list:
+    return [month + timedelta(days=i) for i in range((next_month - month).days)]
+
+
+class CalendarCache:
+    """
+    Кэш календаря занятости комнат по месяцам.
+
+    Запись — занятость одной комнаты (или всех комнат) за один месяц вместе
+    с версиями суток этого месяца; как и в SearchResultCache, запись действительна,
+    пока не изменились глобальная версия и версии её суток. Поэтому бронь сбрасывает
+    только месяцы, которые она задевает, а запрос на несколько месяцев
+    досчитывает в БД только отсутствующие.
+    """
+
+    @staticmethod
+    def entry_key(room_id, month: date) -> str:
+        return ENTRY_KEY.format("all" if room_id is None else room_id, month)
+
+    def get_or_compute(self, bounds: list, room_id, compute) -> tuple:
+        """
+        Занятость за месяцы bounds[0] .. bounds[-1] из кэша, недостающие месяцы — через compute.
+
+        :param bounds: первые числа месяцев и первое число месяца после последнего
+        :param room_id: id комнаты или None для всех комнат
+        :param compute: функция (first_day, last_day) -> {id комнаты: строка занятости}
+        :return: ({id комнаты: строка занятости за весь период}, ETag или None);
+            ETag строится из версий занятости и отдаётся, только если версии общие
+            для всех воркеров: иначе он свой в каждом воркере и не совпадает
+        """
+        months = list(zip(bounds, bounds[1:]))
+        if not settings.SEARCH_CACHE["ENABLED"]:
+            return compute(bounds[0], bounds[-1]), None
+
+        cache = get_cache()
+        month_keys = [version_keys(month_days(*month)) for month in months]
+        entry_keys = [self.entry_key(room_id, month) for month, _ in months]
+        found = cache.get_many(entry_keys)
+        # Версии всех месяцев читаются одним запросом и делятся по месяцам.
+        flat = get_versions([key for keys in month_keys for key in keys])
+        versions, offset = [], 0
+        for keys in month_keys:
+            versions.append(flat[offset : offset + len(keys)])
+            offset += len(keys)
+
+        parts = []
+        for entry_key, month_versions in zip(entry_keys, versions):
+            entry = found.get(entry_key)
+            hit = entry is not None and entry[0] == month_versions
+            cache_lookup("calendar", hit)
+            parts.append(entry[1] if hit else None)
+
+        missing = [i for i, part in enumerate(parts) if part is None]
+        if missing:
+            first, last = missing[0], missing[-1]
+            computed = compute(months[first][0], months[last][1])
+            offset = 0
+            updates = {}
+            for i in range(first, last + 1):
+                days = (months[i][1] - months[i][0]).days
+                if parts[i] is None:
+                    parts[i] = {
+                        room: bits[offset : offset + days]
+                        for room, bits in computed.items()
+                    }
+                    updates[entry_keys[i]] = (versions[i], parts[i])
+                offset += days
+            cache.set_many(updates)
+
+        # Версии общие для всех комнат, поэтому набор комнат во всех месяцах один и тот же.
+        data = {room: "".join(part[room] for part in parts) for room in parts[0]}
+        if not get_version_store().shared:
+            return data, None
+        etag = hashlib.sha1(repr((entry_keys, versions)).encode()).hexdigest()
+        return data, etag
+
+
+calendar_cache = CalendarCache()
@@ -0,0 +1,123 @@
+import threading
+from datetime import datetime
+from datetime import timezone as dt_timezone
+
+from django.conf import settings
+
+from ..metrics import cache_lookup
+from .availability_versions import (aget_versions, get_cache, get_versions,
+                                    period_days, version_keys)
+
+ENTRY_KEY = "search-free-rooms:{}:{}:{}"
+
+
+class SearchResultCache:
+    """
+    Кэш ответов поиска свободных комнат.
+
+    Ключ записи — нормализованные (date_start, date_end, capacity), значение —
+    сериализованный список комнат вместе с версиями, актуальными на момент расчёта.
+    Запись считается действительной, пока не изменилась глобальная версия
+    (изменение комнат) и версии всех суток периода (создание или удаление броней
+    в эти сутки). Версии общие для всех воркеров (SEARCH_CACHE["VERSION_STORE"]),
+    поэтому бронь, созданная в одном воркере, сбрасывает записи во всех; на каждый
+    запрос они читаются одним запросом к БД. Размер и время жизни записей
+    ограничиваются настройками бэкенда кэша (TIMEOUT, MAX_ENTRIES).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def normalize(date_start: datetime, date_end: datetime, capacity: int) -> tuple:
+        """Приводит параметры к единому виду, чтобы одинаковые запросы давали один ключ."""
+        return (
+            date_start.astimezone(dt_timezone.utc).isoformat(),
+            date_end.astimezone(dt_timezone.utc).isoformat(),
+            max(capacity, 0),
+        )
+
+    def _count(self, hit: bool):
+        cache_lookup("search", hit)
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def get_or_compute(
+        self, date_start: datetime, date_end: datetime, capacity: int, compute
+    ):
+        """
+        Возвращает закэшированный ответ либо вычисляет его функцией compute.
+
+        :param date_start: дата заезда
+        :param date_end: дата выезда
+        :param capacity: минимальная вместимость комнаты
+        :param compute: функция без аргументов, возвращающая сериализованный ответ
+        """
+        config = settings.SEARCH_CACHE
+        days = period_days(date_start, date_end)
+        if not config["ENABLED"] or len(days) > config["MAX_DAYS"]:
+            return compute()
+
+        cache = get_cache()
+        entry_key = ENTRY_KEY.format(*self.normalize(date_start, date_end, capacity))
+        keys = version_keys(days)
+        entry = cache.get(entry_key)
+        versions = get_versions(keys)
+
+        if entry is not None and entry[0] == versions:
+            self._count(hit=True)
+            return entry[1]
+
+        self._count(hit=False)
+        data = list(compute())
+        cache.set(entry_key, (versions, data))
+        return data
+
+    async def aget_or_compute(
+        self, date_start: datetime, date_end: datetime, capacity: int, acompute
+    ):
+        """
+        Асинхронный вариант get_or_compute.
+
+        :param acompute: корутинная функция без аргументов, возвращающая сериализованный ответ
+        """
+        config = settings.SEARCH_CACHE
+        days = period_days(date_start, date_end)
+        if not config["ENABLED"] or len(days) > config["MAX_DAYS"]:
+            return await acompute()
+
+        cache = get_cache()
+        entry_key = ENTRY_KEY.format(*self.normalize(date_start, date_end, capacity))
+        keys = version_keys(days)
+        entry = await cache.aget(entry_key)
+        versions = await aget_versions(keys)
+
+        if entry is not None and entry[0] == versions:
+            self._count(hit=True)
+            return entry[1]
+
+        self._count(hit=False)
+        data = list(await acompute())
+        await cache.aset(entry_key, (versions, data))
+        return data
+
+    def stats(self) -> dict:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / total if total else 0.0,
+            }
+
+    def reset_stats(self):
+        with self._lock:
+            self.hits = self.misses = 0
+
+
+search_cache = SearchResultCache()
@@ -0,0 +1,20 @@
+from .partitions import (create_partition, default_months, detach_partition,
+                         detachable_months, ensure_partitions, list_partitions,
+                         shift_month, start_bounds, start_bounds_q,
+                         sync_max_booking_days)
+from .pool import get_pool, pool_stats
+
+__all__ = [
+    "get_pool",
+    "pool_stats",
+    "list_partitions",
+    "default_months",
+    "shift_month",
+    "create_partition",
+    "ensure_partitions",
+    "detachable_months",
+    "detach_partition",
+    "start_bounds",
+    "start_bounds_q",
+    "sync_max_booking_days",
+]
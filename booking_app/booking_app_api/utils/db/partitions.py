@@ -0,0 +1,230 @@
+import re
+from datetime import date, datetime, timedelta
+from datetime import timezone as dt_timezone
+
+from booking_app_admin.models import Booking, max_booking_days
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+PARENT = Booking._meta.db_table
+DEFAULT_PARTITION = f"{PARENT}_default"
+PARTITION_NAME = f"{PARENT}_p{{:%Y_%m}}"
+PARTITION_RE = re.compile(rf"^{PARENT}_p(\d{{4}})_(\d{{2}})$")
+# Однострочная таблица с наибольшей длиной брони для триггера (см. миграцию 0005).
+MAX_LENGTH_TABLE = f"{PARENT}_max_length"
+# Нижняя граница date_start, если длина брони не ограничена.
+EARLIEST = datetime.min.replace(tzinfo=dt_timezone.utc)
+
+
+def month_start(day: date) -> date:
+    return day.replace(day=1)
+
+
+def shift_month(month: date, months: int) -> date:
+    """Первое число месяца, отстоящего от month на months месяцев."""
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def next_month(month: date) -> date:
+    return shift_month(month, 1)
+
+
+def month_bound(month: date) -> datetime:
+    """Начало месяца в часовом поясе TIME_ZONE: граница секций."""
+    return timezone.make_aware(datetime.combine(month, datetime.min.time()))
+
+
+def start_bounds(date_start: datetime, date_end: datetime) -> tuple:
+    """
+    Границы (не включая их) date_start броней, которые могут пересекаться с [date_start, date_end).
+
+    Бронь не длиннее max_booking_days() суток (проверяет триггер), поэтому такое условие
+    на date_start ничего не меняет в результате, но позволяет PostgreSQL не читать
+    секции, в которых пересекающихся броней быть не может. Если длина не ограничена,
+    нижней границы нет.
+    """
+    max_days = max_booking_days()
+    if max_days is None:
+        return EARLIEST, date_end
+    return date_start - timedelta(days=max_days), date_end
+
+
+def start_bounds_q(date_start: datetime, date_end: datetime) -> Q:
+    """Условие start_bounds для запросов к Booking через ORM."""
+    start_from, start_to = start_bounds(date_start, date_end)
+    return Q(date_start__gt=start_from, date_start__lt=start_to)
+
+
+def list_partitions() -> list:
+    """Первые числа месяцев, для которых есть секции, по возрастанию."""
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT child.relname FROM pg_inherits
+            JOIN pg_class AS child ON child.oid = pg_inherits.inhrelid
+            WHERE pg_inherits.inhparent = %s::regclass
+            """,
+            [PARENT],
+        )
+        names = [name for (name,) in cursor]
+    months = []
+    for name in names:
+        match = PARTITION_RE.match(name)
+        if match:
+            months.append(date(int(match[1]), int(match[2]), 1))
+    return sorted(months)
+
+
+def default_months() -> list:
+    """Месяцы, брони которых лежат в секции по умолчанию."""
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            SELECT DISTINCT date_trunc('month', date_start AT TIME ZONE %s)::date
+            FROM {DEFAULT_PARTITION} ORDER BY 1
+            """,
+            [settings.TIME_ZONE],
+        )
+        return [month for (month,) in cursor]
+
+
+def create_partition(month: date) -> int:
+    """
+    Создаёт секцию броней за месяц month и переносит в неё брони из секции по умолчанию.
+
+    Секция собирается отдельной таблицей и подключается через ATTACH PARTITION;
+    на это время секция по умолчанию заблокирована, чтобы в неё не попали брони
+    этого месяца.
+
+    :return: число перенесённых броней
+    """
+    name = PARTITION_NAME.format(month)
+    lower, upper = month_bound(month), month_bound(next_month(month))
+    bounds = f"FROM ('{lower.isoformat()}') TO ('{upper.isoformat()}')"
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(f"LOCK TABLE {DEFAULT_PARTITION} IN ACCESS EXCLUSIVE MODE")
+        cursor.execute(
+            f"CREATE TABLE {name} (LIKE {PARENT} INCLUDING DEFAULTS "
+            f"INCLUDING CONSTRAINTS INCLUDING GENERATED)"
+        )
+        # Такое же ограничение, как граница секции: ATTACH не проверяет строки заново.
+        cursor.execute(
+            f"ALTER TABLE {name} ADD CONSTRAINT {name}_bounds CHECK ("
+            f"date_start >= '{lower.isoformat()}' AND date_start < '{upper.isoformat()}')"
+        )
+        cursor.execute(
+            f"""
+            WITH moved AS (
+                DELETE FROM {DEFAULT_PARTITION}
+                WHERE date_start >= %(lower)s AND date_start < %(upper)s
+                RETURNING id, date_start, date_end, user_id, room_id
+            )
+            INSERT INTO {name} (id, date_start, date_end, user_id, room_id)
+            SELECT id, date_start, date_end, user_id, room_id FROM moved
+            """,
+            {"lower": lower, "upper": upper},
+        )
+        moved = cursor.rowcount
+        cursor.execute(
+            f"ALTER TABLE {PARENT} ATTACH PARTITION {name} FOR VALUES {bounds}"
+        )
+        cursor.execute(f"ALTER TABLE {name} DROP CONSTRAINT {name}_bounds")
+        # Без статистики планировщик считает пустую таблицу десятком страниц строк,
+        # и оценки по таблице броней (EstimatedCountPaginator) завышаются.
+        cursor.execute(f"ANALYZE {name}")
+    return moved
+
+
+def ensure_partitions(first_month: date, last_month: date) -> list:
+    """Создаёт недостающие секции за месяцы first_month .. last_month включительно."""
+    existing = set(list_partitions())
+    created = []
+    month = month_start(first_month)
+    while month <= last_month:
+        if month not in existing:
+            created.append((month, create_partition(month)))
+        month = next_month(month)
+    return created
+
+
+def detachable_months(before: date) -> list:
+    """
+    Секции за месяцы до before, которые можно отключить.
+
+    Отключаются только секции, все брони которых закончились больше чем
+    max_booking_days() суток назад (без ограничения — чем длина самой длинной
+    брони): с ними уже ничто не может пересечься.
+    """
+    max_days = max_booking_days()
+    if max_days is None:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT CEIL(EXTRACT(EPOCH FROM MAX(date_end - date_start)) / 86400) "
+                f"FROM {PARENT}"
+            )
+            max_days = int(cursor.fetchone()[0] or 0)
+    limit = timezone.localdate() - timedelta(days=max_days)
+    return [
+        month for month in list_partitions() if next_month(month) <= min(before, limit)
+    ]
+
+
+def sync_max_booking_days() -> tuple:
+    """
+    Записывает max_booking_days() в таблицу, из которой его читает триггер.
+
+    Увеличить значение можно всегда. Уменьшить (или задать после None) — только если
+    в таблице нет более длинных броней, иначе триггер не нашёл бы пересечений с ними;
+    на время проверки вставка броней заблокирована.
+
+    :return: (прежнее значение, новое значение)
+    :raises ValueError: если есть брони длиннее нового значения
+    """
+    max_days = max_booking_days()
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(f"SELECT days FROM {MAX_LENGTH_TABLE} FOR UPDATE")
+        (previous,) = cursor.fetchone()
+        if previous == max_days:
+            return previous, max_days
+        if max_days is not None and (previous is None or max_days < previous):
+            cursor.execute(f"LOCK TABLE {PARENT} IN SHARE MODE")
+            cursor.execute(
+                f"SELECT COUNT(*) FROM {PARENT} WHERE date_end - date_start > %s",
+                [timedelta(days=max_days)],
+            )
+            (count,) = cursor.fetchone()
+            if count:
+                raise ValueError(
+                    f"Броней длиннее {max_days} суток: {count}. Сократите их или "
+                    'увеличьте BOOKING_PARTITIONS["MAX_BOOKING_DAYS"].'
+                )
+        cursor.execute(f"UPDATE {MAX_LENGTH_TABLE} SET days = %s", [max_days])
+    return previous, max_days
+
+
+def detach_partition(month: date, archive_schema: str = None):
+    """
+    Отключает секцию за месяц month от таблицы броней.
+
+    :param archive_schema: схема, в которую переносится отключённая таблица
+        (создаётся при необходимости); если не задана, таблица удаляется
+    """
+    name = PARTITION_NAME.format(month)
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(f"ALTER TABLE {PARENT} DETACH PARTITION {name}")
+        if archive_schema:
+            # Архивные брони не должны мешать удалять комнаты и пользователей.
+            cursor.execute(
+                "SELECT conname FROM pg_constraint WHERE conrelid = %s::regclass "
+                "AND contype = 'f'",
+                [name],
+            )
+            for (constraint,) in cursor.fetchall():
+                cursor.execute(f'ALTER TABLE {name} DROP CONSTRAINT "{constraint}"')
+            cursor.execute(f"CREATE SCHEMA IF NOT EXISTS {archive_schema}")
+            cursor.execute(f"ALTER TABLE {name} SET SCHEMA {archive_schema}")
+        else:
+            cursor.execute(f"DROP TABLE {name}")
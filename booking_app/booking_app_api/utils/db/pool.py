@@ -0,0 +1,40 @@
+from django.db import connections
+
+
+def get_pool(alias: str = "default"):
+    """Пул соединений psycopg базы alias или None, если пул не включён (DB_POOL_MODE)."""
+    return getattr(connections[alias], "pool", None)
+
+
+def pool_stats(alias: str = "default"):
+    """
+    Метрики пула соединений текущего процесса.
+
+    Счётчики (requests, wait_ms, connections_opened, ...) накапливаются с запуска
+    процесса, in_use и waiting — текущие значения. В in_use попадают и соединения,
+    которые пул открывает в этот момент.
+
+    :param alias: алиас базы в DATABASES
+    :return: словарь метрик или None, если пул не включён
+    """
+    pool = get_pool(alias)
+    if pool is None:
+        return None
+
+    stats = pool.get_stats()
+    requests = stats.get("requests_num", 0)
+    wait_ms = stats.get("requests_wait_ms", 0)
+    return {
+        "min_size": pool.min_size,
+        "max_size": pool.max_size,
+        "size": stats.get("pool_size", 0),
+        "in_use": stats.get("pool_size", 0) - stats.get("pool_available", 0),
+        "waiting": stats.get("requests_waiting", 0),
+        "requests": requests,
+        "wait_ms": wait_ms,
+        "avg_wait_ms": wait_ms / requests if requests else 0.0,
+        "timeouts": stats.get("requests_errors", 0),
+        "connections_opened": stats.get("connections_num", 0),
+        "connect_ms": stats.get("connections_ms", 0),
+        "connections_lost": stats.get("connections_lost", 0),
+    }
@@ -0,0 +1,11 @@
+from .booking_export import (EXPORT_FIELDS, EXPORT_FORMATS, booking_rows,
+                             csv_lines, export_queryset, ndjson_lines)
+
+__all__ = [
+    "EXPORT_FIELDS",
+    "EXPORT_FORMATS",
+    "booking_rows",
+    "csv_lines",
+    "export_queryset",
+    "ndjson_lines",
+]
@@ -0,0 +1,109 @@
+import csv
+import json
+from datetime import datetime
+
+from booking_app_admin.models import Booking
+from django.conf import settings
+from django.db.models import QuerySet
+from django.utils import timezone
+
+EXPORT_FIELDS = [
+    "id",
+    "date_start",
+    "date_end",
+    "room_id",
+    "room_name",
+    "room_capacity",
+    "room_price_per_day",
+    "user_id",
+    "username",
+    "user_email",
+]
+
+# Сколько строк объединяется в один кусок ответа.
+LINES_PER_CHUNK = 500
+
+
+def export_queryset(
+    date_start: datetime = None, date_end: datetime = None, room=None
+) -> QuerySet:
+    """
+    Брони для выгрузки вместе с комнатой и пользователем.
+
+    :param date_start: выгружаются брони, которые заканчиваются после этой даты
+    :param date_end: выгружаются брони, которые начинаются до этой даты
+    :param room: комната или её id
+    :return: QuerySet броней в порядке id
+    """
+    queryset = Booking.objects.select_related("room", "user").order_by("id")
+    if date_start is not None:
+        queryset = queryset.filter(date_end__gt=date_start)
+    if date_end is not None:
+        queryset = queryset.filter(date_start__lt=date_end)
+    if room is not None:
+        queryset = queryset.filter(room=room)
+    return queryset
+
+
+def booking_rows(queryset: QuerySet, chunk_size: int = None):
+    """
+    Строки выгрузки по одной брони.
+
+    QuerySet читается серверным курсором порциями по chunk_size строк, поэтому
+    в памяти одновременно находится не больше одной порции.
+    """
+    chunk_size = chunk_size or settings.BOOKING_EXPORT["CHUNK_SIZE"]
+    for booking in queryset.iterator(chunk_size=chunk_size):
+        yield {
+            "id": booking.id,
+            "date_start": timezone.localtime(booking.date_start).isoformat(),
+            "date_end": timezone.localtime(booking.date_end).isoformat(),
+            "room_id": booking.room_id,
+            "room_name": booking.room.name,
+            "room_capacity": booking.room.capacity,
+            "room_price_per_day": str(booking.room.price_per_day),
+            "user_id": booking.user_id,
+            "username": booking.user.username,
+            "user_email": booking.user.email,
+        }
+
+
+def _chunked(lines):
+    chunk = []
+    for line in lines:
+        chunk.append(line)
+        if len(chunk) >= LINES_PER_CHUNK:
+            yield "".join(chunk)
+            chunk = []
+    if chunk:
+        yield "".join(chunk)
+
+
+def ndjson_lines(rows):
+    """Одна строка JSON на бронь."""
+    return _chunked(json.dumps(row, ensure_ascii=False) + "\n" for row in rows)
+
+
+class _Echo:
+    """Буфер для csv.writer, который возвращает записанную строку вместо хранения."""
+
+    def write(self, value):
+        return value
+
+
+def csv_lines(rows):
+    """CSV с заголовком из EXPORT_FIELDS."""
+    writer = csv.DictWriter(_Echo(), fieldnames=EXPORT_FIELDS)
+
+    def lines():
+        yield writer.writeheader()
+        for row in rows:
+            yield writer.writerow(row)
+
+    return _chunked(lines())
+
+
+EXPORT_FORMATS = {
+    "ndjson": ("application/x-ndjson", ndjson_lines),
+    "csv": ("text/csv", csv_lines),
+}
@@ -1,3 +1,18 @@
-from .availible_rooms import get_free_rooms
+from .availability_bitmap import AvailabilityBitmap, get_availability_bitmap
+from .availability_calendar import get_occupancy, month_starts
+from .availible_rooms import (aget_free_rooms, get_free_rooms,
+                              get_free_rooms_sql)
+from .flexible_search import get_free_rooms_for_windows
+from .free_slots import get_earliest_slots
 
-__all__ = ["get_free_rooms"]
+__all__ = [
+    "get_free_rooms",
+    "aget_free_rooms",
+    "get_free_rooms_sql",
+    "AvailabilityBitmap",
+    "get_availability_bitmap",
+    "get_occupancy",
+    "month_starts",
+    "get_earliest_slots",
+    "get_free_rooms_for_windows",
+]
@@ -0,0 +1,260 @@
+import logging
+import random
+import threading
+import time
+from datetime import date, datetime, timedelta
+
+import numpy as np
+from booking_app_admin.models import Booking, Room
+from django.conf import settings
+from django.utils import timezone
+
+from ..db.partitions import start_bounds_q
+
+logger = logging.getLogger(__name__)
+
+WORD_BITS = 64
+
+
+class AvailabilityBitmap:
+    """
+    Битовая карта занятости комнат с точностью до суток.
+
+    Для каждой комнаты хранится строка из 64-битных слов: бит ``i`` соответствует
+    суткам ``origin + i`` (в часовом поясе TIME_ZONE) и выставлен, если хотя бы одна
+    бронь пересекается с этими сутками. Поиск свободных комнат сводится к побитовому
+    ``AND`` всех строк с маской запрошенного периода.
+
+    Так как брони хранятся с точностью до секунд, а карта — до суток, комнаты, у
+    которых заняты только граничные (неполные) сутки запроса, дополнительно
+    проверяются SQL-запросом по этим комнатам.
+
+    Карта живёт в памяти воркера, строится лениво при первом обращении и
+    обновляется по сигналам Booking/Room. Изменения, сделанные в других процессах,
+    подхватываются полной перестройкой не реже, чем раз в ``max_age`` секунд.
+    """
+
+    def __init__(self, lookback_days=7, horizon_days=730, max_age=300):
+        self.lookback_days = lookback_days
+        self.horizon_days = horizon_days
+        self.max_age = max_age
+        self.n_words = -(-(lookback_days + horizon_days) // WORD_BITS)
+        self.n_days = self.n_words * WORD_BITS
+
+        self._lock = threading.RLock()
+        self._dirty = True
+        self._built_at = 0.0
+        self.origin = None
+        self.room_ids = np.empty(0, dtype=np.int64)
+        self.capacities = np.empty(0, dtype=np.int64)
+        self.words = np.zeros((0, self.n_words), dtype=np.uint64)
+        self._rows = {}
+
+    @classmethod
+    def from_settings(cls):
+        config = settings.AVAILABILITY_BITMAP
+        return cls(
+            lookback_days=config["LOOKBACK_DAYS"],
+            horizon_days=config["HORIZON_DAYS"],
+            max_age=config["MAX_AGE"],
+        )
+
+    # Работа с сутками
+
+    def _expected_origin(self) -> date:
+        return timezone.localdate() - timedelta(days=self.lookback_days)
+
+    def _window(self):
+        tz = timezone.get_current_timezone()
+        start = datetime.combine(self.origin, datetime.min.time(), tzinfo=tz)
+        return start, start + timedelta(days=self.n_days)
+
+    def _day_span(self, date_start: datetime, date_end: datetime):
+        """Индексы суток [first, last), которые задевает промежуток [date_start, date_end)."""
+        start = timezone.localtime(date_start)
+        end = timezone.localtime(date_end)
+        first = (start.date() - self.origin).days
+        last = (end.date() - self.origin).days
+        if end.time() != datetime.min.time():
+            last += 1
+        return first, last
+
+    def _interior_span(self, date_start: datetime, date_end: datetime):
+        """Индексы суток [first, last), целиком лежащих внутри [date_start, date_end)."""
+        start = timezone.localtime(date_start)
+        end = timezone.localtime(date_end)
+        first = (start.date() - self.origin).days
+        if start.time() != datetime.min.time():
+            first += 1
+        last = (end.date() - self.origin).days
+        return first, max(first, last)
+
+    def _mask(self, first: int, last: int) -> np.ndarray:
+        bits = np.zeros(self.n_days, dtype=bool)
+        bits[max(first, 0) : max(min(last, self.n_days), 0)] = True
+        return np.packbits(bits, bitorder="little").view(np.uint64)
+
+    # Построение и обновление
+
+    def _is_stale(self) -> bool:
+        if self._dirty or self.origin != self._expected_origin():
+            return True
+        return bool(self.max_age) and time.monotonic() - self._built_at > self.max_age
+
+    def build(self):
+        """Полностью перестраивает карту по данным из БД."""
+        with self._lock:
+            self.origin = self._expected_origin()
+            window_start, window_end = self._window()
+
+            rooms = list(Room.objects.order_by("id").values_list("id", "capacity"))
+            self.room_ids = np.array([r[0] for r in rooms], dtype=np.int64)
+            self.capacities = np.array([r[1] for r in rooms], dtype=np.int64)
+            self._rows = {
+                room_id: row for row, room_id in enumerate(self.room_ids.tolist())
+            }
+
+            bits = np.zeros((len(rooms), self.n_days), dtype=bool)
+            bookings = Booking.objects.filter(
+                start_bounds_q(window_start, window_end), date_end__gt=window_start
+            ).values_list("room_id", "date_start", "date_end")
+            for room_id, date_start, date_end in bookings.iterator(chunk_size=5000):
+                row = self._rows.get(room_id)
+                if row is None:
+                    continue
+                first, last = self._day_span(date_start, date_end)
+                bits[row, max(first, 0) : min(last, self.n_days)] = True
+
+            self.words = np.packbits(bits, axis=1, bitorder="little").view(np.uint64)
+            self._built_at = time.monotonic()
+            self._dirty = False
+            logger.info(
+                "Битовая карта занятости перестроена: комнат %s, суток %s",
+                len(rooms),
+                self.n_days,
+            )
+
+    def invalidate(self):
+        """Помечает карту устаревшей, она будет перестроена при следующем запросе."""
+        with self._lock:
+            self._dirty = True
+
+    def add_booking(self, room_id: int, date_start: datetime, date_end: datetime):
+        """Отмечает в карте новую бронь без обращения к БД."""
+        with self._lock:
+            if self._dirty or self.origin is None:
+                return
+            row = self._rows.get(room_id)
+            if row is None:
+                self._dirty = True
+                return
+            self.words[row] |= self._mask(*self._day_span(date_start, date_end))
+
+    def refresh_room(self, room_id: int):
+        """Пересчитывает строку комнаты по БД (после удаления или изменения брони)."""
+        with self._lock:
+            if self._dirty or self.origin is None:
+                return
+            row = self._rows.get(room_id)
+            if row is None:
+                self._dirty = True
+                return
+            window_start, window_end = self._window()
+            bookings = Booking.objects.filter(
+                start_bounds_q(window_start, window_end),
+                room_id=room_id,
+                date_end__gt=window_start,
+            ).values_list("date_start", "date_end")
+            words = np.zeros(self.n_words, dtype=np.uint64)
+            for date_start, date_end in bookings:
+                words |= self._mask(*self._day_span(date_start, date_end))
+            self.words[row] = words
+
+    # Поиск
+
+    def free_room_ids(
+        self, date_start: datetime, date_end: datetime, capacity: int = 0
+    ):
+        """
+        Поиск свободных комнат по битовой карте.
+
+        :param date_start: дата заезда
+        :param date_end: дата выезда
+        :param capacity: минимальная вместимость комнаты
+        :return: список id свободных комнат или None, если период не покрывается картой
+        """
+        if date_start >= date_end:
+            return None
+
+        with self._lock:
+            if self._is_stale():
+                self.build()
+            first, last = self._day_span(date_start, date_end)
+            if first < 0 or last > self.n_days:
+                return None
+
+            suitable = self.capacities >= capacity
+            busy = (self.words & self._mask(first, last)).any(axis=1)
+            busy_inside = (
+                self.words & self._mask(*self._interior_span(date_start, date_end))
+            ).any(axis=1)
+            free_ids = self.room_ids[suitable & ~busy].tolist()
+            ambiguous_ids = self.room_ids[suitable & busy & ~busy_inside].tolist()
+
+        if ambiguous_ids:
+            # Заняты только неполные граничные сутки: уточняем по самим броням.
+            busy_ids = set(
+                Booking.objects.filter(
+                    start_bounds_q(date_start, date_end),
+                    room_id__in=ambiguous_ids,
+                    date_end__gt=date_start,
+                ).values_list("room_id", flat=True)
+            )
+            free_ids.extend(
+                room_id for room_id in ambiguous_ids if room_id not in busy_ids
+            )
+        return free_ids
+
+    def verify(
+        self, date_start: datetime, date_end: datetime, bitmap_ids, sql_ids
+    ) -> bool:
+        """
+        Сверка ответа битовой карты с SQL-запросом.
+
+        При расхождении карта помечается устаревшей и будет перестроена.
+        """
+        bitmap_ids, sql_ids = set(bitmap_ids), set(sql_ids)
+        if bitmap_ids == sql_ids:
+            return True
+        logger.warning(
+            "Битовая карта занятости разошлась с БД на периоде %s - %s: "
+            "лишние комнаты %s, пропущенные комнаты %s",
+            date_start,
+            date_end,
+            sorted(bitmap_ids - sql_ids),
+            sorted(sql_ids - bitmap_ids),
+        )
+        self.invalidate()
+        return False
+
+
+_bitmap = None
+_bitmap_lock = threading.Lock()
+
+
+def bitmap_enabled() -> bool:
+    return settings.AVAILABILITY_BITMAP["ENABLED"]
+
+
+def get_availability_bitmap() -> AvailabilityBitmap:
+    """Возвращает битовую карту текущего воркера, создавая её при первом обращении."""
+    global _bitmap
+    if _bitmap is None:
+        with _bitmap_lock:
+            if _bitmap is None:
+                _bitmap = AvailabilityBitmap.from_settings()
+    return _bitmap
+
+
+def should_verify() -> bool:
+    return random.random() < settings.AVAILABILITY_BITMAP["CHECK_RATE"]
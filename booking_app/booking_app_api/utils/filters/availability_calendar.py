@@ -0,0 +1,81 @@
+from datetime import date, datetime, timedelta
+
+from booking_app_admin.models import Booking, Room
+from django.conf import settings
+from django.db import connection
+from django.db.backends.postgresql.psycopg_any import DateTimeTZRange
+from django.utils import timezone
+
+from ..db.partitions import start_bounds
+
+# Сутки периода — промежутки [полночь, следующая полночь) в часовом поясе TIME_ZONE.
+# Для каждой комнаты собираются номера суток, с которыми пересекается хотя бы одна
+# бронь; комнаты без броней в периоде возвращаются с пустым массивом. Брони
+# отбираются по GiST-индексу (room_id, period) только в нужных секциях (start_bounds).
+CALENDAR_SQL = f"""
+WITH days AS (
+    SELECT i, tstzrange(
+        (%(first_day)s::date + i)::timestamp AT TIME ZONE %(tz)s,
+        (%(first_day)s::date + i + 1)::timestamp AT TIME ZONE %(tz)s
+    ) AS span
+    FROM generate_series(0, %(days)s - 1) AS i
+)
+SELECT room.id, array_remove(array_agg(DISTINCT days.i), NULL)
+FROM {Room._meta.db_table} AS room
+LEFT JOIN {Booking._meta.db_table} AS booking
+    ON booking.room_id = room.id AND booking.period && %(window)s
+    AND booking.date_start > %(start_from)s AND booking.date_start < %(start_to)s
+LEFT JOIN days ON booking.period && days.span
+WHERE %(room_id)s::bigint IS NULL OR room.id = %(room_id)s::bigint
+GROUP BY room.id
+ORDER BY room.id
+"""
+
+
+def local_midnight(day: date) -> datetime:
+    return timezone.make_aware(datetime.combine(day, datetime.min.time()))
+
+
+def occupancy_bits(indices, days: int) -> str:
+    """Строка из days символов: "1" — сутки заняты, "0" — свободны."""
+    bits = bytearray(b"0" * days)
+    for index in indices:
+        bits[index] = ord("1")
+    return bits.decode()
+
+
+def get_occupancy(first_day: date, last_day: date, room_id: int = None) -> dict:
+    """
+    Занятость комнат по суткам [first_day, last_day) одним SQL-запросом.
+
+    Сутки считаются занятыми, если с ними пересекается хотя бы одна бронь
+    (так же, как в AvailabilityBitmap).
+
+    :param first_day: первые сутки периода
+    :param last_day: сутки после последних суток периода
+    :param room_id: id комнаты; по умолчанию все комнаты
+    :return: словарь {id комнаты: строка занятости из occupancy_bits}
+    """
+    days = (last_day - first_day).days
+    window_start, window_end = local_midnight(first_day), local_midnight(last_day)
+    start_from, start_to = start_bounds(window_start, window_end)
+    params = {
+        "first_day": first_day,
+        "days": days,
+        "tz": settings.TIME_ZONE,
+        "window": DateTimeTZRange(window_start, window_end),
+        "start_from": start_from,
+        "start_to": start_to,
+        "room_id": room_id,
+    }
+    with connection.cursor() as cursor:
+        cursor.execute(CALENDAR_SQL, params)
+        return {room: occupancy_bits(indices, days) for room, indices in cursor}
+
+
+def month_starts(first_month: date, months: int) -> list:
+    """Первые числа months месяцев подряд, начиная с месяца first_month, и первое число следующего за ними месяца."""
+    starts = [first_month.replace(day=1)]
+    for _ in range(months):
+        starts.append((starts[-1] + timedelta(days=32)).replace(day=1))
+    return starts
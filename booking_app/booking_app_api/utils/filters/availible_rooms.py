@@ -1,20 +1,89 @@
 from datetime import datetime
 
+from asgiref.sync import sync_to_async
 from booking_app_admin.models import Booking, Room
-from django.db.models import Q, QuerySet
+from django.db.backends.postgresql.psycopg_any import DateTimeTZRange
+from django.db.models import Exists, OuterRef, Q, QuerySet
 
+from ..db.partitions import start_bounds_q
+from .availability_bitmap import (bitmap_enabled, get_availability_bitmap,
+                                  should_verify)
 
-def get_free_rooms(date_start: datetime, date_end: datetime) -> QuerySet:
+
+def get_free_rooms_sql(date_start: datetime, date_end: datetime) -> QuerySet:
     """
-    Поиск свободных комнат в заданный временной промежуток.
+    Поиск свободных комнат в заданный временной промежуток запросом к БД.
+
+    Запрос строится как анти-join ``NOT EXISTS`` с оператором ``&&`` по колонке
+    ``period``, что позволяет использовать GiST-индекс (room_id, period), а условие
+    start_bounds_q отсекает секции таблицы броней, которые не могут пересекаться с промежутком.
 
     :param date_start: дата заезда
     :param date_end: дата выезда
     :return: возвращает QuerySet с доступными комнатами по заданым параметрам
     """
 
-    busy_rooms = Booking.objects.filter(
-        Q(date_start__lt=date_end) & Q(date_end__gt=date_start)
-    ).values_list("room_id", flat=True)
-    free_rooms = Room.objects.exclude(id__in=busy_rooms)
+    if date_start < date_end:
+        overlap = Q(period__overlap=DateTimeTZRange(date_start, date_end))
+    else:
+        # Пустой диапазон ни с чем не пересекается, поэтому ищем брони,
+        # в которые попадает сам момент времени.
+        overlap = Q(date_start__lt=date_end) & Q(date_end__gt=date_start)
+
+    busy = Booking.objects.filter(
+        overlap, start_bounds_q(date_start, date_end), room=OuterRef("pk")
+    )
+    free_rooms = Room.objects.filter(~Exists(busy))
     return free_rooms
+
+
+def get_free_rooms(
+    date_start: datetime, date_end: datetime, capacity: int = 0
+) -> QuerySet:
+    """
+    Поиск свободных комнат в заданный временной промежуток.
+
+    Если включена битовая карта занятости (AVAILABILITY_BITMAP), ответ берётся из неё,
+    иначе, а также для периодов вне карты, выполняется SQL-запрос.
+
+    :param date_start: дата заезда
+    :param date_end: дата выезда
+    :param capacity: минимальная вместимость комнаты
+    :return: возвращает QuerySet с доступными комнатами по заданым параметрам
+    """
+
+    if bitmap_enabled():
+        bitmap = get_availability_bitmap()
+        free_ids = bitmap.free_room_ids(date_start, date_end, capacity)
+        if free_ids is not None:
+            if should_verify():
+                sql_ids = (
+                    get_free_rooms_sql(date_start, date_end)
+                    .filter(capacity__gte=capacity)
+                    .values_list("id", flat=True)
+                )
+                bitmap.verify(date_start, date_end, free_ids, sql_ids)
+            return Room.objects.filter(id__in=free_ids)
+
+    return get_free_rooms_sql(date_start, date_end).filter(capacity__gte=capacity)
+
+
+async def aget_free_rooms(
+    date_start: datetime, date_end: datetime, capacity: int = 0
+) -> QuerySet:
+    """
+    Асинхронный вариант get_free_rooms для async views.
+
+    Без битовой карты возвращается ленивый QuerySet, который вызывающий код читает
+    асинхронно. Битовая карта может обращаться к БД при перестроении, поэтому
+    поиск по ней выполняется в отдельном потоке.
+
+    :param date_start: дата заезда
+    :param date_end: дата выезда
+    :param capacity: минимальная вместимость комнаты
+    :return: возвращает QuerySet с доступными комнатами по заданым параметрам
+    """
+
+    if bitmap_enabled():
+        return await sync_to_async(get_free_rooms)(date_start, date_end, capacity)
+    return get_free_rooms_sql(date_start, date_end).filter(capacity__gte=capacity)
@@ -0,0 +1,58 @@
+from booking_app_admin.models import Booking, Room
+
+from ..db.partitions import start_bounds
+
+ROOM_COLUMNS = ", ".join(f"room.{field.column}" for field in Room._meta.concrete_fields)
+
+# Промежутки-кандидаты передаются списком VALUES и соединяются с комнатами
+# анти-join'ом по броням (как в get_free_rooms_sql), поэтому все промежутки
+# проверяются одним запросом по GiST-индексу (room_id, period). Условие на date_start
+# (start_bounds для всех промежутков сразу) отсекает лишние секции таблицы броней.
+FREE_ROOMS_SQL = """
+SELECT {distinct} windows.i AS window_index, {columns}
+FROM (VALUES {values}) AS windows (i, period)
+JOIN {room} AS room ON room.capacity >= %s
+WHERE NOT EXISTS (
+    SELECT 1 FROM {booking} AS booking
+    WHERE booking.room_id = room.id AND booking.period && windows.period
+      AND booking.date_start > %s AND booking.date_start < %s
+)
+ORDER BY windows.i, {order}
+"""
+
+
+def get_free_rooms_for_windows(
+    windows: list, capacity: int = 0, cheapest: bool = False
+) -> list:
+    """
+    Свободные комнаты для каждого из промежутков windows одним SQL-запросом.
+
+    :param windows: список пар (дата заезда, дата выезда); промежутки не должны быть пустыми
+    :param capacity: минимальная вместимость комнаты
+    :param cheapest: вернуть для каждого промежутка только самую дешёвую комнату
+    :return: список списков комнат: i-й элемент — свободные комнаты для windows[i]
+    """
+    result = [[] for _ in windows]
+    if not windows:
+        return result
+
+    sql = FREE_ROOMS_SQL.format(
+        distinct="DISTINCT ON (windows.i)" if cheapest else "",
+        columns=ROOM_COLUMNS,
+        values=", ".join(["(%s, tstzrange(%s, %s))"] * len(windows)),
+        room=Room._meta.db_table,
+        booking=Booking._meta.db_table,
+        order="room.price_per_day, room.id" if cheapest else "room.id",
+    )
+    params = [
+        value
+        for i, (date_start, date_end) in enumerate(windows)
+        for value in (i, date_start, date_end)
+    ]
+    start_from, start_to = start_bounds(
+        min(date_start for date_start, _ in windows),
+        max(date_end for _, date_end in windows),
+    )
+    for room in Room.objects.raw(sql, params + [capacity, start_from, start_to]):
+        result[room.window_index].append(room)
+    return result
@@ -0,0 +1,97 @@
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+from booking_app_admin.models import Booking, Room
+from django.db import connection
+from django.db.backends.postgresql.psycopg_any import DateTimeTZRange
+
+from ..db.partitions import start_bounds
+
+# Для каждой комнаты к её броням в окне поиска добавляется нулевая «бронь» в момент
+# date_from, после чего промежутки между соседними бронями находятся оконными
+# функциями: начало промежутка — самый поздний выезд среди предыдущих броней
+# (не раньше date_from), конец — заезд следующей брони (LEAD) или граница окна.
+# Брони отбираются по GiST-индексу (room_id, period) только в нужных секциях (start_bounds).
+FREE_SLOTS_SQL = f"""
+WITH rooms AS (
+    SELECT id FROM {Room._meta.db_table}
+    WHERE capacity >= %(capacity)s
+      AND (%(max_price)s::numeric IS NULL OR price_per_day <= %(max_price)s::numeric)
+),
+edges AS (
+    SELECT id AS room_id,
+           %(date_from)s::timestamptz AS date_start,
+           %(date_from)s::timestamptz AS date_end
+    FROM rooms
+    UNION ALL
+    SELECT booking.room_id, booking.date_start, booking.date_end
+    FROM {Booking._meta.db_table} AS booking
+    JOIN rooms ON rooms.id = booking.room_id
+    WHERE booking.period && %(window)s
+      AND booking.date_start > %(start_from)s AND booking.date_start < %(start_to)s
+),
+gaps AS (
+    SELECT room_id,
+           GREATEST(MAX(date_end) OVER w, %(date_from)s::timestamptz) AS gap_start,
+           LEAD(date_start, 1, %(horizon)s::timestamptz) OVER w AS gap_end
+    FROM edges
+    WINDOW w AS (
+        PARTITION BY room_id ORDER BY date_start, date_end
+        ROWS BETWEEN UNBOUNDED PRECEDING AND CURRENT ROW
+    )
+)
+SELECT room_id, gap_start, gap_end
+FROM gaps
+WHERE gap_end - gap_start >= %(duration)s
+ORDER BY gap_start, room_id
+LIMIT %(limit)s
+"""
+
+
+def get_earliest_slots(
+    date_from: datetime,
+    duration: timedelta,
+    horizon: datetime,
+    limit: int,
+    capacity: int = 0,
+    max_price: Decimal = None,
+) -> list:
+    """
+    Первые limit свободных окон длительностью duration во всех комнатах одним SQL-запросом.
+
+    Окно начинается в начале промежутка между бронями комнаты; в одной комнате
+    может найтись несколько окон. Ищутся только окна, целиком лежащие в
+    [date_from, horizon), поэтому на больших таблицах читаются лишь брони из этого промежутка.
+
+    :param date_from: начало поиска
+    :param duration: длительность окна
+    :param horizon: граница поиска
+    :param limit: максимальное число окон
+    :param capacity: минимальная вместимость комнаты
+    :param max_price: максимальная цена за сутки
+    :return: список словарей с ключами room, date_start, date_end, free_until,
+        упорядоченный по date_start
+    """
+    start_from, start_to = start_bounds(date_from, horizon)
+    params = {
+        "date_from": date_from,
+        "horizon": horizon,
+        "window": DateTimeTZRange(date_from, horizon),
+        "start_from": start_from,
+        "start_to": start_to,
+        "duration": duration,
+        "limit": limit,
+        "capacity": capacity,
+        "max_price": max_price,
+    }
+    with connection.cursor() as cursor:
+        cursor.execute(FREE_SLOTS_SQL, params)
+        return [
+            {
+                "room": room_id,
+                "date_start": gap_start,
+                "date_end": gap_start + duration,
+                "free_until": gap_end,
+            }
+            for room_id, gap_start, gap_end in cursor
+        ]
@@ -0,0 +1,9 @@
+from .request_timing import (RequestTiming, RequestTimingMiddleware,
+                             current_timing, measure_serialize)
+
+__all__ = [
+    "RequestTiming",
+    "RequestTimingMiddleware",
+    "current_timing",
+    "measure_serialize",
+]
@@ -0,0 +1,193 @@
+import logging
+import random
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from asgiref.sync import (iscoroutinefunction, markcoroutinefunction,
+                          sync_to_async)
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connection
+
+logger = logging.getLogger(__name__)
+
+_current = ContextVar("request_timing", default=None)
+
+
+class RequestTiming:
+    """
+    Счётчики одного запроса: число SQL-запросов, время в БД и время сериализации.
+
+    В serialize входят работа сериализаторов списков (FastListMixin,
+    AsyncListMixin) и рендеринг ответа; SQL-запросы внутри этих шагов (ленивые
+    QuerySet) учитываются только в db. Сериализаторы, которые view вызывает сама,
+    попадают только в total.
+
+    Сам объект — обёртка для ``connection.execute_wrapper``.
+    """
+
+    __slots__ = ("queries", "db", "serialize")
+
+    def __init__(self):
+        self.queries = 0
+        self.db = 0.0
+        self.serialize = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.db += time.perf_counter() - started
+            self.queries += 1
+
+    def server_timing(self, total: float) -> str:
+        """Значение заголовка Server-Timing, длительности в миллисекундах."""
+        return (
+            f'db;dur={self.db * 1000:.1f};desc="{self.queries} queries", '
+            f"serialize;dur={self.serialize * 1000:.1f}, "
+            f"total;dur={total * 1000:.1f}"
+        )
+
+
+def current_timing():
+    """Счётчики текущего запроса или None, если запрос не попал в выборку."""
+    return _current.get()
+
+
+def _start_serialize(timing):
+    started, db = time.perf_counter(), timing.db
+
+    def stop():
+        timing.serialize += time.perf_counter() - started - (timing.db - db)
+
+    return stop
+
+
+@contextmanager
+def measure_serialize():
+    """Добавляет время блока без SQL-запросов к времени сериализации текущего запроса."""
+    timing = _current.get()
+    if timing is None:
+        yield
+        return
+    stop = _start_serialize(timing)
+    try:
+        yield
+    finally:
+        stop()
+
+
+def _add_wrapper(timing):
+    connection.execute_wrappers.append(timing)
+
+
+def _remove_wrapper(timing):
+    connection.execute_wrappers.remove(timing)
+
+
+class RequestTimingMiddleware:
+    """
+    Замер времени обработки запросов (настройка REQUEST_TIMING).
+
+    Для доли SAMPLE_RATE запросов через ``connection.execute_wrapper`` считаются
+    SQL-запросы и время в БД, а в ответ добавляется заголовок Server-Timing
+    (db, serialize, total). Остальные запросы стоят одного вызова ``perf_counter``.
+    Запросы дольше SLOW_REQUEST_MS пишутся в лог с итогами замера в extra.
+
+    Поддерживает и WSGI, и ASGI: под ASGI синхронный код запроса (в том числе
+    async ORM) выполняется в отдельном потоке со своим соединением, поэтому
+    обёртка ставится на соединение этого потока.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not settings.REQUEST_TIMING["ENABLED"]:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+
+        started = time.perf_counter()
+        timing = self.sample()
+        if timing is None:
+            response = self.get_response(request)
+        else:
+            token = _current.set(timing)
+            try:
+                with connection.execute_wrapper(timing):
+                    response = self.get_response(request)
+            finally:
+                _current.reset(token)
+        self.finish(request, response, timing, time.perf_counter() - started)
+        return response
+
+    async def __acall__(self, request):
+        started = time.perf_counter()
+        timing = self.sample()
+        if timing is None:
+            response = await self.get_response(request)
+        else:
+            token = _current.set(timing)
+            try:
+                await sync_to_async(_add_wrapper)(timing)
+                try:
+                    response = await self.get_response(request)
+                finally:
+                    await sync_to_async(_remove_wrapper)(timing)
+            finally:
+                _current.reset(token)
+        self.finish(request, response, timing, time.perf_counter() - started)
+        return response
+
+    def process_template_response(self, request, response):
+        # Ответы DRF рендерятся после view, между этим вызовом и post-render callback.
+        timing = _current.get()
+        if timing is not None:
+            stop = _start_serialize(timing)
+            response.add_post_render_callback(lambda response: stop())
+        return response
+
+    @staticmethod
+    def sample():
+        rate = settings.REQUEST_TIMING["SAMPLE_RATE"]
+        if rate >= 1 or (rate > 0 and random.random() < rate):
+            return RequestTiming()
+        return None
+
+    @staticmethod
+    def finish(request, response, timing, total: float):
+        config = settings.REQUEST_TIMING
+        if timing is not None and config["SERVER_TIMING_HEADER"]:
+            response.headers["Server-Timing"] = timing.server_timing(total)
+
+        total_ms = total * 1000
+        if total_ms < config["SLOW_REQUEST_MS"]:
+            return
+        summary = {
+            "method": request.method,
+            "path": request.path,
+            "status": response.status_code,
+            "duration_ms": round(total_ms, 1),
+        }
+        if timing is not None:
+            summary.update(
+                queries=timing.queries,
+                db_ms=round(timing.db * 1000, 1),
+                serialize_ms=round(timing.serialize * 1000, 1),
+            )
+        logger.warning(
+            "Медленный запрос %s %s: %.1f мс",
+            request.method,
+            request.path,
+            total_ms,
+            extra=summary,
+        )
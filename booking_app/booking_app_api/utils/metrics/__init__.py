@@ -0,0 +1,4 @@
+from .middleware import MetricsMiddleware
+from .registry import cache_lookup, exposition
+
+__all__ = ["MetricsMiddleware", "cache_lookup", "exposition"]
@@ -0,0 +1,57 @@
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+
+from ..instrumentation import current_timing
+from .registry import REQUEST_LATENCY, REQUEST_QUERIES, REQUESTS
+
+# Метка view для запросов, не совпавших ни с одним маршрутом.
+UNRESOLVED_VIEW = "<unresolved>"
+
+
+class MetricsMiddleware:
+    """
+    Число запросов, время ответа и SQL-запросы по view (настройка METRICS).
+
+    View определяется по имени маршрута, поэтому число значений метки ограничено
+    числом маршрутов. Число SQL-запросов берётся из замера RequestTimingMiddleware,
+    поэтому middleware должна стоять после неё.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not settings.METRICS["ENABLED"]:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        started = time.perf_counter()
+        response = self.get_response(request)
+        self.observe(request, response, time.perf_counter() - started)
+        return response
+
+    async def __acall__(self, request):
+        started = time.perf_counter()
+        response = await self.get_response(request)
+        self.observe(request, response, time.perf_counter() - started)
+        return response
+
+    @staticmethod
+    def observe(request, response, duration: float):
+        match = request.resolver_match
+        view = match.view_name if match is not None else UNRESOLVED_VIEW
+        REQUESTS.labels(view, request.method, str(response.status_code)).inc()
+        REQUEST_LATENCY.labels(view, request.method).observe(duration)
+
+        timing = current_timing()
+        if timing is not None:
+            REQUEST_QUERIES.labels(view).observe(timing.queries)
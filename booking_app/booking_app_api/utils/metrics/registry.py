@@ -0,0 +1,54 @@
+"""
+Метрики приложения в формате Prometheus.
+
+Под gunicorn у каждого воркера свои счётчики. Если задана переменная окружения
+PROMETHEUS_MULTIPROC_DIR (её выставляет gunicorn.conf.py до запуска воркеров),
+prometheus_client хранит значения в файлах этого каталога, а exposition()
+складывает их по всем процессам, в том числе завершившимся.
+"""
+
+import os
+
+from prometheus_client import (REGISTRY, CollectorRegistry, Counter, Histogram,
+                               generate_latest, multiprocess)
+
+# Границы корзин гистограммы времени ответа, в секундах.
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+QUERY_BUCKETS = (0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89)
+
+REQUESTS = Counter(
+    "booking_http_requests",
+    "Запросы по view, методу и коду ответа",
+    ["view", "method", "status"],
+)
+REQUEST_LATENCY = Histogram(
+    "booking_http_request_duration_seconds",
+    "Время обработки запроса",
+    ["view", "method"],
+    buckets=LATENCY_BUCKETS,
+)
+REQUEST_QUERIES = Histogram(
+    "booking_http_request_db_queries",
+    "SQL-запросы на запрос (только запросы из выборки REQUEST_TIMING)",
+    ["view"],
+    buckets=QUERY_BUCKETS,
+)
+CACHE_REQUESTS = Counter(
+    "booking_cache_requests",
+    "Обращения к кэшам: доля попаданий — hit / (hit + miss)",
+    ["cache", "result"],
+)
+
+
+def cache_lookup(cache: str, hit: bool):
+    CACHE_REQUESTS.labels(cache, "hit" if hit else "miss").inc()
+
+
+def exposition() -> bytes:
+    """Текущие значения всех метрик в текстовом формате Prometheus."""
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry)
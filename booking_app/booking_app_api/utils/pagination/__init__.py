@@ -0,0 +1,3 @@
+from .keyset_pagination import KeysetCursorPagination
+
+__all__ = ["KeysetCursorPagination"]
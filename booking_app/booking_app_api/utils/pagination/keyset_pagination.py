@@ -0,0 +1,143 @@
+import json
+from operator import attrgetter
+
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import Cursor, CursorPagination
+
+
+class KeysetCursorPagination(CursorPagination):
+    """
+    Курсорная пагинация по набору полей (keyset pagination).
+
+    В отличие от CursorPagination из DRF, позиция курсора хранит значения всех полей
+    сортировки, а не только первого, поэтому следующая страница выбирается условием
+    ``(f1, f2, ...) > (v1, v2, ...)`` без OFFSET. При индексе по полям сортировки
+    любая страница стоит столько же, сколько первая.
+
+    Если сортировка задаётся через OrderingFilter, к ней добавляется первичный ключ,
+    чтобы порядок был однозначным. Поля сортировки не должны содержать NULL.
+    """
+
+    ordering = ("pk",)
+    page_size_query_param = "page_size"
+    max_page_size = 100
+
+    def get_ordering(self, request, queryset, view):
+        ordering = super().get_ordering(request, queryset, view)
+        names = {field.lstrip("-") for field in ordering}
+        if not names & {"pk", "id"}:
+            # Направление первичного ключа совпадает с последним полем, чтобы
+            # составной индекс (поле, id) можно было читать и в обратном порядке.
+            ordering += ("-pk" if ordering[-1].startswith("-") else "pk",)
+        return ordering
+
+    def paginate_queryset(self, queryset, request, view=None):
+        queryset = self._page_queryset(queryset, request, view)
+        if queryset is None:
+            return None
+        return self._set_page(list(queryset))
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        """Асинхронный вариант paginate_queryset для async views."""
+        queryset = self._page_queryset(queryset, request, view)
+        if queryset is None:
+            return None
+        return self._set_page([obj async for obj in queryset])
+
+    def _page_queryset(self, queryset, request, view):
+        """Срез queryset для текущей страницы (на одну запись больше размера страницы)."""
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+
+        self.base_url = request.build_absolute_uri()
+        self.ordering = self.get_ordering(request, queryset, view)
+        self.model = queryset.model
+        self.cursor = self.decode_cursor(request)
+        reverse = self.cursor.reverse if self.cursor else False
+
+        order_by = [
+            self._invert(field) if reverse else field for field in self.ordering
+        ]
+        queryset = queryset.order_by(*order_by)
+        if self.cursor and self.cursor.position is not None:
+            queryset = queryset.filter(
+                self._after(order_by, self.decode_position(self.cursor.position))
+            )
+        return queryset[: self.page_size + 1]
+
+    def _set_page(self, results: list) -> list:
+        reverse = self.cursor.reverse if self.cursor else False
+        self.page = results[: self.page_size]
+        has_more = len(results) > self.page_size
+        if reverse:
+            self.page.reverse()
+            self.has_next, self.has_previous = True, has_more
+        else:
+            self.has_next, self.has_previous = has_more, self.cursor is not None
+        return self.page
+
+    @staticmethod
+    def _invert(field: str) -> str:
+        return field[1:] if field.startswith("-") else f"-{field}"
+
+    @staticmethod
+    def _after(order_by, values) -> Q:
+        """Условие «строго после позиции values» для сортировки order_by."""
+        condition = Q()
+        equal = Q()
+        for field, value in zip(order_by, values):
+            name = field.lstrip("-")
+            lookup = "lt" if field.startswith("-") else "gt"
+            condition |= equal & Q(**{f"{name}__{lookup}": value})
+            equal &= Q(**{name: value})
+        # Нестрогое условие по первому полю дублирует часть выражения выше,
+        # но позволяет БД начать чтение индекса сразу с нужной позиции.
+        first = order_by[0]
+        lookup = "lte" if first.startswith("-") else "gte"
+        return Q(**{f"{first.lstrip('-')}__{lookup}": values[0]}) & condition
+
+    def _field(self, name: str):
+        return self.model._meta.pk if name == "pk" else self.model._meta.get_field(name)
+
+    def encode_position(self, instance) -> str:
+        names = [field.lstrip("-") for field in self.ordering]
+        if isinstance(instance, dict):
+            # Строка из values(): первичный ключ в ней хранится под своим именем.
+            pk_name = self.model._meta.pk.name
+            values = [instance[pk_name if name == "pk" else name] for name in names]
+        else:
+            values = [attrgetter(name)(instance) for name in names]
+        # str() сохраняет микросекунды дат, в отличие от DjangoJSONEncoder.
+        return json.dumps(values, default=str, separators=(",", ":"))
+
+    def decode_position(self, position: str) -> list:
+        try:
+            values = json.loads(position)
+            if not isinstance(values, list) or len(values) != len(self.ordering):
+                raise ValueError
+            return [
+                self._field(field.lstrip("-")).to_python(value)
+                for field, value in zip(self.ordering, values)
+            ]
+        except (TypeError, ValueError, ValidationError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        cursor = Cursor(
+            offset=0, reverse=False, position=self.encode_position(self.page[-1])
+        )
+        return self.encode_cursor(cursor)
+
+    def get_previous_link(self):
+        if not self.has_previous or not self.page:
+            return None
+        cursor = Cursor(
+            offset=0, reverse=True, position=self.encode_position(self.page[0])
+        )
+        return self.encode_cursor(cursor)
@@ -0,0 +1,4 @@
+from .hashers import TunedArgon2PasswordHasher
+from .hashing_pool import hash_password
+
+__all__ = ["TunedArgon2PasswordHasher", "hash_password"]
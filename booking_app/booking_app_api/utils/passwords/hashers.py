@@ -0,0 +1,23 @@
+from django.conf import settings
+from django.contrib.auth.hashers import Argon2PasswordHasher
+
+
+class TunedArgon2PasswordHasher(Argon2PasswordHasher):
+    """
+    Argon2PasswordHasher с параметрами из настройки PASSWORD_HASHING.
+
+    Алгоритм остаётся "argon2", поэтому существующие хеши проверяются как раньше,
+    а хеши со старыми параметрами пересчитываются при следующем входе пользователя.
+    """
+
+    @property
+    def time_cost(self):
+        return settings.PASSWORD_HASHING["ARGON2_TIME_COST"]
+
+    @property
+    def memory_cost(self):
+        return settings.PASSWORD_HASHING["ARGON2_MEMORY_COST"]
+
+    @property
+    def parallelism(self):
+        return settings.PASSWORD_HASHING["ARGON2_PARALLELISM"]
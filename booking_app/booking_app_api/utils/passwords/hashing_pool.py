@@ -0,0 +1,34 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+
+_executor = None
+_executor_pid = None
+_lock = threading.Lock()
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """Пул потоков хеширования текущего процесса (после fork создаётся заново)."""
+    global _executor, _executor_pid
+    with _lock:
+        if _executor is None or _executor_pid != os.getpid():
+            _executor = ThreadPoolExecutor(
+                max_workers=settings.PASSWORD_HASHING["MAX_WORKERS"],
+                thread_name_prefix="password-hashing",
+            )
+            _executor_pid = os.getpid()
+    return _executor
+
+
+def hash_password(raw_password: str) -> str:
+    """
+    make_password в пуле из PASSWORD_HASHING["MAX_WORKERS"] потоков.
+
+    Argon2 отпускает GIL на время вычисления, поэтому ограничение пула задаёт,
+    сколько ядер одновременно занимают регистрации; остальные запросы к
+    воркеру (потоки gthread, ASGI) не ждут, пока закончится всплеск регистраций.
+    """
+    return get_executor().submit(make_password, raw_password).result()
@@ -0,0 +1,22 @@
+import hmac
+
+from django.conf import settings
+from rest_framework.permissions import BasePermission
+
+
+class HasMetricsToken(BasePermission):
+    """
+    Доступ к метрикам по заголовку ``Authorization: Bearer <METRICS["TOKEN"]>``.
+
+    Если токен не задан, доступа нет ни у кого: метрики раскрывают эндпоинты
+    и нагрузку на БД.
+    """
+
+    def has_permission(self, request, view):
+        token = settings.METRICS["TOKEN"]
+        if not token:
+            return False
+        scheme, _, credentials = request.headers.get("Authorization", "").partition(" ")
+        return scheme == "Bearer" and hmac.compare_digest(
+            credentials.encode(), token.encode()
+        )
@@ -3,4 +3,10 @@ from rest_framework.permissions import BasePermission
 
 class IsOwnerOrSuperUser(BasePermission):
     def has_object_permission(self, request, view, obj):
-        return request.user == obj.user or request.user.is_superuser
+        # Сравнение по user_id не загружает владельца брони из БД.
+        return obj.user_id == request.user.pk or request.user.is_superuser
+
+
+class IsSuperUser(BasePermission):
+    def has_permission(self, request, view):
+        return bool(request.user and request.user.is_superuser)
@@ -0,0 +1,11 @@
+from .json_renderers import ORJSONParser, ORJSONRenderer
+from .msgpack_renderers import MessagePackParser, MessagePackRenderer
+from .prometheus_renderers import PrometheusTextRenderer
+
+__all__ = [
+    "ORJSONParser",
+    "ORJSONRenderer",
+    "MessagePackParser",
+    "MessagePackRenderer",
+    "PrometheusTextRenderer",
+]
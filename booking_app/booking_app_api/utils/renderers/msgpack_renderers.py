@@ -0,0 +1,40 @@
+import msgpack
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser
+from rest_framework.renderers import BaseRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+# Значения, которых нет в MessagePack, кодируются так же, как в JSON-ответах.
+_default = JSONEncoder().default
+
+
+class MessagePackRenderer(BaseRenderer):
+    """
+    Ответ в формате MessagePack (``Accept: application/msgpack``).
+
+    Структура данных та же, что и в JSON: Decimal и даты приходят из сериализаторов
+    строками, остальные типы приводятся обработчиком JSONEncoder из DRF.
+    """
+
+    media_type = "application/msgpack"
+    format = "msgpack"
+    charset = None
+    render_style = "binary"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        return msgpack.packb(data, default=_default, use_bin_type=True)
+
+
+class MessagePackParser(BaseParser):
+    """Разбор тела запроса в формате MessagePack."""
+
+    media_type = "application/msgpack"
+    renderer_class = MessagePackRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        try:
+            return msgpack.unpackb(stream.read(), raw=False, strict_map_key=False)
+        except (ValueError, msgpack.UnpackException) as exc:
+            raise ParseError("MessagePack parse error - %s" % str(exc))
@@ -0,0 +1,21 @@
+from rest_framework.renderers import BaseRenderer
+
+
+class PrometheusTextRenderer(BaseRenderer):
+    """
+    Текстовый формат Prometheus (version 0.0.4).
+
+    Данные ответа — уже готовый текст метрик; ошибки (например, 403) выводятся
+    строкой с сообщением.
+    """
+
+    media_type = "text/plain"
+    format = "prometheus"
+    charset = "utf-8"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if isinstance(data, bytes):
+            return data
+        if isinstance(data, dict) and "detail" in data:
+            data = data["detail"]
+        return f"{data}\n".encode(self.charset)
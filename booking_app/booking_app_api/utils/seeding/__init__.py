@@ -0,0 +1,12 @@
+from .synthetic import (LENGTH_DISTRIBUTIONS, booking_rows, copy_rows,
+                        daily_occupancy, room_intervals, room_rows, user_rows)
+
+__all__ = [
+    "LENGTH_DISTRIBUTIONS",
+    "booking_rows",
+    "copy_rows",
+    "daily_occupancy",
+    "room_intervals",
+    "room_rows",
+    "user_rows",
+]
@@ -0,0 +1,177 @@
+import math
+import random
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+
+from django.contrib.auth.hashers import UNUSABLE_PASSWORD_PREFIX
+from django.utils import timezone
+
+# Время заезда и выезда: брони комнаты идут встык, [date_start, date_end).
+CHECK_IN = time(12)
+
+# Логнормальное распределение длины брони: разброс вокруг среднего.
+LOGNORMAL_SIGMA = 0.6
+
+
+def geometric(rng: random.Random, mean: float) -> int:
+    """Целое >= 0 из геометрического распределения со средним mean."""
+    if mean <= 0:
+        return 0
+    return int(math.log(1.0 - rng.random()) / math.log(mean / (mean + 1)))
+
+
+def _geometric_length(mean: float):
+    return lambda rng: 1 + geometric(rng, mean - 1)
+
+
+def _uniform_length(mean: float):
+    high = max(1, round(2 * mean - 1))
+    return lambda rng: rng.randint(1, high)
+
+
+def _lognormal_length(mean: float):
+    mu = math.log(mean) - LOGNORMAL_SIGMA**2 / 2
+    return lambda rng: max(1, round(rng.lognormvariate(mu, LOGNORMAL_SIGMA)))
+
+
+# Распределения длины брони в сутках: имя -> фабрика (среднее) -> функция (rng) -> сутки.
+LENGTH_DISTRIBUTIONS = {
+    "geometric": _geometric_length,
+    "uniform": _uniform_length,
+    "lognormal": _lognormal_length,
+}
+
+
+def daily_occupancy(
+    day: date, occupancy: float, seasonality: float, peak_day: int
+) -> float:
+    """
+    Целевая загрузка комнат в день day.
+
+    Загрузка колеблется вокруг occupancy по косинусу с периодом в год и максимумом
+    в день года peak_day; seasonality — амплитуда колебаний (доля от occupancy).
+    """
+    phase = 2 * math.pi * (day.timetuple().tm_yday - peak_day) / 365.25
+    value = occupancy * (1 + seasonality * math.cos(phase))
+    return min(max(value, 0.01), 0.99)
+
+
+def room_intervals(
+    rng: random.Random,
+    start: date,
+    days: int,
+    occupancy: float,
+    seasonality: float,
+    peak_day: int,
+    draw_length,
+    mean_length: float,
+    max_length: int,
+):
+    """
+    Непересекающиеся брони одной комнаты на days суток начиная со start.
+
+    Перед каждой бронью идёт свободный промежуток со средним
+    mean_length * (1 - загрузка) / загрузка, поэтому доля занятых суток близка
+    к загрузке дня, на который приходится промежуток.
+
+    :param draw_length: функция из LENGTH_DISTRIBUTIONS для длины брони
+    :return: итератор пар (номер первых суток, число суток)
+    """
+    day = 0
+    while True:
+        load = daily_occupancy(
+            start + timedelta(days=day), occupancy, seasonality, peak_day
+        )
+        day += geometric(rng, mean_length * (1 - load) / load)
+        if day >= days:
+            return
+        length = min(draw_length(rng), max_length, days - day)
+        yield day, length
+        day += length
+
+
+def user_rows(prefix: str, count: int, seed: int, start: date):
+    """
+    Строки auth_user для COPY: пользователи с неиспользуемым паролем,
+    зарегистрированные в полночь дня start.
+    """
+    rng = random.Random(f"{seed}-users")
+    joined = timezone.make_aware(datetime.combine(start, time()))
+    for index in range(count):
+        username = f"{prefix}-user-{index}"
+        yield (
+            f"{UNUSABLE_PASSWORD_PREFIX}{rng.getrandbits(160):040x}",
+            False,
+            username,
+            "",
+            "",
+            f"{username}@example.com",
+            False,
+            True,
+            joined,
+        )
+
+
+def room_rows(prefix: str, count: int, seed: int):
+    """Строки комнат для COPY: вместимость от 1 до 6, цена растёт с вместимостью."""
+    rng = random.Random(f"{seed}-rooms")
+    for index in range(count):
+        capacity = rng.choices([1, 2, 3, 4, 6], weights=[2, 5, 2, 2, 1])[0]
+        price = Decimal(1500 * capacity * (0.8 + 0.4 * rng.random()))
+        yield f"{prefix}-room-{index}", price.quantize(Decimal("0.01")), capacity
+
+
+def booking_rows(
+    room_ids: list,
+    user_ids: list,
+    seed: int,
+    start: date,
+    days: int,
+    occupancy: float,
+    seasonality: float = 0.0,
+    peak_day: int = 200,
+    length_distribution: str = "geometric",
+    mean_length: float = 3.0,
+    max_length: int = 30,
+):
+    """
+    Строки броней для COPY: (room_id, user_id, date_start, date_end).
+
+    У каждой комнаты свой генератор случайных чисел, зависящий только от seed
+    и порядкового номера комнаты, поэтому результат детерминирован и не зависит
+    от размера пачек.
+    """
+    draw_length = LENGTH_DISTRIBUTIONS[length_distribution](mean_length)
+    moments = [
+        timezone.make_aware(datetime.combine(start + timedelta(days=day), CHECK_IN))
+        for day in range(days + 1)
+    ]
+    for index, room_id in enumerate(room_ids):
+        rng = random.Random(f"{seed}-room-{index}")
+        for day, length in room_intervals(
+            rng,
+            start,
+            days,
+            occupancy,
+            seasonality,
+            peak_day,
+            draw_length,
+            mean_length,
+            max_length,
+        ):
+            yield room_id, rng.choice(user_ids), moments[day], moments[day + length]
+
+
+def copy_rows(cursor, table: str, columns: tuple, rows) -> int:
+    """
+    Загружает rows в table одной командой COPY FROM STDIN.
+
+    :param cursor: курсор Django поверх psycopg 3
+    :return: число загруженных строк
+    """
+    count = 0
+    with cursor.copy(f"COPY {table} ({', '.join(columns)}) FROM STDIN") as copy:
+        for row in rows:
+            copy.write_row(row)
+            count += 1
+    return count
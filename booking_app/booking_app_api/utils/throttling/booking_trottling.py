@@ -1,9 +1,12 @@
-from rest_framework.throttling import SimpleRateThrottle
+from .gcra_throttle import GCRAThrottle
 
 
-class BookingThrottle(SimpleRateThrottle):
+class BookingThrottle(GCRAThrottle):
     scope = "bookingcreate"
 
     def get_cache_key(self, request, view):
-        # Ограничиваем по IP
-        return self.get_ident(request)
+        # Ограничиваем по IP, отдельно для каждой области
+        return self.cache_format % {
+            "scope": self.scope,
+            "ident": self.get_ident(request),
+        }
@@ -0,0 +1,113 @@
+import math
+import random
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection
+from rest_framework.throttling import SimpleRateThrottle
+
+TABLE = "booking_app_api_throttle_gcra"
+
+# Запрос разрешён, если max(tat, now) + interval - duration <= now; тогда TAT
+# сдвигается на interval. ON CONFLICT DO UPDATE блокирует строку ключа, поэтому
+# проверка и сдвиг выполняются атомарно для всех воркеров.
+HIT_SQL = f"""
+INSERT INTO {TABLE} AS t (key, tat, allowed)
+VALUES (%(key)s, %(now)s + %(interval)s, true)
+ON CONFLICT (key) DO UPDATE SET
+    allowed = greatest(t.tat, %(now)s) + %(interval)s - %(duration)s <= %(now)s,
+    tat = CASE
+        WHEN greatest(t.tat, %(now)s) + %(interval)s - %(duration)s <= %(now)s
+        THEN greatest(t.tat, %(now)s) + %(interval)s
+        ELSE t.tat
+    END
+RETURNING allowed, tat
+"""
+
+PURGE_SQL = f"DELETE FROM {TABLE} WHERE tat < %s"
+
+
+class DatabaseGCRAStore:
+    """Состояние GCRA в UNLOGGED-таблице PostgreSQL, общее для всех воркеров."""
+
+    def hit(self, key: str, now: float, interval: float, duration: int) -> tuple:
+        """
+        Регистрирует запрос, если он укладывается в лимит.
+
+        :param key: ключ ограничения (область и идентификатор клиента)
+        :param now: время запроса в секундах
+        :param interval: интервал между запросами при равномерной нагрузке
+        :param duration: длина окна в секундах (допустимая пачка — duration / interval)
+        :return: (разрешён ли запрос, TAT после запроса)
+        """
+        with connection.cursor() as cursor:
+            cursor.execute(
+                HIT_SQL,
+                {"key": key, "now": now, "interval": interval, "duration": duration},
+            )
+            allowed, tat = cursor.fetchone()
+            if random.random() < settings.THROTTLE_STORE["PURGE_RATE"]:
+                cursor.execute(PURGE_SQL, [now])
+        return allowed, tat
+
+
+class CacheGCRAStore:
+    """Состояние GCRA в кэше по умолчанию."""
+
+    def hit(self, key: str, now: float, interval: float, duration: int) -> tuple:
+        tat = max(cache.get(key, now), now)
+        if tat + interval - duration > now:
+            return False, tat
+        tat += interval
+        cache.set(key, tat, math.ceil(tat - now))
+        return True, tat
+
+
+GCRA_STORES = {
+    "database": DatabaseGCRAStore,
+    "cache": CacheGCRAStore,
+}
+
+
+def get_gcra_store():
+    return GCRA_STORES[settings.THROTTLE_STORE["BACKEND"]]()
+
+
+class GCRAThrottle(SimpleRateThrottle):
+    """
+    Ограничение частоты запросов по алгоритму GCRA (generic cell rate algorithm).
+
+    Вместо списка времён всех запросов за окно для ключа хранится одно число —
+    TAT (theoretical arrival time). Лимит "N/период" разрешает пачку до N запросов,
+    после чего запросы проходят не чаще одного за период / N. Время до следующего
+    разрешённого запроса (wait, заголовок Retry-After) вычисляется точно.
+
+    Хранилище выбирается настройкой THROTTLE_STORE, как у SharedRateThrottle.
+    """
+
+    # Свой префикс: в кэше по старым ключам могут лежать списки истории SimpleRateThrottle.
+    cache_format = "throttle_gcra_%(scope)s_%(ident)s"
+
+    def allow_request(self, request, view):
+        if self.rate is None:
+            return True
+
+        self.key = self.get_cache_key(request, view)
+        if self.key is None:
+            return True
+
+        self.now = self.timer()
+        if self.num_requests <= 0:
+            self.tat = None
+            return False
+
+        self.interval = self.duration / self.num_requests
+        allowed, self.tat = get_gcra_store().hit(
+            self.key, self.now, self.interval, self.duration
+        )
+        return allowed
+
+    def wait(self):
+        if self.tat is None:
+            return None
+        return max(self.tat + self.interval - self.duration - self.now, 0.0)
@@ -0,0 +1,128 @@
+import random
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection
+from rest_framework.throttling import SimpleRateThrottle
+
+TABLE = "booking_app_api_throttle"
+
+# История хранится от новых запросов к старым, как в SimpleRateThrottle.
+# ON CONFLICT DO UPDATE блокирует строку ключа, поэтому проверка лимита и запись
+# нового запроса выполняются атомарно для всех воркеров.
+HIT_SQL = f"""
+INSERT INTO {TABLE} AS t (key, history, allowed, expires_at)
+VALUES (
+    %(key)s,
+    CASE WHEN %(num_requests)s > 0
+        THEN ARRAY[%(now)s]::double precision[]
+        ELSE '{{}}'::double precision[]
+    END,
+    %(num_requests)s > 0,
+    %(expires_at)s
+)
+ON CONFLICT (key) DO UPDATE SET
+    allowed = (
+        SELECT count(*) < %(num_requests)s
+        FROM unnest(t.history) AS h
+        WHERE h > %(window_start)s
+    ),
+    history = (
+        SELECT CASE WHEN count(*) < %(num_requests)s
+            THEN ARRAY[%(now)s] || coalesce(array_agg(h ORDER BY h DESC), '{{}}')
+            ELSE coalesce(array_agg(h ORDER BY h DESC), '{{}}')
+        END
+        FROM unnest(t.history) AS h
+        WHERE h > %(window_start)s
+    ),
+    expires_at = %(expires_at)s
+RETURNING allowed, history
+"""
+
+PURGE_SQL = f"DELETE FROM {TABLE} WHERE expires_at < %s"
+
+
+class DatabaseThrottleStore:
+    """
+    История запросов в UNLOGGED-таблице PostgreSQL, общая для всех воркеров.
+
+    Проверка лимита выполняется одним запросом INSERT ... ON CONFLICT DO UPDATE.
+    Истёкшие записи удаляются после случайной доли запросов (PURGE_RATE).
+    """
+
+    def hit(self, key: str, now: float, num_requests: int, duration: int) -> tuple:
+        """
+        Регистрирует запрос, если лимит не исчерпан.
+
+        :param key: ключ ограничения (область и идентификатор клиента)
+        :param now: время запроса в секундах
+        :param num_requests: сколько запросов разрешено за duration
+        :param duration: длина окна в секундах
+        :return: (разрешён ли запрос, история запросов от новых к старым)
+        """
+        with connection.cursor() as cursor:
+            cursor.execute(
+                HIT_SQL,
+                {
+                    "key": key,
+                    "now": now,
+                    "num_requests": num_requests,
+                    "window_start": now - duration,
+                    "expires_at": now + duration,
+                },
+            )
+            allowed, history = cursor.fetchone()
+            if random.random() < settings.THROTTLE_STORE["PURGE_RATE"]:
+                cursor.execute(PURGE_SQL, [now])
+        return allowed, history
+
+
+class CacheThrottleStore:
+    """История запросов в кэше по умолчанию, как в SimpleRateThrottle."""
+
+    def hit(self, key: str, now: float, num_requests: int, duration: int) -> tuple:
+        history = cache.get(key, [])
+        while history and history[-1] <= now - duration:
+            history.pop()
+        if len(history) >= num_requests:
+            return False, history
+        history.insert(0, now)
+        cache.set(key, history, duration)
+        return True, history
+
+
+THROTTLE_STORES = {
+    "database": DatabaseThrottleStore,
+    "cache": CacheThrottleStore,
+}
+
+
+def get_throttle_store():
+    return THROTTLE_STORES[settings.THROTTLE_STORE["BACKEND"]]()
+
+
+class SharedRateThrottle(SimpleRateThrottle):
+    """
+    SimpleRateThrottle с историей запросов в хранилище THROTTLE_STORE.
+
+    Кэш по умолчанию (LocMemCache) у каждого воркера свой, и при N воркерах клиент
+    получал N-кратный лимит. С хранилищем "database" лимит общий для всех воркеров.
+    Расчёт окна и заголовок Retry-After (wait) совпадают с SimpleRateThrottle.
+
+    Эндпоинты используют GCRAThrottle; этот класс (и таблица booking_app_api_throttle)
+    оставлен как база для сравнения в benchmarks/bench_throttle.py.
+    """
+
+    def allow_request(self, request, view):
+        if self.rate is None:
+            return True
+
+        self.key = self.get_cache_key(request, view)
+        if self.key is None:
+            return True
+
+        self.now = self.timer()
+        allowed, self.history = get_throttle_store().hit(
+            self.key, self.now, self.num_requests, self.duration
+        )
+        return allowed
@@ -1,7 +1,11 @@
 import logging
+from datetime import timedelta
 
-from booking_app_admin.models import Booking
+from booking_app_admin.models import Booking, Room, max_booking_days
+from booking_app_api.utils.analytics import PERIODS
 from booking_app_api.utils.filters import get_free_rooms
+from django.conf import settings
+from django.core.exceptions import ValidationError as DjangoValidationError
 from rest_framework import serializers
 
 from ..Room.rooms_serializer import RoomSerializer
@@ -17,7 +21,31 @@ class BookingSerializer(serializers.ModelSerializer):
         fields = ["id", "date_start", "date_end", "room"]
 
 
+class PrefetchedRelatedField(serializers.PrimaryKeyRelatedField):
+    """
+    PrimaryKeyRelatedField, который берёт объекты из context["prefetched"][имя поля]
+    ({pk: объект}), если словарь передан: при проверке пакета элементов объекты
+    загружаются одним запросом, а не запросом на каждый элемент. Ошибки те же.
+    """
+
+    def to_internal_value(self, data):
+        prefetched = self.context.get("prefetched", {}).get(self.field_name)
+        if prefetched is None:
+            return super().to_internal_value(data)
+        try:
+            if isinstance(data, bool):
+                raise TypeError
+            pk = self.get_queryset().model._meta.pk.to_python(data)
+        except (TypeError, ValueError, DjangoValidationError):
+            self.fail("incorrect_type", data_type=type(data).__name__)
+        if pk not in prefetched:
+            self.fail("does_not_exist", pk_value=data)
+        return prefetched[pk]
+
+
 class BookingCreateSerializer(serializers.ModelSerializer):
+    room = PrefetchedRelatedField(queryset=Room.objects.all())
+
     class Meta:
         model = Booking
         fields = ["room", "date_start", "date_end"]
@@ -32,12 +60,83 @@ class BookingCreateSerializer(serializers.ModelSerializer):
             raise serializers.ValidationError(
                 "Дата начала бронирования не может быть позже даты конца."
             )
+        max_days = max_booking_days()
+        duration = data["date_end"] - data["date_start"]
+        if max_days is not None and duration > timedelta(days=max_days):
+            raise serializers.ValidationError(
+                f"Бронь не может быть длиннее {max_days} суток."
+            )
 
-        # Проверка доступности комнаты на этот период
-        logger.debug(
-            "Проверка свободна ли комната:\n"
-            f"комната: {data['room']}\n"
-            f"свободные комнаты:{get_free_rooms(data['date_start'], data['date_end'])}"
-        )
+        # Проверка доступности комнаты на этот период.
+        # Поиск свободных комнат — отдельный SQL-запрос, поэтому выполняется
+        # только при включённом уровне DEBUG.
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Проверка свободна ли комната:\nкомната: %s\nсвободные комнаты:%s",
+                data["room"],
+                list(get_free_rooms(data["date_start"], data["date_end"])),
+            )
 
         return data
+
+
+class BookingBulkCreateSerializer(serializers.Serializer):
+    """
+    Параметры пакетного создания броней.
+
+    Элементы bookings здесь проверяются только как список: каждый элемент
+    валидируется отдельно через BookingCreateSerializer, чтобы ошибка в одном из них
+    не отменяла проверку остальных.
+    """
+
+    ATOMIC = "atomic"
+    BEST_EFFORT = "best_effort"
+
+    mode = serializers.ChoiceField(choices=[ATOMIC, BEST_EFFORT], default=ATOMIC)
+    bookings = serializers.ListField(allow_empty=False)
+
+    def validate_bookings(self, value):
+        max_items = settings.BULK_BOOKING["MAX_ITEMS"]
+        if len(value) > max_items:
+            raise serializers.ValidationError(
+                f"За один запрос можно создать не более {max_items} броней."
+            )
+        return value
+
+
+class BookingExportParamsSerializer(serializers.Serializer):
+    export_format = serializers.ChoiceField(
+        choices=["ndjson", "csv"], default="ndjson", required=False
+    )
+    date_start = serializers.DateTimeField(required=False)
+    date_end = serializers.DateTimeField(required=False)
+    room = serializers.PrimaryKeyRelatedField(
+        queryset=Room.objects.all(), required=False
+    )
+
+    def validate(self, data):
+        date_start, date_end = data.get("date_start"), data.get("date_end")
+        if date_start and date_end and date_start > date_end:
+            raise serializers.ValidationError(
+                "Дата начала периода не может быть позже даты конца."
+            )
+        return data
+
+
+class BookingAnalyticsParamsSerializer(serializers.Serializer):
+    date_start = serializers.DateField(required=True)
+    date_end = serializers.DateField(required=True)
+    period = serializers.ChoiceField(choices=PERIODS, default="day", required=False)
+    room = serializers.IntegerField(required=False, min_value=1, default=None)
+
+    def validate(self, data):
+        if data["date_start"] > data["date_end"]:
+            raise serializers.ValidationError(
+                "Дата начала периода не может быть позже даты конца."
+            )
+        max_days = settings.BOOKING_ANALYTICS["MAX_DAYS"]
+        if (data["date_end"] - data["date_start"]).days >= max_days:
+            raise serializers.ValidationError(
+                f"Период отчёта не может быть длиннее {max_days} суток."
+            )
+        return data
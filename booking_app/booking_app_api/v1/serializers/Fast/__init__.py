@@ -0,0 +1,9 @@
+from .fast_serializer import (FastSerializer, fast_booking_serializer,
+                              fast_room_serializer, fast_serialization_enabled)
+
+__all__ = [
+    "FastSerializer",
+    "fast_booking_serializer",
+    "fast_room_serializer",
+    "fast_serialization_enabled",
+]
@@ -0,0 +1,204 @@
+import decimal
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.utils import timezone
+from rest_framework import serializers
+from rest_framework.fields import ISO_8601
+from rest_framework.settings import api_settings
+
+from ..Booking.booking_serializer import BookingSerializer
+from ..Room.rooms_serializer import RoomSerializer
+
+
+def fast_serialization_enabled() -> bool:
+    return settings.FAST_SERIALIZATION["ENABLED"]
+
+
+def _identity(tz):
+    return None
+
+
+def _decimal(field):
+    if (
+        not getattr(field, "coerce_to_string", api_settings.COERCE_DECIMAL_TO_STRING)
+        or field.localize
+        or field.normalize_output
+    ):
+        return _generic(field)
+
+    if field.decimal_places is None:
+        return lambda tz: "{:f}".format
+
+    # То же, что DecimalField.quantize, но контекст и шаг вычисляются один раз.
+    context = decimal.getcontext().copy()
+    if field.max_digits is not None:
+        context.prec = field.max_digits
+    exponent = decimal.Decimal(".1") ** field.decimal_places
+    rounding = field.rounding
+
+    def make(tz):
+        return lambda value: "{:f}".format(
+            value.quantize(exponent, rounding=rounding, context=context)
+        )
+
+    return make
+
+
+def _datetime(field):
+    output_format = getattr(field, "format", api_settings.DATETIME_FORMAT)
+    if (
+        output_format is None
+        or output_format.lower() != ISO_8601
+        or hasattr(field, "timezone")
+        or not settings.USE_TZ
+    ):
+        return _generic(field)
+
+    def make(tz):
+        def convert(value):
+            value = value.astimezone(tz).isoformat()
+            if value.endswith("+00:00"):
+                value = value[:-6] + "Z"
+            return value
+
+        return convert
+
+    return make
+
+
+def _generic(field):
+    return lambda tz: field.to_representation
+
+
+# Поля, значения которых из values() уже совпадают с выводом DRF.
+_PASSTHROUGH = (
+    serializers.IntegerField,
+    serializers.CharField,
+    serializers.BooleanField,
+)
+
+# Поля, которым для вывода нужен экземпляр модели.
+_UNSUPPORTED = (
+    serializers.SerializerMethodField,
+    serializers.RelatedField,
+    serializers.BaseSerializer,
+    serializers.ModelField,
+)
+
+
+class FastSerializer:
+    """
+    Быстрая сериализация только для чтения по описанию ModelSerializer.
+
+    Поля сериализатора один раз компилируются в список колонок для ``values()``
+    и функций преобразования значений (Decimal, datetime), после чего строки
+    QuerySet превращаются в словари того же вида, что отдаёт сериализатор, без
+    создания экземпляров моделей и без обхода полей DRF на каждую строку.
+    Вложенные ModelSerializer читаются через JOIN в том же запросе.
+
+    Поддерживаются простые поля модели, PrimaryKeyRelatedField и вложенные
+    ModelSerializer; для остальных полей выбрасывается ImproperlyConfigured.
+    """
+
+    def __init__(self, serializer_class):
+        self.serializer_class = serializer_class
+        self._entries = None
+        self._paths = None
+
+    def _compile(self, serializer, prefix=""):
+        entries = []
+        paths = []
+        model = serializer.Meta.model
+        for key, field in serializer.fields.items():
+            if field.write_only:
+                continue
+            if field.source == "*" or "." in field.source:
+                raise ImproperlyConfigured(
+                    f"{self.serializer_class.__name__}.{key}: источник {field.source!r} "
+                    "не поддерживается быстрой сериализацией."
+                )
+            model_field = model._meta.get_field(field.source)
+            path = prefix + field.source
+
+            if isinstance(field, serializers.ModelSerializer):
+                children, child_paths = self._compile(field, prefix=path + "__")
+                null_path = path if model_field.null else None
+                if null_path:
+                    paths.append(null_path)
+                entries.append((key, null_path, None, children))
+                paths.extend(child_paths)
+                continue
+
+            if isinstance(field, serializers.PrimaryKeyRelatedField):
+                if field.pk_field is not None:
+                    raise ImproperlyConfigured(
+                        f"{self.serializer_class.__name__}.{key}: pk_field не поддерживается."
+                    )
+                make = _identity
+            elif isinstance(field, serializers.DecimalField):
+                make = _decimal(field)
+            elif isinstance(field, serializers.DateTimeField):
+                make = _datetime(field)
+            elif isinstance(field, _PASSTHROUGH):
+                make = _identity
+            elif isinstance(field, _UNSUPPORTED):
+                raise ImproperlyConfigured(
+                    f"{self.serializer_class.__name__}.{key}: поле "
+                    f"{type(field).__name__} не поддерживается быстрой сериализацией."
+                )
+            else:
+                make = _generic(field)
+            paths.append(path)
+            entries.append((key, path, make, None))
+        return entries, paths
+
+    def _ensure_compiled(self):
+        if self._entries is None:
+            self._entries, self._paths = self._compile(self.serializer_class())
+
+    @property
+    def paths(self) -> list:
+        """Колонки, которые нужно выбрать через ``values()``."""
+        self._ensure_compiled()
+        return self._paths
+
+    @classmethod
+    def _bind(cls, entries, tz):
+        bound = []
+        for key, path, make, children in entries:
+            if children is not None:
+                bound.append((key, path, cls._bind(children, tz), True))
+            else:
+                bound.append((key, path, make(tz), False))
+
+        def build(row):
+            result = {}
+            for key, path, convert, nested in bound:
+                if nested:
+                    result[key] = (
+                        None if path is not None and row[path] is None else convert(row)
+                    )
+                    continue
+                value = row[path]
+                if value is None or convert is None:
+                    result[key] = value
+                else:
+                    result[key] = convert(value)
+            return result
+
+        return build
+
+    def serialize_rows(self, rows) -> list:
+        """Преобразует строки из ``values(*self.paths)`` в список словарей."""
+        self._ensure_compiled()
+        build = self._bind(self._entries, timezone.get_current_timezone())
+        return [build(row) for row in rows]
+
+    def serialize(self, queryset) -> list:
+        """Выбирает нужные колонки QuerySet и преобразует их в список словарей."""
+        return self.serialize_rows(queryset.prefetch_related(None).values(*self.paths))
+
+
+fast_room_serializer = FastSerializer(RoomSerializer)
+fast_booking_serializer = FastSerializer(BookingSerializer)
@@ -0,0 +1,16 @@
+from django.conf import settings
+from rest_framework import serializers
+
+
+class RoomCalendarParamsSerializer(serializers.Serializer):
+    month = serializers.DateField(required=True, input_formats=["%Y-%m"])
+    months = serializers.IntegerField(required=False, min_value=1, default=1)
+    room = serializers.IntegerField(required=False, min_value=1, default=None)
+
+    def validate_months(self, value):
+        max_months = settings.AVAILABILITY_CALENDAR["MAX_MONTHS"]
+        if value > max_months:
+            raise serializers.ValidationError(
+                f"Нельзя запросить больше {max_months} месяцев."
+            )
+        return value
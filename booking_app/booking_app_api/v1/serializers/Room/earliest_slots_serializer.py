@@ -0,0 +1,43 @@
+from django.conf import settings
+from django.utils import timezone
+from rest_framework import serializers
+
+
+class EarliestSlotsParamsSerializer(serializers.Serializer):
+    nights = serializers.IntegerField(required=True, min_value=1)
+    date_from = serializers.DateField(required=False, default=timezone.localdate)
+    capacity = serializers.IntegerField(required=False, min_value=0, default=0)
+    max_price = serializers.DecimalField(
+        required=False, max_digits=10, decimal_places=2, min_value=0, default=None
+    )
+    limit = serializers.IntegerField(required=False, min_value=1, default=5)
+
+    def validate_nights(self, value):
+        horizon_days = settings.EARLIEST_SLOTS["HORIZON_DAYS"]
+        if value > horizon_days:
+            raise serializers.ValidationError(
+                f"Нельзя искать окна длиннее {horizon_days} суток."
+            )
+        return value
+
+    def validate_date_from(self, value):
+        if value < timezone.localdate():
+            raise serializers.ValidationError(
+                "Дата начала поиска не может быть в прошлом."
+            )
+        return value
+
+    def validate_limit(self, value):
+        max_limit = settings.EARLIEST_SLOTS["MAX_LIMIT"]
+        if value > max_limit:
+            raise serializers.ValidationError(
+                f"Нельзя запросить больше {max_limit} окон."
+            )
+        return value
+
+
+class FreeSlotSerializer(serializers.Serializer):
+    room = serializers.IntegerField()
+    date_start = serializers.DateTimeField()
+    date_end = serializers.DateTimeField()
+    free_until = serializers.DateTimeField()
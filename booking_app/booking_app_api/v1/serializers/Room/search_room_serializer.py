@@ -1,6 +1,7 @@
 import logging
-from datetime import date
+from datetime import date, datetime, timedelta
 
+from django.conf import settings
 from rest_framework import serializers
 
 logger = logging.getLogger(__name__)
@@ -12,10 +13,59 @@ class RoomSearchParamsSerializer(serializers.Serializer):
     capacity = serializers.IntegerField(required=False, min_value=0, default=0)
 
     def validate(self, data):
-        if data["date_start"] > data["date_end"]:
+        self.validate_window(data["date_start"], data["date_end"])
+        return data
+
+    @staticmethod
+    def validate_window(date_start: datetime, date_end: datetime):
+        if date_start > date_end:
             raise serializers.ValidationError(
                 "Дата заезда не может быть позже даты выезда."
             )
-        if data["date_end"].date() < date.today():
+        if date_end.date() < date.today():
             raise serializers.ValidationError("Дата выезда не может быть в прошлом.")
+
+
+class FlexibleSearchParamsSerializer(RoomSearchParamsSerializer):
+    """
+    Параметры гибкого поиска: базовый промежуток и допуски.
+
+    Промежутки-кандидаты — базовый промежуток, сдвинутый на -shift_days .. shift_days
+    суток, с выездом, сдвинутым ещё на -length_days .. length_days суток. Кандидаты,
+    не проходящие проверки RoomSearchParamsSerializer, и пустые промежутки
+    отбрасываются; итоговый список — в validated_data["windows"].
+    """
+
+    shift_days = serializers.IntegerField(required=False, min_value=0, default=0)
+    length_days = serializers.IntegerField(required=False, min_value=0, default=0)
+    cheapest = serializers.BooleanField(required=False, default=False)
+
+    def validate_shift_days(self, value):
+        return self.check_limit(value, "MAX_SHIFT_DAYS")
+
+    def validate_length_days(self, value):
+        return self.check_limit(value, "MAX_LENGTH_DAYS")
+
+    @staticmethod
+    def check_limit(value, name):
+        limit = settings.FLEXIBLE_SEARCH[name]
+        if value > limit:
+            raise serializers.ValidationError(f"Значение не может быть больше {limit}.")
+        return value
+
+    def validate(self, data):
+        data = super().validate(data)
+        data["windows"] = []
+        for shift in range(-data["shift_days"], data["shift_days"] + 1):
+            for length in range(-data["length_days"], data["length_days"] + 1):
+                date_start = data["date_start"] + timedelta(days=shift)
+                date_end = data["date_end"] + timedelta(days=shift + length)
+                if date_start >= date_end:
+                    continue
+                try:
+                    self.validate_window(date_start, date_end)
+                except serializers.ValidationError:
+                    continue
+                data["windows"].append((date_start, date_end))
+        data["windows"].sort()
         return data
@@ -1,14 +1,28 @@
+from booking_app_api.utils.passwords import hash_password
 from django.contrib.auth import get_user_model
 from django.contrib.auth.password_validation import validate_password
+from django.db import IntegrityError, transaction
 from rest_framework import serializers
 from rest_framework.validators import UniqueValidator
 
+# Уникальные ограничения auth_user и поля, к которым относится нарушение.
+UNIQUE_CONSTRAINTS = {
+    "auth_user_username_key": "username",
+    # Создаётся миграцией booking_app_api 0003_auth_user_email_upper.
+    "auth_user_email_upper_uniq": "email",
+}
+
 
 class RegistrationSerializer(serializers.ModelSerializer):
-    email = serializers.EmailField(
-        required=True,
-        validators=[UniqueValidator(queryset=get_user_model().objects.all())],
-    )
+    """
+    Регистрация пользователя.
+
+    Уникальность username и email не проверяется запросами перед сохранением:
+    пароль хешируется до транзакции, пользователь создаётся одним INSERT,
+    а нарушение уникального индекса возвращается как ошибка валидации поля.
+    """
+
+    email = serializers.EmailField(required=True)
 
     password = serializers.CharField(
         write_only=True, required=True, validators=[validate_password]
@@ -23,6 +37,10 @@ class RegistrationSerializer(serializers.ModelSerializer):
             "password2",
             "email",
         )
+        # Без UniqueValidator, который ModelSerializer добавляет для username.
+        extra_kwargs = {
+            "username": {"validators": [get_user_model().username_validator]},
+        }
 
     def validate(self, attrs):
         if attrs["password"] != attrs["password2"]:
@@ -31,12 +49,30 @@ class RegistrationSerializer(serializers.ModelSerializer):
         return attrs
 
     def create(self, validated_data):
-        user = get_user_model().objects.create(
+        user = get_user_model()(
             username=validated_data["username"],
             email=validated_data["email"],
+            password=hash_password(validated_data["password"]),
         )
 
-        user.set_password(validated_data["password"])
-        user.save()
+        try:
+            with transaction.atomic():
+                user.save()
+        except IntegrityError as e:
+            field = UNIQUE_CONSTRAINTS.get(self.constraint_name(e))
+            if field is None:
+                raise
+            raise serializers.ValidationError({field: [self.unique_message(field)]})
 
         return user
+
+    @staticmethod
+    def constraint_name(error: IntegrityError):
+        return getattr(getattr(error.__cause__, "diag", None), "constraint_name", None)
+
+    @staticmethod
+    def unique_message(field: str) -> str:
+        """Сообщения те же, что у прежних проверок UniqueValidator."""
+        if field == "email":
+            return UniqueValidator.message
+        return get_user_model()._meta.get_field(field).error_messages["unique"]
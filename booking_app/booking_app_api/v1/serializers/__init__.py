@@ -1,13 +1,34 @@
-from .Booking.booking_serializer import (BookingCreateSerializer,
+from .Booking.booking_serializer import (BookingAnalyticsParamsSerializer,
+                                         BookingBulkCreateSerializer,
+                                         BookingCreateSerializer,
+                                         BookingExportParamsSerializer,
                                          BookingSerializer)
+from .Fast.fast_serializer import (FastSerializer, fast_booking_serializer,
+                                   fast_room_serializer,
+                                   fast_serialization_enabled)
+from .Room.calendar_serializer import RoomCalendarParamsSerializer
+from .Room.earliest_slots_serializer import (EarliestSlotsParamsSerializer,
+                                             FreeSlotSerializer)
 from .Room.rooms_serializer import RoomSerializer
-from .Room.search_room_serializer import RoomSearchParamsSerializer
+from .Room.search_room_serializer import (FlexibleSearchParamsSerializer,
+                                          RoomSearchParamsSerializer)
 from .User.registration_serializer import RegistrationSerializer
 
 __all__ = [
     "RoomSerializer",
     "BookingSerializer",
     "RoomSearchParamsSerializer",
+    "FlexibleSearchParamsSerializer",
+    "RoomCalendarParamsSerializer",
+    "EarliestSlotsParamsSerializer",
+    "FreeSlotSerializer",
     "BookingCreateSerializer",
+    "BookingBulkCreateSerializer",
+    "BookingExportParamsSerializer",
+    "BookingAnalyticsParamsSerializer",
     "RegistrationSerializer",
+    "FastSerializer",
+    "fast_room_serializer",
+    "fast_booking_serializer",
+    "fast_serialization_enabled",
 ]
@@ -6,10 +6,31 @@ urlpatterns = [
     # ROOMS API
     path("all-rooms/", ShowRoomsApi.as_view(), name="all-rooms"),
     path("search-free-rooms/", SearchFreeRoomApi.as_view(), name="search-free-rooms"),
+    path(
+        "search-free-rooms/flexible/",
+        FlexibleSearchFreeRoomApi.as_view(),
+        name="flexible-search-free-rooms",
+    ),
+    path("rooms/calendar/", RoomCalendarApi.as_view(), name="room-calendar"),
+    path("rooms/earliest-slots/", EarliestSlotsApi.as_view(), name="earliest-slots"),
     # USER API
     path("user/registration/", UserRegistrationApi.as_view(), name="user-registration"),
     # USER BOOKING API
     path("user/booking/", UserAllBookingApi.as_view(), name="user-all-booking"),
     path("user/booking/<int:pk>/", UserBookingApi.as_view(), name="user-booking"),
     path("user/booking/create/", CreateBookingApi.as_view(), name="create-booking"),
+    path(
+        "user/booking/bulk-create/",
+        CreateBulkBookingApi.as_view(),
+        name="bulk-create-booking",
+    ),
+    # ADMIN API
+    path("booking/export/", ExportBookingApi.as_view(), name="export-booking"),
+    path(
+        "analytics/occupancy/",
+        OccupancyAnalyticsApi.as_view(),
+        name="occupancy-analytics",
+    ),
+    path("service/db-pool/", DbPoolStatsApi.as_view(), name="db-pool-stats"),
+    path("service/metrics/", MetricsApi.as_view(), name="metrics"),
 ]
@@ -0,0 +1,24 @@
+from django.urls import path
+
+from .urls import urlpatterns as sync_urlpatterns
+from .views import (AsyncSearchFreeRoomApi, AsyncShowRoomsApi,
+                    AsyncUserAllBookingApi, AsyncUserBookingApi)
+
+# Read-эндпоинты с асинхронными версиями, остальные маршруты берутся из urls.py.
+ASYNC_VIEWS = {
+    "all-rooms": AsyncShowRoomsApi,
+    "search-free-rooms": AsyncSearchFreeRoomApi,
+    "user-all-booking": AsyncUserAllBookingApi,
+    "user-booking": AsyncUserBookingApi,
+}
+
+urlpatterns = [
+    (
+        path(
+            str(pattern.pattern), ASYNC_VIEWS[pattern.name].as_view(), name=pattern.name
+        )
+        if pattern.name in ASYNC_VIEWS
+        else pattern
+    )
+    for pattern in sync_urlpatterns
+]
@@ -1,15 +1,37 @@
+from .analytics.occupancy import OccupancyAnalyticsApi
+from .booking.async_booking import AsyncUserAllBookingApi, AsyncUserBookingApi
+from .booking.bulk_booking import CreateBulkBookingApi
 from .booking.creat_booking import CreateBookingApi
+from .booking.export_booking import ExportBookingApi
 from .booking.show_booking import UserAllBookingApi
 from .booking.single_booking import UserBookingApi
+from .rooms.async_rooms import AsyncSearchFreeRoomApi, AsyncShowRoomsApi
+from .rooms.earliest_slots import EarliestSlotsApi
+from .rooms.flexible_search import FlexibleSearchFreeRoomApi
+from .rooms.room_calendar import RoomCalendarApi
 from .rooms.search_free_room import SearchFreeRoomApi
 from .rooms.show_rooms import ShowRoomsApi
+from .service.db_pool import DbPoolStatsApi
+from .service.metrics import MetricsApi
 from .user.registration import UserRegistrationApi
 
 __all__ = [
     "ShowRoomsApi",
     "SearchFreeRoomApi",
+    "RoomCalendarApi",
+    "EarliestSlotsApi",
+    "FlexibleSearchFreeRoomApi",
     "UserAllBookingApi",
     "UserBookingApi",
     "CreateBookingApi",
+    "CreateBulkBookingApi",
+    "ExportBookingApi",
+    "OccupancyAnalyticsApi",
+    "DbPoolStatsApi",
+    "MetricsApi",
     "UserRegistrationApi",
+    "AsyncShowRoomsApi",
+    "AsyncSearchFreeRoomApi",
+    "AsyncUserAllBookingApi",
+    "AsyncUserBookingApi",
 ]
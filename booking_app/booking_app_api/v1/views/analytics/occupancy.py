@@ -0,0 +1,92 @@
+from booking_app_api.utils import IsSuperUser
+from booking_app_api.utils.analytics import occupancy_report
+from booking_app_api.v1.serializers import BookingAnalyticsParamsSerializer
+from drf_spectacular.utils import (OpenApiExample, OpenApiParameter,
+                                   OpenApiResponse, extend_schema)
+from rest_framework import serializers
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+
+class OccupancyRowSerializer(serializers.Serializer):
+    room = serializers.IntegerField()
+    period_start = serializers.DateField()
+    booked_hours = serializers.DecimalField(max_digits=12, decimal_places=2)
+    occupancy = serializers.DecimalField(max_digits=6, decimal_places=4)
+    revenue = serializers.DecimalField(max_digits=14, decimal_places=2)
+
+
+@extend_schema(
+    summary="Занятость и выручка комнат",
+    description=(
+        "Занятость (доля занятых часов) и выручка по комнатам за сутки, недели или месяцы. "
+        "Считается по суточной статистике броней. Доступно только суперпользователю."
+    ),
+    parameters=[
+        OpenApiParameter(
+            "date_start", str, required=True, description="Первые сутки (YYYY-MM-DD)"
+        ),
+        OpenApiParameter(
+            "date_end",
+            str,
+            required=True,
+            description="Последние сутки включительно (YYYY-MM-DD)",
+        ),
+        OpenApiParameter(
+            "period",
+            str,
+            required=False,
+            enum=["day", "week", "month"],
+            description="Группировка, по умолчанию day",
+        ),
+        OpenApiParameter("room", int, required=False, description="id комнаты"),
+    ],
+    responses={
+        200: OccupancyRowSerializer(many=True),
+        400: OpenApiResponse(description="Ошибка в параметрах запроса"),
+        403: OpenApiResponse(description="Пользователь не суперпользователь"),
+    },
+    examples=[
+        OpenApiExample(
+            name="Стандартный ответ",
+            value=[
+                {
+                    "room": 1,
+                    "period_start": "2025-02-01",
+                    "booked_hours": "96.00",
+                    "occupancy": "0.1429",
+                    "revenue": "400.00",
+                }
+            ],
+        ),
+    ],
+)
+class OccupancyAnalyticsApi(APIView):
+    """
+    API endpoint с отчётом о занятости и выручке для суперпользователя.
+
+    Отчёт читает только таблицу BookingDailyRollup, которая пересчитывается
+    при изменении броней (см. booking_app_api.utils.analytics), поэтому время
+    ответа не зависит от размера таблицы броней.
+
+    Параметры запроса (query parameters):
+    - date_start, date_end (обязательные): первые и последние сутки отчёта.
+    - period (необязательный): day, week или month.
+    - room (необязательный): id комнаты.
+    """
+
+    permission_classes = [IsAuthenticated, IsSuperUser]
+
+    def get(self, request):
+        serializer = BookingAnalyticsParamsSerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+
+        validated = serializer.validated_data
+        report = occupancy_report(
+            validated["date_start"],
+            validated["date_end"],
+            validated["period"],
+            validated["room"],
+        )
+        return Response(OccupancyRowSerializer(report, many=True).data)
@@ -0,0 +1,56 @@
+from django.http import Http404
+from rest_framework import status
+from rest_framework.response import Response
+
+from ..mixins import AsyncAPIMixin, AsyncListMixin
+from .show_booking import UserAllBookingApi
+from .single_booking import UserBookingApi, user_booking_schema
+
+
+class AsyncUserAllBookingApi(AsyncAPIMixin, AsyncListMixin, UserAllBookingApi):
+    """Асинхронная версия UserAllBookingApi (см. ASYNC_VIEWS)."""
+
+    authentication_classes = UserAllBookingApi.authentication_classes
+
+    async def get(self, request, *args, **kwargs):
+        return await self.alist(request, *args, **kwargs)
+
+
+@user_booking_schema
+class AsyncUserBookingApi(AsyncAPIMixin, UserBookingApi):
+    """Асинхронная версия UserBookingApi (см. ASYNC_VIEWS)."""
+
+    authentication_classes = UserBookingApi.authentication_classes
+
+    async def aget_object(self):
+        """Асинхронный вариант GenericAPIView.get_object."""
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        queryset = self.filter_queryset(self.get_queryset())
+        obj = await queryset.filter(
+            **{self.lookup_field: self.kwargs[lookup_url_kwarg]}
+        ).afirst()
+        if obj is None:
+            raise Http404(
+                f"No {queryset.model._meta.object_name} matches the given query."
+            )
+        self.check_object_permissions(self.request, obj)
+        return obj
+
+    async def get(self, request, *args, **kwargs):
+        instance = await self.aget_object()
+        serializer = self.get_serializer(instance)
+        return Response(serializer.data)
+
+    async def delete(self, request, *args, **kwargs):
+        """
+        Асинхронный вариант UserBookingApi.destroy.
+
+        Django не допускает в одном view синхронные и асинхронные обработчики,
+        поэтому удаление тоже асинхронное. ``adelete`` выполняет ``delete`` в
+        потоке, post_delete (статистика, версии кэша, битовая карта занятости)
+        срабатывает так же, как в синхронной версии.
+        """
+        instance = await self.aget_object()
+        response_text = f"Бронь с id {instance.id} успешно удалена."
+        await instance.adelete()
+        return Response({"detail": response_text}, status=status.HTTP_200_OK)
@@ -0,0 +1,218 @@
+import logging
+
+from booking_app_admin.models import Booking, Room
+from booking_app_api.signals import bookings_created
+from booking_app_api.utils import BookingThrottle
+from booking_app_api.v1.serializers import (BookingBulkCreateSerializer,
+                                            BookingCreateSerializer)
+from django.db import transaction
+from django.db.utils import IntegrityError
+from drf_spectacular.utils import (OpenApiExample, OpenApiResponse,
+                                   extend_schema)
+from rest_framework import status
+from rest_framework.exceptions import ValidationError
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+logger = logging.getLogger(__name__)
+
+CONFLICT_DETAIL = "Комната уже забронирована на указанные даты."
+SKIPPED_DETAIL = "Бронь не создана из-за ошибок в других элементах запроса."
+
+
+@extend_schema(
+    summary="Пакетное создание броней",
+    description=(
+        "Создаёт несколько броней за один запрос. В режиме atomic брони создаются "
+        "только если все элементы корректны и свободны, в режиме best_effort "
+        "создаются все брони, которые удалось создать. Требуется авторизация."
+    ),
+    request=BookingBulkCreateSerializer,
+    responses={
+        201: OpenApiResponse(description="Все брони созданы"),
+        207: OpenApiResponse(
+            description="Созданы не все брони (режим best_effort)",
+            examples=[
+                OpenApiExample(
+                    name="Одна из комнат занята",
+                    value={
+                        "mode": "best_effort",
+                        "results": [
+                            {
+                                "index": 0,
+                                "status": 201,
+                                "data": {
+                                    "id": 10,
+                                    "room": 1,
+                                    "date_start": "2025-07-01T00:00:00+03:00",
+                                    "date_end": "2025-07-03T00:00:00+03:00",
+                                },
+                            },
+                            {
+                                "index": 1,
+                                "status": 409,
+                                "detail": CONFLICT_DETAIL,
+                            },
+                        ],
+                    },
+                    media_type="application/json",
+                ),
+            ],
+        ),
+        400: OpenApiResponse(description="Ошибка валидации одного из элементов"),
+        409: OpenApiResponse(description="Конфликт броней, ни одна бронь не создана"),
+        429: OpenApiResponse(description="Too Many Requests"),
+        503: OpenApiResponse(description="Ошибка сервера"),
+    },
+)
+class CreateBulkBookingApi(APIView):
+    """
+    API для пакетного создания броней.
+
+    Принимает список броней {room, date_start, date_end} и режим:
+    - atomic: все брони создаются в одной транзакции, при любой ошибке не создаётся ни одна;
+    - best_effort: создаются все корректные и свободные брони.
+
+    Каждый элемент проверяется BookingCreateSerializer. Прошедшие проверку брони
+    вставляются одним INSERT под точкой сохранения; если он нарушает ограничение
+    exclude_overlapping_booking, брони вставляются по одной, каждая под своей точкой
+    сохранения, чтобы определить конфликтующие элементы.
+
+    Для каждого элемента в ответе возвращается свой статус:
+    201 — создана, 400 — ошибка валидации, 409 — пересечение с другой бронью,
+    424 — не создана из-за ошибок в других элементах (режим atomic).
+    Общий статус ответа: 201, если созданы все брони, 207, если только часть,
+    иначе 400 или 409.
+    """
+
+    permission_classes = [IsAuthenticated]
+    throttle_classes = [BookingThrottle]
+    serializer_class = BookingBulkCreateSerializer
+
+    def post(self, request):
+        serializer = self.serializer_class(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        mode = serializer.validated_data["mode"]
+        items = serializer.validated_data["bookings"]
+        atomic = mode == BookingBulkCreateSerializer.ATOMIC
+
+        results = [None] * len(items)
+        bookings = {}
+        item_serializer = BookingCreateSerializer(
+            many=True, context={"prefetched": {"room": self.prefetch_rooms(items)}}
+        ).child
+        for index, item in enumerate(items):
+            try:
+                validated = item_serializer.run_validation(item)
+            except ValidationError as e:
+                results[index] = {
+                    "index": index,
+                    "status": status.HTTP_400_BAD_REQUEST,
+                    "errors": e.detail,
+                }
+            else:
+                bookings[index] = Booking(user=request.user, **validated)
+
+        try:
+            if bookings and not (atomic and len(bookings) < len(items)):
+                self.insert(bookings, results, atomic)
+        except Exception as e:  # pragma: no cover
+            logger.error(
+                "Во время пакетного создания броней произошла непредвиденная ошибка:\n"
+                "user: %s\ndata: %s\nerror: %s\nerror_type: %s",
+                request.user,
+                request.data,
+                e,
+                type(e),
+            )
+            return Response(
+                {
+                    "detail": "Сервис временно недоступен.Пожалуйста, перезагрузите страницу и попробуйте ещё раз."
+                },
+                status=status.HTTP_503_SERVICE_UNAVAILABLE,
+            )
+
+        for index, result in enumerate(results):
+            if result is None:
+                results[index] = {
+                    "index": index,
+                    "status": status.HTTP_424_FAILED_DEPENDENCY,
+                    "detail": SKIPPED_DETAIL,
+                }
+
+        statuses = {result["status"] for result in results}
+        if statuses == {status.HTTP_201_CREATED}:
+            response_status = status.HTTP_201_CREATED
+        elif status.HTTP_201_CREATED in statuses:
+            response_status = status.HTTP_207_MULTI_STATUS
+        elif status.HTTP_400_BAD_REQUEST in statuses:
+            response_status = status.HTTP_400_BAD_REQUEST
+        else:
+            response_status = status.HTTP_409_CONFLICT
+
+        logger.info(
+            "Пользователь с id %s создал %s из %s броней пакетом (%s)",
+            request.user.id,
+            sum(result["status"] == status.HTTP_201_CREATED for result in results),
+            len(results),
+            mode,
+            extra={"user_id": request.user.id},
+        )
+        return Response({"mode": mode, "results": results}, status=response_status)
+
+    @staticmethod
+    def prefetch_rooms(items) -> dict:
+        """Комнаты всех элементов одним запросом: {id: Room}."""
+        ids = set()
+        for item in items:
+            try:
+                ids.add(int(item["room"]))
+            except (TypeError, ValueError, KeyError):
+                pass
+        # id вне диапазона bigint не найдутся, а запрос с ними завершился бы ошибкой.
+        return Room.objects.in_bulk([pk for pk in ids if 0 < pk < 2**63])
+
+    def insert(self, bookings, results, atomic):
+        """
+        Вставляет брони и записывает в results статусы созданных и конфликтующих.
+
+        :param bookings: словарь {индекс элемента: несохранённая Booking}
+        :param results: список результатов по элементам запроса
+        :param atomic: отменить все вставки, если хотя бы одна бронь не создана
+        """
+        created = []
+        with transaction.atomic():
+            try:
+                with transaction.atomic():
+                    Booking.objects.bulk_create(bookings.values())
+                created = list(bookings.items())
+            except IntegrityError:
+                for index, booking in bookings.items():
+                    try:
+                        with transaction.atomic():
+                            Booking.objects.bulk_create([booking])
+                    except IntegrityError:
+                        results[index] = {
+                            "index": index,
+                            "status": status.HTTP_409_CONFLICT,
+                            "detail": CONFLICT_DETAIL,
+                        }
+                    else:
+                        created.append((index, booking))
+
+                if atomic and len(created) < len(bookings):
+                    transaction.set_rollback(True)
+                    return
+
+            # bulk_create не отправляет post_save; статистика, кэш поиска и битовая
+            # карта занятости обновляются по одному сигналу на весь пакет.
+            bookings_created.send(
+                sender=Booking, bookings=[booking for _, booking in created]
+            )
+            for index, booking in created:
+                results[index] = {
+                    "index": index,
+                    "status": status.HTTP_201_CREATED,
+                    "data": {"id": booking.pk, **BookingCreateSerializer(booking).data},
+                }
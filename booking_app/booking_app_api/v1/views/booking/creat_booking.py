@@ -136,7 +136,14 @@ class CreateBookingApi(APIView):
                 serializer.validated_data["user"] = request.user
                 serializer.save()
                 logger.info(
-                    f"Пользователь с id  {request.user.id} создал новое бронирование {serializer.data}"
+                    "Пользователь с id %s создал новое бронирование %s",
+                    request.user.id,
+                    serializer.instance.pk,
+                    extra={
+                        "user_id": request.user.id,
+                        "booking_id": serializer.instance.pk,
+                        "room_id": serializer.instance.room_id,
+                    },
                 )
                 return Response(serializer.data, status=status.HTTP_201_CREATED)
         # Обработка исключения от postgresql при попытке создания пересекающихся броней.
@@ -150,10 +157,11 @@ class CreateBookingApi(APIView):
         except Exception as e:  # pragma: no cover
             logger.error(
                 "Во время создания нового бронирования произошла непредвиденная ошибка:\n"
-                f"user: {request.user}\n"
-                f"data: {request.data}\n"
-                f"error: {str(e)}\n"
-                f"error_type: {type(e)}"
+                "user: %s\ndata: %s\nerror: %s\nerror_type: %s",
+                request.user,
+                request.data,
+                e,
+                type(e),
             )
             return Response(
                 {
@@ -0,0 +1,74 @@
+from booking_app_api.utils import IsSuperUser
+from booking_app_api.utils.export import (EXPORT_FORMATS, booking_rows,
+                                          export_queryset)
+from booking_app_api.v1.serializers import BookingExportParamsSerializer
+from django.http import StreamingHttpResponse
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import (OpenApiParameter, OpenApiResponse,
+                                   extend_schema)
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.views import APIView
+
+
+@extend_schema(
+    summary="Выгрузка всех броней",
+    description="Потоковая выгрузка броней вместе с комнатой и пользователем в формате NDJSON или CSV. Доступна только суперпользователю.",
+    parameters=[
+        OpenApiParameter(
+            "export_format",
+            str,
+            required=False,
+            enum=["ndjson", "csv"],
+            description="Формат выгрузки, по умолчанию ndjson",
+        ),
+        OpenApiParameter(
+            "date_start",
+            str,
+            required=False,
+            description="Выгружать брони, которые заканчиваются после этой даты",
+        ),
+        OpenApiParameter(
+            "date_end",
+            str,
+            required=False,
+            description="Выгружать брони, которые начинаются до этой даты",
+        ),
+        OpenApiParameter("room", int, required=False, description="id комнаты"),
+    ],
+    responses={
+        200: OpenApiResponse(response=OpenApiTypes.BINARY, description="Файл выгрузки"),
+        400: OpenApiResponse(description="Ошибка в параметрах запроса"),
+        403: OpenApiResponse(description="Пользователь не суперпользователь"),
+    },
+)
+class ExportBookingApi(APIView):
+    """
+    API endpoint для выгрузки броней суперпользователем.
+
+    Брони читаются из БД серверным курсором порциями и сразу отдаются клиенту
+    через StreamingHttpResponse, поэтому потребление памяти не зависит от размера
+    таблицы.
+
+    Параметры запроса (query parameters):
+    - export_format (необязательный): ndjson или csv.
+    - date_start, date_end (необязательные): период, с которым пересекаются брони.
+    - room (необязательный): id комнаты.
+    """
+
+    permission_classes = [IsAuthenticated, IsSuperUser]
+
+    def get(self, request):
+        serializer = BookingExportParamsSerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        params = dict(serializer.validated_data)
+        export_format = params.pop("export_format", "ndjson")
+
+        content_type, render = EXPORT_FORMATS[export_format]
+        rows = booking_rows(export_queryset(**params))
+        response = StreamingHttpResponse(
+            render(rows), content_type=f"{content_type}; charset=utf-8"
+        )
+        response["Content-Disposition"] = (
+            f'attachment; filename="bookings.{export_format}"'
+        )
+        return response
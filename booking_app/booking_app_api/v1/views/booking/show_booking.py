@@ -1,11 +1,20 @@
 from booking_app_admin.models import Booking
-from booking_app_api.v1.serializers import BookingSerializer
+from booking_app_api.utils import KeysetCursorPagination
+from booking_app_api.utils.authentication import StatelessJWTAuthentication
+from booking_app_api.v1.serializers import (BookingSerializer,
+                                            fast_booking_serializer)
 from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import (OpenApiExample, OpenApiResponse,
                                    extend_schema)
 from rest_framework.generics import ListAPIView
 from rest_framework.permissions import IsAuthenticated
 
+from ..mixins import FastListMixin
+
+
+class BookingCursorPagination(KeysetCursorPagination):
+    ordering = ("date_start", "id")
+
 
 @extend_schema(
     summary="Список всех броней текущего пользователя",
@@ -17,30 +26,34 @@ from rest_framework.permissions import IsAuthenticated
             examples=[
                 OpenApiExample(
                     name="Стандартный ответ",
-                    value=[
-                        {
-                            "id": 1,
-                            "date_start": "2025-04-01T00:00:00+03:00",
-                            "date_end": "2025-04-06T00:00:00+03:00",
-                            "room": {
+                    value={
+                        "next": "http://localhost:8000/api/v1/user/booking/?cursor=cD0lNUIlMjIyMDI1LTA0LTExKzAwJTNBMDAlM0EwMCUyQjAzJTNBMDAlMjIlMkMyJTVE&page_size=2",
+                        "previous": None,
+                        "results": [
+                            {
                                 "id": 1,
-                                "name": "Одиночка",
-                                "capacity": 1,
-                                "price_per_day": "123.00",
+                                "date_start": "2025-04-01T00:00:00+03:00",
+                                "date_end": "2025-04-06T00:00:00+03:00",
+                                "room": {
+                                    "id": 1,
+                                    "name": "Одиночка",
+                                    "capacity": 1,
+                                    "price_per_day": "123.00",
+                                },
                             },
-                        },
-                        {
-                            "id": 2,
-                            "date_start": "2025-04-11T00:00:00+03:00",
-                            "date_end": "2025-04-16T00:00:00+03:00",
-                            "room": {
+                            {
                                 "id": 2,
-                                "name": "Для двоих",
-                                "capacity": 2,
-                                "price_per_day": "300.00",
+                                "date_start": "2025-04-11T00:00:00+03:00",
+                                "date_end": "2025-04-16T00:00:00+03:00",
+                                "room": {
+                                    "id": 2,
+                                    "name": "Для двоих",
+                                    "capacity": 2,
+                                    "price_per_day": "300.00",
+                                },
                             },
-                        },
-                    ],
+                        ],
+                    },
                     media_type="application/json",
                 ),
             ],
@@ -58,7 +71,7 @@ from rest_framework.permissions import IsAuthenticated
         ),
     },
 )
-class UserAllBookingApi(ListAPIView):
+class UserAllBookingApi(FastListMixin, ListAPIView):
     """
     API endpoint для получения данных о всех бронированиях пользователя.
 
@@ -68,11 +81,25 @@ class UserAllBookingApi(ListAPIView):
     по его id.
 
     Объект бронирования содержит в себе поля id, date_start, date_end, room(id, name, capacity, price_per_day).
+
+    Список разбит на страницы курсорной пагинацией в порядке (date_start, id):
+    ссылки на соседние страницы возвращаются в полях next и previous, размер
+    страницы задаётся параметром page_size.
+
+    При включённой настройке FAST_SERIALIZATION список сериализуется через FastSerializer.
+
+    При включённой настройке JWT_AUTH["STATELESS_READS"] пользователь для чтения
+    не загружается из БД, а строится из claims токена (StatelessJWTAuthentication).
     """
 
+    authentication_classes = [StatelessJWTAuthentication]
     permission_classes = [IsAuthenticated]
+    pagination_class = BookingCursorPagination
     queryset = Booking.objects.all().prefetch_related("room")
     serializer_class = BookingSerializer
+    fast_serializer = fast_booking_serializer
 
     def get_queryset(self):
-        return Booking.objects.filter(user=self.request.user).prefetch_related("room")
+        return Booking.objects.filter(user_id=self.request.user.pk).prefetch_related(
+            "room"
+        )
@@ -1,5 +1,6 @@
 from booking_app_admin.models import Booking
 from booking_app_api.utils import IsOwnerOrSuperUser
+from booking_app_api.utils.authentication import StatelessJWTAuthentication
 from booking_app_api.v1.serializers import BookingSerializer
 from drf_spectacular.utils import (OpenApiExample, OpenApiParameter,
                                    OpenApiResponse, OpenApiTypes,
@@ -8,8 +9,7 @@ from rest_framework import status
 from rest_framework.generics import RetrieveDestroyAPIView
 from rest_framework.response import Response
 
-
-@extend_schema_view(
+user_booking_schema = extend_schema_view(
     get=extend_schema(
         summary="Получение информации о конкретной брони пользователя.",
         description="Получение детальной информации о конкретной брони пользователем-владельцем или суперпользователем.",
@@ -121,6 +121,9 @@ from rest_framework.response import Response
         },
     ),
 )
+
+
+@user_booking_schema
 class UserBookingApi(RetrieveDestroyAPIView):
     """
     API endpoint для получения данных о бронировании с возможностью удаления брони.
@@ -131,10 +134,14 @@ class UserBookingApi(RetrieveDestroyAPIView):
     по его id, с помощью метода delete можно удалить бронирование.
 
     Объект бронирования содержит в себе поля id, date_start, date_end, room(id, name, capacity, price_per_day).
+
+    При включённой настройке JWT_AUTH["STATELESS_READS"] пользователь для чтения
+    не загружается из БД, а строится из claims токена (StatelessJWTAuthentication).
     """
 
     queryset = Booking.objects.all().select_related("room")
     serializer_class = BookingSerializer
+    authentication_classes = [StatelessJWTAuthentication]
     permission_classes = [IsOwnerOrSuperUser]
 
     def destroy(self, request, *args, **kwargs):
@@ -0,0 +1,214 @@
+import asyncio
+import weakref
+
+from asgiref.sync import sync_to_async
+from booking_app_api.utils.authentication import CachedJWTAuthentication
+from booking_app_api.utils.instrumentation import measure_serialize
+from booking_app_api.v1.serializers import fast_serialization_enabled
+from django.conf import settings
+from django.db import connections
+from django.http import HttpResponse
+from rest_framework import exceptions
+from rest_framework.renderers import BrowsableAPIRenderer
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+
+
+class FastListMixin:
+    """
+    Быстрый вывод списка для ListAPIView через FastSerializer.
+
+    При включённой настройке FAST_SERIALIZATION QuerySet читается через
+    ``values()`` и сериализуется ``fast_serializer``, иначе используется обычный
+    ``serializer_class``. Вывод в обоих случаях одинаковый. Время сериализации
+    попадает в Server-Timing (serialize).
+    """
+
+    fast_serializer = None
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        fast = self.uses_fast_serializer()
+        if fast:
+            queryset = queryset.prefetch_related(None).values(
+                *self.fast_serializer.paths
+            )
+
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(self.serialize_list(page, fast))
+        return Response(self.serialize_list(queryset, fast))
+
+    def uses_fast_serializer(self) -> bool:
+        return self.fast_serializer is not None and fast_serialization_enabled()
+
+    def serialize_list(self, objects, fast: bool) -> list:
+        with measure_serialize():
+            if fast:
+                return self.fast_serializer.serialize_rows(objects)
+            return self.get_serializer(objects, many=True).data
+
+
+_request_slots = weakref.WeakKeyDictionary()
+
+
+def request_slots() -> asyncio.Semaphore:
+    """Семафор ASYNC_VIEWS["MAX_CONCURRENT_REQUESTS"] для текущего event loop."""
+    loop = asyncio.get_running_loop()
+    semaphore = _request_slots.get(loop)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(settings.ASYNC_VIEWS["MAX_CONCURRENT_REQUESTS"])
+        _request_slots[loop] = semaphore
+    return semaphore
+
+
+def close_request_connections():
+    """
+    close_old_connections для соединений потока текущего запроса.
+
+    Соединения внутри транзакции (например, в TestCase) не закрываются.
+    """
+    for conn in connections.all(initialized_only=True):
+        if not conn.in_atomic_block:
+            conn.close_if_unusable_or_obsolete()
+
+
+class AsyncAPIMixin:
+    """
+    Асинхронная обработка запроса для APIView.
+
+    Повторяет APIView.dispatch, но обработчики методов (get, delete, ...) — корутины,
+    пользователь загружается через ``aauthenticate`` аутентификатора, а ответ
+    рендерится сразу в HttpResponse, чтобы Django не вызывал ``Response.render``
+    в синхронном потоке. Проверка прав, согласование формата и формат ошибок
+    остаются от APIView.
+
+    Django выполняет синхронный код каждого async-запроса (в том числе async ORM)
+    в отдельном потоке со своим соединением с БД, поэтому число одновременно
+    обрабатываемых запросов ограничено ASYNC_VIEWS["MAX_CONCURRENT_REQUESTS"],
+    а соединение закрывается до освобождения места.
+
+    Миксин ставится перед синхронным view, от которого наследуются queryset,
+    сериализаторы и схема OpenAPI; все обработчики методов нужно переопределить
+    асинхронными.
+    """
+
+    authentication_classes = [CachedJWTAuthentication]
+    # Browsable API рендерит шаблоны и формы синхронно, с запросами к БД.
+    renderer_classes = [
+        renderer
+        for renderer in api_settings.DEFAULT_RENDERER_CLASSES
+        if not issubclass(renderer, BrowsableAPIRenderer)
+    ]
+
+    async def dispatch(self, request, *args, **kwargs):
+        async with request_slots():
+            try:
+                return await self.adispatch(request, *args, **kwargs)
+            finally:
+                await sync_to_async(close_request_connections)()
+
+    async def adispatch(self, request, *args, **kwargs):
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+
+        try:
+            await self.ainitial(request, *args, **kwargs)
+
+            if request.method.lower() in self.http_method_names:
+                handler = getattr(
+                    self, request.method.lower(), self.http_method_not_allowed
+                )
+            else:
+                handler = self.http_method_not_allowed
+
+            response = await handler(request, *args, **kwargs)
+
+        except Exception as exc:
+            response = self.handle_exception(exc)
+
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+        return self.to_http_response(self.response)
+
+    async def ainitial(self, request, *args, **kwargs):
+        """Асинхронный вариант APIView.initial."""
+        self.format_kwarg = self.get_format_suffix(**kwargs)
+
+        neg = self.perform_content_negotiation(request)
+        request.accepted_renderer, request.accepted_media_type = neg
+
+        version, scheme = self.determine_version(request, *args, **kwargs)
+        request.version, request.versioning_scheme = version, scheme
+
+        await self.aperform_authentication(request)
+        self.check_permissions(request)
+        self.check_throttles(request)
+
+    async def aperform_authentication(self, request):
+        """
+        Асинхронный вариант Request._authenticate.
+
+        Аутентификаторы без ``aauthenticate`` (например, ForcedAuthentication из
+        тестового клиента) выполняются в синхронном потоке.
+        """
+        for authenticator in request.authenticators:
+            authenticate = getattr(authenticator, "aauthenticate", None)
+            if authenticate is None:
+                authenticate = sync_to_async(authenticator.authenticate)
+            try:
+                user_auth_tuple = await authenticate(request)
+            except exceptions.APIException:
+                request._not_authenticated()
+                raise
+
+            if user_auth_tuple is not None:
+                request._authenticator = authenticator
+                request.user, request.auth = user_auth_tuple
+                return
+
+        request._not_authenticated()
+
+    async def options(self, request, *args, **kwargs):
+        return super().options(request, *args, **kwargs)
+
+    async def apaginate_queryset(self, queryset):
+        """Асинхронный вариант GenericAPIView.paginate_queryset."""
+        if self.paginator is None:
+            return None
+        return await self.paginator.apaginate_queryset(
+            queryset, self.request, view=self
+        )
+
+    @staticmethod
+    def to_http_response(response: Response) -> HttpResponse:
+        with measure_serialize():
+            response.render()
+        return HttpResponse(
+            response.content, status=response.status_code, headers=response.headers
+        )
+
+
+class AsyncListMixin:
+    """
+    Асинхронный вариант ListModelMixin (вместе с FastListMixin, от которого берёт
+    serialize_list).
+
+    Список читается асинхронным ORM, при включённой настройке FAST_SERIALIZATION —
+    через ``values()`` и ``fast_serializer``.
+    """
+
+    async def alist(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        fast = self.uses_fast_serializer()
+        if fast:
+            queryset = queryset.prefetch_related(None).values(
+                *self.fast_serializer.paths
+            )
+
+        page = await self.apaginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(self.serialize_list(page, fast))
+        return Response(self.serialize_list([obj async for obj in queryset], fast))
@@ -0,0 +1,48 @@
+from booking_app_api.utils.cache import search_cache
+from booking_app_api.utils.filters import aget_free_rooms
+from booking_app_api.v1.serializers import (RoomSearchParamsSerializer,
+                                            RoomSerializer,
+                                            fast_room_serializer,
+                                            fast_serialization_enabled)
+from rest_framework.response import Response
+
+from ..mixins import AsyncAPIMixin, AsyncListMixin
+from .search_free_room import SearchFreeRoomApi
+from .show_rooms import ShowRoomsApi
+
+
+class AsyncShowRoomsApi(AsyncAPIMixin, AsyncListMixin, ShowRoomsApi):
+    """Асинхронная версия ShowRoomsApi (см. ASYNC_VIEWS)."""
+
+    async def get(self, request, *args, **kwargs):
+        return await self.alist(request, *args, **kwargs)
+
+
+class AsyncSearchFreeRoomApi(AsyncAPIMixin, SearchFreeRoomApi):
+    """Асинхронная версия SearchFreeRoomApi (см. ASYNC_VIEWS)."""
+
+    async def get(self, request):
+        serializer = RoomSearchParamsSerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+
+        validated = serializer.validated_data
+        date_start = validated["date_start"]
+        date_end = validated["date_end"]
+        capacity = validated["capacity"]
+
+        async def acompute():
+            rooms = await aget_free_rooms(date_start, date_end, capacity)
+            if fast_serialization_enabled():
+                rows = rooms.values(*fast_room_serializer.paths)
+                return fast_room_serializer.serialize_rows(
+                    [row async for row in rows.aiterator()]
+                )
+            return RoomSerializer(
+                [room async for room in rooms.aiterator()], many=True
+            ).data
+
+        data = await search_cache.aget_or_compute(
+            date_start, date_end, capacity, acompute
+        )
+
+        return Response(data)
@@ -0,0 +1,101 @@
+from datetime import timedelta
+
+from booking_app_api.utils.filters import get_earliest_slots
+from booking_app_api.utils.filters.availability_calendar import local_midnight
+from booking_app_api.v1.serializers import (EarliestSlotsParamsSerializer,
+                                            FreeSlotSerializer)
+from django.conf import settings
+from django.utils import timezone
+from drf_spectacular.utils import (OpenApiExample, OpenApiParameter,
+                                   extend_schema)
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+
+@extend_schema(
+    summary="Ближайшие свободные окна",
+    description=(
+        "Первые свободные окна заданной длительности во всех комнатах, "
+        "с возможностью ограничить вместительность и цену за сутки."
+    ),
+    parameters=[
+        OpenApiParameter(
+            "nights", int, required=True, description="Длительность окна в сутках"
+        ),
+        OpenApiParameter(
+            "date_from",
+            str,
+            required=False,
+            description="Дата начала поиска (YYYY-MM-DD), по умолчанию сегодня",
+        ),
+        OpenApiParameter(
+            "capacity", int, required=False, description="Минимальная вместимость"
+        ),
+        OpenApiParameter(
+            "max_price",
+            str,
+            required=False,
+            description="Максимальная цена за сутки",
+        ),
+        OpenApiParameter(
+            "limit",
+            int,
+            required=False,
+            description="Число окон (по умолчанию 5, не больше EARLIEST_SLOTS.MAX_LIMIT)",
+        ),
+    ],
+    responses=FreeSlotSerializer(many=True),
+    examples=[
+        OpenApiExample(
+            name="Стандартный ответ",
+            value=[
+                {
+                    "room": 1,
+                    "date_start": "2025-02-05T12:00:00+03:00",
+                    "date_end": "2025-02-08T12:00:00+03:00",
+                    "free_until": "2025-02-10T00:00:00+03:00",
+                }
+            ],
+        ),
+    ],
+)
+class EarliestSlotsApi(APIView):
+    """
+    API endpoint для поиска ближайших свободных окон.
+
+    Вместо перебора дат через search-free-rooms промежутки между бронями всех
+    комнат находятся одним SQL-запросом с оконными функциями (см.
+    booking_app_api.utils.filters.free_slots). Поиск ограничен горизонтом
+    EARLIEST_SLOTS["HORIZON_DAYS"] суток от даты начала.
+
+    Параметры запроса (query parameters):
+    - nights (обязательный): длительность окна в сутках.
+    - date_from (необязательный): дата начала поиска в формате YYYY-MM-DD
+      (по умолчанию сегодня в часовом поясе TIME_ZONE); окна начинаются не раньше
+      текущего момента.
+    - capacity (необязательный): минимальная вместимость комнаты.
+    - max_price (необязательный): максимальная цена за сутки.
+    - limit (необязательный): число окон.
+
+    free_until — конец промежутка, в котором найдено окно (или граница поиска).
+    """
+
+    def get(self, request):
+        serializer = EarliestSlotsParamsSerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+
+        validated = serializer.validated_data
+        date_from = local_midnight(validated["date_from"])
+        horizon = date_from + timedelta(days=settings.EARLIEST_SLOTS["HORIZON_DAYS"])
+        # Окна не начинаются в прошлом, даже если поиск начат с сегодняшнего дня.
+        date_from = max(date_from, timezone.now())
+
+        slots = get_earliest_slots(
+            date_from,
+            timedelta(days=validated["nights"]),
+            horizon,
+            validated["limit"],
+            validated["capacity"],
+            validated["max_price"],
+        )
+        return Response(FreeSlotSerializer(slots, many=True).data)
@@ -0,0 +1,111 @@
+from booking_app_api.utils.filters import get_free_rooms_for_windows
+from booking_app_api.v1.serializers import (FlexibleSearchParamsSerializer,
+                                            RoomSerializer)
+from drf_spectacular.utils import (OpenApiExample, OpenApiParameter,
+                                   OpenApiResponse, extend_schema)
+from rest_framework.fields import DateTimeField
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+
+@extend_schema(
+    summary="Гибкий поиск по доступным комнатам",
+    description=(
+        "Поиск свободных комнат сразу для всех промежутков вокруг заданного: "
+        "со сдвигом дат на ±shift_days суток и изменением длины проживания на ±length_days суток."
+    ),
+    parameters=[
+        OpenApiParameter(
+            "date_start",
+            str,
+            required=True,
+            description="Начальная дата бронирования (YYYY-MM-DD)",
+        ),
+        OpenApiParameter(
+            "date_end",
+            str,
+            required=True,
+            description="Конечная дата бронирования (YYYY-MM-DD)",
+        ),
+        OpenApiParameter(
+            "capacity",
+            str,
+            required=False,
+            description="Максимальное число жильцов",
+        ),
+        OpenApiParameter(
+            "shift_days",
+            int,
+            required=False,
+            description="Допуск сдвига дат в сутках (не больше FLEXIBLE_SEARCH.MAX_SHIFT_DAYS)",
+        ),
+        OpenApiParameter(
+            "length_days",
+            int,
+            required=False,
+            description="Допуск длины проживания в сутках (не больше FLEXIBLE_SEARCH.MAX_LENGTH_DAYS)",
+        ),
+        OpenApiParameter(
+            "cheapest",
+            bool,
+            required=False,
+            description="Только самая дешёвая комната для каждого промежутка",
+        ),
+    ],
+    responses={200: OpenApiResponse(description="Свободные комнаты по промежуткам")},
+    examples=[
+        OpenApiExample(
+            name="Стандартный ответ",
+            value=[
+                {
+                    "date_start": "2025-02-01T00:00:00+03:00",
+                    "date_end": "2025-02-03T00:00:00+03:00",
+                    "rooms": [
+                        {
+                            "id": 1,
+                            "name": "Для двоих",
+                            "price_per_day": "100.00",
+                            "capacity": 2,
+                        }
+                    ],
+                }
+            ],
+        ),
+    ],
+)
+class FlexibleSearchFreeRoomApi(APIView):
+    """
+    API endpoint для гибкого поиска доступных комнат.
+
+    Вместо отдельного запроса к search-free-rooms на каждый вариант дат все
+    промежутки-кандидаты проверяются одним SQL-запросом (см.
+    booking_app_api.utils.filters.flexible_search). Параметры проверяются так же,
+    как в SearchFreeRoomApi; кандидаты, не прошедшие эти проверки, пропускаются.
+
+    Параметры запроса (query parameters):
+    - date_start, date_end, capacity: как в SearchFreeRoomApi.
+    - shift_days (необязательный): допуск сдвига дат в сутках.
+    - length_days (необязательный): допуск длины проживания в сутках.
+    - cheapest (необязательный): только самая дешёвая комната для каждого промежутка.
+    """
+
+    def get(self, request):
+        serializer = FlexibleSearchParamsSerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+
+        validated = serializer.validated_data
+        windows = validated["windows"]
+        free_rooms = get_free_rooms_for_windows(
+            windows, validated["capacity"], validated["cheapest"]
+        )
+
+        date_field = DateTimeField()
+        data = [
+            {
+                "date_start": date_field.to_representation(date_start),
+                "date_end": date_field.to_representation(date_end),
+                "rooms": RoomSerializer(rooms, many=True).data,
+            }
+            for (date_start, date_end), rooms in zip(windows, free_rooms)
+        ]
+        return Response(data)
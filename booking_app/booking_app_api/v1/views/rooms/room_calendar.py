@@ -0,0 +1,100 @@
+from booking_app_api.utils.cache import calendar_cache
+from booking_app_api.utils.filters import get_occupancy, month_starts
+from booking_app_api.v1.serializers import RoomCalendarParamsSerializer
+from drf_spectacular.utils import (OpenApiExample, OpenApiParameter,
+                                   OpenApiResponse, extend_schema)
+from rest_framework import status
+from rest_framework.exceptions import NotFound
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+
+@extend_schema(
+    summary="Календарь занятости комнат",
+    description=(
+        "Занятость комнат по суткам за один или несколько месяцев. "
+        'Для каждой комнаты возвращается строка, где i-й символ — сутки date_start + i: "1" — '
+        'занято, "0" — свободно.'
+    ),
+    parameters=[
+        OpenApiParameter(
+            "month", str, required=True, description="Первый месяц (YYYY-MM)"
+        ),
+        OpenApiParameter(
+            "months",
+            int,
+            required=False,
+            description="Число месяцев (по умолчанию 1, не больше AVAILABILITY_CALENDAR.MAX_MONTHS)",
+        ),
+        OpenApiParameter(
+            "room",
+            int,
+            required=False,
+            description="id комнаты; по умолчанию все комнаты",
+        ),
+    ],
+    responses={
+        200: OpenApiResponse(description="Календарь занятости"),
+        304: OpenApiResponse(description="Календарь не изменился (If-None-Match)"),
+        404: OpenApiResponse(description="Комната не найдена"),
+    },
+    examples=[
+        OpenApiExample(
+            name="Стандартный ответ",
+            value={
+                "date_start": "2025-02-01",
+                "date_end": "2025-03-01",
+                "rooms": [{"room": 1, "occupied": "0011100000000000000000000000"}],
+            },
+        ),
+    ],
+)
+class RoomCalendarApi(APIView):
+    """
+    API endpoint с календарём занятости комнат.
+
+    Занятость за весь период считается одним SQL-запросом (см.
+    booking_app_api.utils.filters.availability_calendar) и кэшируется помесячно
+    для каждой комнаты и для всех комнат вместе (см. CalendarCache).
+
+    Параметры запроса (query parameters):
+    - month (обязательный): первый месяц в формате YYYY-MM.
+    - months (необязательный): число месяцев.
+    - room (необязательный): id комнаты.
+
+    Ответ содержит ETag, если версии кэша общие для всех воркеров (см.
+    SEARCH_CACHE["VERSION_STORE"]); на запрос с совпадающим If-None-Match отдаётся 304.
+    """
+
+    def get(self, request):
+        serializer = RoomCalendarParamsSerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+
+        validated = serializer.validated_data
+        room_id = validated["room"]
+        bounds = month_starts(validated["month"], validated["months"])
+
+        occupancy, etag = calendar_cache.get_or_compute(
+            bounds,
+            room_id,
+            lambda first_day, last_day: get_occupancy(first_day, last_day, room_id),
+        )
+        if room_id is not None and not occupancy:
+            raise NotFound("Комната не найдена.")
+
+        if etag is not None:
+            etag = f'"{etag}"'
+            if request.headers.get("If-None-Match") == etag:
+                return Response(
+                    status=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+                )
+
+        data = {
+            "date_start": bounds[0],
+            "date_end": bounds[-1],
+            "rooms": [
+                {"room": room, "occupied": bits} for room, bits in occupancy.items()
+            ],
+        }
+        headers = {"ETag": etag} if etag is not None else None
+        return Response(data, headers=headers)
@@ -1,6 +1,9 @@
+from booking_app_api.utils.cache import search_cache
 from booking_app_api.utils.filters import get_free_rooms
 from booking_app_api.v1.serializers import (RoomSearchParamsSerializer,
-                                            RoomSerializer)
+                                            RoomSerializer,
+                                            fast_room_serializer,
+                                            fast_serialization_enabled)
 from drf_spectacular.utils import (OpenApiExample, OpenApiParameter,
                                    extend_schema)
 from rest_framework.response import Response
@@ -61,6 +64,10 @@ class SearchFreeRoomApi(APIView):
     - date_start (обязательный): Начальная дата бронирования в формате YYYY-MM-DD.
     - date_end (обязательный): Конечная дата бронирования в формате YYYY-MM-DD.
     - capacity (необязательный): Минимальная требуемая вместимость комнаты.
+
+    Ответы кэшируются (см. SEARCH_CACHE) и сбрасываются при изменении броней
+    в запрошенном периоде или при изменении комнат. При включённой настройке
+    FAST_SERIALIZATION комнаты сериализуются через FastSerializer.
     """
 
     def get(self, request):
@@ -72,7 +79,12 @@ class SearchFreeRoomApi(APIView):
         date_end = validated["date_end"]
         capacity = validated["capacity"]
 
-        free_rooms = get_free_rooms(date_start, date_end).filter(capacity__gte=capacity)
-        serializer = RoomSerializer(free_rooms, many=True)
+        def compute():
+            rooms = get_free_rooms(date_start, date_end, capacity)
+            if fast_serialization_enabled():
+                return fast_room_serializer.serialize(rooms)
+            return RoomSerializer(rooms, many=True).data
+
+        data = search_cache.get_or_compute(date_start, date_end, capacity, compute)
 
-        return Response(serializer.data)
+        return Response(data)
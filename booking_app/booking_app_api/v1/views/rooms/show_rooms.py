@@ -1,18 +1,21 @@
 from booking_app_admin.models import Room
-from booking_app_api.v1.serializers import RoomSerializer
+from booking_app_api.utils import KeysetCursorPagination
+from booking_app_api.v1.serializers import RoomSerializer, fast_room_serializer
 from drf_spectacular.utils import (OpenApiExample, OpenApiParameter,
                                    extend_schema)
 from rest_framework.filters import OrderingFilter
 from rest_framework.generics import ListAPIView
 
+from ..mixins import FastListMixin
+
 
 @extend_schema(
     summary="Список комнат с возможностью сортировки",
-    description="Получить список всех комнат. Можно сортировать по `price_per_day` и `capacity`.",
+    description="Получить список всех комнат. Можно сортировать по `price_per_day`, `capacity` и `id`.",
     parameters=[
         OpenApiParameter(
             name="ordering",
-            description="Поля сортировки: `price_per_day`, `capacity`.",
+            description="Поля сортировки: `price_per_day`, `capacity`, `id`.",
             required=False,
             type=str,
             location=OpenApiParameter.QUERY,
@@ -22,63 +25,78 @@ from rest_framework.generics import ListAPIView
     examples=[
         OpenApiExample(
             name="Ответ без параметра",
-            value=[
-                {
-                    "id": 1,
-                    "name": "Для двоих",
-                    "price_per_day": "100.00",
-                    "capacity": 2,
-                },
-                {
-                    "id": 2,
-                    "name": "Для одного",
-                    "price_per_day": "50.00",
-                    "capacity": 1,
-                },
-                {
-                    "id": 3,
-                    "name": "Для троих",
-                    "price_per_day": "150.00",
-                    "capacity": 3,
-                },
-            ],
+            value={
+                "next": None,
+                "previous": None,
+                "results": [
+                    {
+                        "id": 1,
+                        "name": "Для двоих",
+                        "price_per_day": "100.00",
+                        "capacity": 2,
+                    },
+                    {
+                        "id": 2,
+                        "name": "Для одного",
+                        "price_per_day": "50.00",
+                        "capacity": 1,
+                    },
+                    {
+                        "id": 3,
+                        "name": "Для троих",
+                        "price_per_day": "150.00",
+                        "capacity": 3,
+                    },
+                ],
+            },
             media_type="application/json",
         ),
         OpenApiExample(
             name="Ответ с сортировкой по цене",
-            value=[
-                {
-                    "id": 2,
-                    "name": "Для одного",
-                    "price_per_day": "50.00",
-                    "capacity": 1,
-                },
-                {
-                    "id": 1,
-                    "name": "Для двоих",
-                    "price_per_day": "100.00",
-                    "capacity": 2,
-                },
-                {
-                    "id": 3,
-                    "name": "Для троих",
-                    "price_per_day": "150.00",
-                    "capacity": 3,
-                },
-            ],
+            value={
+                "next": None,
+                "previous": None,
+                "results": [
+                    {
+                        "id": 2,
+                        "name": "Для одного",
+                        "price_per_day": "50.00",
+                        "capacity": 1,
+                    },
+                    {
+                        "id": 1,
+                        "name": "Для двоих",
+                        "price_per_day": "100.00",
+                        "capacity": 2,
+                    },
+                    {
+                        "id": 3,
+                        "name": "Для троих",
+                        "price_per_day": "150.00",
+                        "capacity": 3,
+                    },
+                ],
+            },
             media_type="application/json",
         ),
     ],
 )
-class ShowRoomsApi(ListAPIView):
+class ShowRoomsApi(FastListMixin, ListAPIView):
     """
     API endpoint - возвращает список из всех комнат,
-    с возможностью сортировки по полям price_per_day и capacity.
+    с возможностью сортировки по полям price_per_day, capacity и id.
 
     Каждый элемент списка содержит id, name, price_per_day, capacity.
+
+    Список разбит на страницы курсорной пагинацией: к выбранной сортировке
+    добавляется id, ссылки на соседние страницы возвращаются в полях next и previous.
+
+    При включённой настройке FAST_SERIALIZATION список сериализуется через FastSerializer.
     """
 
     queryset = Room.objects.all()
     serializer_class = RoomSerializer
+    fast_serializer = fast_room_serializer
+    pagination_class = KeysetCursorPagination
     filter_backends = [OrderingFilter]
-    ordering_fields = ["price_per_day", "capacity"]
+    ordering_fields = ["price_per_day", "capacity", "id"]
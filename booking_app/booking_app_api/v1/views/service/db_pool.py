@@ -0,0 +1,40 @@
+import os
+
+from booking_app_api.utils import IsSuperUser
+from booking_app_api.utils.db import pool_stats
+from django.conf import settings
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import OpenApiResponse, extend_schema
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+
+@extend_schema(
+    summary="Метрики пула соединений с БД",
+    description="Метрики пула соединений воркера, обработавшего запрос. Доступны только суперпользователю.",
+    responses={
+        200: OpenApiResponse(response=OpenApiTypes.OBJECT, description="Метрики пула"),
+        403: OpenApiResponse(description="Пользователь не суперпользователь"),
+    },
+)
+class DbPoolStatsApi(APIView):
+    """
+    API endpoint с метриками пула соединений с БД (DB_POOL_MODE="pool").
+
+    Пул у каждого процесса свой, поэтому ответ относится к воркеру с указанным pid:
+    размер пула, занятые соединения (in_use), ожидающие запросы (waiting),
+    суммарное и среднее время ожидания соединения, число открытых соединений
+    и время на их установку. Если пул не включён, поле pool равно null.
+    """
+
+    permission_classes = [IsAuthenticated, IsSuperUser]
+
+    def get(self, request):
+        return Response(
+            {
+                "pid": os.getpid(),
+                "mode": settings.DB_POOL_MODE,
+                "pool": pool_stats(),
+            }
+        )
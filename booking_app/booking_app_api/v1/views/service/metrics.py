@@ -0,0 +1,38 @@
+from booking_app_api.utils import HasMetricsToken
+from booking_app_api.utils.metrics import exposition
+from booking_app_api.utils.renderers import PrometheusTextRenderer
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import OpenApiResponse, extend_schema
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+
+@extend_schema(
+    summary="Метрики приложения для Prometheus",
+    description=(
+        "Запросы, время ответа и SQL-запросы по view, обращения к кэшам. "
+        'Нужен заголовок "Authorization: Bearer <METRICS_TOKEN>"; '
+        "без заданного METRICS_TOKEN эндпоинт недоступен."
+    ),
+    responses={
+        200: OpenApiResponse(
+            response=OpenApiTypes.STR, description="Метрики в текстовом формате"
+        ),
+        403: OpenApiResponse(description="Неверный или не заданный токен"),
+    },
+)
+class MetricsApi(APIView):
+    """
+    API endpoint с метриками в текстовом формате Prometheus.
+
+    Под gunicorn значения складываются по всем воркерам (см.
+    booking_app_api.utils.metrics.registry), поэтому ответ не зависит от того,
+    какой воркер его отдал.
+    """
+
+    authentication_classes = []
+    permission_classes = [HasMetricsToken]
+    renderer_classes = [PrometheusTextRenderer]
+
+    def get(self, request):
+        return Response(exposition())
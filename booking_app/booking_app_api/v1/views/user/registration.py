@@ -1,16 +1,15 @@
 import logging
 
 from booking_app_api.utils import UserRegistrationThrottle
+from booking_app_api.utils.authentication import ClaimsRefreshToken
 from booking_app_api.v1.serializers import RegistrationSerializer
 from django.contrib.auth import get_user_model
-from django.db import transaction
 from drf_spectacular.utils import (OpenApiExample, OpenApiResponse,
                                    extend_schema)
 from rest_framework import generics, status
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 from rest_framework.serializers import ValidationError
-from rest_framework_simplejwt.tokens import RefreshToken
 
 logger = logging.getLogger(__name__)
 
@@ -109,22 +108,24 @@ class UserRegistrationApi(generics.CreateAPIView):
     def create(self, request, *args, **kwargs):
         serializer = self.serializer_class(data=request.data)
         try:
-            with transaction.atomic():
-                serializer.is_valid(raise_exception=True)
-                user = serializer.save()
-                refresh = RefreshToken.for_user(user)
-                response_data = {
-                    "access_token": str(refresh.access_token),
-                }
-                return Response(response_data, status=status.HTTP_201_CREATED)
+            # Валидация не обращается к БД, а пользователь создаётся одним INSERT
+            # после хеширования пароля, поэтому общая транзакция не нужна.
+            serializer.is_valid(raise_exception=True)
+            user = serializer.save()
+            refresh = ClaimsRefreshToken.for_user(user)
+            response_data = {
+                "access_token": str(refresh.access_token),
+            }
+            return Response(response_data, status=status.HTTP_201_CREATED)
         except ValidationError:
             raise
 
         except Exception as e:  # pragma: no cover
             logger.error(
                 "Вовремя регистрации нового пользователя проищошла непредвиденая ошибка.\n"
-                f"data: {request.data}\n"
-                f"error: {str(e)}"
+                "data: %s\nerror: %s",
+                request.data,
+                e,
             )
             return Response(
                 {"detail": "Произошла непредвиденная ошибка. Попробуйте позднее."},
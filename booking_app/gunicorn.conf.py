@@ -0,0 +1,40 @@
+"""
+Настройки gunicorn для settings_prod::
+
+    gunicorn booking_app.wsgi:application
+
+(файл gunicorn.conf.py из текущего каталога подхватывается автоматически).
+Число воркеров передаётся в окружение воркеров: по нему settings_prod делит
+бюджет соединений с БД (DB_MAX_CONNECTIONS) между пулами процессов. Пул открывает
+соединения по мере надобности, поэтому у воркера с одним потоком занято одно.
+"""
+
+import multiprocessing
+import os
+import shutil
+from pathlib import Path
+
+bind = os.getenv("GUNICORN_BIND", "0.0.0.0:8000")
+workers = int(os.getenv("WEB_CONCURRENCY", multiprocessing.cpu_count() * 2 + 1))
+threads = int(os.getenv("GUNICORN_THREADS", "1"))
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "30"))
+
+os.environ["WEB_CONCURRENCY"] = str(workers)
+
+# Метрики Prometheus воркеров пишутся в файлы общего каталога и складываются
+# при выдаче (booking_app_api.utils.metrics). Переменная должна быть задана
+# до того, как воркер импортирует prometheus_client.
+os.environ.setdefault("PROMETHEUS_MULTIPROC_DIR", "/tmp/booking_app_metrics")
+
+
+def on_starting(server):
+    # Файлы прошлого запуска содержат значения уже несуществующего сервера.
+    directory = Path(os.environ["PROMETHEUS_MULTIPROC_DIR"])
+    shutil.rmtree(directory, ignore_errors=True)
+    directory.mkdir(parents=True)
+
+
+def child_exit(server, worker):
+    from prometheus_client import multiprocess
+
+    multiprocess.mark_process_dead(worker.pid)